@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the time to lay out a blotter with the box layout and with
+the solver.
+
+The blotter is a Container with a vbox of rows, each an hbox of a label
+and a few fields. The time to initialize the layout and the mean time
+to lay it out at a new size are measured with the box layout of the
+Container, and with the solver which the Container used before pure box
+trees were recognized.
+
+Usage: python bench_box_layout.py [rows] [columns] [repeat]
+
+"""
+import sys
+from timeit import default_timer
+
+from traits.api import Tuple
+
+from enaml.components.constraints_widget import ConstraintsWidget
+from enaml.components.container import Container
+from enaml.layout.layout_helpers import hbox, vbox
+
+
+class Widget(ConstraintsWidget):
+    """ A constraints widget with a fixed size hint, which discards its
+    layout geometry.
+
+    """
+    hint = Tuple((80, 24))
+
+    def size_hint(self):
+        return self.hint
+
+    def set_layout_geometry(self, rect):
+        pass
+
+
+class Blotter(Container):
+    """ A container with a settable size.
+
+    """
+    current_size = Tuple((800, 600))
+
+    def size(self):
+        return self.current_size
+
+
+def blotter(rows, columns):
+    """ Returns a new blotter with the given number of rows and fields
+    per row.
+
+    """
+    owner = Blotter()
+    boxes = []
+    for row in xrange(rows):
+        label = Widget(hint=(60, 20), hug_width='weak')
+        fields = [
+            Widget(hug_width='ignore') for column in xrange(columns)
+        ]
+        for widget in [label] + fields:
+            owner.add_subcomponent(widget)
+        boxes.append(hbox(label, *fields))
+    owner.constraints = [vbox(*boxes)]
+    return owner
+
+
+def time_layout(use_box, rows, columns, repeat):
+    """ Returns the time to initialize the layout of a blotter and the
+    mean time to lay it out at a new size.
+
+    """
+    owner = blotter(rows, columns)
+    start = default_timer()
+    if not (use_box and owner.initialize_box_layout()):
+        owner.layout_manager.initialize(owner.compute_constraints())
+    init_time = default_timer() - start
+    layout_time = 0.0
+    for idx in xrange(repeat):
+        owner.current_size = (800 + idx % 2 * 100, 600 + idx % 2 * 100)
+        start = default_timer()
+        owner.do_refresh()
+        layout_time += default_timer() - start
+    return init_time, layout_time / repeat
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    solver = time_layout(False, rows, columns, repeat)
+    box = time_layout(True, rows, columns, repeat)
+    print '%d rows of %d fields, times in ms' % (rows, columns)
+    print '%10s %12s %12s' % ('', 'initialize', 'layout')
+    for name, (init_time, layout_time) in (('solver', solver), ('box', box)):
+        print '%10s %12.2f %12.2f' % (name, init_time * 1e3, layout_time * 1e3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the memory used by each component of a large form.
+
+Labels and Fields are created through a toolkit which has no backend,
+so only the memory of the component shells is measured. The memory is
+reported both as the growth of the resident set size of the process
+and as the size of the objects which are tracked by the garbage
+collector, which excludes the memory of strings and numbers.
+
+Usage: python bench_component_memory.py [count]
+
+"""
+import gc
+import resource
+import sys
+
+from enaml.components.field import Field
+from enaml.components.label import Label
+from enaml.core.constructor import Constructor
+from enaml.core.toolkit import Toolkit
+
+
+def resident_size():
+    """ Returns the resident set size of the process in bytes.
+
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * resource.getpagesize()
+    except IOError:
+        # The maximum resident set size is a fallback on platforms
+        # without procfs. It is in kilobytes on Linux, and in bytes
+        # on OSX.
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        if sys.platform == 'darwin':
+            return usage.ru_maxrss
+        return usage.ru_maxrss * 1024
+
+
+def tracked_size(ignore):
+    """ Returns the total size in bytes of the objects tracked by the
+    garbage collector, except for the objects whose ids are given.
+
+    """
+    return sum(
+        sys.getsizeof(obj) for obj in gc.get_objects()
+        if id(obj) not in ignore
+    )
+
+
+def measure(toolkit, name, count):
+    """ Creates 'count' components with the named constructor of the
+    toolkit and returns the (resident, tracked) bytes per component.
+
+    """
+    # Create one component first, so that the memory used by the
+    # classes and their traits is not counted.
+    with toolkit:
+        toolkit[name]()
+    gc.collect()
+    ignore = set(id(obj) for obj in gc.get_objects())
+    ignore.add(id(ignore))
+    tracked = tracked_size(ignore)
+    resident = resident_size()
+    with toolkit:
+        components = [toolkit[name]() for idx in xrange(count)]
+    gc.collect()
+    resident = resident_size() - resident
+    tracked = tracked_size(ignore) - tracked
+    del components
+    return resident / count, tracked / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    toolkit = Toolkit(
+        Label=Constructor(lambda: Label),
+        Field=Constructor(lambda: Field),
+    )
+    templ = '%8s %8s %16s %16s'
+    print templ % ('name', 'count', 'resident B/cmpt', 'tracked B/cmpt')
+    for name in ('Label', 'Field'):
+        resident, tracked = measure(toolkit, name, count)
+        print templ % (name, count, resident, tracked)
+
+
+if __name__ == '__main__':
+    main()
+
@@ -0,0 +1,74 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the cost of repeatedly creating, setting up and releasing a
+declared component, with and without the pool of its factory.
+
+The component is a small headless tree with bound attributes, so the
+timings only include the Enaml overhead; toolkit widget creation, which
+the pool also avoids, is not measured.
+
+Usage: python bench_component_pooling.py [cycles]
+
+"""
+import sys
+from timeit import default_timer
+
+from traits.api import HasTraits, Int
+
+from enaml.tests.headless_toolkit import headless_toolkit, compile_source
+
+
+SOURCE = """
+enamldef Row(BaseComponent):
+    attr model
+    attr value: int << model.x
+    attr label: str = 'row'
+
+enamldef Pane(BaseComponent):
+    id: pane
+    attr model
+    Row:
+        model = pane.model
+    Row:
+        model = pane.model
+    Row:
+        model = pane.model
+    Row:
+        model = pane.model
+"""
+
+
+class Model(HasTraits):
+
+    x = Int
+
+
+def cycle(Pane, model, toolkit, count):
+    start = default_timer()
+    for i in xrange(count):
+        with toolkit:
+            pane = Pane(model=model)
+        if not pane.initialized:
+            pane.setup()
+        pane.release()
+    return default_timer() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    module = compile_source(SOURCE)
+    Pane = module.Pane
+    toolkit = headless_toolkit()
+    model = Model()
+    templ = '%10s %10s %14s'
+    print templ % ('pool size', 'cycles', 'us per cycle')
+    for size in (0, 1):
+        Pane.pool_size = size
+        elapsed = cycle(Pane, model, toolkit, count)
+        print templ % (size, count, '%.1f' % (elapsed / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
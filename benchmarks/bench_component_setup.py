@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the time to setup component trees of increasing size.
+
+Each tree is a balanced tree of BaseComponent instances with a fixed
+branching factor. The setup time of the flattened setup driver is
+compared against a driver which runs each setup step as a separate
+recursive traversal of the tree, as was done before the driver was
+flattened.
+
+Usage: python bench_component_setup.py [branching]
+
+"""
+import sys
+from timeit import default_timer
+
+from enaml.core.base_component import BaseComponent
+
+
+def make_tree(size, branching):
+    """ Creates a balanced tree of 'size' components.
+
+    """
+    root = BaseComponent()
+    nodes = [root]
+    idx = 0
+    while len(nodes) < size:
+        parent = nodes[idx // branching]
+        child = BaseComponent()
+        parent.add_subcomponent(child)
+        nodes.append(child)
+        idx += 1
+    return root
+
+
+def recursive_setup(cmpnt, parent=None):
+    """ Runs the setup steps with one recursive traversal per step.
+
+    """
+    def walk(cmpnt, method, *args):
+        getattr(cmpnt, method)(*args)
+        for child in cmpnt._subcomponents:
+            walk(child, method, *args)
+
+    def walk_up(cmpnt, method):
+        for child in cmpnt._subcomponents:
+            walk_up(child, method)
+        getattr(cmpnt, method)()
+
+    walk(cmpnt, '_setup_create_widgets', parent)
+    walk(cmpnt, '_setup_init_widgets')
+    walk(cmpnt, '_setup_eval_expressions')
+    walk(cmpnt, '_setup_bind_widgets')
+    walk(cmpnt, '_setup_listeners')
+    walk(cmpnt, '_setup_init_visibility')
+    walk_up(cmpnt, '_setup_init_layout')
+    walk_up(cmpnt, '_setup_finalize')
+    walk_up(cmpnt, '_setup_set_initialized')
+
+
+def time_setup(setup, size, branching):
+    root = make_tree(size, branching)
+    start = default_timer()
+    setup(root)
+    return default_timer() - start
+
+
+def main():
+    branching = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    templ = '%8s %14s %14s'
+    print templ % ('size', 'recursive ms', 'flat ms')
+    for size in (100, 1000, 5000, 20000):
+        recursive = time_setup(recursive_setup, size, branching)
+        flat = time_setup(BaseComponent.setup, size, branching)
+        print templ % (size, '%.2f' % (recursive * 1e3),
+                       '%.2f' % (flat * 1e3))
+
+
+if __name__ == '__main__':
+    main()
+
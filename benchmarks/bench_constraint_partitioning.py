@@ -0,0 +1,137 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the time to solve a form of independent groups.
+
+The form is a column of groups, each a column of widgets with its own
+size variables, which never refer to the variables of another group.
+The layout is timed with a single solver for every constraint, as was
+done before the constraints were partitioned, and with a ConstraintsLayout
+which gives each group its own solver. A widget of one group is hidden
+and shown, and the update of the constraints and the following layout
+are timed.
+
+Usage: python bench_constraint_partitioning.py [groups] [widgets] [repeat]
+
+"""
+import sys
+from timeit import default_timer
+
+from casuarius import ConstraintVariable, Solver, medium
+
+from enaml.layout.constraints_layout import ConstraintsLayout
+
+
+class Widget(object):
+    """ The constraint variables of a widget.
+
+    """
+    def __init__(self, name):
+        self.left = ConstraintVariable('left_%s' % name)
+        self.top = ConstraintVariable('top_%s' % name)
+        self.width = ConstraintVariable('width_%s' % name)
+        self.height = ConstraintVariable('height_%s' % name)
+
+
+def group_constraints(group, widgets, hidden):
+    """ Returns new constraints which stack the widgets of a group
+    which are not hidden in a column.
+
+    """
+    shown = [w for idx, w in enumerate(widgets) if idx != hidden]
+    cns = [
+        group.width >= 0, group.height >= 0, shown[0].top == 10,
+        (group.width == 200) | 'strong',
+    ]
+    for w in shown:
+        cns.extend([
+            w.left >= 0, w.top >= 0, w.width >= 0, w.height >= 0,
+            w.left == 10, w.left + w.width == group.width - 10,
+            (w.width == 100) | 'strong', (w.height == 20) | 'strong',
+        ])
+    for above, below in zip(shown, shown[1:]):
+        cns.append(below.top == above.top + above.height + 10)
+    last = shown[-1]
+    cns.append(group.height >= last.top + last.height + 10)
+    return cns
+
+
+class SingleSolver(object):
+    """ A layout which adds every constraint to a single solver.
+
+    """
+    def initialize(self, constraints):
+        self.solver = Solver(autosolve=False)
+        for cn in constraints:
+            self.solver.add_constraint(cn)
+        self.solver.autosolve = True
+
+    def update_constraints(self, old_cns, new_cns):
+        solver = self.solver
+        solver.autosolve = False
+        for cn in old_cns:
+            solver.remove_constraint(cn)
+        for cn in new_cns:
+            solver.add_constraint(cn)
+        solver.autosolve = True
+
+    def layout(self, cb, width, height, size):
+        with self.solver.suggest_values(
+            [(width, size[0]), (height, size[1])], medium, 1.0):
+            cb()
+
+
+def time_form(layout, count, widgets, repeat):
+    """ Returns the mean times of the initialization of the layout, of
+    the update of the constraints of a group when one of its widgets is
+    hidden or shown, and of the layout.
+
+    """
+    width = ConstraintVariable('width')
+    height = ConstraintVariable('height')
+    groups = [Widget('group_%d' % idx) for idx in xrange(count)]
+    members = [
+        [Widget('%d_%d' % (idx, jdx)) for jdx in xrange(widgets)]
+        for idx in xrange(count)
+    ]
+    cns = [width >= 0, height >= 0, width >= groups[0].width]
+    group_cns = [
+        group_constraints(group, group_members, None)
+        for group, group_members in zip(groups, members)
+    ]
+    start = default_timer()
+    layout.initialize(cns + sum(group_cns, []))
+    init_time = default_timer() - start
+
+    callback = lambda: None
+    middle = count // 2
+    update_time = layout_time = 0.0
+    for idx in xrange(repeat):
+        hidden = widgets // 2 if idx % 2 == 0 else None
+        new_cns = group_constraints(groups[middle], members[middle], hidden)
+        start = default_timer()
+        layout.update_constraints(group_cns[middle], new_cns)
+        update_time += default_timer() - start
+        group_cns[middle] = new_cns
+        start = default_timer()
+        layout.layout(callback, width, height, (640, 480))
+        layout_time += default_timer() - start
+    return init_time, update_time / repeat, layout_time / repeat
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    widgets = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    single = time_form(SingleSolver(), count, widgets, repeat)
+    partitioned = time_form(ConstraintsLayout(), count, widgets, repeat)
+    print '%d groups of %d widgets, times in ms' % (count, widgets)
+    print '%12s %12s %12s %12s' % ('', 'initialize', 'update', 'layout')
+    for name, times in (('single', single), ('partitioned', partitioned)):
+        print '%12s %12.2f %12.2f %12.2f' % ((name,) + tuple(
+            t * 1e3 for t in times))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the time to relayout a form when one widget is hidden.
+
+The form is a column of widgets, each with the hard, size hint and
+stacking constraints a Container would compute for it. Hiding one
+widget removes its constraints and links its neighbours. The relayout
+is timed with a solver which is rebuilt from every constraint, as was
+done before the constraints were diffed, and with a solver which is
+updated with the changed constraints only.
+
+Usage: python bench_constraint_updates.py [count] [repeat]
+
+"""
+import sys
+from timeit import default_timer
+
+from casuarius import ConstraintVariable
+
+from enaml.layout.constraints_layout import ConstraintsLayout
+
+
+class Widget(object):
+    """ The constraint variables of a widget.
+
+    """
+    def __init__(self, idx):
+        self.left = ConstraintVariable('left_%d' % idx)
+        self.top = ConstraintVariable('top_%d' % idx)
+        self.width = ConstraintVariable('width_%d' % idx)
+        self.height = ConstraintVariable('height_%d' % idx)
+
+
+def form_constraints(width, height, widgets, hidden):
+    """ Returns new constraints which stack the widgets which are not
+    hidden in a column.
+
+    """
+    shown = [w for idx, w in enumerate(widgets) if idx != hidden]
+    cns = [width >= 0, height >= 0, shown[0].top == 10]
+    for w in shown:
+        cns.extend([
+            w.left >= 0, w.top >= 0, w.width >= 0, w.height >= 0,
+            w.left == 10, w.left + w.width == width - 10,
+            (w.width == 100) | 'strong', (w.height == 20) | 'strong',
+        ])
+    for above, below in zip(shown, shown[1:]):
+        cns.append(below.top == above.top + above.height + 10)
+    last = shown[-1]
+    cns.append(height >= last.top + last.height + 10)
+    return cns
+
+
+def time_toggles(relayout, count, repeat):
+    """ Returns the mean times of the update of the constraints and of
+    the layout, when the widget in the middle of the form is hidden or
+    shown.
+
+    """
+    width = ConstraintVariable('width')
+    height = ConstraintVariable('height')
+    widgets = [Widget(idx) for idx in xrange(count)]
+    layout = ConstraintsLayout()
+    layout.initialize(form_constraints(width, height, widgets, None))
+    callback = lambda: None
+    update_time = layout_time = 0.0
+    for idx in xrange(repeat):
+        hidden = count // 2 if idx % 2 == 0 else None
+        cns = form_constraints(width, height, widgets, hidden)
+        start = default_timer()
+        relayout(layout, cns)
+        update_time += default_timer() - start
+        start = default_timer()
+        layout.layout(callback, width, height, (640, 480))
+        layout_time += default_timer() - start
+    return update_time / repeat, layout_time / repeat
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    rebuild = time_toggles(ConstraintsLayout.initialize, count, repeat)
+    update = time_toggles(ConstraintsLayout.replace_constraints, count, repeat)
+    print '%d widgets, mean times in ms' % count
+    print '%10s %12s %12s' % ('', 'constraints', 'layout')
+    for name, (cns_time, layout_time) in (
+        ('rebuild', rebuild), ('update', update)):
+        print '%10s %12.2f %12.2f' % (name, cns_time * 1e3, layout_time * 1e3)
+
+
+if __name__ == '__main__':
+    main()
+
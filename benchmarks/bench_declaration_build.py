@@ -0,0 +1,56 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the instantiation throughput of a 3-level derived Enaml
+declaration with 20 bindings.
+
+The throughput with the cached build plans is compared with the
+throughput when the plans are cleared before each instantiation, which
+evaluates every base type, operator and attribute type lookup on each
+instantiation, as was done before the plans were cached.
+
+Usage: python bench_declaration_build.py [count]
+
+"""
+import sys
+from timeit import default_timer
+
+from enaml.tests.headless_toolkit import headless_toolkit, compile_source
+
+
+def make_source():
+    lines = ['enamldef Level0(BaseComponent):']
+    lines.extend('    attr a%d: int = %d' % (i, i) for i in range(10))
+    lines.append('enamldef Level1(Level0):')
+    lines.extend('    attr b%d: int = a%d + 1' % (i, i) for i in range(5))
+    lines.append('enamldef Level2(Level1):')
+    lines.extend('    a%d = %d' % (i, i * 2) for i in range(5))
+    return '\n'.join(lines) + '\n'
+
+
+def run(decls, toolkit, count, clear):
+    start = default_timer()
+    with toolkit:
+        for i in xrange(count):
+            if clear:
+                for decl in decls:
+                    decl.clear_plans()
+            decls[-1]()
+    return default_timer() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    module = compile_source(make_source())
+    decls = [module.Level0, module.Level1, module.Level2]
+    toolkit = headless_toolkit()
+    templ = '%14s %14s'
+    print templ % ('plans', 'inst per sec')
+    for label, clear in (('cleared', True), ('cached', False)):
+        elapsed = run(decls, toolkit, count, clear)
+        print templ % (label, '%.0f' % (count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
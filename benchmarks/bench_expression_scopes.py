@@ -0,0 +1,127 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the cost of evaluating bound expressions with and without
+the reuse of execution scopes.
+
+For each mode, the number of scope objects (ExecutionScope, NonlocalScope
+and override dicts) allocated per evaluation and the time per evaluation
+are reported for the '<<', '::' and '>>' operators.
+
+Usage: python bench_expression_scopes.py [iterations]
+
+"""
+import sys
+import timeit
+
+from traits.api import HasTraits, Int
+
+from enaml.core import expressions
+from enaml.core.expressions import AbstractExpression
+from enaml.tests.headless_toolkit import headless_toolkit, compile_source
+
+
+SOURCE = """
+enamldef Main(BaseComponent):
+    attr model
+    attr total: int << model.x + model.y
+    attr out: int = 0
+    out >> model.y
+    attr log: int = 0
+    log :: model.y
+"""
+
+
+class Model(HasTraits):
+
+    x = Int
+
+    y = Int
+
+
+class AllocationCounter(object):
+    """ Counts the allocations of the scope objects by wrapping their
+    constructors and the 'get_overrides' method of the expressions.
+
+    """
+    def __init__(self):
+        self.count = 0
+        self._patched = []
+
+    def _wrap(self, owner, name):
+        func = getattr(owner, name)
+        counter = self
+        def wrapper(*args, **kwargs):
+            counter.count += 1
+            return func(*args, **kwargs)
+        self._patched.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, wrapper)
+
+    def __enter__(self):
+        self._wrap(expressions.ExecutionScope, '__init__')
+        self._wrap(expressions.NonlocalScope, '__init__')
+        self._wrap(AbstractExpression, 'get_overrides')
+        return self
+
+    def __exit__(self, *args):
+        for owner, name, value in reversed(self._patched):
+            setattr(owner, name, value)
+        del self._patched[:]
+
+
+def run(reuse, iterations):
+    """ Runs the benchmark for the given reuse mode and returns a dict
+    of the (allocations, seconds) per evaluation for each operator.
+
+    """
+    AbstractExpression.reuse_scope = reuse
+    module = compile_source(SOURCE)
+    model = Model()
+    with headless_toolkit():
+        cmpnt = module.Main(model=model)
+    cmpnt.setup()
+
+    def subscribe():
+        model.x += 1
+
+    def update():
+        cmpnt.out += 1
+
+    def notify():
+        model.y += 1
+
+    results = {}
+    for op, func in (('<<', subscribe), ('>>', update), ('::', notify)):
+        func()
+        with AllocationCounter() as counter:
+            func()
+        allocs = counter.count
+        seconds = timeit.timeit(func, number=iterations) / iterations
+        results[op] = (allocs, seconds)
+    return results
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    old_reuse = AbstractExpression.reuse_scope
+    try:
+        fresh = run(False, iterations)
+        reused = run(True, iterations)
+    finally:
+        AbstractExpression.reuse_scope = old_reuse
+
+    # The '>>' and '::' cases also trigger the '<<' expression, since
+    # they change the 'y' attribute of the model.
+    templ = '%-4s %12s %12s %14s %14s'
+    print templ % ('op', 'allocs/fresh', 'allocs/reuse', 'usec/fresh',
+                   'usec/reuse')
+    for op in ('<<', '>>', '::'):
+        f_allocs, f_secs = fresh[op]
+        r_allocs, r_secs = reused[op]
+        print templ % (op, f_allocs, r_allocs, '%.2f' % (f_secs * 1e6),
+                       '%.2f' % (r_secs * 1e6))
+
+
+if __name__ == '__main__':
+    main()
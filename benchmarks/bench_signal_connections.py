@@ -0,0 +1,74 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Measures the cost of connecting, emitting and disconnecting a signal
+with a large number of handlers.
+
+The handlers are a mix of functions and bound methods. The total time
+for each step is reported, along with the time per handler, which should
+not grow with the number of handlers.
+
+Usage: python bench_signal_connections.py [handlers]
+
+"""
+import sys
+from timeit import default_timer
+
+from enaml.core.signaling import Signal
+
+
+class Emitter(object):
+
+    changed = Signal()
+
+
+class Listener(object):
+
+    def on_changed(self, value):
+        pass
+
+
+def make_handler():
+    def handler(value):
+        pass
+    return handler
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    emitter = Emitter()
+    signal = emitter.changed
+    listeners = [Listener() for i in xrange(count // 2)]
+    handlers = [make_handler() for i in xrange(count - len(listeners))]
+    callbacks = [l.on_changed for l in listeners] + handlers
+
+    def connect():
+        for callback in callbacks:
+            signal.connect(callback)
+
+    def reconnect():
+        for callback in callbacks:
+            signal.connect(callback)
+
+    def emit():
+        signal(42)
+
+    def disconnect():
+        for callback in callbacks:
+            signal.disconnect(callback)
+
+    templ = '%-12s %12s %14s'
+    print templ % ('step', 'total ms', 'usec/handler')
+    for name, func in (('connect', connect), ('reconnect', reconnect),
+                       ('emit', emit), ('disconnect', disconnect)):
+        start = default_timer()
+        func()
+        seconds = default_timer() - start
+        print templ % (name, '%.2f' % (seconds * 1e3),
+                       '%.3f' % (seconds * 1e6 / count))
+
+
+if __name__ == '__main__':
+    main()
+
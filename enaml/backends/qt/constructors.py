@@ -137,6 +137,7 @@ QT_CONSTRUCTORS = dict((
     constructor('form'),
     constructor('group_box'),
     constructor('scroll_area'),
+    constructor('virtual_repeater'),
     constructor('progress_bar'),
     constructor('tab_group'),
     constructor('tab'),
@@ -65,6 +65,14 @@ class QtBaseWidgetComponent(AbstractTkBaseWidgetComponent):
         """
         super(QtBaseWidgetComponent, self).bind()
 
+    def set_parent(self, parent):
+        """ Sets the parent of the underlying Qt widget.
+
+        """
+        widget = self.widget
+        if widget:
+            widget.setParent(parent)
+
     def destroy(self):
         """ Destroys the underlying Qt widget.
 
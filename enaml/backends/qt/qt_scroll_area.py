@@ -6,6 +6,7 @@ from .qt import QtCore, QtGui
 from .qt_constraints_widget import QtConstraintsWidget
 
 from ...components.scroll_area import AbstractTkScrollArea
+from ...layout.geometry import Rect
 
 
 SCROLLBAR_POLICY_MAP = dict(
@@ -39,6 +40,36 @@ class QtScrollArea(QtConstraintsWidget, AbstractTkScrollArea):
         self.set_vertical_policy(shell.vertical_scrollbar_policy)
         self.update_scrolled_component()
 
+    def bind(self):
+        """ Connects the scrollbar signals so that the visible rect of
+        the shell object is kept up-to-date.
+
+        """
+        super(QtScrollArea, self).bind()
+        widget = self.widget
+        for bar in (widget.horizontalScrollBar(), widget.verticalScrollBar()):
+            bar.valueChanged.connect(self._on_scrolled)
+            bar.rangeChanged.connect(self._on_scrolled)
+        self._on_scrolled()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def _on_scrolled(self, *args):
+        """ The signal handler for the scrollbar 'valueChanged' and 
+        'rangeChanged' signals. It updates the visible rect of the
+        shell object from the scrollbar values and the viewport size.
+
+        """
+        widget = self.widget
+        viewport = widget.viewport()
+        self.shell_obj.visible_rect = Rect(
+            widget.horizontalScrollBar().value(),
+            widget.verticalScrollBar().value(),
+            viewport.width(),
+            viewport.height(),
+        )
+
     #--------------------------------------------------------------------------
     # Shell Object Change Handlers
     #--------------------------------------------------------------------------
@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt_container import QtContainer
+
+from ...components.virtual_repeater import AbstractTkVirtualRepeater
+
+
+class QtVirtualRepeater(QtContainer, AbstractTkVirtualRepeater):
+    """ A Qt4 implementation of VirtualRepeater.
+
+    """
+    # The QtContainer implementation is enough.
+    pass
+
@@ -78,6 +78,7 @@ WX_CONSTRUCTORS = dict((
     constructor('group_box'),
     constructor('progress_bar'),
     constructor('scroll_area'),
+    constructor('virtual_repeater'),
     constructor('tab_group'),
     constructor('tab'),
     constructor('splitter'),
@@ -65,6 +65,16 @@ class WXBaseWidgetComponent(AbstractTkBaseWidgetComponent):
         """
         super(WXBaseWidgetComponent, self).bind()
 
+    def set_parent(self, parent):
+        """ Reparents the underlying Wx widget. Wx does not allow a
+        child window to be without a parent, so a None parent leaves
+        the widget with its current parent.
+
+        """
+        widget = self.widget
+        if parent is not None and isinstance(widget, wx.Window):
+            widget.Reparent(parent)
+
     def destroy(self):
         """ Destroy the underlying Wx widget.
 
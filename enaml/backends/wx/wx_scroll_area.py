@@ -7,6 +7,7 @@ import wx
 from .wx_constraints_widget import WXConstraintsWidget
 
 from ...components.scroll_area import AbstractTkScrollArea
+from ...layout.geometry import Rect
 
 
 # As mentioned in the notes of the docstring for WXScrollArea, we
@@ -115,6 +116,29 @@ class WXScrollArea(WXConstraintsWidget, AbstractTkScrollArea):
         self.set_vertical_policy(shell.vertical_scrollbar_policy)
         self.update_scrolled_component()
 
+    def bind(self):
+        """ Binds the scroll and size events so that the visible rect
+        of the shell object is kept up-to-date.
+
+        """
+        super(WXScrollArea, self).bind()
+        widget = self.widget
+        widget.Bind(wx.EVT_SCROLLWIN, self._on_scrolled)
+        widget.Bind(wx.EVT_SIZE, self._on_scrolled)
+        self.update_visible_rect()
+
+    #--------------------------------------------------------------------------
+    # Event Handlers
+    #--------------------------------------------------------------------------
+    def _on_scrolled(self, event):
+        """ The event handler for the scroll and size events of the 
+        widget. The window is scrolled by the default handler, so the
+        visible rect is updated once the event has been processed.
+
+        """
+        event.Skip()
+        wx.CallAfter(self.update_visible_rect)
+
     #--------------------------------------------------------------------------
     # Implementation
     #--------------------------------------------------------------------------
@@ -202,6 +226,21 @@ class WXScrollArea(WXConstraintsWidget, AbstractTkScrollArea):
         vert = SCROLLBAR_POLICY_MAP[policy]
         self.widget.SetScrollRate(horiz, vert)
    
+    def update_visible_rect(self):
+        """ Update the visible rect of the shell object from the view
+        start and the client size of the widget.
+
+        """
+        widget = self.widget
+        if not widget:
+            return
+        x, y = widget.GetViewStart()
+        unit_x, unit_y = widget.GetScrollPixelsPerUnit()
+        width, height = widget.GetClientSizeTuple()
+        self.shell_obj.visible_rect = Rect(
+            x * max(unit_x, 1), y * max(unit_y, 1), width, height,
+        )
+
     def update_scrolled_component(self):
         """ Update the QScrollArea's children with the current children.
 
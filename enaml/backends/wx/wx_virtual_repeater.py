@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .wx_container import WXContainer
+
+from ...components.virtual_repeater import AbstractTkVirtualRepeater
+
+
+class WXVirtualRepeater(WXContainer, AbstractTkVirtualRepeater):
+    """ A wxPython implementation of VirtualRepeater.
+
+    """
+    # The WXContainer implementation is enough.
+    pass
+
@@ -91,6 +91,16 @@ class AbstractTkBaseWidgetComponent(object):
         """
         pass
 
+    @abstractmethod
+    def set_parent(self, parent):
+        """ Called when the underlying widget should be moved into a
+        new parent toolkit widget, or removed from its parent when the
+        given parent is None. This is used when a released component
+        is parked for reuse and later reattached.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def destroy(self):
         """ Called when the underlying widget should be destroyed.
@@ -195,3 +205,21 @@ class BaseWidgetComponent(BaseComponent):
         self.abstract_obj.destroy()
         self.abstract_obj = None
 
+    #--------------------------------------------------------------------------
+    # Pooling Methods
+    #--------------------------------------------------------------------------
+    def _detach_widgets(self):
+        """ A reimplemented parent class method which detaches the
+        toolkit widget from its parent widget. The widgets of the
+        children stay in the toolkit widget.
+
+        """
+        self.abstract_obj.set_parent(None)
+
+    def _attach_widgets(self, parent):
+        """ A reimplemented parent class method which moves the toolkit
+        widget into the given parent widget.
+
+        """
+        self.abstract_obj.set_parent(parent)
+
@@ -2,7 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Instance, Property, Tuple, Enum, on_trait_change
+from traits.api import Instance, Property, Tuple, Enum
 
 from .widget_component import WidgetComponent, AbstractTkWidgetComponent
 
@@ -44,10 +44,11 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
     #: specify a logical default for the given control.
     hug_height = PolicyEnum('strong')
 
-    #: The combination of (hug_width, hug_height).
-    hug = Property(
-        Tuple(PolicyEnum, PolicyEnum), depends_on='hug_width, hug_height',
-    )
+    #: The combination of (hug_width, hug_height). The change of the
+    #: property is signaled by the change handlers of its parts, which
+    #: are static handlers rather than a per-object 'depends_on'
+    #: listener.
+    hug = Property(Tuple(PolicyEnum, PolicyEnum))
 
     #: How strongly a component resists clipping its contents. Valid 
     #: strengths are 'weak', 'medium', 'strong', 'required' and 'ignore'. 
@@ -59,11 +60,9 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
     #: The default is 'strong' for height.
     resist_clip_height = PolicyEnum('strong')
 
-    #: The combination of (resist_clip_width, resist_clip_height).
-    resist_clip = Property(
-        Tuple(PolicyEnum, PolicyEnum),
-        depends_on='resist_clip_width, resist_clip_height',
-    )
+    #: The combination of (resist_clip_width, resist_clip_height). The
+    #: change of the property is signaled like the change of 'hug'.
+    resist_clip = Property(Tuple(PolicyEnum, PolicyEnum))
 
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkConstraintsWidget)
@@ -100,7 +99,42 @@ class ConstraintsWidget(WidgetComponent, Constrainable):
     #--------------------------------------------------------------------------
     # Change Handlers
     #--------------------------------------------------------------------------
-    @on_trait_change('hug, resist_clip')
+    def _hug_width_changed(self, old, new):
+        """ The change handler for the 'hug_width' attribute.
+
+        """
+        height = self.hug_height
+        self.trait_property_changed('hug', (old, height), (new, height))
+        self._on_constraints_widget_deps_changed()
+
+    def _hug_height_changed(self, old, new):
+        """ The change handler for the 'hug_height' attribute.
+
+        """
+        width = self.hug_width
+        self.trait_property_changed('hug', (width, old), (width, new))
+        self._on_constraints_widget_deps_changed()
+
+    def _resist_clip_width_changed(self, old, new):
+        """ The change handler for the 'resist_clip_width' attribute.
+
+        """
+        height = self.resist_clip_height
+        self.trait_property_changed(
+            'resist_clip', (old, height), (new, height),
+        )
+        self._on_constraints_widget_deps_changed()
+
+    def _resist_clip_height_changed(self, old, new):
+        """ The change handler for the 'resist_clip_height' attribute.
+
+        """
+        width = self.resist_clip_width
+        self.trait_property_changed(
+            'resist_clip', (width, old), (width, new),
+        )
+        self._on_constraints_widget_deps_changed()
+
     def _on_constraints_widget_deps_changed(self):
         """ A handler which requests a relayout from the *parent* when
         the 'hug' or 'resist_clip' values change, provided that the 
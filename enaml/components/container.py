@@ -2,6 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from casuarius import CassowaryError
 from traits.api import (
     List, Instance, Property, cached_property, Bool, WeakRef
 )
@@ -11,10 +12,13 @@ from .constraints_widget import (
 )
 from .layout_task_handler import LayoutTaskHandler
 
+from ..layout.box_layout import BoxGroup, BoxItem, BoxLayout
 from ..layout.constrainable import PaddingConstraints, Constrainable
-from ..layout.constraints_layout import ConstraintsLayout
-from ..layout.layout_helpers import expand_constraints
-from ..layout.geometry import Size, Box
+from ..layout.constraints_layout import ConstraintsLayout, constraint_key
+from ..layout.layout_helpers import (
+    LinearBoxHelper, clear_invisible, expand_constraints,
+)
+from ..layout.geometry import Size, Box, Rect
     
 
 class AbstractTkContainer(AbstractTkConstraintsWidget):
@@ -78,6 +82,17 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
     #: the size_hint_updated event is fired.
     _size_hint = Property(Instance(Size), depends_on='size_hint_updated')
 
+    #: A private dict which maps each child whose size hint constraints
+    #: are in the solver of this container to the list of those
+    #: constraints. It is computed by 'compute_constraints' so that a
+    #: new size hint only needs to replace the constraints of a child.
+    _size_hint_cns = Instance(dict, ())
+
+    #: A private BoxLayout which lays out the children when they are
+    #: arranged by a pure tree of hbox and vbox helpers, or None when
+    #: the layout is managed by the solver of the 'layout_manager'.
+    _box_layout = Instance(BoxLayout)
+
     #: Overridden parent class trait.
     abstract_obj = Instance(AbstractTkContainer)
 
@@ -154,8 +169,9 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         """
         # We only need to initialize the manager if we own the layout.
         if self.owns_layout:
-            constraints = self.compute_constraints()
-            self.layout_manager.initialize(constraints)
+            if not self.initialize_box_layout():
+                constraints = self.compute_constraints()
+                self.layout_manager.initialize(constraints)
             # We fire off a size hint updated event here since, if
             # for some reason, the size hint was computed before 
             # the layout was initialized, the value will be wrong
@@ -203,6 +219,45 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         else:
             self._layout_owner.request_refresh()
 
+    def request_size_hint_update(self, component):
+        """ A reimplemented parent class method which replaces the size
+        hint constraints of the child in the solver and refreshes the
+        layout, rather than recomputing all of the constraints.
+
+        """
+        self.request_refresh_task(self._update_size_hint, component)
+
+    def _update_size_hint(self, component):
+        """ Replaces the size hint constraints of the given child in the
+        solver of the layout owner. A relayout is requested instead if
+        the size hint constraints of the child are not in the solver.
+
+        """
+        owner = self if self.owns_layout else self._layout_owner
+        if owner._box_layout is not None:
+            # A box tree is cheap to rebuild with the new size hint.
+            owner.request_relayout()
+            return
+        old_cns = owner._size_hint_cns.get(component)
+        if old_cns is None or not owner.layout_manager.initialized:
+            owner.request_relayout()
+            return
+        expand = expand_constraints
+        new_cns = list(expand(component, component.size_hint_constraints()))
+        # Several updates may be queued for the same child before the
+        # refresh, and all but the first of them find no change.
+        if map(constraint_key, old_cns) == map(constraint_key, new_cns):
+            return
+        try:
+            owner.layout_manager.update_constraints(old_cns, new_cns)
+        except CassowaryError:
+            owner.request_relayout()
+            return
+        owner._size_hint_cns[component] = new_cns
+        # The size hint of the owner may have changed as well. See the
+        # comment in 'do_relayout'.
+        owner.size_hint_updated()
+
     def request_relayout_task(self, callback, *args, **kwargs):
         """ A reimplemented parent class method which forwards the call
         to the layout owner if necessary.
@@ -231,16 +286,16 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
 
         """
         # At this point, we know that we own the layout since the
-        # calls that trigger the call to this method would have 
+        # calls that trigger the call to this method would have
         # already been forwarded on to the layout owner. So, at
         # this point, we just have to recompute the constraints
-        # and do a refresh.
-
-        # TODO There is a big opportunity here to optimize by calling
-        # .update_constraints() on the layout manager instead of just
-        # recomputing everything from scratch, but that will require
-        # tracking the created constraints so for now we just punt.
-        self.layout_manager.initialize(self.compute_constraints())
+        # and do a refresh. The layout manager diffs the recomputed
+        # constraints against the ones in its solver, so only the
+        # constraints which changed are removed from or added to it.
+        # A pure box tree does not need the solver at all.
+        if not self.initialize_box_layout():
+            cns = self.compute_constraints()
+            self.layout_manager.replace_constraints(cns)
         self.do_refresh()
 
         # We emit the size hint updated event at this point since
@@ -259,9 +314,13 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         # calls that trigger the call to this method would have 
         # already been forwarded on to the layout owner. So, at
         # this point, we just have to do a refresh.
+        size = self.size()
+        box_layout = self._box_layout
+        if box_layout is not None:
+            box_layout.layout(self.apply_box_layout, size)
+            return
         width = self.width
         height = self.height
-        size = self.size()
         self.layout_manager.layout(self.apply_layout, width, height, size)
 
     def apply_layout(self):
@@ -282,6 +341,20 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
                     if child._layout_owner is self:
                         push((new_offset, child.constraints_children))
 
+    def apply_box_layout(self, geometry):
+        """ The callback invoked by the box layout with the geometry of
+        the children. The children of a box tree are never containers
+        whose layout is owned by this container, so there are no
+        offsets to apply.
+
+        """
+        for child, x, y, width, height in geometry:
+            rect = Rect(
+                int(round(x)), int(round(y)),
+                int(round(width)), int(round(height)),
+            )
+            child.set_layout_geometry(rect)
+
     #--------------------------------------------------------------------------
     # Constraints Computation
     #--------------------------------------------------------------------------
@@ -296,6 +369,14 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         cns = []
         cns_extend = cns.extend
 
+        # The size hint constraints of the children are recorded so
+        # that they can be replaced when a size hint changes.
+        self._size_hint_cns = size_hint_cns = {}
+        def size_hint_constraints(child):
+            hint_cns = list(expand(child, child.size_hint_constraints()))
+            size_hint_cns[child] = hint_cns
+            return hint_cns
+
         # We don't care about the size hint constraints for a container
         # which manages a layout because the actual size is the input
         # to the solver.
@@ -324,10 +405,10 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
                     # don't care about any of the container's internal 
                     # constraints.
                     cns_extend(expand(child, child.hard_constraints()))
-                    cns_extend(expand(child, child.size_hint_constraints()))
+                    cns_extend(size_hint_constraints(child))
             else:
                 cns_extend(expand(child, child.hard_constraints()))
-                cns_extend(expand(child, child.size_hint_constraints()))
+                cns_extend(size_hint_constraints(child))
                 cns_extend(expand(child, child.user_constraints()))
                 cns_extend(expand(child, child.component_constraints()))
                 if isinstance(child, PaddingConstraints):
@@ -335,6 +416,103 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
                     
         return cns
 
+    def initialize_box_layout(self):
+        """ Initializes the box layout of the container if its children
+        are arranged by a pure tree of box helpers.
+
+        Returns
+        -------
+        result : bool
+            True if the box layout was initialized, False if the layout
+            must be managed by the solver.
+
+        """
+        root = self.compute_box_tree()
+        if root is None:
+            self._box_layout = None
+            return False
+        box_layout = BoxLayout()
+        box_layout.initialize(root, self.compute_padding())
+        self._box_layout = box_layout
+        return True
+
+    def compute_box_tree(self):
+        """ Computes the box tree of the container for a BoxLayout.
+
+        The tree can only be computed when the only constraints of the
+        container are a single hbox or vbox helper of the children,
+        with nested hbox and vbox helpers but without spacers, and with
+        required padding. Every visible child must appear once in the
+        tree, and must only be constrained by its size hint, so a child
+        which shares the layout of the container is not allowed.
+
+        Returns
+        -------
+        result : BoxGroup or None
+            The root of the box tree, or None if the constraints of the
+            container are not a pure tree of box helpers.
+
+        """
+        if self.component_constraints():
+            return None
+        cns = [cn for cn in self.user_constraints() if cn is not None]
+        if len(cns) != 1 or not isinstance(cns[0], LinearBoxHelper):
+            return None
+        strengths = self.padding_strength
+        if isinstance(strengths, basestring):
+            strengths = (strengths,)
+        if any(strength != 'required' for strength in strengths):
+            return None
+
+        children = set(self.constraints_children)
+        placed = set()
+
+        def box_item(child):
+            if child not in children or child in placed:
+                return None
+            if not isinstance(child, ConstraintsWidget):
+                return None
+            if isinstance(child, Container):
+                if child.share_layout:
+                    return None
+            elif child.user_constraints() or child.component_constraints():
+                return None
+            placed.add(child)
+            hint = child.size_hint()
+            return BoxItem(child, hint, child.hug, child.resist_clip)
+
+        def box_group(helper):
+            if (helper.default_strength is not None or
+                helper.default_weight is not None):
+                return None
+            items = [item for item in helper.items if item is not None]
+            if helper.clear_invisible:
+                items = clear_invisible(items)
+            if not items:
+                return None
+            nodes = []
+            for item in items:
+                if isinstance(item, LinearBoxHelper):
+                    node = box_group(item)
+                else:
+                    node = box_item(item)
+                if node is None:
+                    return None
+                nodes.append(node)
+            return BoxGroup(
+                helper.orientation, nodes, helper.spacing, helper.margins,
+            )
+
+        root = box_group(cns[0])
+        if root is None:
+            return None
+        # A visible child outside of the tree would be positioned by its
+        # size hint constraints alone.
+        for child in children - placed:
+            if child.visible:
+                return None
+        return root
+
     def default_user_constraints(self):
         """ Constraints to use if the constraints trait is an empty list.
         The default container behavior is to put the layout children into
@@ -402,7 +580,10 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         then this method will return (-1, -1).
 
         """
-        if self.owns_layout and self.layout_manager.initialized:
+        if self.owns_layout and self._box_layout is not None:
+            w, h = self._box_layout.get_min_size()
+            res = Size(int(round(w)), int(round(h)))
+        elif self.owns_layout and self.layout_manager.initialized:
             width = self.width
             height = self.height
             w, h = self.layout_manager.get_min_size(width, height)
@@ -418,7 +599,10 @@ class Container(LayoutTaskHandler, PaddingConstraints, ConstraintsWidget):
         then this method will return (-1, -1).
 
         """
-        if self.owns_layout and self.layout_manager.initialized:
+        if self.owns_layout and self._box_layout is not None:
+            w, h = self._box_layout.get_max_size()
+            res = Size(int(round(w)), int(round(h)))
+        elif self.owns_layout and self.layout_manager.initialized:
             width = self.width
             height = self.height
             w, h = self.layout_manager.get_max_size(width, height)
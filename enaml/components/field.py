@@ -5,7 +5,7 @@
 from abc import abstractmethod
 
 from traits.api import (
-    Bool, Int, Unicode, Enum, Instance, Any, List, on_trait_change,
+    Bool, Int, Unicode, Enum, Instance, Any, List,
 )
 
 from .control import Control, AbstractTkControl
@@ -594,10 +594,21 @@ class Field(Control):
         
         return res
 
-    @on_trait_change('value, validator')
+    def _value_changed(self):
+        """ The change handler for the 'value' attribute.
+
+        """
+        self._update_text_from_value()
+
+    def _validator_changed(self):
+        """ The change handler for the 'validator' attribute.
+
+        """
+        self._update_text_from_value()
+
     def _update_text_from_value(self):
-        """ A change handler which updates the displayed text whenever
-        the 'value' or the 'validator' attributes change.
+        """ Updates the displayed text whenever the 'value' or the
+        'validator' attributes change.
 
         """
         if not guard.guarded(self, 'submitting'):
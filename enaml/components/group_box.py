@@ -72,25 +72,12 @@ class GroupBox(Container):
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkGroupBox)
 
-    def padding_constraints(self):
-        """ Overriden padding constraints method to add the contents 
-        margins of the underlying group box to the specified user 
-        padding.
+    def compute_padding(self):
+        """ Overriden padding method to add the contents margins of the
+        underlying group box to the specified user padding.
 
         """
-        cns = []
         margin_box = self.abstract_obj.get_contents_margins()
         user_padding = self.padding
-        padding = map(sum, zip(margin_box, user_padding))
-        tags = ('top', 'right', 'bottom', 'left')
-        strengths = self.padding_strength
-        if isinstance(strengths, basestring):
-            strengths = (strengths,) * 4
-        for tag, strength, padding in zip(tags, strengths, padding):
-            tag = 'padding_' + tag
-            sym = getattr(self, tag)
-            cns.append(sym >= 0)
-            if strength != 'ignore':
-                cns.append((sym == padding) | strength)
-        return cns
+        return Box(*map(sum, zip(margin_box, user_padding)))
 
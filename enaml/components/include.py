@@ -2,9 +2,11 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import List, Instance, Either, Bool, Property, cached_property
+from traits.api import (
+    List, Instance, Either, Bool, Property, Callable, cached_property,
+)
 
-from ..core.base_component import BaseComponent
+from ..core.base_component import BaseComponent, setup_components
 
 
 class Include(BaseComponent):
@@ -29,6 +31,19 @@ class Include(BaseComponent):
         depends_on='_components',
     )
     
+    #: An optional callable which returns the key of a dynamic component.
+    #: When the components change, an old component with the same key
+    #: as a new component is kept in its place, as is, and only the 
+    #: components which were added or removed are setup or released.
+    #: The kept component is not updated from the new component, so any
+    #: attribute other than the key which differs on the new component
+    #: is silently dropped along with it. By default, the components are
+    #: matched by identity, so a binding which builds new components on
+    #: every change, such as 'components << [Row(item=x) for x in items]',
+    #: rebuilds every row. Such a binding needs a key which identifies
+    #: the rows by their data, such as 'lambda row: row.item'.
+    component_key = Callable
+
     #: A private attribute which stores the underlying list of created
     #: components. This list should not be manipulated by user code.
     _components = List(Instance(BaseComponent))
@@ -56,6 +71,8 @@ class Include(BaseComponent):
         """
         if isinstance(val, BaseComponent):
             val = [val]
+        if self._components_initialized:
+            val = self._reconcile_components(val)
         self._components = val
     
     def _get_toolkit_widget(self):
@@ -85,11 +102,18 @@ class Include(BaseComponent):
         )
         self._actual_updated()
 
-    def _setup_components(self):
+    def _setup_components(self, cmpnts=None):
         """ An internal method used to setup the dynamic child components.
 
+        Parameters
+        ----------
+        cmpnts : list of BaseComponent, optional
+            The dynamic components to setup. The default is to setup
+            all of the dynamic components.
+
         """
-        cmpnts = self.components
+        if cmpnts is None:
+            cmpnts = self.components
         if not cmpnts:
             return
 
@@ -106,46 +130,53 @@ class Include(BaseComponent):
         except AttributeError:
             toolkit_parent = None
 
-        # The following blocks perform roughly the same setup process
-        # as BaseComponent.setup(), except that we don't need to perform
-        # the setup for this Include instance (since it's already setup).
-        # Also, since we don't need to recurse into any children (an
-        # Include can't have children), there is no need to break these
-        # blocks out into separate methods.
-
         # Need to explicitly assign the parent to the components 
         # since they were not added via the add_subcomponent method.
         for child in cmpnts:
             child.parent = self
-        
-        for child in cmpnts:
-            child._setup_create_widgets(toolkit_parent)
-            
-        for child in cmpnts:
-            child._setup_init_widgets()
-
-        for child in cmpnts:
-            child._setup_eval_expressions()
-
-        for child in cmpnts:
-            child._setup_bind_widgets()
-                
-        for child in cmpnts:
-            child._setup_listeners()
 
+        # The components are setup with the same process as used by 
+        # BaseComponent.setup(), except that we don't need to perform
+        # the setup for this Include instance (since it's already setup).
+        # Components reused from the pool of their factory are already
+        # setup, so their widgets only need to be attached.
+        new = []
         for child in cmpnts:
-            child._setup_init_visibility()
+            if child.initialized:
+                child._attach_widgets(toolkit_parent)
+            else:
+                new.append(child)
+        setup_components(new, toolkit_parent)
 
-        for child in cmpnts:
-            child._setup_init_layout()
+        self._components_initialized = True
 
-        for child in cmpnts:
-            child._setup_finalize()
+    #--------------------------------------------------------------------------
+    # Reconciliation
+    #--------------------------------------------------------------------------
+    def _reconcile_components(self, cmpnts):
+        """ Returns the list of components which replaces the current 
+        dynamic components when the given components are assigned. 
 
-        for child in cmpnts:
-            child._setup_set_initialized()
+        Each new component which has the same key as a current component
+        is replaced by that component, in the order of the new list. The
+        replaced component has never been setup and is released.
 
-        self._components_initialized = True
+        """
+        key = self.component_key or id
+        current = {}
+        for cmpnt in self._components:
+            current.setdefault(key(cmpnt), []).append(cmpnt)
+        res = []
+        for cmpnt in cmpnts:
+            matches = current.get(key(cmpnt))
+            if matches:
+                old = matches.pop(0)
+                if old is not cmpnt:
+                    cmpnt.release()
+                res.append(old)
+            else:
+                res.append(cmpnt)
+        return res
 
     #--------------------------------------------------------------------------
     # Parent Class Overrides 
@@ -159,6 +190,16 @@ class Include(BaseComponent):
                "or a list components to the 'components' attribute instead.")
         raise ValueError(msg)
 
+    def request_size_hint_update(self, component):
+        """ A reimplemented parent class method which proxies the call
+        to the parent, since the dynamic children of this Include are
+        laid out by the parent.
+
+        """
+        parent = self.parent
+        if parent is not None:
+            parent.request_size_hint_update(component)
+
     def get_actual(self):
         """ A reimplemented parent class method to include the dynamic
         children of this Include in our parent's list of children.
@@ -171,21 +212,21 @@ class Include(BaseComponent):
         return res
 
     def destroy(self):
-        """ A re-implemented parent class method which destroys all of
+        """ A re-implemented parent class method which releases all of
         the underlying dynamic children.
 
         """
         super(Include, self).destroy()
         for item in self.components:
-            item.destroy()
+            item.release()
 
     #--------------------------------------------------------------------------
     # Change Handlers 
     #--------------------------------------------------------------------------
     def _components_changed(self, name, old, new):
         """ Reacts to changes in the dynamic components and sets up the 
-        new children, making sure the old ones are destroyed and that 
-        the '_actual_updated' event gets fired.
+        added children, making sure the removed ones are released and 
+        that the '_actual_updated' event gets fired once.
 
         """
         # The first time a cached property is set, the notification
@@ -195,10 +236,14 @@ class Include(BaseComponent):
         # that condition as well a making sure the object is fully
         # initialized before destroying any of the old children.
         if self.initialized and old is not None:
+            old_ids = set(id(item) for item in old)
+            new_ids = set(id(item) for item in new)
+            added = [item for item in new if id(item) not in old_ids]
+            removed = [item for item in old if id(item) not in new_ids]
             def closure():
-                for item in old:
-                    item.destroy()
-                self._setup_components()
+                for item in removed:
+                    item.release()
+                self._setup_components(added)
                 self._actual_updated()
             self.request_relayout_task(closure)
             
@@ -43,6 +43,16 @@ class Inline(BaseComponent):
         """
         return sum([c.get_actual() for c in self._subcomponents], [])
 
+    def request_size_hint_update(self, component):
+        """ A reimplemented parent class method which proxies the call
+        to the parent, since the inlined children of this component are
+        laid out by the parent.
+
+        """
+        parent = self.parent
+        if parent is not None:
+            parent.request_size_hint_update(component)
+
     #--------------------------------------------------------------------------
     # Change Handlers
     #--------------------------------------------------------------------------
@@ -16,7 +16,7 @@ from .container import Container
 from .layout_task_handler import LayoutTaskHandler
 from .widget_component import WidgetComponent
 
-from ..layout.geometry import Size
+from ..layout.geometry import Rect, Size
 
 
 #: Enum trait describing the scrollbar policies that can be assigned to 
@@ -88,6 +88,12 @@ class ScrollArea(LayoutTaskHandler, ConstraintsWidget):
     #: areas do not hug their height and are free to expand.
     hug_height = 'ignore'
 
+    #: The (x, y, width, height) rect of the scrolled component which is
+    #: currently visible in the viewport of the scroll area. This is
+    #: updated by the toolkit widget as the area is scrolled or resized
+    #: and should not be modified by user code.
+    visible_rect = Instance(Rect, (0, 0, 0, 0))
+
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkScrollArea)
 
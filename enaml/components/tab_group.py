@@ -14,6 +14,7 @@ from .constraints_widget import (
 from .layout_task_handler import LayoutTaskHandler
 from .tab import Tab
 
+from ..core.base_component import update_shown_components
 from ..enums import TabPosition
 
 
@@ -87,6 +88,9 @@ class TabGroup(LayoutTaskHandler, ConstraintsWidget):
 
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkTabGroup)
+
+    #: Overridden parent class attribute
+    _hiding_attributes = ('visible', '_selected_index')
     
     #--------------------------------------------------------------------------
     # Property Getters
@@ -136,9 +140,26 @@ class TabGroup(LayoutTaskHandler, ConstraintsWidget):
         if self.initialized:
             self.request_relayout()
 
+    @on_trait_change('_selected_index, tabs')
+    def _on_selected_tab_changed(self):
+        """ A change handler which applies the updates deferred by the
+        components of the newly selected tab while it was hidden.
+
+        """
+        update_shown_components()
+
     #--------------------------------------------------------------------------
     # Overrides
     #--------------------------------------------------------------------------
+    def hides(self, component):
+        """ A reimplemented parent class method which reports that the
+        tabs which are not selected are hidden.
+
+        """
+        if isinstance(component, Tab) and component is not self.selected_tab:
+            return True
+        return super(TabGroup, self).hides(component)
+
     def do_relayout(self):
         """ A reimplemented LayoutTaskHandler handler method which will
         perform necessary update activity when a relayout is requested.
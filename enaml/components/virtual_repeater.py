@@ -0,0 +1,294 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from itertools import chain
+
+from traits.api import Any, Callable, Instance, Int, List, Tuple
+
+from .container import AbstractTkContainer, Container
+from .include import Include
+from .scroll_area import ScrollArea
+from .widget_component import WidgetComponent
+
+from ..layout.geometry import Rect
+
+
+def visible_range(top, height, row_height, overscan, count):
+    """ Computes the range of rows which intersect a viewport.
+
+    Parameters
+    ----------
+    top : int
+        The offset of the top of the viewport from the top of the first
+        row.
+
+    height : int
+        The height of the viewport.
+
+    row_height : int
+        The height of a row.
+
+    overscan : int
+        The number of extra rows to include on either side of the rows
+        which intersect the viewport.
+
+    count : int
+        The total number of rows.
+
+    Returns
+    -------
+    result : (first, last)
+        The index of the first row in the range and the index one past
+        the last row in the range.
+
+    """
+    row_height = max(row_height, 1)
+    first = max(0, top // row_height - overscan)
+    last = min(count, (top + max(height, 0)) // row_height + 1 + overscan)
+    return first, max(first, last)
+
+
+class AbstractTkVirtualRepeater(AbstractTkContainer):
+    """ The abstract toolkit VirtualRepeater interface.
+
+    """
+    pass
+
+
+class VirtualRepeater(Container):
+    """ A Container subclass which repeats a row component for each item
+    of a sequence, but only creates the rows which are visible in the
+    viewport of the nearest ancestor ScrollArea.
+
+    The rows are created by calling the 'factory' and are dynamically
+    included into the repeater with an internal Include. The rows are
+    laid out top to bottom with a fixed 'row_height' and the repeater
+    is given the height of all of the rows, so that the scroll area can
+    scroll over the full extent of the items. As the area is scrolled,
+    the rows which leave the viewport are recycled for the rows which
+    enter it by assigning a new value to their 'item' attribute, so
+    that only the visible rows are ever seen by the layout solver.
+
+    """
+    #: The list of items to repeat. The rows are updated when the list
+    #: is replaced or changed in place.
+    items = List(Any)
+
+    #: A callable which takes no arguments and returns a new row
+    #: component. The row component must have an 'item' attribute
+    #: which is assigned the item it displays. An enamldef with an
+    #: 'attr item' declaration is a typical factory.
+    factory = Callable
+
+    #: The fixed height of a row, in pixels.
+    row_height = Int(24)
+
+    #: The number of extra rows which are created above and below the
+    #: viewport, so that small scrolls do not require new rows.
+    overscan = Int(5)
+
+    #: Overridden parent class trait.
+    abstract_obj = Instance(AbstractTkVirtualRepeater)
+
+    #: A private Include which holds the rows which are realized.
+    _include = Instance(Include, ())
+
+    #: A private list of the realized rows, in the order of their items.
+    _rows = List
+
+    #: A private tuple of the (first, last, count) range of the items
+    #: which are displayed by the realized rows.
+    _window = Tuple
+
+    #: A private reference to the scroll area whose viewport determines
+    #: the rows which are realized.
+    _scroll_area = Instance(ScrollArea)
+
+    def __init__(self, **traits):
+        super(VirtualRepeater, self).__init__(**traits)
+        self.add_subcomponent(self._include)
+
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def _setup_create_widgets(self, parent):
+        """ A reimplemented parent class setup method which starts
+        tracking the viewport of the nearest ancestor scroll area and
+        realizes the initial rows. The rows are setup along with the
+        internal Include.
+
+        """
+        super(VirtualRepeater, self)._setup_create_widgets(parent)
+        for cmpnt in self.traverse_ancestors():
+            if isinstance(cmpnt, ScrollArea):
+                self._scroll_area = cmpnt
+                cmpnt.on_trait_change(self.update_rows, 'visible_rect')
+                break
+        self.update_rows()
+
+    def _setup_finalize(self):
+        """ A reimplemented parent class setup method which updates the
+        rows once the layout of the repeater has been initialized.
+
+        """
+        super(VirtualRepeater, self)._setup_finalize()
+        self.update_rows()
+
+    def destroy(self):
+        """ A reimplemented parent class method which stops tracking the
+        viewport of the scroll area.
+
+        """
+        area = self._scroll_area
+        if area is not None:
+            area.on_trait_change(self.update_rows, 'visible_rect', remove=True)
+            self._scroll_area = None
+        super(VirtualRepeater, self).destroy()
+        del self._rows[:]
+
+    #--------------------------------------------------------------------------
+    # Change Handlers
+    #--------------------------------------------------------------------------
+    def _items_changed(self):
+        """ Updates the items of the realized rows when the sequence of
+        items is replaced.
+
+        """
+        self._window = ()
+        self.update_rows()
+
+    def _items_items_changed(self):
+        """ Updates the items of the realized rows when the list of
+        items is changed in place.
+
+        """
+        self._window = ()
+        self.update_rows()
+
+    def _row_height_changed(self):
+        """ Updates the realized rows when the row height changes.
+
+        """
+        self.update_rows()
+
+    def _overscan_changed(self):
+        """ Updates the realized rows when the overscan changes.
+
+        """
+        self.update_rows()
+
+    #--------------------------------------------------------------------------
+    # Row Management
+    #--------------------------------------------------------------------------
+    def viewport(self):
+        """ Returns the Rect of this component which is visible in the
+        viewport of the scroll area, or None if the repeater is not in
+        a scroll area.
+
+        """
+        area = self._scroll_area
+        if area is None:
+            return None
+        x, y, width, height = area.visible_rect
+        # The visible rect is relative to the scrolled component, so the
+        # offsets of the components between it and the repeater are
+        # removed to bring the rect into the repeater's coordinates.
+        scrolled = area.scrolled_component
+        for cmpnt in chain([self], self.traverse_ancestors(area)):
+            if cmpnt is scrolled:
+                break
+            if isinstance(cmpnt, WidgetComponent):
+                dx, dy = cmpnt.pos()
+                x -= dx
+                y -= dy
+        return Rect(x, y, width, height)
+
+    def update_rows(self):
+        """ Realizes the rows for the items which are in the viewport.
+
+        The rows of items which leave the viewport are recycled for the
+        items which enter it. New rows are only created when there are
+        not enough rows to recycle, and the extra rows are destroyed.
+
+        """
+        if self.factory is None:
+            return
+        items = self.items
+        count = len(items)
+        viewport = self.viewport()
+        if viewport is None:
+            first, last = 0, count
+        else:
+            first, last = visible_range(
+                viewport.y, viewport.height, self.row_height,
+                self.overscan, count,
+            )
+        if self._window == (first, last, count):
+            return
+
+        # Keep the rows of the items which remain in the window and
+        # collect the others to be recycled.
+        old_rows = self._rows
+        old_first = self._window[0] if self._window else 0
+        kept = {}
+        spare = []
+        for idx, row in enumerate(old_rows, old_first):
+            if self._window and first <= idx < last:
+                kept[idx] = row
+            else:
+                spare.append(row)
+
+        rows = []
+        spare = iter(spare)
+        for idx in xrange(first, last):
+            row = kept.get(idx)
+            if row is None:
+                row = next(spare, None)
+                if row is None:
+                    row = self._create_row()
+                row.item = items[idx]
+            rows.append(row)
+
+        self._rows = rows
+        self._window = (first, last, count)
+        self._include.components = rows
+        if self.initialized:
+            self.request_relayout()
+
+    def _create_row(self):
+        """ Creates a new row with the factory, inside the toolkit of
+        the repeater if it has one.
+
+        """
+        toolkit = self.toolkit
+        if toolkit is None:
+            return self.factory()
+        with toolkit:
+            return self.factory()
+
+    #--------------------------------------------------------------------------
+    # Constraints Computation
+    #--------------------------------------------------------------------------
+    def default_user_constraints(self):
+        """ Stacks the realized rows at the offsets of their items and
+        makes the repeater as tall as all of the rows.
+
+        """
+        if not self._window:
+            return []
+        first, last, count = self._window
+        row_height = self.row_height
+        top = self.contents_top
+        cns = [self.contents_bottom == top + count * row_height]
+        rows = set(self.constraints_children)
+        for idx, row in enumerate(self._rows, first):
+            if row not in rows:
+                continue
+            cns.extend([
+                row.top == top + idx * row_height,
+                row.height == row_height,
+                row.left == self.contents_left,
+                row.right == self.contents_right,
+            ])
+        return cns
@@ -10,6 +10,7 @@ from .base_widget_component import (
     BaseWidgetComponent, AbstractTkBaseWidgetComponent,
 )
 
+from ..core.base_component import update_shown_components
 from ..core.trait_types import EnamlEvent
 from ..guard import guard
 from ..styling.color import ColorTrait
@@ -287,6 +288,9 @@ class WidgetComponent(BaseWidgetComponent):
     #: Overridden parent class trait
     abstract_obj = Instance(AbstractTkWidgetComponent) 
 
+    #: Overridden parent class attribute
+    _hiding_attributes = ('visible',)
+
     #--------------------------------------------------------------------------
     # Property Getters
     #--------------------------------------------------------------------------
@@ -319,11 +323,13 @@ class WidgetComponent(BaseWidgetComponent):
         # of the framework which are not dependent on change notification.
         # By using the method here, we help to ensure a consistent state.
         self.set_visible(visible)
+        if visible:
+            update_shown_components()
 
     def _size_hint_updated_changed(self):
-        """ A change handler which requests a relayout from its *parent*
-        when its size hint has updated, provided that the component is
-        initialized.
+        """ A change handler which requests a size hint update from its
+        *parent* when its size hint has updated, provided that the
+        component is initialized.
 
         Note that it is critical that the request be made to the parent,
         since a given component has no use for its size hint in its 
@@ -333,7 +339,39 @@ class WidgetComponent(BaseWidgetComponent):
         if self.initialized:
             parent = self.parent
             if parent is not None:
-                parent.request_relayout()
+                parent.request_size_hint_update(self)
+
+    #--------------------------------------------------------------------------
+    # Visibility Methods
+    #--------------------------------------------------------------------------
+    def hides(self, component):
+        """ A reimplemented parent class method which reports that the
+        component hides itself when it is not visible.
+
+        """
+        if component is self and not self.visible:
+            return True
+        return super(WidgetComponent, self).hides(component)
+
+    #--------------------------------------------------------------------------
+    # Pooling Methods
+    #--------------------------------------------------------------------------
+    def _detach_widgets(self):
+        """ A reimplemented parent class method which hides the toolkit
+        widget before it is detached.
+
+        """
+        self.abstract_obj.set_visible(False)
+        super(WidgetComponent, self)._detach_widgets()
+
+    def _attach_widgets(self, parent):
+        """ A reimplemented parent class method which shows the toolkit
+        widget once it is attached, if the component is visible.
+
+        """
+        super(WidgetComponent, self)._attach_widgets(parent)
+        if self.visible:
+            self.abstract_obj.set_visible(True)
 
     #--------------------------------------------------------------------------
     # Geometry Methods
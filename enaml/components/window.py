@@ -183,6 +183,20 @@ class Window(LayoutTaskHandler, WidgetComponent):
         if not visible or self.initialized:
             self.abstract_obj.set_visible(visible)
 
+    def _detach_widgets(self):
+        """ A reimplemented parent class method which hides the window
+        when it is parked. A window has no parent widget to leave.
+
+        """
+        self.hide()
+
+    def _attach_widgets(self, parent):
+        """ A reimplemented parent class method which does nothing. A
+        reused window is shown by calling its 'show' method.
+
+        """
+        pass
+
     #--------------------------------------------------------------------------
     # Change Handlers
     #--------------------------------------------------------------------------
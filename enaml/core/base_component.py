@@ -3,19 +3,313 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from collections import deque
+from itertools import chain
+from weakref import WeakSet
 
 from traits.api import (
-    Bool, HasStrictTraits, Instance, List, Property, Str, WeakRef, Dict, 
-    Disallow,
+    Bool, HasStrictTraits, Instance, List, Property, Str, WeakRef, Disallow,
+    Tuple, Any, Int,
 )
 
-from .expressions import AbstractExpression
+from .expressions import invalidate_name_caches
+from .propagation import (
+    invalidate_ranks, defer_update, begin_propagation, end_propagation,
+)
 from .toolkit import Toolkit
 from .trait_types import (
     EnamlEvent, LazyProperty, UserAttribute, UserEvent, ExpressionTrait,
+    SharedDict, EMPTY_DICT,
 )
 
 
+#------------------------------------------------------------------------------
+# Hidden Updates
+#------------------------------------------------------------------------------
+#: The components which hold updates that were deferred while they were
+#: hidden. They are checked by 'flush_hidden_updates'.
+_hidden_dirty = WeakSet()
+
+
+def flush_hidden_updates():
+    """ Applies the deferred updates of the components which are no
+    longer hidden. This should be called whenever a component may have
+    been shown, such as when a widget becomes visible or the selected
+    tab of a tab group changes.
+
+    """
+    if not _hidden_dirty:
+        return
+    begin_propagation()
+    try:
+        for cmpnt in list(_hidden_dirty):
+            if not cmpnt.is_hidden():
+                _hidden_dirty.discard(cmpnt)
+                cmpnt._apply_hidden_updates()
+    finally:
+        end_propagation()
+
+
+#------------------------------------------------------------------------------
+# Lazy Realization
+#------------------------------------------------------------------------------
+#: The components whose subcomponents were not setup because they were
+#: hidden at setup time. They are checked by 'realize_shown_components'.
+_unrealized = WeakSet()
+
+
+def realize_shown_components():
+    """ Sets up the deferred subcomponents of the components which are
+    no longer hidden. 
+
+    """
+    if not _unrealized:
+        return
+    for cmpnt in list(_unrealized):
+        # A component which is still being setup is checked at the end
+        # of its setup, once its bound expressions are evaluated.
+        if not cmpnt.initialized:
+            continue
+        if cmpnt in _unrealized and not cmpnt.is_hidden():
+            _unrealized.discard(cmpnt)
+            cmpnt._realize_children()
+
+
+def update_shown_components():
+    """ Realizes the deferred subtrees and applies the deferred updates
+    of the components which are no longer hidden. This should only be
+    called by the handlers which may show a component, such as when a
+    widget becomes visible or the selected tab of a tab group changes.
+    A component which is moved to a new parent only checks its own
+    subtree with 'update_shown_subtree'.
+
+    """
+    realize_shown_components()
+    flush_hidden_updates()
+
+
+def update_shown_subtree(root):
+    """ Realizes the deferred subtrees and applies the deferred updates
+    of the components in the subtree of the given component which are
+    no longer hidden. Unlike 'update_shown_components', it only checks
+    the components of the subtree, so it is used when the subtree may
+    have been shown by being moved to a new parent. A subtree which
+    is not yet setup is skipped, since the setup checks its visibility.
+
+    """
+    if not root.initialized or not (_unrealized or _hidden_dirty):
+        return
+    pending = [
+        cmpnt for cmpnt in root.traverse()
+        if cmpnt._children_deferred or cmpnt in _hidden_dirty
+    ]
+    if not pending:
+        return
+    for cmpnt in pending:
+        if cmpnt in _unrealized and not cmpnt.is_hidden():
+            _unrealized.discard(cmpnt)
+            cmpnt._realize_children()
+    begin_propagation()
+    try:
+        for cmpnt in pending:
+            if cmpnt in _hidden_dirty and not cmpnt.is_hidden():
+                _hidden_dirty.discard(cmpnt)
+                cmpnt._apply_hidden_updates()
+    finally:
+        end_propagation()
+
+
+#------------------------------------------------------------------------------
+# Name Index
+#------------------------------------------------------------------------------
+#: The index of the named components, which maps a name to the WeakSet
+#: of the components which were given that name. It is used by the
+#: 'find_by_name' and 'find_all_by_name' methods, which check that the
+#: indexed components are in the subtree being searched.
+_name_index = {}
+
+
+def _index_name(cmpnt, old, new):
+    """ Moves a component from its old name to its new name in the name
+    index. An empty name is not indexed.
+
+    """
+    if old:
+        named = _name_index.get(old)
+        if named is not None:
+            named.discard(cmpnt)
+            if not named:
+                del _name_index[old]
+    if new:
+        named = _name_index.get(new)
+        if named is None:
+            named = _name_index[new] = WeakSet()
+        named.add(cmpnt)
+
+
+#------------------------------------------------------------------------------
+# Setup Driver
+#------------------------------------------------------------------------------
+def _hidden_at_setup(cmpnt, parent):
+    """ Returns whether a component may be hidden at setup time, before
+    its bound expressions are evaluated.
+
+    An attribute listed in the '_hiding_attributes' of the component or
+    of its parent which is bound to an expression is not evaluated here,
+    since its expression would be evaluated ahead of the setup of the
+    tree. The component is then assumed to be hidden, and the deferral
+    is confirmed by 'setup_components' once the expressions of the tree
+    have been evaluated. Otherwise, the 'hides' method only reads the
+    static values of the attributes.
+
+    """
+    for owner in (cmpnt, parent):
+        expressions = owner._expressions
+        if expressions:
+            for name in owner._hiding_attributes:
+                if name in expressions:
+                    return True
+    return cmpnt.hides(cmpnt) or parent.hides(cmpnt)
+
+
+def _flatten_subtrees(roots):
+    """ Flattens the subtrees of the given components without recursion.
+
+    Parameters
+    ----------
+    roots : list of BaseComponent
+        The roots of the subtrees to flatten.
+
+    Returns
+    -------
+    result : (preorder, postorder, parents, deferred)
+        The lists of the components in pre-order and in post-order, the
+        list of the index in the pre-order list of the parent of each
+        component in the pre-order list, or -1 for a root, and the list
+        of the components whose subcomponents were deferred.
+
+    """
+    preorder = []
+    postorder = []
+    parents = []
+    deferred = []
+    stack = []
+    for root in reversed(roots):
+        lazy = any(a.lazy_realization for a in root.traverse_ancestors())
+        stack.append((root, -1, False, lazy))
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        cmpnt, parent_idx, visited, lazy = pop()
+        if visited:
+            postorder.append(cmpnt)
+            continue
+        idx = len(preorder)
+        preorder.append(cmpnt)
+        parents.append(parent_idx)
+        push((cmpnt, parent_idx, True, lazy))
+        subcomponents = cmpnt._subcomponents
+        if not subcomponents:
+            continue
+
+        # In the lazy realization mode, the subtree of a component 
+        # which is hidden is not setup until the component is shown.
+        # A component without a parent, such as a top-level window, is
+        # always setup since it is about to be shown.
+        lazy = lazy or cmpnt.lazy_realization
+        if lazy:
+            parent = cmpnt.parent
+            if parent is not None and _hidden_at_setup(cmpnt, parent):
+                cmpnt._children_deferred = True
+                _unrealized.add(cmpnt)
+                deferred.append(cmpnt)
+                continue
+
+        for child in reversed(subcomponents):
+            push((child, idx, False, lazy))
+    return preorder, postorder, parents, deferred
+
+
+def setup_components(components, parent=None):
+    """ Runs the setup process described in BaseComponent.setup for 
+    the subtrees of the given components.
+
+    The subtrees are flattened once, and each setup step is run in turn
+    over the flattened list, calling the setup method of the step once
+    for every component. The steps which create and initialize the 
+    widgets, evaluate the expressions, bind the widgets, add the
+    listeners and initialize the visibility are run top-down, and the
+    steps which initialize the layout, finalize the components and mark
+    them as initialized are run bottom-up.
+
+    If the 'lazy_realization' attribute of a component or one of its
+    ancestors is True, the subtree of a component which is hidden at
+    setup time is not setup until the component is shown. Whether a
+    component whose visibility is bound to an expression is hidden is
+    decided once the expressions of the tree have been evaluated.
+
+    Parameters
+    ----------
+    components : list of BaseComponent
+        The roots of the subtrees to setup.
+
+    parent : native toolkit widget, optional
+        The toolkit widget which is the parent of the toolkit widgets
+        of the given components.
+
+    """
+    preorder, postorder, parents, deferred = _flatten_subtrees(components)
+
+    # The children of a widget component are created in its toolkit
+    # widget. The children of any other component are created in the 
+    # same toolkit widget as the component itself.
+    widgets = []
+    for cmpnt, parent_idx in zip(preorder, parents):
+        widget = parent if parent_idx == -1 else widgets[parent_idx]
+        cmpnt._setup_create_widgets(widget)
+        widgets.append(getattr(cmpnt, 'toolkit_widget', widget))
+
+    for cmpnt in preorder:
+        cmpnt._setup_init_widgets()
+
+    for cmpnt in preorder:
+        cmpnt._setup_eval_expressions()
+
+    for cmpnt in preorder:
+        cmpnt._setup_bind_widgets()
+
+    for cmpnt in preorder:
+        cmpnt._setup_listeners()
+
+    for cmpnt in preorder:
+        cmpnt._setup_init_visibility()
+
+    for cmpnt in postorder:
+        cmpnt._setup_init_layout()
+
+    for cmpnt in postorder:
+        cmpnt._setup_finalize()
+
+    for cmpnt in postorder:
+        cmpnt._setup_set_initialized()
+
+    # The deferred subtrees of the components which turned out to be
+    # shown once their expressions were evaluated are setup now.
+    for cmpnt in deferred:
+        if cmpnt in _unrealized and not cmpnt.is_hidden():
+            _unrealized.discard(cmpnt)
+            cmpnt._realize_children()
+
+
+#------------------------------------------------------------------------------
+# User Attributes
+#------------------------------------------------------------------------------
+#: The prototype ctraits of the user attributes, keyed on the attribute
+#: type and whether the attribute is an event. A trait is cloned when it
+#: is added to an object, so a prototype can be shared by the attributes
+#: of every component declared with the same type.
+_attribute_traits = {}
+
+
 class BaseComponent(HasStrictTraits):
     """ The most base class of the Enaml component hierarchy.
 
@@ -31,7 +325,7 @@ class BaseComponent(HasStrictTraits):
     #: The parent component of this component. It is stored as a weakref
     #: to mitigate issues with reference cycles. A top-level component's
     #: parent is None.
-    parent = WeakRef('BaseComponent')
+    parent = WeakRef('BaseComponent', allow_none=True)
 
     #: The list of children for this component. This is a read-only
     #: lazy property that is computed based on the static list of
@@ -40,9 +334,14 @@ class BaseComponent(HasStrictTraits):
     #: user code.
     children = LazyProperty(
         List(Instance('BaseComponent')), 
-        depends_on='_subcomponents:_actual_updated',
+        depends_on='_subcomponents:_actual_updated, _children_deferred',
     )
 
+    #: A private read-only lazy property which maps each child of this
+    #: component to its index in the list of children. It is used by the
+    #: name index lookups to find the position of a child in one step.
+    _child_positions = LazyProperty(Instance(dict), depends_on='children')
+
     #: Whether the component has been initialized or not. This will be 
     #: set to True after all of the setup() steps defined here are 
     #: completed. It should not be changed afterwards. This can be used 
@@ -57,17 +356,70 @@ class BaseComponent(HasStrictTraits):
     #: A reference to the toolkit that was used to create this object.
     toolkit = Instance(Toolkit)
 
+    #: Whether the updates of the attributes bound to this component
+    #: are deferred while it is hidden. A component is hidden when it,
+    #: or one of its ancestors, hides it (see the 'hides' method). The
+    #: deferred updates of an attribute are coalesced into a single 
+    #: update which is applied when the component is shown again.
+    pause_hidden_updates = Bool(False)
+
+    #: Whether the setup of the subtrees which are hidden at setup time
+    #: is deferred until they are first shown. It applies to the whole
+    #: subtree of the component. The subcomponents of a hidden component
+    #: are not included in its children until they have been setup.
+    lazy_realization = Bool(False)
+
     #: The private dictionary of expression objects that are bound to 
     #: attributes on this component. It should not be manipulated by
     #: user code. Rather, expressions should be bound by calling the 
-    #: 'bind_expression' method.
-    _expressions = Dict(Str, List(Instance(AbstractExpression)))
-
-    #: The private list of virtual base classes that were used to 
-    #: instantiate this component from Enaml source code. The 
-    #: EnamlFactory class of the Enaml runtime will directly append
-    #: to this list as necessary.
-    _bases = List
+    #: 'bind_expression' method. It maps the name of an attribute to a
+    #: list of AbstractExpression objects. The dict is shared and empty
+    #: until the first expression is bound.
+    _expressions = SharedDict
+
+    #: The private dictionary of the updates which were deferred while
+    #: the component was hidden. It maps the name of an attribute to a
+    #: (value, stale) tuple, where value is the latest value emitted by
+    #: the bound expression, or NotImplemented, and stale is whether
+    #: the bound expression must be reevaluated. The dict is shared and
+    #: empty until the first update is deferred.
+    _hidden_updates = SharedDict
+
+    #: Whether the setup of the subcomponents of this component has been
+    #: deferred because the component was hidden at setup time.
+    _children_deferred = Bool(False)
+
+    #: The private epoch of the name resolution of the component. It is
+    #: replaced whenever the parent of the component changes or a new
+    #: attribute is added to the component, which invalidates the name
+    #: resolution caches of the expressions bound in its subtree.
+    _name_epoch = Int(0)
+
+    #: The private tuple of the names of the attributes which are read
+    #: by the 'hides' method of the component. When one of them is bound
+    #: to an expression, the lazy realization does not decide whether a
+    #: subtree is hidden until the bound expressions have been evaluated.
+    #: Subclasses which reimplement the 'hides' method should extend it.
+    _hiding_attributes = ()
+
+    #: The private tuple of virtual base classes that were used to
+    #: instantiate this component from Enaml source code. The
+    #: EnamlFactory class of the Enaml runtime will directly prepend
+    #: to this tuple as necessary.
+    _bases = Tuple
+
+    #: The private reference to the factory which parks this component
+    #: for reuse when it is released, or None if the component is not
+    #: pooled. It is set by the EnamlFactory class of the Enaml runtime.
+    _pool_factory = Any
+
+    #: The private dictionary of the values of the user attributes which
+    #: are not bound to an expression, as they were when the tree of a
+    #: pooled component was setup. It maps each component of the tree to
+    #: the dict of the values of its initialized attributes, and is used
+    #: to restore them when the component is reused. The dict is shared
+    #: and empty unless the component is pooled.
+    _pool_defaults = SharedDict
 
     #: The private internal list of subcomponents for this component. 
     #: This list should not be manipulated by the user, and should not
@@ -123,11 +475,52 @@ class BaseComponent(HasStrictTraits):
         """ The lazy property getter for the 'children' attribute.
 
         This property getter returns the flattened list of components
-        returned by calling 'get_actual()' on each subcomponent.
+        returned by calling 'get_actual()' on each subcomponent, or an
+        empty list if the setup of the subcomponents was deferred.
 
         """
+        if self._children_deferred:
+            return []
         return sum([c.get_actual() for c in self._subcomponents], [])
+
+    def _get__child_positions(self):
+        """ The lazy property getter for the '_child_positions' attribute.
+
+        """
+        return dict((child, idx) for idx, child in enumerate(self.children))
     
+    #--------------------------------------------------------------------------
+    # Change Handlers
+    #--------------------------------------------------------------------------
+    def _parent_changed(self):
+        """ The change handler for the 'parent' attribute. A new parent
+        changes the resolution of implicit attributes, so the name 
+        resolution caches of the expressions of the subtree of the
+        component are invalidated. The new parent may also show the
+        component, so the deferred subtrees and updates of the subtree
+        are checked. The components outside of the subtree are not
+        affected by the move and are left to the visibility handlers.
+
+        """
+        invalidate_name_caches(self)
+        update_shown_subtree(self)
+
+    def _name_changed(self, old, new):
+        """ The change handler for the 'name' attribute. It keeps the
+        component in the name index under its current name.
+
+        """
+        _index_name(self, old, new)
+
+    def _pause_hidden_updates_changed(self, paused):
+        """ The change handler for the 'pause_hidden_updates' attribute.
+        Any deferred updates are applied once updates are unpaused.
+
+        """
+        if not paused and self._hidden_updates:
+            _hidden_dirty.discard(self)
+            self._apply_hidden_updates()
+
     #--------------------------------------------------------------------------
     # Component Manipulation
     #--------------------------------------------------------------------------
@@ -179,6 +572,12 @@ class BaseComponent(HasStrictTraits):
         need to partake in certain portions of the layout process 
         should re-implement the appropriate setup methods.
 
+        Each setup method is called once for every component in the
+        tree by 'setup_components'. Steps 1 through 6 are performed 
+        top-down, and steps 7 through 9 are performed bottom-up. The
+        setup methods therefore only handle their own component and 
+        must not recurse into the subcomponents.
+
         Parameters
         ----------
         parent : native toolkit widget, optional
@@ -187,15 +586,7 @@ class BaseComponent(HasStrictTraits):
             the parent toolkit widget for this component.
 
         """
-        self._setup_create_widgets(parent)
-        self._setup_init_widgets()
-        self._setup_eval_expressions()
-        self._setup_bind_widgets()
-        self._setup_listeners()
-        self._setup_init_visibility()
-        self._setup_init_layout()
-        self._setup_finalize()
-        self._setup_set_initialized()
+        setup_components([self], parent)
 
     def _setup_create_widgets(self, parent):
         """ A setup method that, by default, is a no-op. Subclasses 
@@ -203,8 +594,7 @@ class BaseComponent(HasStrictTraits):
         to create the underlying toolkit widget(s).
 
         """
-        for child in self._subcomponents:
-            child._setup_create_widgets(parent)
+        pass
 
     def _setup_init_widgets(self):
         """ A setup method that, by default, is a no-op. Subclasses 
@@ -212,8 +602,7 @@ class BaseComponent(HasStrictTraits):
         to initialize their internal toolkit widget(s).
 
         """
-        for child in self._subcomponents:
-            child._setup_init_widgets()
+        pass
 
     def _setup_eval_expressions(self):
         """ A setup method that loops over all of bound expressions and
@@ -224,8 +613,10 @@ class BaseComponent(HasStrictTraits):
         """
         for name in self._expressions:
             getattr(self, name)
-        for child in self._subcomponents:
-            child._setup_eval_expressions()
+        # A name which is bound to an expression is initialized quietly,
+        # so it is added to the name index here.
+        if self.name:
+            _index_name(self, None, self.name)
 
     def _setup_bind_widgets(self):
         """ A setup method that, by default, is a no-op. Subclasses 
@@ -233,8 +624,7 @@ class BaseComponent(HasStrictTraits):
         to bind any event handlers of their internal toolkit widget(s).
 
         """
-        for child in self._subcomponents:
-            child._setup_bind_widgets()
+        pass
 
     def _setup_listeners(self):
         """ A setup method that, by default, is a no-op. Subclasses 
@@ -243,8 +633,7 @@ class BaseComponent(HasStrictTraits):
         toolkit widget(s).
 
         """
-        for child in self._subcomponents:
-            child._setup_listeners()
+        pass
 
     def _setup_init_visibility(self):
         """ A setup method that, by default, is a no-op. Subclasses 
@@ -252,8 +641,7 @@ class BaseComponent(HasStrictTraits):
         to initialize the visibility of their widgets.
 
         """
-        for child in self._subcomponents:
-            child._setup_init_visibility()
+        pass
 
     def _setup_init_layout(self):
         """ A setup method that, by default, is a no-op. Subclasses 
@@ -261,8 +649,7 @@ class BaseComponent(HasStrictTraits):
         their underlying layout.
 
         """
-        for child in self._subcomponents:
-            child._setup_init_layout()
+        pass
 
     def _setup_finalize(self):
         """ A setup method that, by default, is a no-op. Subclasses
@@ -271,17 +658,41 @@ class BaseComponent(HasStrictTraits):
         this method.
 
         """
-        for child in self._subcomponents:
-            child._setup_finalize()
+        pass
 
     def _setup_set_initialized(self):
         """ A setup method which updates the initialized attribute of 
-        the component to True. This is performed bottom-up.
+        the component to True. This is performed bottom-up. A pooled
+        component records the values of the unbound user attributes of
+        its tree, which is setup by now.
 
         """
-        for child in self._subcomponents:
-            child._setup_set_initialized()
         self.initialized = True
+        if self._pool_factory is not None:
+            defaults = {}
+            for cmpnt in self.traverse():
+                dct = cmpnt.__dict__
+                defaults[cmpnt] = dict(
+                    (name, dct[name])
+                    for name in cmpnt._unbound_attributes() if name in dct
+                )
+            self._pool_defaults = defaults
+
+    def _realize_children(self):
+        """ Sets up the subcomponents whose setup was deferred because
+        this component was hidden at setup time, then adds them to the
+        children of the component.
+
+        """
+        # The toolkit widgets of the subcomponents are created in the
+        # toolkit widget of the nearest widget component.
+        widget = None
+        for cmpnt in chain([self], self.traverse_ancestors()):
+            widget = getattr(cmpnt, 'toolkit_widget', None)
+            if widget is not None:
+                break
+        setup_components(self._subcomponents, widget)
+        self._children_deferred = False
 
     #--------------------------------------------------------------------------
     # Teardown Methods
@@ -297,7 +708,110 @@ class BaseComponent(HasStrictTraits):
         for child in self._subcomponents:
             child.destroy()
         del self._subcomponents[:]
-        self._expressions.clear()
+        self._expressions = EMPTY_DICT
+        self._hidden_updates = EMPTY_DICT
+        self._pool_defaults = EMPTY_DICT
+        _hidden_dirty.discard(self)
+        _unrealized.discard(self)
+        if self.initialized:
+            _index_name(self, self.name, None)
+
+    def release(self):
+        """ Releases a component which is no longer needed.
+
+        If the component was created by a factory which pools its
+        components, and the pool of the factory is not full, then the
+        component is parked in the pool so that a later call to the
+        factory can reuse it. Otherwise, the component is destroyed.
+
+        """
+        factory = self._pool_factory
+        if factory is None or not factory.park(self):
+            self.destroy()
+
+    #--------------------------------------------------------------------------
+    # Pooling Methods
+    #--------------------------------------------------------------------------
+    def _park(self):
+        """ Called by the factory when the component is parked. The
+        component is detached from its parent and, if it has been
+        setup, its toolkit widgets are hidden and detached from the
+        parent widget.
+
+        """
+        parent = self.parent
+        if parent is not None:
+            if self in parent._subcomponents:
+                parent._subcomponents.remove(self)
+            self.parent = None
+        if self.initialized:
+            self._detach_widgets()
+
+    def _unpark(self):
+        """ Called by the factory when a parked component is reused.
+        The user attributes of the tree which are not bound are restored
+        to their values when the tree was setup, and an attribute which
+        was not initialized then is uninitialized again. The attributes
+        which have a bound expression are then reset to the current
+        value of the expression. The components which were added to the
+        tree after it was setup keep their attributes.
+
+        """
+        defaults = self._pool_defaults
+        cmpnts = list(self.traverse())
+        for cmpnt in cmpnts:
+            cmpnt._hidden_updates = EMPTY_DICT
+            _hidden_dirty.discard(cmpnt)
+            values = defaults.get(cmpnt)
+            if values is None:
+                continue
+            dct = cmpnt.__dict__
+            for name in cmpnt._unbound_attributes():
+                if name in values:
+                    setattr(cmpnt, name, values[name])
+                else:
+                    dct.pop(name, None)
+        for cmpnt in cmpnts:
+            for name, exprs in cmpnt._expressions.iteritems():
+                expr = exprs[0]
+                if expr is not None:
+                    val = expr.eval()
+                    if val is not NotImplemented:
+                        setattr(cmpnt, name, val)
+
+    def _unbound_attributes(self):
+        """ Returns the list of the names of the user attributes of the
+        component which are not bound to an expression.
+
+        """
+        expressions = self._expressions
+        names = []
+        for name, ctrait in self._instance_traits().iteritems():
+            if isinstance(ctrait.trait_type, UserAttribute):
+                exprs = expressions.get(name)
+                if exprs is None or exprs[0] is None:
+                    names.append(name)
+        return names
+
+    def _detach_widgets(self):
+        """ Hides the toolkit widgets of the component and detaches
+        them from their parent widget. The default implementation
+        detaches the widgets of the children. Subclasses which have
+        a toolkit widget should reimplement this method.
+
+        """
+        for child in self.children:
+            child._detach_widgets()
+
+    def _attach_widgets(self, parent):
+        """ Attaches the toolkit widgets of a reused component to the
+        given parent widget and restores their visibility. The default
+        implementation attaches the widgets of the children. Subclasses
+        which have a toolkit widget should reimplement this method.
+
+        """
+        for child in self.children:
+            child._attach_widgets(parent)
 
     #--------------------------------------------------------------------------
     # Layout Stubs
@@ -389,6 +903,20 @@ class BaseComponent(HasStrictTraits):
         if parent is not None:
             parent.request_refresh_task(callback, *args, **kwargs)
 
+    def request_size_hint_update(self, component):
+        """ A method called by a child component when its size hint has
+        changed. By default, this method requests a relayout. Layout
+        implementors which can update the constraints of the size hint
+        of a single child should reimplement this method.
+
+        Parameters
+        ----------
+        component : BaseComponent
+            The child component whose size hint has changed.
+
+        """
+        self.request_relayout()
+
     #--------------------------------------------------------------------------
     # Bound Attribute Handling
     #--------------------------------------------------------------------------
@@ -438,16 +966,31 @@ class BaseComponent(HasStrictTraits):
         # We could potentially check for those, but its probably more 
         # useful to allow for overriding such things from Enaml, so we 
         # just go ahead and add the attribute.
+        key = (attr_type, is_event)
         try:
-            if is_event:
-                self.add_trait(name, UserEvent(attr_type))
-            else:
-                self.add_trait(name, UserAttribute(attr_type))
+            trait = _attribute_traits.get(key)
+        except TypeError:
+            # The attribute type is not hashable, so it is not cached.
+            trait = key = None
+        try:
+            if trait is None:
+                if is_event:
+                    trait = UserEvent(attr_type).as_ctrait()
+                else:
+                    trait = UserAttribute(attr_type).as_ctrait()
+                if key is not None:
+                    _attribute_traits[key] = trait
+            self.add_trait(name, trait)
         except TypeError:
             msg = ("'%s' is not a valid type for the '%s' attribute "
                    "declaration on %s")
             raise TypeError(msg % (attr_type, name, self))
 
+        # The new attribute may shadow a name which was previously 
+        # resolved further up the tree or in the globals by one of the
+        # expressions of the subtree.
+        invalidate_name_caches(self)
+
     def bind_expression(self, name, expression, notify_only=False):
         """ Binds the given expression to the attribute 'name'.
          
@@ -484,6 +1027,8 @@ class BaseComponent(HasStrictTraits):
         # the left associative expression (or None) and all following
         # items will be the notify_only expressions.
         expressions = self._expressions
+        if expressions is EMPTY_DICT:
+            expressions = self._expressions = {}
         if name not in expressions:
             self.on_trait_change(self._on_bound_attr_changed, name)
             expressions[name] = [None]
@@ -502,6 +1047,7 @@ class BaseComponent(HasStrictTraits):
                 old.expression_changed.disconnect(handler)
             expression.expression_changed.connect(handler)
             expressions[name][0] = expression
+            invalidate_ranks()
         
             # Hookup support for default value computation.
             if not self.initialized:
@@ -524,7 +1070,8 @@ class BaseComponent(HasStrictTraits):
         with the new value from the expression.
 
         """
-        setattr(self, name, value)
+        if not self.defer_hidden_update(name, value):
+            setattr(self, name, value)
     
     def _on_bound_attr_changed(self, obj, name, old, new):
         """ A private handler which is called when any attribute which
@@ -541,6 +1088,87 @@ class BaseComponent(HasStrictTraits):
                 if expr is not None:
                     expr.notify(old, new)
 
+    #--------------------------------------------------------------------------
+    # Visibility Methods
+    #--------------------------------------------------------------------------
+    def hides(self, component):
+        """ Returns whether this component hides the given component,
+        which is either this component or one of its children. The 
+        default implementation returns False. Subclasses which can be
+        hidden, or which hide some of their children, should reimplement
+        this method and call 'update_shown_components' when a component 
+        may have been shown. The names of the attributes which are read
+        by this method should be listed in '_hiding_attributes'.
+
+        """
+        return False
+
+    def is_hidden(self):
+        """ Returns whether this component is hidden, either by itself
+        or by one of its ancestors.
+
+        """
+        cmpnt = self
+        while cmpnt is not None:
+            if cmpnt.hides(cmpnt):
+                return True
+            parent = cmpnt.parent
+            if parent is not None and parent.hides(cmpnt):
+                return True
+            cmpnt = parent
+        return False
+
+    def defer_hidden_update(self, name, value=NotImplemented):
+        """ Defers the update of an attribute if 'pause_hidden_updates'
+        is True and the component is hidden.
+
+        Parameters
+        ----------
+        name : string
+            The name of the attribute to update.
+
+        value : object, optional
+            The new value of the attribute. If not given, the bound 
+            expression is marked as stale and is reevaluated when the
+            component is shown.
+
+        Returns
+        -------
+        result : bool
+            True if the update was deferred, False if it should be 
+            applied immediately.
+
+        """
+        if not self.pause_hidden_updates or not self.is_hidden():
+            return False
+        updates = self._hidden_updates
+        if updates is EMPTY_DICT:
+            updates = self._hidden_updates = {}
+        pending, stale = updates.get(name, (NotImplemented, False))
+        if value is NotImplemented:
+            stale = True
+        else:
+            pending = value
+        updates[name] = (pending, stale)
+        _hidden_dirty.add(self)
+        return True
+
+    def _apply_hidden_updates(self):
+        """ Applies the updates which were deferred while the component
+        was hidden. A stale expression is reevaluated once, or at the 
+        end of the active propagation.
+
+        """
+        updates = self._hidden_updates
+        self._hidden_updates = EMPTY_DICT
+        for name, (value, stale) in updates.iteritems():
+            if value is not NotImplemented:
+                setattr(self, name, value)
+            if stale:
+                expr = self._expressions[name][0]
+                if expr is not None and not defer_update(expr):
+                    expr.reevaluate()
+
     #--------------------------------------------------------------------------
     # Auxiliary Methods 
     #--------------------------------------------------------------------------
@@ -611,10 +1239,13 @@ class BaseComponent(HasStrictTraits):
         """ Locate and return a named item that exists in the subtree
         which starts at this node.
 
-        This method will traverse the tree of components, breadth first,
-        from this point downward, looking for a component with the given
-        name. The first one with the given name is returned, or None if
-        no component is found.
+        This method looks for a component with the given name in the
+        tree of components from this point downward. The first one with
+        the given name in a breadth first traversal is returned, or None
+        if no component is found. Once the component is initialized, a
+        subtree which is large compared to the number of components
+        with the given name is searched through the name index rather
+        than by traversing it.
 
         Parameters
         ----------
@@ -628,9 +1259,110 @@ class BaseComponent(HasStrictTraits):
             no component is found.
         
         """
+        limit = self._traversal_limit(name)
+        found = self._find_traversed(name, limit, True)
+        if found is None:
+            found = self._find_indexed(name)
+            if found:
+                return min(found)[1]
+        elif found:
+            return found[0]
+
+    def find_all_by_name(self, name):
+        """ Locate and return all of the named items that exist in the
+        subtree which starts at this node.
+
+        Parameters
+        ----------
+        name : string
+            The name of the components for which to search.
+
+        Returns
+        -------
+        result : list of BaseComponent
+            The components found with the given name, in breadth first
+            order. The list is empty if no component is found.
+
+        """
+        limit = self._traversal_limit(name)
+        found = self._find_traversed(name, limit)
+        if found is None:
+            found = [cmpnt for key, cmpnt in sorted(self._find_indexed(name))]
+        return found
+
+    def _traversal_limit(self, name):
+        """ Returns the number of components which may be visited when
+        searching the subtree for the given name by traversing it, or
+        None if the whole subtree is traversed.
+
+        Walking up the tree from an indexed component with the name
+        costs a fraction of visiting several components in a traversal,
+        so the subtree is searched through the index once a traversal
+        visits more than a quarter as many components as there are
+        indexed components. A small subtree is therefore traversed even
+        when the name is repeated throughout the process. The index is
+        only complete once the component is initialized.
+
+        """
+        if not self.initialized:
+            return None
+        return len(_name_index.get(name, ())) // 4
+
+    def _find_traversed(self, name, limit, first=False):
+        """ Returns the list of the components of the subtree which have
+        the given name in breadth first order, or None if the traversal
+        visits more than 'limit' components before it is complete. The
+        traversal stops at the first match if 'first' is True.
+
+        """
+        found = []
+        visited = 0
         for cmpnt in self.traverse():
+            if limit is not None:
+                visited += 1
+                if visited > limit:
+                    return None
             if cmpnt.name == name:
-                return cmpnt
+                found.append(cmpnt)
+                if first:
+                    break
+        return found
+
+    def _find_indexed(self, name):
+        """ Returns a list of (key, component) pairs for the components
+        in the name index which have the given name and are in the
+        subtree of this component. Sorting the keys gives the breadth
+        first order of the components.
+
+        The position of a component in the children of its parent is
+        looked up in the '_child_positions' map of the parent, so each
+        step up the tree takes constant time. The cost of a lookup is
+        linear in the total depth of the indexed components with the
+        given name, which includes those in other trees, so it is only
+        used for a subtree which is larger than their number.
+
+        """
+        found = []
+        for cmpnt in list(_name_index.get(name, ())):
+            if cmpnt.name != name:
+                continue
+            # The path of the component is the list of the indices of
+            # its ancestors in the children of their parents. A parent
+            # such as an Include does not list the component in its
+            # children, so the component is looked for further up.
+            path = []
+            node = cmpnt
+            ancestor = cmpnt.parent
+            while node is not self and ancestor is not None:
+                idx = ancestor._child_positions.get(node)
+                if idx is not None:
+                    path.append(idx)
+                    node = ancestor
+                ancestor = ancestor.parent
+            if node is self:
+                path.reverse()
+                found.append(((len(path), path), cmpnt))
+        return found
 
     def toplevel_component(self):
         """ Walks up the tree of components starting at this node and
@@ -0,0 +1,30 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from contextlib import contextmanager
+
+from .propagation import begin_propagation, end_propagation
+
+
+@contextmanager
+def batch_updates():
+    """ A context manager which defers the reevaluation of the bound
+    expressions which depend on changed values until the outermost
+    context exits.
+
+    Each dirty expression is then reevaluated once, in dependency
+    order, no matter how many of its dependencies changed within the
+    block. Contexts may be nested. For example::
+
+        with batch_updates():
+            model.x = 1
+            model.y = 2
+
+    """
+    begin_propagation()
+    try:
+        yield
+    finally:
+        end_propagation()
+
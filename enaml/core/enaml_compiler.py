@@ -9,8 +9,9 @@ import types
 from .byteplay import (
     Code, LOAD_FAST, CALL_FUNCTION, LOAD_GLOBAL, STORE_FAST, LOAD_CONST,
     LOAD_ATTR, STORE_SUBSCR, RETURN_VALUE, POP_TOP, MAKE_FUNCTION,
-    STORE_NAME, LOAD_NAME, SetLineno,
+    STORE_NAME, LOAD_NAME, SetLineno, BINARY_SUBSCR,
 )
+from .operators import precompile_variants
 
 
 # Increment this number whenever the compiler changes the code which it
@@ -27,7 +28,18 @@ from .byteplay import (
 #     line number specified by the ast. The workaround is to compile the 
 #     code object, then make a new copy of it with the proper firstlineno 
 #     set via the types.CodeType constructor.
-COMPILER_VERSION = 2
+# 3 : Precompiled code variants - 17 October 2012
+#     When compiling with precompile=True, the monitored and inverted
+#     variants of the expressions bound with the default operators are
+#     generated at compile time and registered with the runtime code 
+#     caches when the module is executed.
+# 4 : Declaration build plans - 17 October 2012
+#     The base types, operators and attribute types of a declaration
+#     are no longer evaluated by the declaration function. They are
+#     compiled into a tuple of lookup code objects which is given to
+#     the EnamlDeclaration, and the function receives the evaluated
+#     lookups as its 'plan' argument.
+COMPILER_VERSION = 4
 
 
 #------------------------------------------------------------------------------
@@ -41,6 +53,16 @@ STARTUP = ['from enaml.core.factory import EnamlDeclaration']
 CLEANUP = ['del EnamlDeclaration']
 
 
+# Code that registers the precompiled code variants of a module. It is
+# executed before any other code in the module. The ops which call the
+# register function with the table of variants are generated between
+# the import and the del.
+PRECOMPILED_STARTUP = ['from enaml.core.operators import register_precompiled']
+
+
+PRECOMPILED_CLEANUP = ['del register_precompiled']
+
+
 def _var_name_generator():
     """ Returns a generator that generates sequential variable names for
     use in a code block.
@@ -98,9 +120,19 @@ class DeclarationCompiler(_NodeVisitor):
 
     """
     @classmethod
-    def compile(cls, node, filename):
+    def compile(cls, node, filename, variants=None):
         """ Compiles the given Declaration node into a byteplay code 
-        object.
+        object and a tuple of lookup code objects.
+
+        If a list is given for 'variants', the precompiled code variants
+        of the bound expressions will be appended to it.
+
+        The names of the base types, operators and attribute types used
+        by the declaration are not evaluated by the generated code. Each
+        of them is compiled into a lookup code object, and the results
+        of evaluating the lookups are given to the generated function as
+        its 'plan' argument, so that they can be computed once for a
+        given toolkit and reused for every instantiation.
 
         Given this sample declaration in Enaml::
           
@@ -114,40 +146,45 @@ class DeclarationCompiler(_NodeVisitor):
         We generate bytecode that would correspond to a Python function that
         looks similar to this::
         
-        def FooWindow(identifiers, toolkit):
+        def FooWindow(identifiers, toolkit, plan):
             f_globals = globals()
-            eval_ = eval
-            foo_cls = eval('Window', toolkit, f_globals)
+            foo_cls = plan[0]
             foo = foo_cls.__enaml_call__(identifiers, toolkit)
             identifiers['foo'] = foo
-            op = eval_('__operator_Equal__', toolkit, f_globals)
+            op = plan[1]
             op(foo, 'a', <ast>, <code>, identifiers, f_globals, toolkit)
-            btn_cls = eval_('PushButton', toolkit, f_globals)
+            btn_cls = plan[2]
             btn = btn_cls.__enaml_call__(None, toolkit)
             identifiers['btn'] = button
-            op = eval_('__operator_Equal__', toolkit, f_globals)
+            op = plan[1]
             op(item, 'text', <ast>, <code>, identifiers, f_globals, toolkit)
             foo.add_subcomponent(button)
             return foo
+
+        Where the lookups are the compiled forms of 'Window',
+        '__operator_Equal__' and 'PushButton'.
         
         """
-        compiler = cls(filename)
+        compiler = cls(filename, variants)
         compiler.visit(node)
         code_ops = compiler.code_ops
         code = Code(
-            code_ops, [], ['identifiers', 'toolkit'], False, False, True, 
-            node.name, filename, node.lineno, node.doc,
+            code_ops, [], ['identifiers', 'toolkit', 'plan'], False, False,
+            True, node.name, filename, node.lineno, node.doc,
         )
-        return code
+        return code, tuple(compiler.lookups)
 
-    def __init__(self, filename):
+    def __init__(self, filename, variants=None):
         self.filename = filename
+        self.variants = variants
         self.code_ops = []
         self.extend_ops = self.code_ops.extend
         self.name_gen = _var_name_generator()
         self.name_stack = []
         self.push_name = self.name_stack.append
         self.pop_name = self.name_stack.pop
+        self.lookups = []
+        self.lookup_indices = {}
 
     def curr_name(self):
         """ Returns the current variable name on the stack.
@@ -155,6 +192,27 @@ class DeclarationCompiler(_NodeVisitor):
         """
         return self.name_stack[-1]
 
+    def load_lookup(self, source):
+        """ Returns the ops which load the evaluated lookup for the
+        given source from the plan. The source is either a string or
+        a Python ast node. Lookups of the same string are shared.
+
+        """
+        indices = self.lookup_indices
+        if isinstance(source, basestring) and source in indices:
+            index = indices[source]
+        else:
+            index = len(self.lookups)
+            code = compile(source, self.filename, mode='eval')
+            self.lookups.append(code)
+            if isinstance(source, basestring):
+                indices[source] = index
+        return [
+            (LOAD_FAST, 'plan'),
+            (LOAD_CONST, index),
+            (BINARY_SUBSCR, None),
+        ]
+
     def visit_Declaration(self, node):
         """ Creates the bytecode ops for a declaration node. This visitor
         handles creating the component instance and storing it's identifer
@@ -164,24 +222,17 @@ class DeclarationCompiler(_NodeVisitor):
         name = self.name_gen.next()
         extend_ops = self.extend_ops
         self.push_name(name)
-        base_code = compile(node.base.py_ast, self.filename, mode='eval')
         extend_ops([
             # f_globals = globals()
             (LOAD_GLOBAL, 'globals'),
             (CALL_FUNCTION, 0x0000),
             (STORE_FAST, 'f_globals'),
+        ])
 
-            # eval_ = eval
-            (LOAD_GLOBAL, 'eval'),
-            (STORE_FAST, 'eval_'),
-
-            # foo_cls = eval('Window', toolkit, f_globals)
-            # foo = foo_cls.__enaml_call__(identifiers, toolkit)
-            (LOAD_FAST, 'eval_'),
-            (LOAD_CONST, base_code),
-            (LOAD_FAST, 'toolkit'),
-            (LOAD_FAST, 'f_globals'),
-            (CALL_FUNCTION, 0x0003),
+        # foo_cls = plan[0]
+        # foo = foo_cls.__enaml_call__(identifiers, toolkit)
+        extend_ops(self.load_lookup(node.base.py_ast))
+        extend_ops([
             (LOAD_ATTR, '__enaml_call__'),
             (LOAD_FAST, 'identifiers'),
             (LOAD_FAST, 'toolkit'),
@@ -229,13 +280,8 @@ class DeclarationCompiler(_NodeVisitor):
         # and the call the add_attribute method
         node_type = node.type
         if node_type is not None:
-            type_code = compile(node_type.py_ast, self.filename, mode='eval')
+            extend_ops(self.load_lookup(node_type.py_ast))
             extend_ops([
-                (LOAD_FAST, 'eval_'),
-                (LOAD_CONST, type_code),
-                (LOAD_FAST, 'toolkit'),
-                (LOAD_FAST, 'f_globals'),
-                (CALL_FUNCTION, 0x0003),
                 (LOAD_CONST, node.is_event),
                 (CALL_FUNCTION, 0x0003),
                 (POP_TOP, None),
@@ -261,10 +307,9 @@ class DeclarationCompiler(_NodeVisitor):
         # A binding is accomplished by loading the appropriate binding
         # operator function and passing it the a number of arguments:
         #
-        # op = eval('__operator_Equal__', toolkit, f_globals)
+        # op = plan[1]
         # op(item, 'a', code, identifiers, f_globals, toolkit)
         fn = self.filename
-        op_code = compile(node.binding.op, fn, mode='eval')
         py_ast = node.binding.expr.py_ast
         if isinstance(py_ast, ast.Module):
             expr_code = compile(py_ast, fn, mode='exec')
@@ -275,12 +320,13 @@ class DeclarationCompiler(_NodeVisitor):
             # exceptions are properly reported.
             expr_code = compile(py_ast, fn, mode='eval')
             expr_code = update_firstlineno(expr_code, py_ast.lineno)
+        variants = self.variants
+        if variants is not None:
+            variant = precompile_variants(node.binding.op, expr_code)
+            if variant is not None:
+                variants.append(variant)
+        self.extend_ops(self.load_lookup(node.binding.op))
         self.extend_ops([
-            (LOAD_FAST, 'eval_'),
-            (LOAD_CONST, op_code),
-            (LOAD_FAST, 'toolkit'),
-            (LOAD_FAST, 'f_globals'),
-            (CALL_FUNCTION, 0x0003),
             (LOAD_FAST, self.curr_name()),
             (LOAD_CONST, node.name),
             (LOAD_CONST, expr_code),
@@ -300,19 +346,14 @@ class DeclarationCompiler(_NodeVisitor):
         extend_ops = self.extend_ops
         name = self.name_gen.next()
         self.push_name(name)
-        op_code = compile(node.name, self.filename, mode='eval')
+        # btn_cls = plan[2]
+        # btn = btn_cls.__enaml_call__(None, toolkit)
+        # When instantiating a Declaration, it is called without
+        # identifiers, so that it creates it's own new identifiers
+        # scope. This means that derived declarations share ids,
+        # but the composed children have an isolated id space.
+        extend_ops(self.load_lookup(node.name))
         extend_ops([
-            # btn_cls = eval('PushButton', toolkit, f_globals)
-            # btn = btn_cls.__enaml_call__(None, toolkit)
-            # When instantiating a Declaration, it is called without
-            # identifiers, so that it creates it's own new identifiers
-            # scope. This means that derived declarations share ids,
-            # but the composed children have an isolated id space.
-            (LOAD_FAST, 'eval_'),
-            (LOAD_CONST, op_code),
-            (LOAD_FAST, 'toolkit'),
-            (LOAD_FAST, 'f_globals'),
-            (CALL_FUNCTION, 0x0003),
             (LOAD_ATTR, '__enaml_call__'),
             (LOAD_CONST, None),
             (LOAD_FAST, 'toolkit'),
@@ -355,7 +396,7 @@ class EnamlCompiler(_NodeVisitor):
 
     """
     @classmethod
-    def compile(cls, module_ast, filename):
+    def compile(cls, module_ast, filename, precompile=False):
         """ The main entry point of the compiler.
 
         Parameters
@@ -363,17 +404,40 @@ class EnamlCompiler(_NodeVisitor):
         module_ast : Instance(enaml_ast.Module)
             The enaml module ast node that should be compiled.
         
-        module_dict : dict
-            The dictionary of the Python module into which we are
-            compiling the enaml code.
+        filename : string
+            The filename to use for the compiled code objects.
+
+        precompile : bool, optional
+            If True, the monitored and inverted variants of expressions
+            bound with the default operators are generated at compile 
+            time and stored in the module code, so that they need not be
+            generated at runtime. The default is False.
         
         """
-        compiler = cls(filename)
+        compiler = cls(filename, precompile)
         compiler.visit(module_ast)
 
         module_ops = [(SetLineno, 1)]
         extend_ops = module_ops.extend
 
+        # Generate the code which registers the precompiled variants
+        variants = compiler.variants
+        if variants:
+            for start in PRECOMPILED_STARTUP:
+                start_code = compile(start, filename, mode='exec')
+                # Skip the SetLineo and ReturnValue codes
+                extend_ops(Code.from_code(start_code).code[1:-2])
+            extend_ops([
+                (LOAD_NAME, 'register_precompiled'),
+                (LOAD_CONST, tuple(variants)),
+                (CALL_FUNCTION, 0x0001),
+                (POP_TOP, None),
+            ])
+            for end in PRECOMPILED_CLEANUP:
+                end_code = compile(end, filename, mode='exec')
+                # Skip the SetLineo and ReturnValue codes
+                extend_ops(Code.from_code(end_code).code[1:-2])
+
         # Generate the startup code for the module
         for start in STARTUP:
             start_code = compile(start, filename, mode='exec')
@@ -401,9 +465,10 @@ class EnamlCompiler(_NodeVisitor):
         )
         return mod_code.to_code()
 
-    def __init__(self, filename):
+    def __init__(self, filename, precompile=False):
         self.code_ops = []
         self.filename = filename
+        self.variants = [] if precompile else None
 
     def visit_Module(self, node):
         """ The module node visitor method. Used internally by the
@@ -433,8 +498,10 @@ class EnamlCompiler(_NodeVisitor):
 
         """
         # This creates a function from the generated code ops then
-        # wraps that function in an EnamlDeclaration.
-        func_code = DeclarationCompiler.compile(node, self.filename)
+        # wraps that function and its lookups in an EnamlDeclaration.
+        func_code, lookups = DeclarationCompiler.compile(
+            node, self.filename, self.variants,
+        )
         name = node.name
         self.code_ops.extend([
             (LOAD_CONST, func_code),
@@ -442,7 +509,8 @@ class EnamlCompiler(_NodeVisitor):
             (STORE_NAME, name),
             (LOAD_NAME, 'EnamlDeclaration'),
             (LOAD_NAME, name),
-            (CALL_FUNCTION, 0x0001),
+            (LOAD_CONST, lookups),
+            (CALL_FUNCTION, 0x0002),
             (STORE_NAME, name),
         ])
 
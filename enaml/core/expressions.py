@@ -5,15 +5,18 @@
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple, defaultdict
 from contextlib import contextmanager
+from itertools import count
+from timeit import default_timer
 from weakref import ref
 
-from traits.api import Disallow
-
 from .byteplay import Code
-from .monitors import AbstractMonitor
+from .monitors import AbstractMonitor, TraitHandlerMixin
+from .propagation import defer_update, rank_epoch
 from .signaling import Signal
 from .trait_types import UninitializedAttributeError
 
+from ..utils import LRUCache
+
 
 #------------------------------------------------------------------------------
 # Expression Helpers
@@ -43,6 +46,306 @@ def swap_attribute(obj, attr, value):
     setattr(obj, attr, old)
 
 
+#: The BindingProfiler which records the evaluations and notifications
+#: of the expressions, or None if profiling is disabled.
+_binding_profiler = None
+
+
+def set_binding_profiler(profiler):
+    """ Installs the given BindingProfiler for all expressions. Passing
+    None disables profiling. See the 'profiling' module.
+
+    """
+    global _binding_profiler
+    _binding_profiler = profiler
+
+
+def _code_key(code, classes):
+    """ Returns the key of a code object and a tuple of monitor or
+    inverter classes in the code caches. Code objects compare equal
+    regardless of their file name, so the file name is a part of the
+    key. Otherwise, the same expression on the same line of two files
+    would share code which reports the first file in its tracebacks.
+
+    """
+    return (code, code.co_filename, tuple(classes))
+
+
+#: A process-wide, bounded cache of monitored code objects. The key is
+#: a tuple of (code, filename, monitor_classes) and the value is the
+#: code object which has been instrumented with the insertion code of
+#: the monitors. The instrumented code is independent of any particular
+#: monitor instance and so is shared by every expression built from the
+#: same code.
+_monitored_code_cache = LRUCache(maxsize=1024)
+
+
+def monitored_code(code, monitors):
+    """ Returns a version of the given code object which has been 
+    instrumented with the insertion code generated by the monitors.
+    The result is cached in a process-wide LRU cache on the code
+    object and the classes of the monitors.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The compiled code object for the Python expression.
+
+    monitors : sequence of AbstractMonitor
+        The monitor instances which generate the insertion code.
+        On a cache miss, the 'get_insertion_code' method of these
+        instances is used to build the code.
+
+    Returns
+    -------
+    result : types.CodeType
+        The instrumented code object. When evaluated, the monitor 
+        instances must be available in the scope under the names 
+        given by their 'scope_key()' method.
+
+    """
+    key = _code_key(code, (type(monitor) for monitor in monitors))
+    cache = _monitored_code_cache
+    res = cache.get(key)
+    if res is not None:
+        return res
+
+    # Collect the generated code from the monitors that will be
+    # inserted into the code for the expression.
+    bp_code = Code.from_code(code)
+    code_list = list(bp_code.code)
+    insertions = defaultdict(list)
+    for monitor in monitors:
+        for idx, ins_code in monitor.get_insertion_code(code_list):
+            insertions[idx].extend(ins_code)
+    
+    # Create a new code list which interleaves the code generated
+    # by the monitors at the appropriate location in the expression.
+    new_code = []
+    for idx, code_op in enumerate(code_list):
+        if idx in insertions:
+            new_code.extend(insertions[idx])
+        new_code.append(code_op)
+    
+    bp_code.code = new_code
+    res = cache[key] = bp_code.to_code()
+    return res
+
+
+def add_monitored_code(code, monitor_classes, monitored):
+    """ Adds an instrumented code object to the monitored code cache. 
+    This is used to seed the cache with code which was instrumented
+    ahead of time by the Enaml compiler.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The compiled code object for the Python expression.
+
+    monitor_classes : iterable of AbstractMonitor subclasses
+        The monitor classes which were used to instrument the code.
+
+    monitored : types.CodeType
+        The instrumented code object.
+
+    """
+    _monitored_code_cache[_code_key(code, monitor_classes)] = monitored
+
+
+#: A process-wide, bounded cache of inverted code objects. The key is a
+#: tuple of (code, filename, inverter_classes) and the value is the tuple
+#: of code objects generated by the inverters which were able to invert
+#: the code.
+_inverted_code_cache = LRUCache(maxsize=1024)
+
+
+#: The namedtuple returned by 'inverted_code_cache_info()'.
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+def inverted_code(code, inverter_classes):
+    """ Returns the inverted versions of the given code object which 
+    are generated by the given inverter classes. The result is cached
+    in a process-wide LRU cache on the code object and the inverter 
+    classes.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The compiled code object for the Python expression.
+
+    inverter_classes : iterable of AbstractInverter subclasses
+        The concrete AbstractInverter subclasses which will invert the
+        given expression code into a mirrored operation.
+
+    Returns
+    -------
+    result : tuple of types.CodeType
+        The inverted code objects, in the order of the inverter classes
+        which were able to invert the code. This will be empty if none
+        of the inverters could invert the code.
+
+    """
+    key = _code_key(code, inverter_classes)
+    cache = _inverted_code_cache
+    res = cache.get(key)
+    if res is not None:
+        return res
+
+    inverters = []
+    bp_code = Code.from_code(code)
+    code_list = bp_code.code
+    for inv_cls in inverter_classes:
+        inverter = inv_cls()
+        new_code = inverter.get_inverted_code(code_list)
+        if new_code is not None:
+            bp_code.code = new_code
+            inverters.append(bp_code.to_code())
+
+    res = cache[key] = tuple(inverters)
+    return res
+
+
+def add_inverted_code(code, inverter_classes, inverted):
+    """ Adds a tuple of inverted code objects to the inverted code 
+    cache. This is used to seed the cache with code which was inverted
+    ahead of time by the Enaml compiler.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The compiled code object for the Python expression.
+
+    inverter_classes : iterable of AbstractInverter subclasses
+        The inverter classes which were used to invert the code.
+
+    inverted : tuple of types.CodeType
+        The inverted code objects.
+
+    """
+    _inverted_code_cache[_code_key(code, inverter_classes)] = inverted
+
+
+#: A process-wide cache of the scope entries required by the code which
+#: is generated by a tuple of inverter classes.
+_inverter_scope_cache = {}
+
+
+def inverter_scope(inverter_classes):
+    """ Returns the dict of scope entries which must be supplied when
+    evaluating the code generated by the given inverter classes. The
+    dict maps the 'scope_key()' of each inverter class to its handler
+    and must not be modified by the caller.
+
+    """
+    key = tuple(inverter_classes)
+    cache = _inverter_scope_cache
+    if key in cache:
+        return cache[key]
+    res = cache[key] = dict(
+        (inv_cls.scope_key(), inv_cls().get_handler()) 
+        for inv_cls in inverter_classes
+    )
+    return res
+
+
+def inverted_code_cache_info():
+    """ Returns a CacheInfo namedtuple with the hit and miss counts and
+    the current and maximum size of the inverted code cache.
+
+    """
+    cache = _inverted_code_cache
+    return CacheInfo(cache.hits, cache.misses, cache.maxsize, len(cache))
+
+
+#------------------------------------------------------------------------------
+# Name Resolution Cache
+#------------------------------------------------------------------------------
+#: The resolution tiers recorded by a NameResolutionCache. A name which
+#: resolves to an implicit attribute is recorded with a weak reference
+#: to the component which provided it. A name recorded as global was 
+#: not found in the identifiers or the component hierarchy, and the 
+#: lookup resumes with the globals and then the toolkit.
+_IDENTIFIER_TIER = 0
+_IMPLICIT_TIER = 1
+_GLOBAL_TIER = 2
+
+
+#: The source of the name epochs of the components. Every epoch is
+#: unique, so the epochs of the ancestors of a component identify the
+#: state of the path along which its names are resolved.
+_name_epochs = count(1)
+
+
+def invalidate_name_caches(component):
+    """ Invalidates the NameResolutionCache instances of the expressions
+    bound in the subtree of the given component. This is called by the
+    BaseComponent whenever a change is made to the component which may
+    alter the resolution of implicit attributes in its subtree.
+
+    Parameters
+    ----------
+    component : BaseComponent
+        The component whose parent changed or which was given a new
+        attribute. Its name epoch is replaced by a new epoch.
+
+    """
+    component._name_epoch = next(_name_epochs)
+
+
+class NameResolutionCache(object):
+    """ A per-expression cache which remembers the tier of the scope
+    resolution order which resolved a name, and for implicit attributes 
+    the component which provided it.
+
+    The cache records the name epochs of the component and its ancestors
+    and is cleared when one of them changes, which happens when one of
+    them is reparented or given a new attribute. Changes made elsewhere
+    in the component hierarchy leave the cache intact. A new identifier
+    is detected by the scope when a cached name is looked up. The
+    assignments and overrides are never cached since they are specific
+    to a single evaluation.
+
+    """
+    __slots__ = ('epochs', 'entries')
+
+    def __init__(self):
+        """ Initialize a NameResolutionCache.
+
+        """
+        self.epochs = []
+        self.entries = {}
+
+    def validate(self, obj):
+        """ Clears the cache if the name epoch of the given component or
+        one of its ancestors has changed since the entries were recorded.
+
+        Parameters
+        ----------
+        obj : BaseComponent
+            The component on which the expression is bound.
+
+        """
+        epochs = self.epochs
+        n_epochs = len(epochs)
+        idx = 0
+        cmpnt = obj
+        while cmpnt is not None:
+            if idx == n_epochs or epochs[idx] != cmpnt._name_epoch:
+                break
+            idx += 1
+            cmpnt = cmpnt.parent
+        else:
+            if idx == n_epochs:
+                return
+        self.entries.clear()
+        del epochs[:]
+        cmpnt = obj
+        while cmpnt is not None:
+            epochs.append(cmpnt._name_epoch)
+            cmpnt = cmpnt.parent
+
+
 #------------------------------------------------------------------------------
 # Execution Scope
 #------------------------------------------------------------------------------
@@ -52,12 +355,15 @@ class ExecutionScope(object):
 
     Notes
     -----
-    Strong references are kept to all objects passed to the constructor,
-    so these scope objects should be created as needed and discarded in
-    order to avoid issues with reference cycles.
+    Only a weak reference is kept to the component. Strong references
+    are kept to the other objects passed to the constructor, so these
+    must not refer back to the owner of the scope. A scope may be kept
+    alive and reused for many evaluations by calling 'reset' before 
+    each evaluation.
 
     """
-    def __init__(self, obj, identifiers, f_globals, toolkit, overrides, cb):
+    def __init__(self, obj, identifiers, f_globals, toolkit, overrides, cb,
+                 cache=None):
         """ Initialize an execution scope.
 
         Parameters
@@ -85,14 +391,24 @@ class ExecutionScope(object):
             found and accessed on the object. The arguments passed are 
             the object and the attribute name.
 
+        cache : NameResolutionCache, optional
+            A cache which records how names were resolved by previous
+            scopes of the same expression. If not given, every name is
+            resolved by walking the full resolution order.
+
         """
-        self._obj = obj
+        self._obj_ref = ref(obj)
         self._identifiers = identifiers
         self._f_globals = f_globals
         self._toolkit = toolkit
         self._overrides = overrides
         self._attr_cb = cb
         self._assignments = {}
+        if cache is not None:
+            cache.validate(obj)
+            self._cache = cache.entries
+        else:
+            self._cache = None
 
     def __getitem__(self, name):
         """ Lookup an item from the namespace.
@@ -136,27 +452,69 @@ class ExecutionScope(object):
         if name in dct:
             return dct[name]
         
+        # If the name was resolved by a previous evaluation, go straight
+        # to the tier which resolved it. Should that fail, or should the
+        # name have since become an identifier, the name is resolved
+        # again by walking the full resolution order below.
+        cache = self._cache
+        if cache is not None and name in cache:
+            tier, cmpnt_ref = cache[name]
+            if tier == _IDENTIFIER_TIER:
+                dct = self._identifiers
+                if name in dct:
+                    return dct[name]
+            elif name in self._identifiers:
+                pass
+            elif tier == _IMPLICIT_TIER:
+                cmpnt = cmpnt_ref()
+                if cmpnt is not None:
+                    try:
+                        res = getattr(cmpnt, name)
+                    except AttributeError:
+                        pass
+                    else:
+                        cb = self._attr_cb
+                        if cb is not None:
+                            cb(cmpnt, name)
+                        return res
+            else:
+                return self._lookup_global(name)
+            del cache[name]
+
         # Identifiers have the highest precedence of value able to
         # be supplied by a user of the framework.
         dct = self._identifiers
         if name in dct:
+            if cache is not None:
+                cache[name] = (_IDENTIFIER_TIER, None)
             return dct[name]
 
         # After identifiers, the implicit attributes of the component
         # hierarchy have precedence.
-        parent = self._obj
+        parent = self._obj_ref()
         while parent is not None:
             try:
                 res = getattr(parent, name)
             except AttributeError:
                 parent = parent.parent
             else:
+                if cache is not None:
+                    cache[name] = (_IMPLICIT_TIER, ref(parent))
                 # Call the attribute callback if given.
                 cb = self._attr_cb
                 if cb is not None:
                     cb(parent, name)
                 return res
 
+        if cache is not None:
+            cache[name] = (_GLOBAL_TIER, None)
+        return self._lookup_global(name)
+
+    def _lookup_global(self, name):
+        """ Lookup a name in the globals and then the toolkit. This is
+        the tail of the resolution order of '__getitem__'.
+
+        """
         # Global variables come after implicit attributes
         dct = self._f_globals
         if name in dct:
@@ -166,6 +524,21 @@ class ExecutionScope(object):
         # Builtins will be checked by Python using the global dict.
         return self._toolkit[name]
 
+    def reset(self, cb=None):
+        """ Resets the scope so that it may be reused for another 
+        evaluation. The assignments of the previous evaluation are 
+        cleared and the given attribute callback is installed.
+
+        Parameters
+        ----------
+        cb : callable or None, optional
+            The attribute callback to use for the next evaluation. See
+            the constructor for details.
+
+        """
+        self._assignments.clear()
+        self._attr_cb = cb
+
     def __setitem__(self, name, val):
         """ Stores the value into the internal assignments dict. This 
 
@@ -224,10 +597,25 @@ class NonlocalScope(object):
             found and accessed on the object. The arguments passed are 
             the object and the attribute name.
         
+        Notes
+        -----
+        Only a weak reference is kept to the component, so that the
+        scope may be stored in a long-lived ExecutionScope.
+
         """
-        self._nls_obj = obj
+        self._nls_obj_ref = ref(obj) if obj is not None else None
         self._nls_attr_cb = cb
 
+    @property
+    def _nls_obj(self):
+        """ The component which forms the first level of the scope, or
+        None if it has been garbage collected.
+
+        """
+        obj_ref = self._nls_obj_ref
+        if obj_ref is not None:
+            return obj_ref()
+
     def __repr__(self):
         """ A pretty representation of the NonlocalScope.
 
@@ -279,7 +667,7 @@ class NonlocalScope(object):
         scope via setattr instead of setitem.
 
         """
-        if name in ('_nls_obj', '_nls_attr_cb'):
+        if name in ('_nls_obj_ref', '_nls_attr_cb'):
             super(NonlocalScope, self).__setattr__(name, value)
         else:
             try:
@@ -367,6 +755,11 @@ class AbstractExpression(object):
     #: computed value of the expression.
     expression_changed = Signal()
 
+    #: Whether the expression keeps a single long-lived ExecutionScope 
+    #: which is reset and reused for every evaluation. If False, a new
+    #: scope is created for each evaluation.
+    reuse_scope = True
+
     def __init__(self, obj, name, code, identifiers, f_globals, toolkit):
         """ Initializes and expression object.
 
@@ -400,6 +793,73 @@ class AbstractExpression(object):
         self.identifiers = identifiers
         self.f_globals = f_globals
         self.toolkit = toolkit
+        self.name_cache = NameResolutionCache()
+        self._scope_state = None
+        self._scope_busy = False
+
+    def get_overrides(self):
+        """ Returns a new dict of the override values for the execution
+        scope which are constant for the lifetime of the expression. 
+        The 'nonlocals' entry is added by 'acquire_scope'. Subclasses may 
+        reimplement this method to add their own values. 
+
+        """
+        return {}
+
+    def acquire_scope(self, obj, cb=None):
+        """ Returns the execution scope for an evaluation of the code. 
+
+        If 'reuse_scope' is True, the scope is created on first use and
+        reset for later evaluations. Otherwise, or if the scope is still
+        in use by an outer evaluation of this expression, a new scope is
+        created. The scope must be given back with 'release_scope' once
+        the evaluation is complete.
+
+        Parameters
+        ----------
+        obj : BaseComponent
+            The component to which the expression is bound.
+
+        cb : callable or None, optional
+            The attribute callback for the scope and its nonlocals.
+
+        Returns
+        -------
+        result : tuple
+            A tuple of (scope, overrides) where overrides is the dict of
+            override values of the scope. Values which are specific to 
+            an evaluation may be added to it by the caller, but should 
+            be removed once the evaluation is complete.
+
+        """
+        state = self._scope_state
+        if state is not None and not self._scope_busy:
+            scope, overrides, nonlocals = state
+            scope.reset(cb)
+            nonlocals._nls_attr_cb = cb
+            self._scope_busy = True
+            return scope, overrides
+        
+        nonlocals = NonlocalScope(obj, cb)
+        overrides = self.get_overrides()
+        overrides['nonlocals'] = nonlocals
+        scope = ExecutionScope(
+            obj, self.identifiers, self.f_globals, self.toolkit, 
+            overrides, cb, self.name_cache,
+        )
+        if state is None and self.reuse_scope:
+            self._scope_state = (scope, overrides, nonlocals)
+            self._scope_busy = True
+        return scope, overrides
+
+    def release_scope(self, scope):
+        """ Gives back a scope returned by 'acquire_scope' so that it 
+        may be reused by the next evaluation.
+
+        """
+        state = self._scope_state
+        if state is not None and state[0] is scope:
+            self._scope_busy = False
 
     @abstractmethod
     def eval(self):
@@ -450,16 +910,19 @@ class SimpleExpression(AbstractExpression):
         if obj is None:
             return NotImplemented
         
-        overrides = {'nonlocals': NonlocalScope(obj, None)}
-        identifiers = self.identifiers
-        f_globals = self.f_globals
-        toolkit = self.toolkit
-        scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, None,
-        )
+        profiler = _binding_profiler
+        if profiler is not None:
+            start = default_timer()
+
+        scope, overrides = self.acquire_scope(obj)
+        try:
+            with self.toolkit:
+                res = eval(self.code, self.f_globals, scope)
+        finally:
+            self.release_scope(scope)
 
-        with toolkit:
-            res =  eval(self.code, f_globals, scope)
+        if profiler is not None:
+            profiler.record_eval(self, default_timer() - start)
         
         return res
 
@@ -502,19 +965,21 @@ class NotificationExpression(AbstractExpression):
         if obj is None:
             return
 
-        identifiers = self.identifiers
-        f_globals = self.f_globals
-        toolkit = self.toolkit
-        override = {
-            'event': self.event(obj, self.name, old, new),
-            'nonlocals': NonlocalScope(obj, None),
-        }
-        scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, override, None,
-        )
+        profiler = _binding_profiler
+        if profiler is not None:
+            start = default_timer()
+
+        scope, overrides = self.acquire_scope(obj)
+        overrides['event'] = self.event(obj, self.name, old, new)
+        try:
+            with self.toolkit:
+                eval(self.code, self.f_globals, scope)
+        finally:
+            del overrides['event']
+            self.release_scope(scope)
 
-        with toolkit:
-            eval(self.code, f_globals, scope)
+        if profiler is not None:
+            profiler.record_notify(self, default_timer() - start)
 
 
 #------------------------------------------------------------------------------
@@ -542,17 +1007,7 @@ class UpdateExpression(AbstractExpression):
         """
         super(UpdateExpression, self).__init__(*args)
         
-        inverters = []
-        bp_code = Code.from_code(self.code)
-        code_list = bp_code.code
-
-        for inv_cls in inverter_classes:
-            inverter = inv_cls()
-            new_code = inverter.get_inverted_code(code_list)
-            if new_code is not None:
-                bp_code.code = new_code
-                inverters.append(bp_code.to_code())
-        
+        inverters = inverted_code(self.code, inverter_classes)
         if not inverters:
             msg = ("Unable to delegate expression to the '%s' attribute of "
                    "the %s object. The provided expression is not structured "
@@ -560,7 +1015,18 @@ class UpdateExpression(AbstractExpression):
                    "the supplied code inverters.")
             raise ValueError(msg % (self.name, self.obj_ref()))
 
-        self.inverters = tuple(inverters)
+        self.inverters = inverters
+        self.inverter_scope = inverter_scope(inverter_classes)
+
+    def get_overrides(self):
+        """ Returns the override values which provide the inverter 
+        handlers and the name of the attribute to the inverted code.
+
+        """
+        overrides = super(UpdateExpression, self).get_overrides()
+        overrides.update(self.inverter_scope)
+        overrides['_[name]'] = self.name
+        return overrides
     
     def eval(self):
         """ A no-op eval method since UpdateExpression does not support 
@@ -587,37 +1053,51 @@ class UpdateExpression(AbstractExpression):
         # which are not valid Python identifiers and therefore do
         # not risk clashing with names in the expression. This is
         # the same technique used by the Python interpreter itself.
-        identifiers = self.identifiers
-        f_globals = self.f_globals
-        toolkit = self.toolkit
-        overrides = {
-            '_[expr]': self, '_[obj]': obj, '_[old]': old, '_[new]': new, 
-            '_[name]': self.name, 'nonlocals': NonlocalScope(obj, None),
-        }
-        scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, None,
-        )
+        profiler = _binding_profiler
+        if profiler is not None:
+            start = default_timer()
+
+        # The values which are specific to this change are removed once
+        # the inversion is complete, so that the long-lived scope does 
+        # not hold a reference cycle to the expression.
+        scope, overrides = self.acquire_scope(obj)
+        overrides['_[expr]'] = self
+        overrides['_[obj]'] = obj
+        overrides['_[old]'] = old
+        overrides['_[new]'] = new
 
         # Run through the inverters, giving each a chance to do the
         # inversion. The process ends with the first success. If 
         # none of the invertors are successful an error is raised.
-        with toolkit:
-            for inverter in self.inverters:
-                if eval(inverter, f_globals, scope):
-                    break
-            else:
-                msg = ("Unable to delegate expression to the %r attribute "
-                       "of the %s object. None of the provided inverters were "
-                       "successful in assigning the value.")
-                raise RuntimeError(msg % (self.name, obj))
+        f_globals = self.f_globals
+        try:
+            with self.toolkit:
+                for inverter in self.inverters:
+                    if eval(inverter, f_globals, scope):
+                        break
+                else:
+                    msg = ("Unable to delegate expression to the %r "
+                           "attribute of the %s object. None of the "
+                           "provided inverters were successful in "
+                           "assigning the value.")
+                    raise RuntimeError(msg % (self.name, obj))
+        finally:
+            del overrides['_[expr]'], overrides['_[obj]']
+            del overrides['_[old]'], overrides['_[new]']
+            self.release_scope(scope)
+
+        if profiler is not None:
+            profiler.record_notify(self, default_timer() - start)
 
 
 #------------------------------------------------------------------------------
 # Subscription Expression
 #------------------------------------------------------------------------------
-class _ImplicitAttributeBinder(object):
+class _ImplicitAttributeBinder(TraitHandlerMixin):
     """ A thin class which supports attaching a notifier to an implicit
-    attribute lookup.
+    attribute lookup. Like the trait monitors, it keeps the notifiers
+    of successive evaluations connected when the dependencies are 
+    unchanged.
 
     """
     # This doesn't need to be provided as a monitor because implicit 
@@ -634,6 +1114,7 @@ class _ImplicitAttributeBinder(object):
             reference to the parent is stored.
 
         """
+        super(_ImplicitAttributeBinder, self).__init__()
         self.parent_ref = ref(parent)
     
     def __call__(self, obj, name):
@@ -649,11 +1130,9 @@ class _ImplicitAttributeBinder(object):
             The attribute name of interest
              
         """
-        trait = obj.trait(name)
-        if trait is not None and trait is not Disallow:
-            obj.on_trait_change(self.notify, name)
+        self.do_binding(obj, name)
     
-    def notify(self):
+    def expression_changed(self):
         """ The trait change handler callback. It calls the monitor
         changed method on the parent when the trait changes, provided 
         the parent has not already been garbage collected.
@@ -664,6 +1143,20 @@ class _ImplicitAttributeBinder(object):
             parent._on_monitor_changed()
 
 
+def _expression_writer(obj, attr):
+    """ Returns the subscription expression which writes the given 
+    attribute of a component, or None if there is no such expression.
+
+    """
+    expressions = getattr(obj, '_expressions', None)
+    if isinstance(expressions, dict):
+        entry = expressions.get(attr)
+        if entry:
+            writer = entry[0]
+            if isinstance(writer, SubscriptionExpression):
+                return writer
+
+
 class SubscriptionExpression(AbstractExpression):
     """ A concrete implementation of AbstractExpression. An instance 
     of SubcriptionExpression emits the expression_changed signal when
@@ -699,33 +1192,88 @@ class SubscriptionExpression(AbstractExpression):
             monitor.expression_changed.connect(handler)
             monitors.append(monitor)
 
-        # Collect the generated code from the monitors that will be
-        # inserted into the code for the expression.
-        bp_code = Code.from_code(self.code)
-        code_list = list(bp_code.code)
-        insertions = defaultdict(list)
-        for monitor in monitors:
-            for idx, code in monitor.get_insertion_code(code_list):
-                insertions[idx].extend(code)
-        
-        # Create a new code list which interleaves the code generated
-        # by the monitors at the appropriate location in the expression.
-        new_code = []
-        for idx, code_op in enumerate(code_list):
-            if idx in insertions:
-                new_code.extend(insertions[idx])
-            new_code.append(code_op)
-        
-        bp_code.code = new_code
-        self.eval_code = bp_code.to_code()
+        # The instrumented code is shared amongst all expressions with
+        # the same code and monitor classes. The monitor instances are
+        # supplied to the code through the scope on each evaluation.
+        self.eval_code = monitored_code(self.code, monitors)
         self.monitors = tuple(monitors)
+        self.monitor_scope = dict((m.scope_key(), m) for m in monitors)
         self.implicit_binder = _ImplicitAttributeBinder(self)
         self.old_value = NotImplemented
+        self._rank = 0
+        self._rank_epoch = -1
+        self._ranking = False
+
+    def dependencies(self):
+        """ Returns the list of (obj, attr) pairs on which the monitors
+        and the implicit attribute binder of the expression have hooked
+        notifiers.
+
+        """
+        res = list(self.implicit_binder.dependencies())
+        for monitor in self.monitors:
+            res.extend(monitor.dependencies())
+        return res
+
+    def rank(self):
+        """ Returns the topological rank of the expression. 
+
+        The rank is zero for an expression which does not depend on an
+        attribute written by another expression, and is otherwise one
+        more than the highest rank of those expressions. Expressions
+        pending an update are updated in order of rank. The rank is 
+        cached until the dependency graph changes.
+
+        """
+        epoch = rank_epoch()
+        if self._rank_epoch == epoch:
+            return self._rank
+
+        # A cycle of expressions, such as two delegations which refer
+        # to each other, is broken by ranking the repeated expression 
+        # as zero.
+        if self._ranking:
+            return 0
+        self._ranking = True
+        try:
+            rank = 0
+            for obj, attr in self.dependencies():
+                writer = _expression_writer(obj, attr)
+                if writer is not None and writer is not self:
+                    rank = max(rank, writer.rank() + 1)
+        finally:
+            self._ranking = False
+
+        self._rank = rank
+        self._rank_epoch = epoch
+        return rank
+
+    def get_overrides(self):
+        """ Returns the override values which provide the monitors to
+        the instrumented code.
+
+        """
+        overrides = super(SubscriptionExpression, self).get_overrides()
+        overrides.update(self.monitor_scope)
+        return overrides
 
     def _on_monitor_changed(self):
         """ The signal callback which is fired from a monitor when the
-        expression changes. It will fire the expression_changed signal
-        provided that the value of the expression has actually changed.
+        expression changes. The expression is reevaluated immediately,
+        or at the end of the active 'batch_updates' context, unless its
+        component defers the update while it is hidden.
+
+        """
+        obj = self.obj_ref()
+        if obj is not None and obj.defer_hidden_update(self.name):
+            return
+        if not defer_update(self):
+            self.reevaluate()
+
+    def reevaluate(self):
+        """ Reevaluates the expression and fires the expression_changed
+        signal provided that the value of the expression has actually
+        changed.
 
         """
         new_value = self.eval()
@@ -737,36 +1285,48 @@ class SubscriptionExpression(AbstractExpression):
         except Exception:
             different = True
 
+        profiler = _binding_profiler
+        if profiler is not None:
+            profiler.record_change(self, different)
+
         if different:
             self.old_value = new_value
             self.expression_changed(self, self.name, new_value)
 
     def eval(self):
-        """ Evaluates the expression and returns the result. It also
-        resets the monitors before evaluating the expression to help
-        ensures that duplicate notifications are avoided.
+        """ Evaluates the expression and returns the result. The 
+        monitors record the dependencies of the evaluation, so that 
+        only the notifiers of the dependencies which changed since the
+        last evaluation are disconnected or connected.
 
         """
-        # Reset the monitors before every evaluation so that any old 
-        # notifiers are disconnected. This avoids muti-notifications.
-        self.implicit_binder = binder = _ImplicitAttributeBinder(self)
-        for monitor in self.monitors:
-            monitor.reset()
-
+        binder = self.implicit_binder
         obj = self.obj_ref()
         if obj is None:
+            binder.reset()
+            for monitor in self.monitors:
+                monitor.reset()
             return NotImplemented
         
-        identifiers = self.identifiers
-        f_globals = self.f_globals
-        toolkit = self.toolkit
-        overrides = {'nonlocals': NonlocalScope(obj, binder)}
-        scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, binder,
-        )
+        profiler = _binding_profiler
+        if profiler is not None:
+            start = default_timer()
 
-        with toolkit:
-            res = eval(self.eval_code, f_globals, scope)
+        binder.begin_tracking()
+        for monitor in self.monitors:
+            monitor.begin_tracking()
+        scope, overrides = self.acquire_scope(obj, binder)
+        try:
+            with self.toolkit:
+                res = eval(self.eval_code, self.f_globals, scope)
+        finally:
+            self.release_scope(scope)
+            binder.end_tracking()
+            for monitor in self.monitors:
+                monitor.end_tracking()
+
+        if profiler is not None:
+            profiler.record_eval(self, default_timer() - start)
 
         return res
 
@@ -803,17 +1363,7 @@ class DelegationExpression(SubscriptionExpression):
         """
         super(DelegationExpression, self).__init__(*args)
         
-        inverters = []
-        bp_code = Code.from_code(self.code)
-        code_list = bp_code.code
-
-        for inv_cls in inverter_classes:
-            inverter = inv_cls()
-            new_code = inverter.get_inverted_code(code_list)
-            if new_code is not None:
-                bp_code.code = new_code
-                inverters.append(bp_code.to_code())
-        
+        inverters = inverted_code(self.code, inverter_classes)
         if not inverters:
             msg = ("Unable to delegate expression to the '%s' attribute of "
                    "the %s object. The provided expression is not structured "
@@ -822,6 +1372,18 @@ class DelegationExpression(SubscriptionExpression):
             raise ValueError(msg % (self.name, self.obj_ref()))
 
         self.inverters = inverters
+        self.inverter_scope = inverter_scope(inverter_classes)
+
+    def get_overrides(self):
+        """ Returns the override values which provide the monitors and
+        inverter handlers to the instrumented and inverted code, and the
+        name of the attribute to the inverted code.
+
+        """
+        overrides = super(DelegationExpression, self).get_overrides()
+        overrides.update(self.inverter_scope)
+        overrides['_[name]'] = self.name
+        return overrides
     
     def notify(self, old, new):
         """ A notification method which runs through the list of inverted
@@ -855,27 +1417,171 @@ class DelegationExpression(SubscriptionExpression):
         # which are not valid Python identifiers and therefore do
         # not risk clashing with names in the expression. This is
         # the same technique used by the Python interpreter itself.
-        identifiers = self.identifiers
-        f_globals = self.f_globals
-        toolkit = self.toolkit
-        overrides = {
-            '_[expr]': self, '_[obj]': obj, '_[old]': old, '_[new]': new, 
-            '_[name]': self.name, 'nonlocals': NonlocalScope(obj, None),
-        }
-        scope = ExecutionScope(
-            obj, identifiers, f_globals, toolkit, overrides, None,
-        )
+        profiler = _binding_profiler
+        if profiler is not None:
+            start = default_timer()
+
+        # The values which are specific to this change are removed once
+        # the inversion is complete, so that the long-lived scope does 
+        # not hold a reference cycle to the expression.
+        scope, overrides = self.acquire_scope(obj)
+        overrides['_[expr]'] = self
+        overrides['_[obj]'] = obj
+        overrides['_[old]'] = old
+        overrides['_[new]'] = new
 
         # Run through the inverters, giving each a chance to do the
         # inversion. The process ends with the first success. If 
         # none of the invertors are successful an error is raised.
-        with toolkit:
-            for inverter in self.inverters:
-                if eval(inverter, f_globals, scope):
-                    break
-            else:
-                msg = ("Unable to delegate expression to the '%s' attribute "
-                       "of the %s object. None of the provided inverters were "
-                       "successful in assigning the value.")
-                raise RuntimeError(msg)
+        f_globals = self.f_globals
+        try:
+            with self.toolkit:
+                for inverter in self.inverters:
+                    if eval(inverter, f_globals, scope):
+                        break
+                else:
+                    msg = ("Unable to delegate expression to the '%s' "
+                           "attribute of the %s object. None of the "
+                           "provided inverters were successful in "
+                           "assigning the value.")
+                    raise RuntimeError(msg)
+        finally:
+            del overrides['_[expr]'], overrides['_[obj]']
+            del overrides['_[old]'], overrides['_[new]']
+            self.release_scope(scope)
+
+        if profiler is not None:
+            profiler.record_notify(self, default_timer() - start)
+
+
+
+#------------------------------------------------------------------------------
+# Throttled Subscription Expression
+#------------------------------------------------------------------------------
+class ThrottledSubscriptionExpression(SubscriptionExpression):
+    """ A SubscriptionExpression subclass which is reevaluated at most 
+    once per interval. 
+
+    A change which arrives less than an interval after the last update
+    schedules a single update with the timer of the toolkit application
+    for the end of the interval. Further changes which arrive before
+    then are folded into that update, which delivers the latest value
+    of the expression. If there is no application, the expression is 
+    updated immediately.
+
+    """
+    def __init__(self, interval, *args):
+        """ Initialize a ThrottledSubscriptionExpression.
+
+        Parameters
+        ----------
+        interval : float
+            The minimum number of seconds between updates.
+
+        *args
+            The arguments required to initialize a 
+            SubscriptionExpression.
+
+        """
+        super(ThrottledSubscriptionExpression, self).__init__(*args)
+        self.interval = interval
+        self._last_update = None
+        self._timer_pending = False
+
+    def _on_monitor_changed(self):
+        """ The signal callback which is fired from a monitor when the
+        expression changes. The expression is updated immediately if 
+        the interval has elapsed since the last update, and otherwise
+        at the end of the interval.
+
+        """
+        if self._timer_pending:
+            return
+        app = self.toolkit.app
+        now = default_timer()
+        last = self._last_update
+        if app is None or last is None or now - last >= self.interval:
+            self._last_update = now
+            super(ThrottledSubscriptionExpression, self)._on_monitor_changed()
+        else:
+            self._timer_pending = True
+            ms = int((self.interval - (now - last)) * 1000) + 1
+            app.timer(ms, self._on_timer)
+
+    def _on_timer(self):
+        """ The timer callback which updates the expression with its
+        latest value at the end of the interval.
+
+        """
+        self._timer_pending = False
+        if self.obj_ref() is None:
+            return
+        self._last_update = default_timer()
+        super(ThrottledSubscriptionExpression, self)._on_monitor_changed()
+
+
+#------------------------------------------------------------------------------
+# Debounced Subscription Expression
+#------------------------------------------------------------------------------
+class DebouncedSubscriptionExpression(SubscriptionExpression):
+    """ A SubscriptionExpression subclass which is reevaluated only once
+    its dependencies have stopped changing for a quiet period.
+
+    The first change schedules an update with the timer of the toolkit
+    application for the end of the quiet period. When the timer fires,
+    the update is postponed again if there were further changes in the
+    meantime. If there is no application, the expression is updated 
+    immediately.
+
+    """
+    def __init__(self, delay, *args):
+        """ Initialize a DebouncedSubscriptionExpression.
+
+        Parameters
+        ----------
+        delay : float
+            The number of seconds without a change after which the
+            expression is updated.
+
+        *args
+            The arguments required to initialize a 
+            SubscriptionExpression.
+
+        """
+        super(DebouncedSubscriptionExpression, self).__init__(*args)
+        self.delay = delay
+        self._last_change = None
+        self._timer_pending = False
+
+    def _on_monitor_changed(self):
+        """ The signal callback which is fired from a monitor when the
+        expression changes. The update is scheduled for the end of the
+        quiet period.
+
+        """
+        app = self.toolkit.app
+        if app is None:
+            super(DebouncedSubscriptionExpression, self)._on_monitor_changed()
+            return
+        self._last_change = default_timer()
+        if not self._timer_pending:
+            self._timer_pending = True
+            app.timer(int(self.delay * 1000) + 1, self._on_timer)
+
+    def _on_timer(self):
+        """ The timer callback which updates the expression if the quiet
+        period has elapsed since the last change, or waits out the rest
+        of the period otherwise.
+
+        """
+        if self.obj_ref() is None:
+            self._timer_pending = False
+            return
+        remaining = self._last_change + self.delay - default_timer()
+        app = self.toolkit.app
+        if remaining > 0 and app is not None:
+            app.timer(int(remaining * 1000) + 1, self._on_timer)
+            return
+        self._timer_pending = False
+        super(DebouncedSubscriptionExpression, self)._on_monitor_changed()
 
@@ -2,7 +2,9 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import weakref
 from abc import ABCMeta, abstractmethod
+from opcode import opmap
 
 from .base_component import BaseComponent
 from .toolkit import Toolkit
@@ -18,6 +20,20 @@ class EnamlFactory(object):
     """
     __metaclass__ = ABCMeta
 
+    #: The maximum number of released components which are parked by
+    #: the factory for reuse. Pooling is disabled when this is zero,
+    #: which is the default. Only the components which are created by
+    #: calling the factory from Python code are pooled. They are parked
+    #: by calling their 'release' method instead of 'destroy'. The
+    #: attributes of a reused tree which are bound to an expression are
+    #: reset to the value of the expression, and its user attributes
+    #: which are not bound are restored to their values at setup. The
+    #: state of the toolkit widgets and of the layout is carried over.
+    pool_size = 0
+
+    def __init__(self):
+        self._pool = []
+
     def __call__(self, **kwargs):
         """ Invokes the underlying Enaml build function and applies the
         given keyword arguments as attributes to the result. 
@@ -59,18 +75,75 @@ class EnamlFactory(object):
         Returns
         -------
         result : BaseComponent
-            The BaseComponent instance that was created.
+            The BaseComponent instance that was created, or a parked
+            component which is reused if the factory pools components.
 
         """
+        # A component created from Enaml source shares the identifiers
+        # of the enclosing declaration, so it can't be swapped for a
+        # parked component. Only the top-level calls are pooled.
+        pooled = identifiers is None and self.pool_size > 0
         if identifiers is None:
             identifiers = {}
         if toolkit is None:
             toolkit = Toolkit.active_toolkit()
+        if pooled:
+            component = self.unpark(toolkit)
+            if component is not None:
+                return component
         component = self.build(identifiers, toolkit)
         component.toolkit = toolkit
-        component._bases.insert(0, self)
+        component._bases = (self,) + component._bases
+        if pooled:
+            component._pool_factory = self
         return component
 
+    def park(self, component):
+        """ Parks a released component for reuse by a later call to
+        the factory.
+
+        Parameters
+        ----------
+        component : BaseComponent
+            A component which was created by this factory and has been
+            released.
+
+        Returns
+        -------
+        result : bool
+            True if the component was parked, or False if the pool is
+            full and the component should be destroyed instead.
+
+        """
+        pool = self._pool
+        if len(pool) >= self.pool_size:
+            return False
+        component._park()
+        pool.append(component)
+        return True
+
+    def unpark(self, toolkit):
+        """ Removes a parked component which was created with the
+        given toolkit from the pool and prepares it for reuse.
+
+        Parameters
+        ----------
+        toolkit : Toolkit
+            The toolkit with which the component was created.
+
+        Returns
+        -------
+        result : BaseComponent or None
+            The parked component, or None if there is no such component.
+
+        """
+        pool = self._pool
+        for idx, component in enumerate(pool):
+            if component.toolkit is toolkit:
+                del pool[idx]
+                component._unpark()
+                return component
+
     def __instancecheck__(self, instance):
         """ Overrides isinstance(obj, ctor) for instances of this factory
         class. This allows one check if a component instance was created 
@@ -107,16 +180,52 @@ class EnamlFactory(object):
 #------------------------------------------------------------------------------
 # Enaml Declaration
 #------------------------------------------------------------------------------
+#: The bytecode of a lookup code object which loads a single name.
+_NAME_LOOKUP_CODE = ''.join(
+    [chr(opmap['LOAD_NAME']), '\x00\x00', chr(opmap['RETURN_VALUE'])]
+)
+
+
+def _lookup_name(code):
+    """ Returns the name loaded by a lookup code object which does
+    nothing but load a single name, or None for any other lookup.
+
+    """
+    if code.co_code == _NAME_LOOKUP_CODE:
+        return code.co_names[0]
+
+
 class EnamlDeclaration(EnamlFactory):
     """ An EnamlFactory which exposes a compiled Enaml declaration
     function with an interface that is easy to use from Python.
 
+    The base types, operators and attribute types used by the function
+    are resolved by a tuple of lookup code objects. The results of the
+    lookups for a given toolkit are its build plan, which is computed
+    the first time the declaration is instantiated with the toolkit and
+    is reused for the later instantiations.
+
+    Before a plan is reused, the name of each lookup is checked in the
+    module globals and the toolkit, and the plan is computed again if
+    the name is now bound to a different object. A lookup which is not
+    a single name, such as an attribute of a module, can't be checked
+    this way, so only that lookup is evaluated again when the plan is
+    reused.
+
     """
-    def __init__(self, func):
+    def __init__(self, func, lookups):
+        super(EnamlDeclaration, self).__init__()
         self.__func__ = func
+        self.__lookups__ = lookups
         self.__doc__ = func.__doc__
         self.__name__ = func.__name__
         self.__module__ = func.__module__
+        self._plans = {}
+        self._lookup_names = names = tuple(map(_lookup_name, lookups))
+        self._dynamic_lookups = tuple(
+            (idx, code) for idx, (name, code) in enumerate(zip(names, lookups))
+            if name is None
+        )
 
     def __repr__(self):
         return '%s.%s' % (self.__module__, self.__name__)
@@ -126,5 +235,76 @@ class EnamlDeclaration(EnamlFactory):
         component generated by the internal compiled Enaml function.
 
         """
-        return self.__func__(identifiers, toolkit)
+        plan = self.build_plan(toolkit)
+        return self.__func__(identifiers, toolkit, plan)
+
+    def build_plan(self, toolkit):
+        """ Returns the build plan of the declaration for the given
+        toolkit, computing it if necessary.
+
+        Parameters
+        ----------
+        toolkit : Toolkit
+            The toolkit in which the lookups are evaluated.
+
+        Returns
+        -------
+        result : tuple
+            The results of evaluating the lookups of the declaration.
+
+        """
+        # A Toolkit is a dict, so the plans are keyed on its id. The
+        # weakref removes the plan when the toolkit is collected, so
+        # that a new toolkit with the same id can't reuse it.
+        plans = self._plans
+        key = id(toolkit)
+        entry = plans.get(key)
+        f_globals = self.__func__.func_globals
+        if entry is not None:
+            ref, plan = entry
+            if ref() is toolkit:
+                if self._plan_valid(plan, toolkit, f_globals):
+                    dynamic = self._dynamic_lookups
+                    if dynamic:
+                        plan = list(plan)
+                        for idx, code in dynamic:
+                            plan[idx] = eval(code, toolkit, f_globals)
+                        plan = tuple(plan)
+                    return plan
+        plan = tuple(
+            eval(code, toolkit, f_globals) for code in self.__lookups__
+        )
+        ref = weakref.ref(toolkit, lambda r: plans.pop(key, None))
+        plans[key] = (ref, plan)
+        return plan
+
+    def _plan_valid(self, plan, toolkit, f_globals):
+        """ Returns whether the names of the lookups of a plan are still
+        bound to the objects in the plan. A lookup is evaluated with the
+        module globals as its locals and the toolkit as its globals, so
+        the names are checked in that order. A name which is found in
+        neither is a builtin and is assumed to be unchanged. A lookup
+        which is not a single name is skipped, since it is evaluated
+        again by the caller.
+
+        """
+        for name, obj in zip(self._lookup_names, plan):
+            if name is None:
+                continue
+            if name in f_globals:
+                if f_globals[name] is not obj:
+                    return False
+            elif name in toolkit:
+                if dict.__getitem__(toolkit, name) is not obj:
+                    return False
+        return True
+
+    def clear_plans(self):
+        """ Clears the build plans of the declaration, so that the
+        lookups are evaluated again on the next instantiation. This is
+        only needed when an object in a plan is changed in place, since
+        a rebound name is detected by the declaration.
+
+        """
+        self._plans.clear()
 
@@ -345,7 +345,7 @@ class EnamlImporter(AbstractEnamlImporter):
         with open(file_info.src_path) as src_file:
             src = src_file.read()
         ast = parse(src)
-        code = EnamlCompiler.compile(ast, file_info.src_path)
+        code = EnamlCompiler.compile(ast, file_info.src_path, precompile=True)
         self._write_cache(code, src_mod_time, file_info)
         return (code, file_info.src_path)
 
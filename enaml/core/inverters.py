@@ -45,9 +45,35 @@ class AbstractInverter(object):
     The generated expression should return True if it successfully 
     completed the operation, False otherwise.
 
+    The generated code is cached and shared by every expression which 
+    uses the same code object and inverter classes, and may be written
+    to disk with the compiled Enaml module. It must therefore only use
+    constants which can be marshalled. The handler returned by the
+    'get_handler' method is available in the scope under the name 
+    given by the 'scope_key' classmethod.
+
     """
     __metaclass__ = ABCMeta
 
+    @classmethod
+    def scope_key(cls):
+        """ Returns the name under which the handler of this inverter 
+        is made available to the generated code during evaluation.
+
+        The name is not a valid Python identifier and therefore does 
+        not risk clashing with names used in the expression.
+
+        """
+        return '_[%s.%s]' % (cls.__module__, cls.__name__)
+
+    @abstractmethod
+    def get_handler(self):
+        """ Returns the callable which is loaded by the generated code
+        with a LOAD_NAME of the 'scope_key()' name.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_inverted_code(self, code_list):
         """ Generates the byteplay code operations which represent
@@ -88,10 +114,9 @@ class AbstractAttributeInverter(AbstractInverter):
         """
         attr_code, attr_arg = code_list[-2]
         if attr_code == LOAD_ATTR:
-            handler = self.get_setattr_handler()
             new_code = code_list[:-2]
             new_code.extend([
-                (LOAD_CONST, handler),
+                (LOAD_NAME, self.scope_key()),
                 (ROT_TWO, None),
                 (LOAD_CONST, attr_arg),
                 (LOAD_NAME, '_[new]'),
@@ -100,6 +125,12 @@ class AbstractAttributeInverter(AbstractInverter):
             ])
             return new_code
 
+    def get_handler(self):
+        """ Returns the setattr handler given by 'get_setattr_handler'.
+
+        """
+        return self.get_setattr_handler()
+
     @abstractmethod
     def get_setattr_handler(self):
         """ Returns a function which accepts three arguments: an object,
@@ -166,12 +197,11 @@ class AbstractCallInverter(AbstractInverter):
         """
         func_code, func_arg = code_list[-2]
         if func_code == CALL_FUNCTION:
-            handler = self._call_wrapper(self.get_call_handler())
             new_code = code_list[:-2]
             n_stack_args = (func_arg & 0xFF) + 2 * ((func_arg >> 8) & 0xFF)
             new_code.extend([
                 (BUILD_TUPLE, n_stack_args),
-                (LOAD_CONST, handler),
+                (LOAD_NAME, self.scope_key()),
                 (ROT_THREE, None),
                 (LOAD_CONST, func_arg),
                 (LOAD_NAME, '_[new]'),
@@ -180,6 +210,13 @@ class AbstractCallInverter(AbstractInverter):
             ])
             return new_code
 
+    def get_handler(self):
+        """ Returns the call handler given by 'get_call_handler', wrapped
+        so that it unpacks the stack arguments.
+
+        """
+        return self._call_wrapper(self.get_call_handler())
+
     @abstractmethod
     def get_call_handler(self):
         """ Returns a function which accepts four arguments: the object
@@ -240,10 +277,9 @@ class AbstractNameInverter(AbstractInverter):
         """
         name_code, name_arg = code_list[-2]
         if name_code == LOAD_NAME and len(code_list) == 3:
-            handler = self.get_name_handler()
             new_code = code_list[:-2]
             new_code.extend([
-                (LOAD_CONST, handler),
+                (LOAD_NAME, self.scope_key()),
                 (LOAD_NAME, '_[expr]'),
                 (LOAD_NAME, '_[obj]'),
                 (LOAD_NAME, '_[name]'),
@@ -254,6 +290,12 @@ class AbstractNameInverter(AbstractInverter):
             ])
             return new_code
 
+    def get_handler(self):
+        """ Returns the name handler given by 'get_name_handler'.
+
+        """
+        return self.get_name_handler()
+
     @abstractmethod
     def get_name_handler(self):
         """ Returns a function which accepts five arguments: the 
@@ -133,6 +133,8 @@ class EnamlLexer(object):
         (r'>=', 'GREATEREQUAL'),
         (r'<<', 'LEFTSHIFT'),
         (r'<<=', 'LEFTSHIFTEQUAL'),
+        (r'<<<', 'LEFTSHIFTLESS'),
+        (r'<<:', 'LEFTSHIFTCOLON'),
         (r'<', 'LESS'),
         (r'<=', 'LESSEQUAL'),
         (r'-', 'MINUS'),
@@ -3,14 +3,16 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from weakref import ref
 
 from traits.api import HasTraits, Disallow
 
 from .byteplay import (
-    CALL_FUNCTION, ROT_THREE, LOAD_CONST, LOAD_ATTR, ROT_TWO, BUILD_TUPLE, 
-    UNPACK_SEQUENCE, POP_TOP, DUP_TOP,
+    CALL_FUNCTION, ROT_THREE, LOAD_CONST, LOAD_ATTR, LOAD_NAME, ROT_TWO,
+    BUILD_TUPLE, UNPACK_SEQUENCE, POP_TOP, DUP_TOP,
 )
+from .propagation import begin_propagation, end_propagation, invalidate_ranks
 from .signaling import Signal
 
 
@@ -34,6 +36,17 @@ class AbstractMonitor(object):
     #: A signal which is emitted when the expression has changed.
     expression_changed = Signal()
 
+    @classmethod
+    def scope_key(cls):
+        """ Returns the name under which an instance of this monitor
+        is made available to the generated code during evaluation.
+
+        The name is not a valid Python identifier and therefore does 
+        not risk clashing with names used in the expression.
+
+        """
+        return '_[%s.%s]' % (cls.__module__, cls.__name__)
+
     @abstractmethod
     def get_insertion_code(self, code_list):
         """ Generates the byteplay code operations to be inserted into 
@@ -60,6 +73,12 @@ class AbstractMonitor(object):
         the stack exactly the way it found it. If this is not maintained,
         then random exceptions and/or crashes *will* result.
 
+        The generated code is cached and shared by every expression 
+        which uses the same code object and monitor classes. It must
+        therefore not hold references to this monitor instance. The
+        monitor in use for a given evaluation should be retrieved 
+        from the scope with a LOAD_NAME of the 'scope_key()' name.
+
         """
         raise NotImplementedError
 
@@ -71,6 +90,38 @@ class AbstractMonitor(object):
         """
         raise NotImplementedError
 
+    def begin_tracking(self):
+        """ Called by the owner expression before the expression is 
+        evaluated. 
+
+        The default implementation calls 'reset', so that the notifiers
+        are rebuilt from scratch by the evaluation. Monitors which can
+        compare the dependencies of successive evaluations should 
+        reimplement this method along with 'end_tracking'.
+
+        """
+        self.reset()
+
+    def end_tracking(self):
+        """ Called by the owner expression after the expression has
+        been evaluated, whether or not the evaluation succeeded. 
+
+        Monitors which reimplement 'begin_tracking' should unhook here
+        the notifiers for the dependencies which were not used by the
+        evaluation. The default implementation is a no-op.
+
+        """
+        pass
+
+    def dependencies(self):
+        """ Returns an iterable of the (obj, attr) pairs on which the
+        monitor has hooked notifiers. This is used to order the updates
+        of expressions. The default implementation returns an empty
+        tuple.
+
+        """
+        return ()
+
 
 #------------------------------------------------------------------------------
 # Abstract Attribute Monitor
@@ -88,13 +139,10 @@ class AbstractAttributeMonitor(AbstractMonitor):
         be called with the object and attribute name as arguments.
 
         """
-        # A weak closure which is injected into the stack to call the
-        # monitor method upon attribute access.
-        def code_binder(obj, attr, selfref=ref(self)):
-            this = selfref()
-            if this is not None:
-                this.monitor_attribute(obj, attr)
-        
+        # The monitor is loaded from the scope when the code executes
+        # so that the generated code is independent of this instance.
+        key = self.scope_key()
+
         # The list of code segments that will be inserted into the
         # new bytecode for the expression.
         insertion_code = []
@@ -102,15 +150,16 @@ class AbstractAttributeMonitor(AbstractMonitor):
         for idx, (op, op_arg) in enumerate(code_list):
             # This bit of code is injected between the object on TOS
             # and its pending attribute access. The TOS obj is duped,
-            # the rotated above the binder code. The attr is loaded,
-            # and the binder is called with the object and attr. The
-            # return value of the binder is discarded. This leaves the
-            # original TOS and pending attribute access to continue on
-            # as normal
+            # the rotated above the bound monitor method. The attr is 
+            # loaded, and the method is called with the object and attr.
+            # The return value of the method is discarded. This leaves 
+            # the original TOS and pending attribute access to continue 
+            # on as normal
             if op == LOAD_ATTR:
                 code = [
                     (DUP_TOP, None),
-                    (LOAD_CONST, code_binder),
+                    (LOAD_NAME, key),
+                    (LOAD_ATTR, 'monitor_attribute'),
                     (ROT_TWO, None),
                     (LOAD_CONST, op_arg),
                     (CALL_FUNCTION, 0x0002),
@@ -154,21 +203,10 @@ class AbstractCallMonitor(AbstractMonitor):
         called with the object, args, and kwargs.
 
         """
-        # A weak closure which is injected into the stack to call the
-        # monitor method on function call.
-        def code_binder(func_obj, arg_tuple, arg_spec, selfref=ref(self)):
-            this = selfref()
-            if this is not None:
-                nargs = arg_spec & 0xFF
-                args = arg_tuple[:nargs]
-                kwargs = dict(zip(arg_tuple[nargs::2], arg_tuple[nargs+1::2]))
-                this.monitor_function(func_obj, args, kwargs)
-            # The UNPACK_SEQUENCE op_codes which will unpack these 
-            # return values will unpack things onto the stack in the
-            # reverse of how they are provided. So, we pre-reverse them
-            # so they come out in the right order.
-            return (tuple(reversed(arg_tuple)), func_obj)
-                
+        # The monitor is loaded from the scope when the code executes
+        # so that the generated code is independent of this instance.
+        key = self.scope_key()
+
         # The list of code segments that will be inserted into the
         # new bytecode for the expression.
         insertion_code = []
@@ -176,10 +214,10 @@ class AbstractCallMonitor(AbstractMonitor):
         for idx, (op, op_arg) in enumerate(code_list):
             # This bit of code is injected just before a function call
             # is performed. The arguments on the stack are packed into
-            # tuple. The code binder is then pushed onto the stack and
-            # rotated under the func_obj and arg_tuple. The arg spec
-            # is then loaded and the code binder is invoked. The return 
-            # value of the code binder is the original func_obj and 
+            # tuple. The bound 'monitor_call' method is then pushed onto
+            # the stack and rotated under the func_obj and arg_tuple. The
+            # arg spec is then loaded and the method is invoked. The 
+            # return value of the method is the original func_obj and 
             # arg_tuple. This return tuple is unpacked, and then the 
             # arg_tuple is unpacked and the function call proceeds as 
             # normal.
@@ -194,7 +232,8 @@ class AbstractCallMonitor(AbstractMonitor):
                 n_stack_args = (op_arg & 0xFF) + 2 * ((op_arg >> 8) & 0xFF)
                 code = [
                     (BUILD_TUPLE, n_stack_args),
-                    (LOAD_CONST, code_binder),
+                    (LOAD_NAME, key),
+                    (LOAD_ATTR, 'monitor_call'),
                     (ROT_THREE, None),
                     (LOAD_CONST, op_arg),
                     (CALL_FUNCTION, 0x0003),
@@ -206,6 +245,40 @@ class AbstractCallMonitor(AbstractMonitor):
             # TODO - CALL_FUNCTION_VAR, CALL_FUNCTION_KW, CALL_FUNCTION_VAR_KW
 
         return insertion_code
+
+    def monitor_call(self, func_obj, arg_tuple, arg_spec):
+        """ The method invoked by the generated code just before a 
+        function call is performed. It unpacks the stack arguments and
+        dispatches to the 'monitor_function' method.
+
+        Parameters
+        ----------
+        func_obj : callable object
+            The function-like object which is about to be called.
+
+        arg_tuple : tuple
+            The tuple of objects on the stack which will be passed to
+            the function.
+
+        arg_spec : int
+            The op_arg of the CALL_FUNCTION op code.
+
+        Returns
+        -------
+        result : (tuple, callable object)
+            The reversed arg_tuple and the func_obj, in the form which
+            is expected by the generated UNPACK_SEQUENCE op codes.
+
+        """
+        nargs = arg_spec & 0xFF
+        args = arg_tuple[:nargs]
+        kwargs = dict(zip(arg_tuple[nargs::2], arg_tuple[nargs+1::2]))
+        self.monitor_function(func_obj, args, kwargs)
+        # The UNPACK_SEQUENCE op_codes which will unpack these 
+        # return values will unpack things onto the stack in the
+        # reverse of how they are provided. So, we pre-reverse them
+        # so they come out in the right order.
+        return (tuple(reversed(arg_tuple)), func_obj)
     
     @abstractmethod
     def monitor_function(self, func_obj, args, kwargs):
@@ -227,6 +300,128 @@ class AbstractCallMonitor(AbstractMonitor):
         raise NotImplementedError
 
 
+#------------------------------------------------------------------------------
+# Trait Dispatcher
+#------------------------------------------------------------------------------
+class _TraitDispatcher(object):
+    """ A class which owns the single trait notifier for an object 
+    attribute pair, and dispatches the change notifications to all of 
+    the handlers which are subscribed to the pair.
+
+    The handlers are notified within a propagation, so that the 
+    expressions which depend on the change are updated in order of
+    rank once all of the handlers have been notified.
+
+    """
+    #: The registry of dispatchers, keyed on (obj_id, attr).
+    _dispatchers = {}
+
+    @classmethod
+    def subscribe(cls, obj, attr, handler):
+        """ Subscribes the handler to the changes of the given object
+        attribute pair, creating the dispatcher if necessary.
+
+        Parameters
+        ----------
+        obj : HasTraits
+            The object which owns the trait.
+
+        attr : string
+            The name of the trait on the object.
+
+        handler : _TraitNotificationHandler
+            The handler to notify of changes. Only a weak reference to
+            the handler is kept.
+
+        """
+        key = (id(obj), attr)
+        dispatcher = cls._dispatchers.get(key)
+        if dispatcher is None or dispatcher.obj_ref() is not obj:
+            dispatcher = cls._dispatchers[key] = cls(key, obj, attr)
+        dispatcher.add_handler(handler)
+
+    @classmethod
+    def unsubscribe(cls, obj, attr, handler):
+        """ Unsubscribes the handler from the changes of the given 
+        object attribute pair.
+
+        """
+        dispatcher = cls._dispatchers.get((id(obj), attr))
+        if dispatcher is not None and dispatcher.obj_ref() is obj:
+            dispatcher.remove_handler(id(handler))
+
+    def __init__(self, key, obj, attr):
+        """ Initialize a _TraitDispatcher.
+
+        Parameters
+        ----------
+        key : tuple
+            The key of the dispatcher in the registry.
+
+        obj : HasTraits
+            The object which owns the trait. Only a weak reference to 
+            the object is kept.
+
+        attr : string
+            The name of the trait on the object.
+
+        """
+        self.key = key
+        self.obj_ref = ref(obj, self._on_obj_collected)
+        self.attr = attr
+        self.handlers = OrderedDict()
+        obj.on_trait_change(self.notify, attr)
+
+    def _on_obj_collected(self, obj_ref):
+        """ A weakref callback which unregisters the dispatcher once
+        its object has been garbage collected.
+
+        """
+        self._unregister()
+
+    def _unregister(self):
+        """ Removes the dispatcher from the registry.
+
+        """
+        dispatchers = self._dispatchers
+        if dispatchers.get(self.key) is self:
+            del dispatchers[self.key]
+
+    def add_handler(self, handler):
+        """ Adds a handler to the dispatcher.
+
+        """
+        key = id(handler)
+        remove = lambda handler_ref: self.remove_handler(key)
+        self.handlers[key] = ref(handler, remove)
+
+    def remove_handler(self, key):
+        """ Removes the handler with the given id from the dispatcher.
+        The dispatcher disconnects itself once it has no handlers.
+
+        """
+        handlers = self.handlers
+        handlers.pop(key, None)
+        if not handlers:
+            obj = self.obj_ref()
+            if obj is not None:
+                obj.on_trait_change(self.notify, self.attr, remove=True)
+            self._unregister()
+
+    def notify(self):
+        """ The trait change callback which notifies the handlers.
+
+        """
+        begin_propagation()
+        try:
+            for handler_ref in self.handlers.values():
+                handler = handler_ref()
+                if handler is not None:
+                    handler.notify()
+        finally:
+            end_propagation()
+
+
 #------------------------------------------------------------------------------
 # Trait Notification Handler
 #------------------------------------------------------------------------------
@@ -240,19 +435,33 @@ class _TraitNotificationHandler(object):
 
         Parameters
         ----------
-        parent : AbstractMonitor
-            The AbstractMonitor instance which is the parent of this
-            handler. Only a weak reference to the parent is kept.
+        parent : object
+            The object which is the parent of this handler, typically
+            an AbstractMonitor. Its 'expression_changed' attribute is
+            called when the trait changes. Only a weak reference to the
+            parent is kept.
 
         obj : HasTraits
             The HasTraits instance on which we are attaching a listener.
+            Only a weak reference to the object is kept.
         
         attr : string
             The trait attribute on the object to which we should listen.
 
         """
         self._parent_ref = ref(parent)
-        obj.on_trait_change(self.notify, attr)
+        self.obj_ref = ref(obj)
+        self.attr = attr
+        _TraitDispatcher.subscribe(obj, attr, self)
+
+    def disconnect(self):
+        """ Removes the handler from the trait notifications, provided
+        the object has not already been garbage collected.
+
+        """
+        obj = self.obj_ref()
+        if obj is not None:
+            _TraitDispatcher.unsubscribe(obj, self.attr, self)
 
     def notify(self):
         """ The trait change callback which will emit the expression
@@ -279,13 +488,62 @@ class TraitHandlerMixin(object):
         # is the notification handler for that pair. The object id 
         # is used to avoid ref cycles and potential hashing issues.
         self._handlers = {}
+        # The handlers of the previous evaluation which have not yet
+        # been used by the current evaluation, and the depth of nested
+        # calls to 'begin_tracking'.
+        self._previous = {}
+        self._tracking_depth = 0
+        self._changed = False
 
     def reset(self):
-        """ Clears the existing handlers which results in the notifiers
-        being destroyed.
+        """ Disconnects and clears all of the existing handlers.
+
+        """
+        for handlers in (self._handlers, self._previous):
+            for handler in handlers.itervalues():
+                handler.disconnect()
+            handlers.clear()
+        invalidate_ranks()
+
+    def dependencies(self):
+        """ Returns the list of (obj, attr) pairs which are hooked by
+        the handlers.
+
+        """
+        res = []
+        for handler in self._handlers.itervalues():
+            obj = handler.obj_ref()
+            if obj is not None:
+                res.append((obj, handler.attr))
+        return res
+
+    def begin_tracking(self):
+        """ Starts recording the dependencies of an evaluation. The 
+        existing handlers are kept connected and are moved back into
+        use as the evaluation accesses their object attribute pairs.
 
         """
-        self._handlers.clear()
+        # A nested evaluation of the same expression records into the
+        # dependencies of the outer evaluation.
+        self._tracking_depth += 1
+        if self._tracking_depth == 1:
+            self._previous = self._handlers
+            self._handlers = {}
+
+    def end_tracking(self):
+        """ Disconnects the handlers for the dependencies which were
+        not used by the evaluation.
+
+        """
+        self._tracking_depth -= 1
+        if self._tracking_depth == 0:
+            previous = self._previous
+            if previous or self._changed:
+                for handler in previous.itervalues():
+                    handler.disconnect()
+                previous.clear()
+                self._changed = False
+                invalidate_ranks()
 
     def do_binding(self, obj, attr):
         """ Hooks up a notifier to the object attribute pair if the 
@@ -300,6 +558,16 @@ class TraitHandlerMixin(object):
         key = (id(obj), attr)
         if key in handlers:
             return
+
+        # Reuse the handler from the previous evaluation if it is still
+        # connected to this object. The identity check guards against
+        # the id of a dead object having been reused.
+        handler = self._previous.pop(key, None)
+        if handler is not None:
+            if handler.obj_ref() is obj:
+                handlers[key] = handler
+                return
+            handler.disconnect()
         
         if isinstance(obj, HasTraits):
             # Only hook up a notifier if the attribute access refers to
@@ -309,6 +577,7 @@ class TraitHandlerMixin(object):
             if trait is not None and trait.trait_type is not Disallow:
                 handler = _TraitNotificationHandler(self, obj, attr)
                 handlers[key] = handler
+                self._changed = True
 
 
 #------------------------------------------------------------------------------
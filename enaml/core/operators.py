@@ -4,7 +4,9 @@
 #------------------------------------------------------------------------------
 from .expressions import (
     SimpleExpression, NotificationExpression, SubscriptionExpression, 
-    DelegationExpression, UpdateExpression,
+    DelegationExpression, UpdateExpression, ThrottledSubscriptionExpression,
+    DebouncedSubscriptionExpression, monitored_code, inverted_code,
+    add_monitored_code, add_inverted_code,
 )
 from .inverters import (
     GenericAttributeInverter, GetattrInverter, ImplicitAttrInverter,
@@ -54,6 +56,25 @@ from .monitors import TraitAttributeMonitor, TraitGetattrMonitor
 #: are free to get creative with the operators.
 
 
+#: The monitor classes used by the default '<<' and ':=' operators.
+DEFAULT_MONITORS = (TraitAttributeMonitor, TraitGetattrMonitor)
+
+
+#: The inverter classes used by the default '>>' and ':=' operators.
+DEFAULT_INVERTERS = (
+    GenericAttributeInverter, GetattrInverter, ImplicitAttrInverter,
+)
+
+
+#: The maximum number of updates per second of the default '<<<' 
+#: operator. This matches a typical display refresh rate.
+DEFAULT_THROTTLE_RATE = 60.0
+
+
+#: The quiet period in seconds of the default '<<:' operator.
+DEFAULT_DEBOUNCE_DELAY = 0.1
+
+
 def op_simple(cmpnt, attr, code, identifiers, f_globals, toolkit):
     """ The default Enaml operator for '=' expressions. It binds an
     instance of SimpleExpression to the component.
@@ -77,7 +98,7 @@ def op_update(cmpnt, attr, code, identifiers, f_globals, toolkit):
     instance of UpdateExpression to the component.
 
     """
-    inverters = [GenericAttributeInverter, GetattrInverter, ImplicitAttrInverter]
+    inverters = DEFAULT_INVERTERS
     expr = UpdateExpression(inverters, cmpnt, attr, code, identifiers, f_globals, toolkit)
     cmpnt.bind_expression(attr, expr, notify_only=True)
 
@@ -89,11 +110,81 @@ def op_subscribe(cmpnt, attr, code, identifiers, f_globals, toolkit):
     the builtin getattr function.
 
     """
-    monitors = [TraitAttributeMonitor, TraitGetattrMonitor]
+    monitors = DEFAULT_MONITORS
     expr = SubscriptionExpression(monitors, cmpnt, attr, code, identifiers, f_globals, toolkit)
     cmpnt.bind_expression(attr, expr)
 
 
+def throttled_operator(rate):
+    """ Creates an operator which binds an instance of 
+    ThrottledSubscriptionExpression to the component, using the same
+    monitors as the '<<' operator.
+
+    Parameters
+    ----------
+    rate : float
+        The maximum number of updates per second of the expression.
+        The latest value of the expression is always delivered.
+
+    Returns
+    -------
+    result : callable
+        An operator function which can be added to the operators
+        of an Enaml module.
+
+    """
+    interval = 1.0 / rate
+    def op_throttle(cmpnt, attr, code, identifiers, f_globals, toolkit):
+        monitors = DEFAULT_MONITORS
+        expr = ThrottledSubscriptionExpression(
+            interval, monitors, cmpnt, attr, code, identifiers, f_globals, 
+            toolkit,
+        )
+        cmpnt.bind_expression(attr, expr)
+    return op_throttle
+
+
+def debounced_operator(delay):
+    """ Creates an operator which binds an instance of 
+    DebouncedSubscriptionExpression to the component, using the same
+    monitors as the '<<' operator.
+
+    Parameters
+    ----------
+    delay : float
+        The number of seconds without a change after which the 
+        expression is updated.
+
+    Returns
+    -------
+    result : callable
+        An operator function which can be added to the operators
+        of an Enaml module.
+
+    """
+    def op_debounce(cmpnt, attr, code, identifiers, f_globals, toolkit):
+        monitors = DEFAULT_MONITORS
+        expr = DebouncedSubscriptionExpression(
+            delay, monitors, cmpnt, attr, code, identifiers, f_globals, 
+            toolkit,
+        )
+        cmpnt.bind_expression(attr, expr)
+    return op_debounce
+
+
+#: The default Enaml operator for '<<<' expressions. It is a throttled
+#: version of the '<<' operator, updated at most DEFAULT_THROTTLE_RATE
+#: times per second through the timer of the toolkit application.
+op_throttle = throttled_operator(DEFAULT_THROTTLE_RATE)
+
+
+#: The default Enaml operator for '<<:' expressions. It is a debounced
+#: version of the '<<' operator, updated through the timer of the 
+#: toolkit application once DEFAULT_DEBOUNCE_DELAY seconds have passed
+#: without a change.
+op_debounce = debounced_operator(DEFAULT_DEBOUNCE_DELAY)
+
+
 def op_delegate(cmpnt, attr, code, identifiers, f_globals, toolkit):
     """ The default Enaml operator for ':=' expressions. It binds an
     instance of DelegationExpression to the component using monitors
@@ -103,8 +194,8 @@ def op_delegate(cmpnt, attr, code, identifiers, f_globals, toolkit):
     builtin getattr function.
 
     """
-    inverters = [GenericAttributeInverter, GetattrInverter, ImplicitAttrInverter]
-    monitors = [TraitAttributeMonitor, TraitGetattrMonitor]
+    inverters = DEFAULT_INVERTERS
+    monitors = DEFAULT_MONITORS
     expr = DelegationExpression(inverters, monitors, cmpnt, attr, code, identifiers, f_globals, toolkit)
     cmpnt.bind_expression(attr, expr)
 
@@ -112,8 +203,77 @@ def op_delegate(cmpnt, attr, code, identifiers, f_globals, toolkit):
 OPERATORS = {
     '__operator_Equal__': op_simple,
     '__operator_LessLess__': op_subscribe,
+    '__operator_LessLessLess__': op_throttle,
+    '__operator_LessLessColon__': op_debounce,
     '__operator_ColonEqual__': op_delegate,
     '__operator_ColonColon__': op_notify,
     '__operator_GreaterGreater__': op_update,
 }
 
+
+#------------------------------------------------------------------------------
+# Precompiled Code Variants
+#------------------------------------------------------------------------------
+#: The names of the default operators which rewrite the expression code,
+#: mapped to a tuple of booleans indicating whether the code is monitored
+#: and whether it is inverted by that operator.
+REWRITING_OPERATORS = {
+    '__operator_LessLess__': (True, False),
+    '__operator_LessLessLess__': (True, False),
+    '__operator_LessLessColon__': (True, False),
+    '__operator_ColonEqual__': (True, True),
+    '__operator_GreaterGreater__': (False, True),
+}
+
+
+def precompile_variants(op_name, code):
+    """ Generates ahead of time the rewritten variants of an expression
+    code object which will be needed by the default operator of the
+    given name. This is used by the Enaml compiler.
+
+    Parameters
+    ----------
+    op_name : string
+        The name of the operator, e.g. '__operator_LessLess__'.
+    
+    code : types.CodeType
+        The compiled code object for the Python expression.
+
+    Returns
+    -------
+    result : tuple or None
+        A tuple of (code, monitored, inverted) where monitored is the 
+        code instrumented by the DEFAULT_MONITORS or None, and inverted
+        is the tuple of code objects generated by the DEFAULT_INVERTERS
+        or None. If the operator does not rewrite the code, None is 
+        returned.
+
+    """
+    if op_name not in REWRITING_OPERATORS:
+        return None
+    monitor, invert = REWRITING_OPERATORS[op_name]
+    monitored = inverted = None
+    if monitor:
+        monitors = [mcls() for mcls in DEFAULT_MONITORS]
+        monitored = monitored_code(code, monitors)
+    if invert:
+        inverted = inverted_code(code, DEFAULT_INVERTERS)
+    return (code, monitored, inverted)
+
+
+def register_precompiled(variants):
+    """ Seeds the process-wide code caches with variants which were 
+    generated by 'precompile_variants'. This is called by the code of
+    compiled Enaml modules when they are executed.
+
+    Parameters
+    ----------
+    variants : iterable of tuples
+        An iterable of (code, monitored, inverted) tuples.
+
+    """
+    for code, monitored, inverted in variants:
+        if monitored is not None:
+            add_monitored_code(code, DEFAULT_MONITORS, monitored)
+        if inverted is not None:
+            add_inverted_code(code, DEFAULT_INVERTERS, inverted)
@@ -5,9 +5,9 @@ _tabversion = '3.2'
 
 _lr_method = 'LALR'
 
-_lr_signature = '\x9b\xb3\xba\x0eT?@J\x91\xb2S\xc4GZ\xe6\xd5'
+_lr_signature = '\x9br\x06\x18:W\xfe\xaa\xd2.\xa3UI:\x99\xe9'
     
-_lr_action_items = {'LPAR':([0,1,6,7,9,13,14,16,18,24,28,29,30,31,33,35,39,42,43,44,47,49,52,54,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,102,103,104,106,109,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,137,138,140,144,147,148,150,155,157,160,161,163,165,166,168,169,170,171,177,183,185,186,187,188,189,191,193,194,195,196,199,201,202,205,210,211,213,215,216,218,219,220,228,233,234,244,246,248,251,253,256,258,260,262,263,265,270,271,272,274,277,278,279,281,282,291,292,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,319,321,324,328,330,333,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,374,375,377,378,379,383,391,394,401,404,410,414,417,418,420,428,429,430,432,435,437,440,444,447,450,453,459,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,510,516,521,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[1,1,-132,1,1,1,-47,-135,-131,-129,-133,1,-289,1,1,-290,1,-48,1,-9,-7,1,165,171,1,1,1,-8,-134,1,-287,-288,1,1,1,1,-136,1,-130,-280,-49,1,-50,1,1,1,1,-207,1,1,-117,-108,-112,-107,1,-110,-114,-109,-113,-116,-118,-115,-111,1,1,-173,-172,242,1,-291,1,1,251,1,1,1,-285,1,1,1,165,1,1,-278,171,1,-283,-233,1,-229,-228,-236,-231,-234,-232,-230,-6,1,1,314,316,-282,1,1,-281,1,1,1,1,-208,1,1,1,1,1,171,1,1,-43,1,-286,1,1,1,-306,1,1,1,-279,-309,1,1,1,171,1,1,1,-284,1,1,-237,1,-235,1,1,1,1,1,1,1,408,411,1,-160,1,-209,1,1,1,1,1,1,-155,-150,1,1,-307,1,1,1,-359,1,1,1,-308,171,171,-145,1,-169,-137,483,1,-161,-210,1,-166,1,1,-154,1,1,1,-360,1,1,171,171,1,1,1,1,-142,1,-138,-139,-147,-44,1,1,-156,1,1,1,-149,1,1,1,1,171,1,171,-170,1,1,-141,-140,1,-10,-151,-152,-157,1,1,-146,1,1,1,-171,1,-144,1,1,1,1,1,1,-143,-148,1,-158,-159,-11,-12,1,1,1,1,1,-153,-13,-14,-15,-16,]),'ENDMARKER':([0,6,8,14,16,18,24,28,41,42,44,47,63,64,73,85,89,95,97,135,136,153,196,258,328,354,355,391,401,404,417,428,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[2,-132,100,-47,-135,-131,-129,-133,152,-48,-9,-7,-8,-134,-5,-136,-130,-49,-50,-173,-172,255,-6,-43,-160,-155,-150,-145,-169,-137,-161,-166,-154,-142,-138,-139,-147,-44,-156,-149,-170,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'NOTEQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,185,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,185,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'AMPEREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,120,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'CIRCUMFLEX':([10,12,23,30,35,37,38,51,52,67,72,90,101,105,107,113,131,132,140,149,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,232,239,240,241,254,262,267,268,269,271,278,279,280,300,336,351,364,371,378,],[-262,112,-256,-289,-290,-270,-246,-250,-274,-287,-288,-280,-271,-264,-263,233,-257,-258,-291,-247,-272,-285,-252,-251,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-245,-249,-307,-277,-308,]),'WITH':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,353,354,355,391,401,404,417,428,430,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[7,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,7,-136,-130,-49,-50,-173,-172,-6,-43,-160,7,-155,-150,-145,-169,-137,-161,-166,7,-154,-142,-138,-139,-147,-44,-156,-149,-170,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'MINUS':([0,1,6,7,9,10,13,14,16,18,23,24,28,29,30,31,33,35,37,39,42,43,44,47,49,52,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,101,102,103,104,105,106,107,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,132,133,134,135,136,138,140,144,147,150,151,155,157,160,161,163,165,166,168,169,170,177,181,183,185,186,187,188,189,191,193,194,195,196,199,201,210,211,213,215,216,218,219,220,222,223,224,225,226,233,234,239,240,241,244,246,248,253,256,258,260,262,263,265,270,271,272,274,277,278,279,280,281,282,291,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,371,374,375,377,378,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[39,39,-132,39,39,-262,39,-47,-135,-131,134,-129,-133,39,-289,39,39,-290,-270,39,-48,39,-9,-7,39,-274,39,39,39,-8,-134,39,-287,-288,39,39,39,39,-136,39,-130,-280,-49,39,-50,-271,39,39,39,-264,39,-263,39,39,-117,-108,-112,-107,39,-110,-114,-109,-113,-116,-118,-115,-111,134,-258,39,39,-173,-172,39,-291,39,39,39,-272,39,39,-285,39,39,39,-276,39,39,-278,39,-273,-283,-233,39,-229,-228,-236,-231,-234,-232,-230,-6,39,39,-282,39,39,-281,39,39,39,39,-266,-268,-269,-267,-265,39,39,-259,-260,-261,39,39,39,39,39,-43,39,-286,39,39,39,-306,39,39,39,-279,-309,-275,39,39,39,39,39,39,-284,39,39,-237,39,-235,39,39,39,39,39,39,39,39,-160,39,39,39,39,39,39,39,-155,-150,39,39,-307,39,39,39,-359,-277,39,39,39,-308,-145,39,-169,-137,39,-161,39,-166,39,39,-154,39,39,39,-360,39,39,39,39,39,39,-142,39,-138,-139,-147,-44,39,39,-156,39,39,39,-149,39,39,39,39,39,-170,39,39,-141,-140,39,-10,-151,-152,-157,39,39,-146,39,39,39,-171,39,-144,39,39,39,39,39,39,-143,-148,39,-158,-159,-11,-12,39,39,39,39,39,-153,-13,-14,-15,-16,]),'LESS':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,188,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,188,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'EXCEPT':([95,97,258,259,354,490,493,545,605,606,],[-49,-50,-43,356,356,-44,-156,-157,-158,-159,]),'PLUS':([0,1,6,7,9,10,13,14,16,18,23,24,28,29,30,31,33,35,37,39,42,43,44,47,49,52,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,101,102,103,104,105,106,107,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,132,133,134,135,136,138,140,144,147,150,151,155,157,160,161,163,165,166,168,169,170,177,181,183,185,186,187,188,189,191,193,194,195,196,199,201,210,211,213,215,216,218,219,220,222,223,224,225,226,233,234,239,240,241,244,246,248,253,256,258,260,262,263,265,270,271,272,274,277,278,279,280,281,282,291,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,371,374,375,377,378,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[9,9,-132,9,9,-262,9,-47,-135,-131,133,-129,-133,9,-289,9,9,-290,-270,9,-48,9,-9,-7,9,-274,9,9,9,-8,-134,9,-287,-288,9,9,9,9,-136,9,-130,-280,-49,9,-50,-271,9,9,9,-264,9,-263,9,9,-117,-108,-112,-107,9,-110,-114,-109,-113,-116,-118,-115,-111,133,-258,9,9,-173,-172,9,-291,9,9,9,-272,9,9,-285,9,9,9,-276,9,9,-278,9,-273,-283,-233,9,-229,-228,-236,-231,-234,-232,-230,-6,9,9,-282,9,9,-281,9,9,9,9,-266,-268,-269,-267,-265,9,9,-259,-260,-261,9,9,9,9,9,-43,9,-286,9,9,9,-306,9,9,9,-279,-309,-275,9,9,9,9,9,9,-284,9,9,-237,9,-235,9,9,9,9,9,9,9,9,-160,9,9,9,9,9,9,9,-155,-150,9,9,-307,9,9,9,-359,-277,9,9,9,-308,-145,9,-169,-137,9,-161,9,-166,9,9,-154,9,9,9,-360,9,9,9,9,9,9,-142,9,-138,-139,-147,-44,9,9,-156,9,9,9,-149,9,9,9,9,9,-170,9,9,-141,-140,9,-10,-151,-152,-157,9,9,-146,9,9,9,-171,9,-144,9,9,9,9,9,9,-143,-148,9,-158,-159,-11,-12,9,9,9,9,9,-153,-13,-14,-15,-16,]),'PERCENTEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,125,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'IMPORT':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,109,135,136,155,196,207,208,209,216,219,228,258,299,315,318,320,322,328,330,333,350,353,354,355,391,401,404,417,418,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[11,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,11,-136,-130,-49,11,-50,-207,-173,-172,11,-6,319,321,-191,11,11,-208,-43,11,11,11,410,-192,-160,11,-209,11,11,-155,-150,-145,-169,-137,-161,-210,-166,11,11,-154,11,11,11,-142,-138,-139,-147,-44,11,11,-156,11,-149,11,-170,11,11,-141,-140,-10,-151,-152,-157,-146,-171,11,-144,11,11,11,-143,-148,11,-158,-159,-11,-12,11,-153,-13,-14,-15,-16,]),'EQEQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,195,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,195,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'RBRACE':([10,12,19,23,27,30,32,35,37,38,46,48,49,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,158,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,263,264,266,267,268,269,271,278,279,280,295,300,305,311,336,344,351,358,359,360,361,364,371,378,388,395,397,422,438,439,440,441,485,498,519,520,535,536,537,573,580,591,593,607,613,],[-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,160,-250,-274,-287,-224,-288,-218,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,262,-285,-252,-251,-276,-278,-273,-283,-225,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-342,-343,-341,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-245,-241,-249,-217,-347,-344,-337,-307,-277,-308,-386,-227,-221,-212,-348,-339,-338,-336,-370,-340,-382,-381,-373,-372,-371,-374,-345,-383,-375,-346,-384,]),'EXEC':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[13,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,13,-136,-130,-49,13,-50,-173,-172,13,-6,13,13,-43,13,13,13,-160,13,13,13,-155,-150,-145,-169,-137,-161,-166,13,13,-154,13,13,13,-142,-138,-139,-147,-44,13,13,-156,13,-149,13,-170,13,13,-141,-140,-10,-151,-152,-157,-146,-171,13,-144,13,13,13,-143,-148,13,-158,-159,-11,-12,13,-153,-13,-14,-15,-16,]),'SLASH':([10,30,35,37,52,67,72,90,101,105,107,140,151,160,166,170,181,183,210,215,222,223,224,225,226,262,271,278,279,280,300,364,371,378,],[106,-289,-290,-270,-274,-287,-288,-280,-271,-264,106,-291,-272,-285,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-286,-306,-279,-309,-275,-284,-307,-277,-308,]),'PASS':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,574,575,577,578,592,594,596,597,598,599,601,603,604,605,606,614,615,617,618,619,620,624,628,629,632,633,635,637,638,645,646,648,649,650,651,653,654,655,656,657,658,659,660,661,662,664,665,667,668,670,671,672,673,674,],[20,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,20,-136,-130,-49,20,-50,-173,-172,20,-6,20,20,-43,20,20,20,-160,20,20,20,-155,-150,-145,-169,-137,-161,-166,20,20,-154,20,20,20,-142,-138,-139,-147,-44,20,20,-156,20,-149,20,-170,20,20,-141,-140,-10,-151,-152,-157,-146,-171,20,-144,600,20,20,20,-143,-21,-19,-17,-20,600,600,-148,20,-158,-159,600,-11,-18,-22,-12,600,-37,20,-153,600,600,-13,-23,-25,-28,-42,-14,-15,600,-41,-39,-38,-40,-27,666,-16,-24,-26,-34,666,-32,-35,666,-29,-33,-36,-30,666,-31,]),'NAME':([0,1,6,7,9,11,13,14,16,18,24,26,28,29,31,33,34,39,42,43,44,47,49,54,55,56,57,61,63,64,65,73,74,80,82,83,84,85,86,87,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,167,168,169,171,172,176,177,185,186,187,188,189,191,193,194,195,196,199,201,208,209,211,213,216,218,219,220,227,229,230,233,234,242,244,246,248,251,253,256,258,260,263,265,270,272,274,277,281,282,291,292,293,296,298,299,301,303,306,307,308,309,310,312,314,315,316,318,319,321,322,324,328,330,332,335,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,379,383,385,387,391,394,401,404,408,410,411,414,417,420,428,429,430,432,435,437,440,444,447,450,453,454,455,457,459,461,463,466,468,472,473,475,476,477,479,483,488,490,491,492,493,494,495,496,497,498,500,503,508,510,511,512,516,521,522,523,526,527,528,530,538,540,542,543,545,548,550,554,555,558,559,563,564,567,568,569,570,574,575,577,578,579,582,589,590,592,594,596,597,598,599,601,602,603,604,605,606,610,614,615,616,617,618,619,620,621,623,624,625,626,627,628,629,630,632,633,635,637,638,639,645,646,648,649,650,651,653,654,655,656,657,658,659,660,661,662,664,665,667,668,670,671,672,673,674,],[67,67,-132,67,67,109,67,-47,-135,-131,-129,137,-133,67,67,67,148,67,-48,67,-9,-7,67,173,67,179,67,67,-8,-134,67,67,67,202,67,67,109,-136,67,109,-130,-49,67,-50,67,67,67,67,67,67,-117,-108,-112,-107,67,-110,-114,-109,-113,-116,-118,-115,-111,67,67,-173,-172,67,67,67,67,67,67,67,67,67,279,67,67,173,289,294,67,-233,67,-229,-228,-236,-231,-234,-232,-230,-6,67,67,109,-191,67,67,67,67,67,67,331,333,109,67,67,340,67,67,67,173,67,67,-43,67,67,67,67,67,67,67,67,67,67,173,67,67,390,67,67,67,-237,67,-235,67,67,67,67,67,67,67,407,407,-192,67,-160,67,418,109,67,67,67,67,67,67,-155,-150,67,67,67,67,67,-359,67,67,67,173,173,460,462,-145,67,-169,-137,407,407,407,67,-161,67,-166,67,67,-154,67,67,67,-360,67,67,173,506,507,509,173,67,67,67,67,-142,67,-138,-139,407,531,407,-147,-44,67,67,-156,67,67,67,-149,67,67,67,67,173,556,557,67,173,-170,67,67,-141,-140,407,67,-10,-151,-152,-157,67,67,583,584,586,-146,67,67,67,-171,67,-144,602,67,67,67,67,608,67,67,-143,-21,-19,-17,-20,616,616,622,-148,67,-158,-159,631,602,-11,622,-18,-22,-12,616,67,67,-37,67,67,643,67,-153,647,616,616,-13,-23,-25,652,-28,-42,-14,-15,616,-41,-39,-38,-40,-27,663,-16,-24,-26,-34,669,-32,-35,669,-29,-33,-36,-30,669,-31,]),'INDENT':([257,539,644,],[353,574,657,]),'MINUSEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,119,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'ENAMLDEF':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,354,355,391,401,404,417,428,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[26,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,26,-136,-130,-49,-50,-173,-172,-6,-43,-160,-155,-150,-145,-169,-137,-161,-166,-154,-142,-138,-139,-147,-44,-156,-149,-170,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'DEDENT':([6,14,16,18,24,28,42,64,85,89,95,97,135,136,258,328,354,355,391,401,404,417,428,430,431,432,472,475,476,488,489,490,493,497,522,527,528,542,543,545,559,568,570,592,594,596,597,598,599,601,603,605,606,617,618,620,624,629,632,633,637,638,645,646,650,651,653,654,655,656,659,660,661,662,664,665,667,668,670,671,672,673,674,],[-132,-47,-135,-131,-129,-133,-48,-134,-136,-130,-49,-50,-173,-172,-43,-160,-155,-150,-145,-169,-137,-161,-166,-46,490,-154,-142,-138,-139,-147,-45,-44,-156,-149,-170,-141,-140,-151,-152,-157,-146,-171,-144,-143,-21,-19,-17,-20,615,619,-148,-158,-159,-18,-22,635,-37,-153,648,649,-23,-25,-28,-42,658,-41,-39,-38,-40,-27,-24,-26,-34,668,-32,-35,672,-29,-33,-36,-30,674,-31,]),'RETURN':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[29,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,29,-136,-130,-49,29,-50,-173,-172,29,-6,29,29,-43,29,29,29,-160,29,29,29,-155,-150,-145,-169,-137,-161,-166,29,29,-154,29,29,29,-142,-138,-139,-147,-44,29,29,-156,29,-149,29,-170,29,29,-141,-140,-10,-151,-152,-157,-146,-171,29,-144,29,29,29,-143,-148,29,-158,-159,-11,-12,29,-153,-13,-14,-15,-16,]),'DEL':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[31,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,31,-136,-130,-49,31,-50,-173,-172,31,-6,31,31,-43,31,31,31,-160,31,31,31,-155,-150,-145,-169,-137,-161,-166,31,31,-154,31,31,31,-142,-138,-139,-147,-44,31,31,-156,31,-149,31,-170,31,31,-141,-140,-10,-151,-152,-157,-146,-171,31,-144,31,31,31,-143,-148,31,-158,-159,-11,-12,31,-153,-13,-14,-15,-16,]),'PRINT':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[33,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,33,-136,-130,-49,33,-50,-173,-172,33,-6,33,33,-43,33,33,33,-160,33,33,33,-155,-150,-145,-169,-137,-161,-166,33,33,-154,33,33,33,-142,-138,-139,-147,-44,33,33,-156,33,-149,33,-170,33,33,-141,-140,-10,-151,-152,-157,-146,-171,33,-144,33,33,33,-143,-148,33,-158,-159,-11,-12,33,-153,-13,-14,-15,-16,]),'DOUBLESTAR':([30,35,52,54,67,72,90,140,160,165,166,170,183,210,215,251,262,271,274,278,279,292,300,316,364,370,378,382,383,442,444,459,501,510,513,521,552,585,609,],[-289,-290,168,176,-287,-288,-280,-291,-285,272,277,-278,-283,-282,-281,176,-286,-306,367,-279,-309,387,-284,272,-307,-359,-308,454,457,500,-360,512,550,555,558,176,582,610,630,]),'DEF':([0,6,14,16,18,22,24,25,28,42,44,47,63,64,73,85,89,95,97,130,135,136,196,258,317,328,353,354,355,391,401,404,417,428,430,432,470,472,475,476,488,490,493,497,522,524,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[34,-132,-47,-135,-131,-175,-129,34,-133,-48,-9,-7,-8,-134,34,-136,-130,-49,-50,-174,-173,-172,-6,-43,-176,-160,34,-155,-150,-145,-169,-137,-161,-166,34,-154,-177,-142,-138,-139,-147,-44,-156,-149,-170,-178,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'CIRCUMFLEXEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,118,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'COLON':([10,12,19,23,27,30,32,35,37,38,45,46,48,51,52,54,67,68,72,75,77,90,98,99,101,105,107,113,131,132,140,143,149,151,156,159,160,162,164,166,169,170,173,174,175,180,181,183,190,198,200,201,202,204,206,210,215,221,222,223,224,225,226,232,239,240,241,247,252,254,261,262,267,268,269,271,278,279,280,283,289,290,292,294,295,300,305,311,312,313,327,329,336,344,348,351,352,356,357,358,364,371,372,377,378,381,383,384,386,388,395,397,398,399,416,421,422,427,433,434,436,448,450,456,458,459,460,462,465,469,474,499,506,507,509,510,514,521,525,541,544,546,547,553,556,557,566,576,583,584,586,602,608,616,622,631,647,663,669,],[-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,155,-214,-222,-250,-274,177,-287,-224,-288,-218,-123,-280,-162,219,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,265,-285,-252,-251,-276,281,-278,-414,-390,293,299,-273,-283,-225,-219,-125,-124,315,-223,318,-282,-281,330,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,350,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,374,-407,-395,-391,-409,-385,-284,-226,-220,-126,-127,-163,-165,-245,-241,-167,-249,429,435,437,-217,-307,-277,447,281,-308,-415,-396,-400,-410,-386,-227,-221,-128,468,-164,487,-212,-168,491,492,495,503,281,-412,-405,-401,-387,-389,516,523,526,548,-408,-392,-394,-406,-411,567,569,575,577,578,579,-413,-397,-399,590,604,-402,-404,-388,627,-393,634,639,-398,-403,627,634,]),'DOUBLECOLON':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,169,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,283,295,300,305,311,336,344,351,358,364,371,377,378,388,395,397,422,450,602,616,622,652,663,669,],[-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,282,-278,-273,-283,-225,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,375,-385,-284,-226,-220,-245,-241,-249,-217,-307,-277,282,-308,-386,-227,-221,-212,282,628,628,628,628,628,628,]),'$end':([2,71,100,152,255,],[-4,0,-3,-2,-1,]),'FOR':([0,6,10,12,14,16,18,19,23,24,27,28,30,32,35,37,38,42,44,46,47,48,51,52,63,64,67,68,72,73,75,85,89,90,92,95,97,101,105,107,113,131,132,135,136,140,143,149,151,156,159,160,162,164,166,170,181,183,184,190,196,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,258,261,262,267,268,269,271,275,278,279,280,295,300,305,311,328,336,344,351,353,354,355,358,361,364,371,378,388,391,395,397,401,404,417,422,428,430,432,472,475,476,485,488,490,493,497,517,518,519,520,522,527,528,540,542,543,545,559,565,568,570,573,587,588,589,591,592,603,605,606,612,613,615,619,629,635,648,649,658,],[43,-132,-262,-242,-47,-135,-131,-213,-256,-129,-211,-133,-289,-238,-290,-270,-246,-48,-9,-214,-7,-222,-250,-274,-8,-134,-287,-224,-288,43,-218,-136,-130,-280,211,-49,-50,-271,-264,-263,-243,-257,-258,-173,-172,-291,-239,-247,-272,-215,211,-285,-252,-251,-276,-278,-273,-283,301,-225,-6,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-43,-216,-286,-254,-255,-253,-306,211,-279,-309,-275,-385,-284,-226,-220,-160,-245,-241,-249,43,-155,-150,-217,211,-307,-277,-308,-386,-145,-227,-221,-169,-137,-161,-212,-166,43,-154,-142,-138,-139,211,-147,-44,-156,-149,301,-376,-382,-381,-170,-141,-140,-10,-151,-152,-157,-146,-377,-171,-144,211,301,-379,-378,-383,-143,-148,-158,-159,-380,-384,-11,-12,-153,-13,-14,-15,-16,]),'DOUBLESTAREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,122,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'ELSE':([10,12,23,30,32,35,37,38,46,48,51,52,67,68,72,75,90,95,97,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,243,247,254,258,261,262,267,268,269,271,278,279,280,300,305,311,336,344,351,354,355,358,364,371,378,391,395,397,404,432,472,475,488,490,493,527,545,592,605,606,],[-262,-242,-256,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-280,-49,-50,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,341,-240,-248,-43,-216,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-220,-245,-241,-249,-155,433,-217,-307,-277,-308,465,-227,-221,474,-154,-142,474,541,-44,-156,-141,-157,-143,-158,-159,]),'TRY':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,353,354,355,391,401,404,417,428,430,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[45,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,45,-136,-130,-49,-50,-173,-172,-6,-43,-160,45,-155,-150,-145,-169,-137,-161,-166,45,-154,-142,-138,-139,-147,-44,-156,-149,-170,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'AND':([10,12,23,30,32,35,37,38,48,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,311,336,344,351,364,371,378,395,397,],[-262,-242,-256,-289,-238,-290,-270,-246,-222,-250,-274,-287,-224,-288,199,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,-225,310,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-220,-245,-241,-249,-307,-277,-308,-227,-221,]),'LBRACE':([0,1,6,7,9,13,14,16,18,24,28,29,31,33,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[49,49,-132,49,49,49,-47,-135,-131,-129,-133,49,49,49,49,-48,49,-9,-7,49,49,49,49,-8,-134,49,49,49,49,49,-136,49,-130,-49,49,-50,49,49,49,49,49,49,-117,-108,-112,-107,49,-110,-114,-109,-113,-116,-118,-115,-111,49,49,-173,-172,49,49,49,49,49,49,49,49,49,49,49,49,-233,49,-229,-228,-236,-231,-234,-232,-230,-6,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-43,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-237,49,-235,49,49,49,49,49,49,49,49,-160,49,49,49,49,49,49,49,-155,-150,49,49,49,49,49,-359,49,49,49,-145,49,-169,-137,49,-161,49,-166,49,49,-154,49,49,49,-360,49,49,49,49,49,49,-142,49,-138,-139,-147,-44,49,49,-156,49,49,49,-149,49,49,49,49,49,-170,49,49,-141,-140,49,-10,-151,-152,-157,49,49,-146,49,49,49,-171,49,-144,49,49,49,49,49,49,-143,-148,49,-158,-159,-11,-12,49,49,49,49,49,-153,-13,-14,-15,-16,]),'AS':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,90,98,101,105,107,108,109,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,228,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,333,336,344,351,358,364,371,378,388,395,397,407,418,422,436,],[-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-280,218,-271,-264,-263,227,-207,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-223,-282,-281,-266,-268,-269,-267,-265,-208,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-209,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,479,-210,-212,494,]),'OR':([10,12,23,30,32,35,37,38,46,48,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,300,305,311,336,344,351,358,364,371,378,395,397,],[-262,-242,-256,-289,-238,-290,-270,-246,157,-222,-250,-274,-287,-224,-288,-218,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,260,-285,-252,-251,-276,-278,-273,-283,-225,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-220,-245,-241,-249,-217,-307,-277,-308,-227,-221,]),'LEFTSHIFT':([10,23,30,35,37,51,52,67,72,90,101,105,107,131,132,140,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,239,240,241,262,267,268,269,271,278,279,280,300,364,371,378,602,616,622,652,663,669,],[-262,-256,-289,-290,-270,161,-274,-287,-288,-280,-271,-264,-263,-257,-258,-291,-272,-285,-252,161,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-259,-260,-261,-286,-254,-255,-253,-306,-279,-309,-275,-284,-307,-277,-308,626,626,626,626,626,626,]),'CONTINUE':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[53,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,53,-136,-130,-49,53,-50,-173,-172,53,-6,53,53,-43,53,53,53,-160,53,53,53,-155,-150,-145,-169,-137,-161,-166,53,53,-154,53,53,53,-142,-138,-139,-147,-44,53,53,-156,53,-149,53,-170,53,53,-141,-140,-10,-151,-152,-157,-146,-171,53,-144,53,53,53,-143,-148,53,-158,-159,-11,-12,53,-153,-13,-14,-15,-16,]),'NOT':([0,1,6,7,10,12,14,16,18,23,24,28,29,30,32,33,35,37,38,42,44,47,49,51,52,55,57,63,64,65,67,68,72,73,74,82,83,85,86,89,90,95,96,97,101,105,107,113,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,132,135,136,138,140,143,147,149,151,155,157,160,162,164,165,166,169,170,177,181,183,189,190,196,199,201,210,213,215,216,219,220,222,223,224,225,226,232,234,239,240,241,247,248,254,256,258,260,262,263,265,267,268,269,270,271,272,274,278,279,280,281,282,291,293,296,299,300,303,305,309,310,312,314,315,316,318,324,328,330,336,341,344,346,347,350,351,353,354,355,356,360,364,365,367,368,370,371,374,375,377,378,391,394,395,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[83,83,-132,83,-262,-242,-47,-135,-131,-256,-129,-133,83,-289,-238,83,-290,-270,-246,-48,-9,-7,83,-250,-274,83,83,-8,-134,83,-287,192,-288,83,83,83,83,-136,83,-130,-280,-49,83,-50,-271,-264,-263,-243,83,-117,-108,-112,-107,83,-110,-114,-109,-113,-116,-118,-115,-111,-257,-258,-173,-172,83,-291,-239,83,-247,-272,83,83,-285,-252,-251,83,-276,83,-278,83,-273,-283,306,192,-6,83,83,-282,83,-281,83,83,83,-266,-268,-269,-267,-265,-244,83,-259,-260,-261,-240,83,-248,83,-43,83,-286,83,83,-254,-255,-253,83,-306,83,83,-279,-309,-275,83,83,83,83,83,83,-284,83,-226,83,83,83,83,83,83,83,83,-160,83,-245,83,-241,83,83,83,-249,83,-155,-150,83,83,-307,83,83,83,-359,-277,83,83,83,-308,-145,83,-227,-169,-137,83,-161,83,-166,83,83,-154,83,83,83,-360,83,83,83,83,83,83,-142,83,-138,-139,-147,-44,83,83,-156,83,83,83,-149,83,83,83,83,83,-170,83,83,-141,-140,83,-10,-151,-152,-157,83,83,-146,83,83,83,-171,83,-144,83,83,83,83,83,83,-143,-148,83,-158,-159,-11,-12,83,83,83,83,83,-153,-13,-14,-15,-16,]),'LAMBDA':([0,1,6,7,14,16,18,24,28,29,33,42,44,47,49,55,57,63,64,65,73,74,82,85,86,89,95,96,97,116,117,118,119,120,121,122,123,124,125,126,127,128,129,135,136,147,155,165,169,177,196,201,213,216,219,220,234,248,256,258,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,328,330,341,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[54,54,-132,54,-47,-135,-131,-129,-133,54,54,-48,-9,-7,54,54,54,-8,-134,54,54,54,54,-136,54,-130,-49,54,-50,54,-117,-108,-112,-107,54,-110,-114,-109,-113,-116,-118,-115,-111,-173,-172,54,54,54,54,54,-6,54,54,54,54,54,54,54,54,-43,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-160,54,54,54,54,54,54,-155,-150,54,54,54,54,54,-359,54,54,54,-145,54,-169,-137,-161,54,-166,54,54,-154,54,54,54,-360,54,54,54,54,521,54,-142,54,-138,-139,-147,-44,54,54,-156,54,54,54,-149,54,54,54,54,54,-170,54,54,-141,-140,521,-10,-151,-152,-157,54,54,-146,521,521,521,-171,54,-144,54,54,54,54,521,521,-143,-148,54,-158,-159,-11,-12,54,54,54,54,54,-153,-13,-14,-15,-16,]),'NEWLINE':([0,3,4,5,6,10,12,14,15,16,17,18,19,20,21,23,24,27,28,29,30,32,33,35,36,37,38,40,41,42,44,46,47,48,50,51,52,53,55,58,59,60,62,63,64,66,67,68,69,70,72,73,75,76,77,78,79,81,82,85,88,89,90,94,95,96,97,101,105,107,108,109,110,111,113,114,115,131,132,135,136,139,140,141,142,143,145,146,149,151,155,156,160,162,164,166,170,178,179,181,183,190,196,197,198,200,201,203,204,205,210,215,216,217,219,222,223,224,225,226,228,231,232,235,236,237,238,239,240,241,244,245,247,248,249,250,254,258,261,262,267,268,269,271,278,279,280,295,297,299,300,305,311,312,313,315,318,326,328,330,331,333,334,336,337,338,339,342,343,344,345,346,350,351,354,355,358,364,371,378,388,389,390,391,395,396,397,398,401,402,404,405,406,407,409,412,413,417,418,419,422,423,424,425,426,428,429,432,435,437,464,468,471,472,475,476,477,478,481,482,486,487,488,490,491,492,493,495,497,515,516,522,523,526,527,528,529,530,531,532,534,540,542,543,545,559,568,569,570,571,572,575,577,578,592,595,600,603,604,605,606,615,619,622,627,628,629,634,635,636,640,641,642,643,648,649,652,658,666,],[8,95,-180,97,-132,-262,-242,-47,-103,-135,-64,-131,-213,-77,-56,-256,-129,-211,-133,-85,-289,-238,-65,-290,-60,-270,-246,-63,153,-48,-9,-214,-7,-222,-59,-250,-274,-84,-87,-80,-61,-79,-57,-8,-134,-81,-287,-224,-83,-82,-288,-5,-218,-78,-123,-62,-179,-91,-92,-136,-58,-130,-280,-52,-49,-51,-50,-271,-264,-263,-195,-207,-181,-203,-243,-98,-106,-257,-258,-173,-172,-86,-291,-76,-330,-239,-67,-66,-247,-272,257,-215,-285,-252,-251,-276,-278,-88,-94,-273,-283,-225,-6,-101,-219,-125,-124,-93,-223,317,-282,-281,-53,-54,257,-266,-268,-269,-267,-265,-208,-204,-244,-105,-104,-120,-119,-259,-260,-261,-331,-332,-240,-71,-72,-68,-248,-43,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-95,257,-284,-226,-220,-126,-127,257,257,-55,-160,257,-196,-209,-205,-245,-99,-122,-121,-334,-333,-241,-74,-73,257,-249,-155,-150,-217,-307,-277,-308,-386,-89,-97,-145,-227,-102,-221,-128,-169,470,-137,-197,-182,-193,-183,-188,-189,-161,-210,-206,-212,-335,-75,-70,-69,-166,257,-154,257,257,-96,257,524,-142,-138,-139,-198,-199,-186,-185,-100,539,-147,-44,257,257,-156,257,-149,-90,257,-170,257,257,-141,-140,-201,-200,-194,-184,-190,-10,-151,-152,-157,-146,-171,257,-144,-202,-187,257,257,257,-143,614,618,-148,257,-158,-159,-11,-12,637,644,257,-153,644,-13,651,653,654,655,656,-14,-15,659,-16,671,]),'RAISE':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[55,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,55,-136,-130,-49,55,-50,-173,-172,55,-6,55,55,-43,55,55,55,-160,55,55,55,-155,-150,-145,-169,-137,-161,-166,55,55,-154,55,55,55,-142,-138,-139,-147,-44,55,55,-156,55,-149,55,-170,55,55,-141,-140,-10,-151,-152,-157,-146,-171,55,-144,55,55,55,-143,-148,55,-158,-159,-11,-12,55,-153,-13,-14,-15,-16,]),'GLOBAL':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[56,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,56,-136,-130,-49,56,-50,-173,-172,56,-6,56,56,-43,56,56,56,-160,56,56,56,-155,-150,-145,-169,-137,-161,-166,56,56,-154,56,56,56,-142,-138,-139,-147,-44,56,56,-156,56,-149,56,-170,56,56,-141,-140,-10,-151,-152,-157,-146,-171,56,-144,56,56,56,-143,-148,56,-158,-159,-11,-12,56,-153,-13,-14,-15,-16,]),'WHILE':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,353,354,355,391,401,404,417,428,430,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[57,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,57,-136,-130,-49,-50,-173,-172,-6,-43,-160,57,-155,-150,-145,-169,-137,-161,-166,57,-154,-142,-138,-139,-147,-44,-156,-149,-170,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'VBAR':([10,12,23,30,32,35,37,38,51,52,67,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,336,344,351,364,371,378,],[-262,-242,-256,-289,144,-290,-270,-246,-250,-274,-287,-288,-280,-271,-264,-263,-243,-257,-258,-291,246,-247,-272,-285,-252,-251,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-245,-241,-249,-307,-277,-308,]),'STAR':([10,30,35,37,52,54,67,72,90,101,105,107,140,151,160,165,166,170,181,183,210,215,222,223,224,225,226,251,262,271,274,278,279,280,292,300,316,319,321,364,370,371,378,383,410,444,459,510,521,],[102,-289,-290,-270,-274,172,-287,-288,-280,-271,-264,102,-291,-272,-285,270,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,172,-286,-306,365,-279,-309,-275,385,-284,270,406,412,-307,-359,-277,-308,455,482,-360,511,554,172,]),'DOT':([30,35,52,67,72,87,90,109,140,160,166,170,183,208,209,210,215,228,262,271,278,279,300,322,333,364,378,418,],[-289,-290,167,-287,-288,209,-280,229,-291,-285,167,-278,-283,322,-191,-282,-281,332,-286,-306,-279,-309,-284,-192,-209,-307,-308,-210,]),'LEFTSHIFTEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,129,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'TILDE':([0,1,6,7,9,13,14,16,18,24,28,29,31,33,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[61,61,-132,61,61,61,-47,-135,-131,-129,-133,61,61,61,61,-48,61,-9,-7,61,61,61,61,-8,-134,61,61,61,61,61,-136,61,-130,-49,61,-50,61,61,61,61,61,61,-117,-108,-112,-107,61,-110,-114,-109,-113,-116,-118,-115,-111,61,61,-173,-172,61,61,61,61,61,61,61,61,61,61,61,61,-233,61,-229,-228,-236,-231,-234,-232,-230,-6,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-43,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-237,61,-235,61,61,61,61,61,61,61,61,-160,61,61,61,61,61,61,61,-155,-150,61,61,61,61,61,-359,61,61,61,-145,61,-169,-137,61,-161,61,-166,61,61,-154,61,61,61,-360,61,61,61,61,61,61,-142,61,-138,-139,-147,-44,61,61,-156,61,61,61,-149,61,61,61,61,61,-170,61,61,-141,-140,61,-10,-151,-152,-157,61,61,-146,61,61,61,-171,61,-144,61,61,61,61,61,61,-143,-148,61,-158,-159,-11,-12,61,61,61,61,61,-153,-13,-14,-15,-16,]),'RSQB':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,65,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,182,183,184,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,281,282,283,284,285,286,295,300,302,303,304,305,311,336,344,351,358,364,371,372,373,374,375,376,377,378,388,393,394,395,397,422,447,448,449,450,451,467,502,503,504,517,518,519,520,551,560,561,562,565,587,588,589,591,611,612,613,],[-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,183,-287,-224,-288,-218,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,300,-283,-293,-225,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-318,-319,-317,-310,378,-316,-385,-284,-292,-294,-295,-226,-220,-245,-241,-249,-217,-307,-277,-322,-324,-320,-321,-312,-311,-308,-386,-297,-296,-227,-221,-212,-323,-325,-329,-313,-314,-298,-327,-326,-315,-364,-376,-382,-381,-328,-365,-367,-366,-377,-368,-379,-378,-383,-369,-380,-384,]),'PERCENT':([10,30,35,37,52,67,72,90,101,105,107,140,151,160,166,170,181,183,210,215,222,223,224,225,226,262,271,278,279,280,300,364,371,378,],[103,-289,-290,-270,-274,-287,-288,-280,-271,-264,103,-291,-272,-285,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-286,-306,-279,-309,-275,-284,-307,-277,-308,]),'DOUBLESLASH':([10,30,35,37,52,67,72,90,101,105,107,140,151,160,166,170,181,183,210,215,222,223,224,225,226,262,271,278,279,280,300,364,371,378,],[104,-289,-290,-270,-274,-287,-288,-280,-271,-264,104,-291,-272,-285,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-286,-306,-279,-309,-275,-284,-307,-277,-308,]),'EQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,82,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,173,174,181,183,190,198,200,201,203,204,210,215,222,223,224,225,226,232,237,238,239,240,241,247,254,261,262,267,268,269,271,275,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,381,386,388,395,397,398,422,456,602,616,622,652,663,669,],[-262,-242,121,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-92,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-414,291,-273,-283,-225,-219,-125,-124,-93,-223,-282,-281,-266,-268,-269,-267,-265,-244,121,121,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,368,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-415,461,-386,-227,-221,-128,-212,508,625,625,625,625,625,625,]),'PLUSEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,123,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'ELLIPSIS':([169,377,450,],[286,286,286,]),'LESSEQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,194,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,194,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'LSQB':([0,1,6,7,9,13,14,16,18,24,28,29,30,31,33,35,39,42,43,44,47,49,52,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,140,144,147,150,155,157,160,161,163,165,166,168,169,170,177,183,185,186,187,188,189,191,193,194,195,196,199,201,210,211,213,215,216,218,219,220,233,234,244,246,248,253,256,258,260,262,263,265,270,271,272,274,277,278,279,281,282,291,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,374,375,377,378,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[65,65,-132,65,65,65,-47,-135,-131,-129,-133,65,-289,65,65,-290,65,-48,65,-9,-7,65,169,65,65,65,-8,-134,65,-287,-288,65,65,65,65,-136,65,-130,-280,-49,65,-50,65,65,65,65,65,65,-117,-108,-112,-107,65,-110,-114,-109,-113,-116,-118,-115,-111,65,65,-173,-172,65,-291,65,65,65,65,65,-285,65,65,65,169,65,65,-278,65,-283,-233,65,-229,-228,-236,-231,-234,-232,-230,-6,65,65,-282,65,65,-281,65,65,65,65,65,65,65,65,65,65,65,-43,65,-286,65,65,65,-306,65,65,65,-279,-309,65,65,65,65,65,65,-284,65,65,-237,65,-235,65,65,65,65,65,65,65,65,-160,65,65,65,65,65,65,65,-155,-150,65,65,-307,65,65,65,-359,65,65,65,-308,-145,65,-169,-137,65,-161,65,-166,65,65,-154,65,65,65,-360,65,65,65,65,65,65,-142,65,-138,-139,-147,-44,65,65,-156,65,65,65,-149,65,65,65,65,65,-170,65,65,-141,-140,65,-10,-151,-152,-157,65,65,-146,65,65,65,-171,65,-144,65,65,65,65,65,65,-143,-148,65,-158,-159,-11,-12,65,65,65,65,65,-153,-13,-14,-15,-16,]),'GREATER':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,187,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,187,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'VBAREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,127,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'BREAK':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[69,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,69,-136,-130,-49,69,-50,-173,-172,69,-6,69,69,-43,69,69,69,-160,69,69,69,-155,-150,-145,-169,-137,-161,-166,69,69,-154,69,69,69,-142,-138,-139,-147,-44,69,69,-156,69,-149,69,-170,69,69,-141,-140,-10,-151,-152,-157,-146,-171,69,-144,69,69,69,-143,-148,69,-158,-159,-11,-12,69,-153,-13,-14,-15,-16,]),'STAREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,117,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'ELIF':([95,97,258,404,472,475,490,527,592,],[-49,-50,-43,473,-142,473,-44,-141,-143,]),'SLASHEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,126,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'NUMBER':([0,1,6,7,9,13,14,16,18,24,28,29,31,33,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[72,72,-132,72,72,72,-47,-135,-131,-129,-133,72,72,72,72,-48,72,-9,-7,72,72,72,72,-8,-134,72,72,72,72,72,-136,72,-130,-49,72,-50,72,72,72,72,72,72,-117,-108,-112,-107,72,-110,-114,-109,-113,-116,-118,-115,-111,72,72,-173,-172,72,72,72,72,72,72,72,72,72,72,72,72,-233,72,-229,-228,-236,-231,-234,-232,-230,-6,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-43,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-237,72,-235,72,72,72,72,72,72,72,72,-160,72,72,72,72,72,72,72,-155,-150,72,72,72,72,72,-359,72,72,72,-145,72,-169,-137,72,-161,72,-166,72,72,-154,72,72,72,-360,72,72,72,72,72,72,-142,72,-138,-139,-147,-44,72,72,-156,72,72,72,-149,72,72,72,72,72,-170,72,72,-141,-140,72,-10,-151,-152,-157,72,72,-146,72,72,72,-171,72,-144,72,72,72,72,72,72,-143,-148,72,-158,-159,-11,-12,72,72,72,72,72,-153,-13,-14,-15,-16,]),'RPAR':([1,10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,82,90,91,92,93,101,105,107,113,131,132,140,143,149,151,156,160,162,164,165,166,170,173,174,181,183,190,198,200,201,203,204,210,212,213,214,215,222,223,224,225,226,232,239,240,241,247,251,254,261,262,267,268,269,271,273,275,276,278,279,280,287,288,289,290,292,294,295,300,305,311,312,313,314,316,324,325,336,340,344,349,351,358,362,363,364,366,369,370,371,378,379,380,381,383,384,386,388,395,397,398,400,403,405,407,415,422,443,444,445,446,452,453,456,458,459,460,462,477,478,480,484,485,505,506,507,509,510,514,519,520,529,530,531,533,535,536,537,549,553,556,557,571,573,581,583,584,586,591,593,608,613,631,647,],[90,-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-92,-280,210,-300,215,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,271,-276,-278,-414,-390,-273,-283,-225,-219,-125,-124,-93,-223,-282,-302,-301,-299,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,348,-248,-216,-286,-254,-255,-253,-306,364,-361,-349,-279,-309,-275,-416,381,-407,-395,-391,-409,-385,-284,-226,-220,-126,-127,399,402,-303,-304,-245,421,-241,427,-249,-217,-351,-353,-307,-354,-362,-350,-277,-308,-417,-418,-415,-396,-400,-410,-386,-227,-221,-128,469,471,-197,-193,-305,-212,-356,-355,-358,-363,-420,-419,-412,-405,-401,-387,-389,-198,-199,532,534,-370,-421,-408,-392,-394,-406,-411,-382,-381,-201,-200,-194,572,-373,-372,-371,-352,-413,-397,-399,-202,-374,-357,-402,-404,-388,-383,-375,-393,-384,-398,-403,]),'ASSERT':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[74,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,74,-136,-130,-49,74,-50,-173,-172,74,-6,74,74,-43,74,74,74,-160,74,74,74,-155,-150,-145,-169,-137,-161,-166,74,74,-154,74,74,74,-142,-138,-139,-147,-44,74,74,-156,74,-149,74,-170,74,74,-141,-140,-10,-151,-152,-157,-146,-171,74,-144,74,74,74,-143,-148,74,-158,-159,-11,-12,74,-153,-13,-14,-15,-16,]),'RIGHTSHIFTEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,128,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'GREATEREQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,191,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,191,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'SEMI':([3,4,10,12,15,17,19,20,21,23,27,29,30,32,33,35,36,37,38,40,46,48,50,51,52,53,55,58,59,60,62,66,67,68,69,70,72,75,76,77,78,79,81,82,88,90,94,101,105,107,108,109,110,111,113,114,115,131,132,139,140,141,142,143,145,146,149,151,156,160,162,164,166,170,178,179,181,183,190,197,198,200,201,203,204,210,215,217,222,223,224,225,226,228,231,232,235,236,237,238,239,240,241,244,245,247,248,249,250,254,261,262,267,268,269,271,278,279,280,295,297,300,305,311,312,313,326,331,333,334,336,337,338,339,342,343,344,345,346,351,358,364,371,378,388,389,390,395,396,397,398,405,406,407,409,412,413,418,419,422,423,424,425,426,464,477,478,481,482,486,515,529,530,531,532,534,571,572,],[96,-180,-262,-242,-103,-64,-213,-77,-56,-256,-211,-85,-289,-238,-65,-290,-60,-270,-246,-63,-214,-222,-59,-250,-274,-84,-87,-80,-61,-79,-57,-81,-287,-224,-83,-82,-288,-218,-78,-123,-62,-179,-91,-92,-58,-280,216,-271,-264,-263,-195,-207,-181,-203,-243,-98,-106,-257,-258,-86,-291,-76,-330,-239,-67,-66,-247,-272,-215,-285,-252,-251,-276,-278,-88,-94,-273,-283,-225,-101,-219,-125,-124,-93,-223,-282,-281,-54,-266,-268,-269,-267,-265,-208,-204,-244,-105,-104,-120,-119,-259,-260,-261,-331,-332,-240,-71,-72,-68,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-95,-284,-226,-220,-126,-127,-55,-196,-209,-205,-245,-99,-122,-121,-334,-333,-241,-74,-73,-249,-217,-307,-277,-308,-386,-89,-97,-227,-102,-221,-128,-197,-182,-193,-183,-188,-189,-210,-206,-212,-335,-75,-70,-69,-96,-198,-199,-186,-185,-100,-90,-201,-200,-194,-184,-190,-202,-187,]),'DOUBLESLASHEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-262,-242,124,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,-123,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-219,-125,-124,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-216,-286,-254,-255,-253,-306,-279,-309,-275,-385,-284,-226,-220,-126,-127,-245,-241,-249,-217,-307,-277,-308,-386,-227,-221,-128,-212,]),'COMMA':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,92,98,99,101,105,107,108,109,111,113,131,132,140,142,143,146,149,151,156,159,160,162,164,166,170,173,174,178,179,181,183,184,190,197,198,200,204,210,212,215,222,223,224,225,226,228,231,232,239,240,241,245,247,249,250,254,261,262,264,267,268,269,271,275,276,278,279,280,281,282,283,284,286,287,289,290,295,300,304,305,311,313,325,327,329,331,333,334,336,337,342,344,345,351,358,359,361,362,364,366,369,371,372,373,374,375,376,378,380,381,384,386,388,389,390,393,395,397,398,405,407,415,418,419,422,423,424,426,436,438,439,443,446,447,448,449,451,452,456,458,460,467,478,485,502,503,504,505,507,514,518,519,520,529,531,535,536,537,551,553,556,565,571,573,580,583,588,591,593,607,612,613,],[-262,-242,-213,-256,-211,-289,-238,-290,-270,-246,-214,-222,-250,-274,-287,-224,-288,-218,201,-280,213,-162,220,-271,-264,-263,-195,-207,230,-243,-257,-258,-291,244,-239,248,-247,-272,-215,263,-285,-252,-251,-276,-278,-414,292,296,298,-273,-283,303,-225,309,-219,312,-223,-282,324,-281,-266,-268,-269,-267,-265,-208,335,-244,-259,-260,-261,343,-240,346,347,-248,-216,-286,360,-254,-255,-253,-306,-361,370,-279,-309,-275,-318,-319,-317,377,-316,379,382,383,-385,-284,394,-226,-220,-127,-304,-163,220,-196,-209,-205,-245,420,-334,-241,-74,-249,-217,-347,440,442,-307,444,-362,-277,-322,-324,-320,-321,450,-308,453,-415,459,-410,-386,463,298,-297,-227,-221,-128,477,-193,-305,-210,-206,-212,-335,-75,248,496,-348,498,501,-363,-323,-325,-329,-314,-420,-412,510,513,-298,530,-370,-327,-326,-315,-421,552,-411,564,-382,-381,-201,-194,-373,-372,-371,-328,-413,585,589,-202,-374,-345,609,-379,-383,-375,-346,-380,-384,]),'CLASS':([0,6,14,16,18,22,24,25,28,42,44,47,63,64,73,85,89,95,97,130,135,136,196,258,317,328,353,354,355,391,401,404,417,428,430,432,470,472,475,476,488,490,493,497,522,524,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[80,-132,-47,-135,-131,-175,-129,80,-133,-48,-9,-7,-8,-134,80,-136,-130,-49,-50,-174,-173,-172,-6,-43,-176,-160,80,-155,-150,-145,-169,-137,-161,-166,80,-154,-177,-142,-138,-139,-147,-44,-156,-149,-170,-178,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'RIGHTSHIFT':([10,23,30,33,35,37,51,52,67,72,90,101,105,107,131,132,140,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,239,240,241,262,267,268,269,271,278,279,280,300,364,371,378,602,616,622,652,663,669,],[-262,-256,-289,147,-290,-270,163,-274,-287,-288,-280,-271,-264,-263,-257,-258,-291,-272,-285,-252,163,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-259,-260,-261,-286,-254,-255,-253,-306,-279,-309,-275,-284,-307,-277,-308,621,621,621,621,621,621,]),'STRING':([0,1,6,7,9,13,14,16,18,24,28,29,30,31,33,35,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,140,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,574,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,628,629,635,648,649,658,],[35,35,-132,35,35,35,-47,-135,-131,-129,-133,35,140,35,35,-290,35,-48,35,-9,-7,35,35,35,35,-8,-134,35,35,35,35,35,-136,35,-130,-49,35,-50,35,35,35,35,35,35,-117,-108,-112,-107,35,-110,-114,-109,-113,-116,-118,-115,-111,35,35,-173,-172,35,-291,35,35,35,35,35,35,35,35,35,35,35,-233,35,-229,-228,-236,-231,-234,-232,-230,-6,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-43,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-237,35,-235,35,35,35,35,35,35,35,35,-160,35,35,35,35,35,35,35,-155,-150,35,35,35,35,35,-359,35,35,35,-145,35,-169,-137,35,-161,35,-166,35,35,-154,35,35,35,-360,35,35,35,35,35,35,-142,35,-138,-139,-147,-44,35,35,-156,35,35,35,-149,35,35,35,35,35,-170,35,35,-141,-140,35,-10,-151,-152,-157,35,35,-146,35,35,35,-171,35,-144,595,35,35,35,35,35,35,-143,-148,35,-158,-159,-11,-12,35,35,35,35,35,-153,-13,-14,-15,-16,]),'COLONEQUAL':([602,616,622,652,663,669,],[623,623,623,623,623,623,]),'IS':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,189,-288,-280,-271,-264,-263,-243,-257,-258,-291,-239,-247,-272,-285,-252,-251,-276,-278,-273,-283,189,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-245,-241,-249,-307,-277,-308,-227,]),'YIELD':([0,1,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,116,117,118,119,120,121,122,123,124,125,126,127,128,129,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[82,82,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,82,-136,-130,-49,82,-50,82,-117,-108,-112,-107,82,-110,-114,-109,-113,-116,-118,-115,-111,-173,-172,82,-6,82,82,-43,82,82,82,-160,82,82,82,-155,-150,-145,-169,-137,-161,-166,82,82,-154,82,82,82,-142,-138,-139,-147,-44,82,82,-156,82,-149,82,-170,82,82,-141,-140,-10,-151,-152,-157,-146,-171,82,-144,82,82,82,-143,-148,82,-158,-159,-11,-12,82,-153,-13,-14,-15,-16,]),'FINALLY':([95,97,258,259,354,355,432,490,493,542,545,605,606,],[-49,-50,-43,357,-155,434,-154,-44,-156,576,-157,-158,-159,]),'AT':([0,6,14,16,18,22,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,317,328,353,354,355,391,401,404,417,428,430,432,470,472,475,476,488,490,493,497,522,524,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,629,635,648,649,658,],[84,-132,-47,-135,-131,84,-129,-133,-48,-9,-7,-8,-134,84,-136,-130,-49,-50,-173,-172,-6,-43,-176,-160,84,-155,-150,-145,-169,-137,-161,-166,84,-154,-177,-142,-138,-139,-147,-44,-156,-149,-170,-178,-141,-140,-10,-151,-152,-157,-146,-171,-144,-143,-148,-158,-159,-11,-12,-153,-13,-14,-15,-16,]),'AMPER':([10,23,30,35,37,38,51,52,67,72,90,101,105,107,131,132,140,149,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,239,240,241,254,262,267,268,269,271,278,279,280,300,351,364,371,378,],[-262,-256,-289,-290,-270,150,-250,-274,-287,-288,-280,-271,-264,-263,-257,-258,-291,253,-272,-285,-252,-251,-276,-278,-273,-283,-282,-281,-266,-268,-269,-267,-265,-259,-260,-261,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-249,-307,-277,-308,]),'IN':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,114,131,132,140,142,143,149,151,154,160,162,164,166,170,181,183,190,192,210,215,222,223,224,225,226,232,239,240,241,244,245,247,254,262,267,268,269,271,278,279,280,300,305,323,336,342,343,344,351,364,371,378,392,395,423,],[-262,-242,-256,-289,-238,-290,-270,-246,-250,-274,-287,193,-288,-280,-271,-264,-263,-243,234,-257,-258,-291,-330,-239,-247,-272,256,-285,-252,-251,-276,-278,-273,-283,193,308,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-331,-332,-240,-248,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,414,-245,-334,-333,-241,-249,-307,-277,-308,466,-227,-335,]),'IF':([0,6,10,12,14,16,18,23,24,27,28,30,32,35,37,38,42,44,46,47,48,51,52,63,64,67,68,72,73,75,85,89,90,95,97,101,105,107,113,131,132,135,136,140,143,149,151,156,160,162,164,166,170,181,183,190,196,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,258,261,262,267,268,269,271,278,279,280,300,305,311,328,336,344,351,353,354,355,358,364,371,378,391,395,397,401,404,417,428,430,432,472,475,476,485,488,490,493,497,517,518,519,520,522,527,528,540,542,543,545,559,565,568,570,573,587,588,589,591,592,603,605,606,612,613,615,619,629,635,648,649,658,],[86,-132,-262,-242,-47,-135,-131,-256,-129,138,-133,-289,-238,-290,-270,-246,-48,-9,-214,-7,-222,-250,-274,-8,-134,-287,-224,-288,86,-218,-136,-130,-280,-49,-50,-271,-264,-263,-243,-257,-258,-173,-172,-291,-239,-247,-272,-215,-285,-252,-251,-276,-278,-273,-283,-225,-6,-219,-223,-282,-281,-266,-268,-269,-267,-265,-244,-259,-260,-261,-240,-248,-43,-216,-286,-254,-255,-253,-306,-279,-309,-275,-284,-226,-220,-160,-245,-241,-249,86,-155,-150,-217,-307,-277,-308,-145,-227,-221,-169,-137,-161,-166,86,-154,-142,-138,-139,538,-147,-44,-156,-149,563,-376,-382,-381,-170,-141,-140,-10,-151,-152,-157,-146,-377,-171,-144,538,563,-379,-378,-383,-143,-148,-158,-159,-380,-384,-11,-12,-153,-13,-14,-15,-16,]),'FROM':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,628,629,635,648,649,658,],[87,-132,-47,-135,-131,-129,-133,-48,-9,-7,-8,-134,87,-136,-130,-49,87,-50,-173,-172,87,-6,87,87,-43,87,87,87,-160,87,87,87,-155,-150,-145,-169,-137,-161,-166,87,87,-154,87,87,87,-142,-138,-139,-147,-44,87,87,-156,87,-149,87,-170,87,87,-141,-140,-10,-151,-152,-157,-146,-171,87,-144,87,87,87,-143,-148,87,-158,-159,-11,-12,87,-153,-13,-14,-15,-16,]),}
+_lr_action_items = {'LPAR':([0,1,6,7,9,13,14,16,18,24,28,29,30,31,33,35,39,42,43,44,47,49,52,54,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,102,103,104,106,109,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,137,138,140,144,147,148,150,155,157,160,161,163,165,166,168,169,170,171,177,183,185,186,187,188,189,191,193,194,195,196,199,201,202,205,210,211,213,215,216,218,219,220,228,233,234,244,246,248,251,253,256,258,260,262,263,265,270,271,272,274,277,278,279,281,282,291,292,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,319,321,324,328,330,333,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,374,375,377,378,379,383,391,394,401,404,410,414,417,418,420,428,429,430,432,435,437,440,444,447,450,453,459,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,510,516,521,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[1,1,-134,1,1,1,-49,-137,-133,-131,-135,1,-291,1,1,-292,1,-50,1,-9,-7,1,165,171,1,1,1,-8,-136,1,-289,-290,1,1,1,1,-138,1,-132,-282,-51,1,-52,1,1,1,1,-209,1,1,-119,-110,-114,-109,1,-112,-116,-111,-115,-118,-120,-117,-113,1,1,-175,-174,242,1,-293,1,1,251,1,1,1,-287,1,1,1,165,1,1,-280,171,1,-285,-235,1,-231,-230,-238,-233,-236,-234,-232,-6,1,1,314,316,-284,1,1,-283,1,1,1,1,-210,1,1,1,1,1,171,1,1,-45,1,-288,1,1,1,-308,1,1,1,-281,-311,1,1,1,171,1,1,1,-286,1,1,-239,1,-237,1,1,1,1,1,1,1,408,411,1,-162,1,-211,1,1,1,1,1,1,-157,-152,1,1,-309,1,1,1,-361,1,1,1,-310,171,171,-147,1,-171,-139,483,1,-163,-212,1,-168,1,1,-156,1,1,1,-362,1,1,171,171,1,1,1,1,-144,1,-140,-141,-149,-46,1,1,-158,1,1,1,-151,1,1,1,1,171,1,171,-172,1,1,-143,-142,1,-10,-153,-154,-159,1,1,-148,1,1,1,-173,1,-146,1,1,1,1,1,1,-145,-150,1,-160,-161,-11,-12,1,1,1,1,1,1,1,-155,-13,-14,-15,-16,]),'ENDMARKER':([0,6,8,14,16,18,24,28,41,42,44,47,63,64,73,85,89,95,97,135,136,153,196,258,328,354,355,391,401,404,417,428,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[2,-134,100,-49,-137,-133,-131,-135,152,-50,-9,-7,-8,-136,-5,-138,-132,-51,-52,-175,-174,255,-6,-45,-162,-157,-152,-147,-171,-139,-163,-168,-156,-144,-140,-141,-149,-46,-158,-151,-172,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'NOTEQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,185,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,185,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'AMPEREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,120,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'CIRCUMFLEX':([10,12,23,30,35,37,38,51,52,67,72,90,101,105,107,113,131,132,140,149,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,232,239,240,241,254,262,267,268,269,271,278,279,280,300,336,351,364,371,378,],[-264,112,-258,-291,-292,-272,-248,-252,-276,-289,-290,-282,-273,-266,-265,233,-259,-260,-293,-249,-274,-287,-254,-253,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-247,-251,-309,-279,-310,]),'WITH':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,353,354,355,391,401,404,417,428,430,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[7,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,7,-138,-132,-51,-52,-175,-174,-6,-45,-162,7,-157,-152,-147,-171,-139,-163,-168,7,-156,-144,-140,-141,-149,-46,-158,-151,-172,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'MINUS':([0,1,6,7,9,10,13,14,16,18,23,24,28,29,30,31,33,35,37,39,42,43,44,47,49,52,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,101,102,103,104,105,106,107,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,132,133,134,135,136,138,140,144,147,150,151,155,157,160,161,163,165,166,168,169,170,177,181,183,185,186,187,188,189,191,193,194,195,196,199,201,210,211,213,215,216,218,219,220,222,223,224,225,226,233,234,239,240,241,244,246,248,253,256,258,260,262,263,265,270,271,272,274,277,278,279,280,281,282,291,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,371,374,375,377,378,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[39,39,-134,39,39,-264,39,-49,-137,-133,134,-131,-135,39,-291,39,39,-292,-272,39,-50,39,-9,-7,39,-276,39,39,39,-8,-136,39,-289,-290,39,39,39,39,-138,39,-132,-282,-51,39,-52,-273,39,39,39,-266,39,-265,39,39,-119,-110,-114,-109,39,-112,-116,-111,-115,-118,-120,-117,-113,134,-260,39,39,-175,-174,39,-293,39,39,39,-274,39,39,-287,39,39,39,-278,39,39,-280,39,-275,-285,-235,39,-231,-230,-238,-233,-236,-234,-232,-6,39,39,-284,39,39,-283,39,39,39,39,-268,-270,-271,-269,-267,39,39,-261,-262,-263,39,39,39,39,39,-45,39,-288,39,39,39,-308,39,39,39,-281,-311,-277,39,39,39,39,39,39,-286,39,39,-239,39,-237,39,39,39,39,39,39,39,39,-162,39,39,39,39,39,39,39,-157,-152,39,39,-309,39,39,39,-361,-279,39,39,39,-310,-147,39,-171,-139,39,-163,39,-168,39,39,-156,39,39,39,-362,39,39,39,39,39,39,-144,39,-140,-141,-149,-46,39,39,-158,39,39,39,-151,39,39,39,39,39,-172,39,39,-143,-142,39,-10,-153,-154,-159,39,39,-148,39,39,39,-173,39,-146,39,39,39,39,39,39,-145,-150,39,-160,-161,-11,-12,39,39,39,39,39,39,39,-155,-13,-14,-15,-16,]),'LESS':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,188,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,188,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'EXCEPT':([95,97,258,259,354,490,493,545,605,606,],[-51,-52,-45,356,356,-46,-158,-159,-160,-161,]),'PLUS':([0,1,6,7,9,10,13,14,16,18,23,24,28,29,30,31,33,35,37,39,42,43,44,47,49,52,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,101,102,103,104,105,106,107,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,132,133,134,135,136,138,140,144,147,150,151,155,157,160,161,163,165,166,168,169,170,177,181,183,185,186,187,188,189,191,193,194,195,196,199,201,210,211,213,215,216,218,219,220,222,223,224,225,226,233,234,239,240,241,244,246,248,253,256,258,260,262,263,265,270,271,272,274,277,278,279,280,281,282,291,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,371,374,375,377,378,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[9,9,-134,9,9,-264,9,-49,-137,-133,133,-131,-135,9,-291,9,9,-292,-272,9,-50,9,-9,-7,9,-276,9,9,9,-8,-136,9,-289,-290,9,9,9,9,-138,9,-132,-282,-51,9,-52,-273,9,9,9,-266,9,-265,9,9,-119,-110,-114,-109,9,-112,-116,-111,-115,-118,-120,-117,-113,133,-260,9,9,-175,-174,9,-293,9,9,9,-274,9,9,-287,9,9,9,-278,9,9,-280,9,-275,-285,-235,9,-231,-230,-238,-233,-236,-234,-232,-6,9,9,-284,9,9,-283,9,9,9,9,-268,-270,-271,-269,-267,9,9,-261,-262,-263,9,9,9,9,9,-45,9,-288,9,9,9,-308,9,9,9,-281,-311,-277,9,9,9,9,9,9,-286,9,9,-239,9,-237,9,9,9,9,9,9,9,9,-162,9,9,9,9,9,9,9,-157,-152,9,9,-309,9,9,9,-361,-279,9,9,9,-310,-147,9,-171,-139,9,-163,9,-168,9,9,-156,9,9,9,-362,9,9,9,9,9,9,-144,9,-140,-141,-149,-46,9,9,-158,9,9,9,-151,9,9,9,9,9,-172,9,9,-143,-142,9,-10,-153,-154,-159,9,9,-148,9,9,9,-173,9,-146,9,9,9,9,9,9,-145,-150,9,-160,-161,-11,-12,9,9,9,9,9,9,9,-155,-13,-14,-15,-16,]),'PERCENTEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,125,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'IMPORT':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,109,135,136,155,196,207,208,209,216,219,228,258,299,315,318,320,322,328,330,333,350,353,354,355,391,401,404,417,418,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[11,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,11,-138,-132,-51,11,-52,-209,-175,-174,11,-6,319,321,-193,11,11,-210,-45,11,11,11,410,-194,-162,11,-211,11,11,-157,-152,-147,-171,-139,-163,-212,-168,11,11,-156,11,11,11,-144,-140,-141,-149,-46,11,11,-158,11,-151,11,-172,11,11,-143,-142,-10,-153,-154,-159,-148,-173,11,-146,11,11,11,-145,-150,11,-160,-161,-11,-12,11,-155,-13,-14,-15,-16,]),'EQEQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,195,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,195,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'RBRACE':([10,12,19,23,27,30,32,35,37,38,46,48,49,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,158,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,263,264,266,267,268,269,271,278,279,280,295,300,305,311,336,344,351,358,359,360,361,364,371,378,388,395,397,422,438,439,440,441,485,498,519,520,535,536,537,573,580,591,593,607,613,],[-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,160,-252,-276,-289,-226,-290,-220,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,262,-287,-254,-253,-278,-280,-275,-285,-227,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-344,-345,-343,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-247,-243,-251,-219,-349,-346,-339,-309,-279,-310,-388,-229,-223,-214,-350,-341,-340,-338,-372,-342,-384,-383,-375,-374,-373,-376,-347,-385,-377,-348,-386,]),'EXEC':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[13,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,13,-138,-132,-51,13,-52,-175,-174,13,-6,13,13,-45,13,13,13,-162,13,13,13,-157,-152,-147,-171,-139,-163,-168,13,13,-156,13,13,13,-144,-140,-141,-149,-46,13,13,-158,13,-151,13,-172,13,13,-143,-142,-10,-153,-154,-159,-148,-173,13,-146,13,13,13,-145,-150,13,-160,-161,-11,-12,13,-155,-13,-14,-15,-16,]),'SLASH':([10,30,35,37,52,67,72,90,101,105,107,140,151,160,166,170,181,183,210,215,222,223,224,225,226,262,271,278,279,280,300,364,371,378,],[106,-291,-292,-272,-276,-289,-290,-282,-273,-266,106,-293,-274,-287,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-288,-308,-281,-311,-277,-286,-309,-279,-310,]),'PASS':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,574,575,577,578,592,594,596,597,598,599,601,603,604,605,606,614,615,617,618,619,620,624,630,631,634,635,637,639,640,648,650,652,653,654,655,657,658,659,660,661,662,663,664,665,666,667,668,670,671,673,674,676,677,678,679,680,],[20,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,20,-138,-132,-51,20,-52,-175,-174,20,-6,20,20,-45,20,20,20,-162,20,20,20,-157,-152,-147,-171,-139,-163,-168,20,20,-156,20,20,20,-144,-140,-141,-149,-46,20,20,-158,20,-151,20,-172,20,20,-143,-142,-10,-153,-154,-159,-148,-173,20,-146,600,20,20,20,-145,-21,-19,-17,-20,600,600,-150,20,-160,-161,600,-11,-18,-22,-12,600,-37,20,-155,600,600,-13,-23,-25,-28,-44,-14,-15,600,-43,-39,-38,-40,-42,-27,672,-41,-16,-24,-26,-34,672,-32,-35,672,-29,-33,-36,-30,672,-31,]),'NAME':([0,1,6,7,9,11,13,14,16,18,24,26,28,29,31,33,34,39,42,43,44,47,49,54,55,56,57,61,63,64,65,73,74,80,82,83,84,85,86,87,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,167,168,169,171,172,176,177,185,186,187,188,189,191,193,194,195,196,199,201,208,209,211,213,216,218,219,220,227,229,230,233,234,242,244,246,248,251,253,256,258,260,263,265,270,272,274,277,281,282,291,292,293,296,298,299,301,303,306,307,308,309,310,312,314,315,316,318,319,321,322,324,328,330,332,335,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,379,383,385,387,391,394,401,404,408,410,411,414,417,420,428,429,430,432,435,437,440,444,447,450,453,454,455,457,459,461,463,466,468,472,473,475,476,477,479,483,488,490,491,492,493,494,495,496,497,498,500,503,508,510,511,512,516,521,522,523,526,527,528,530,538,540,542,543,545,548,550,554,555,558,559,563,564,567,568,569,570,574,575,577,578,579,582,589,590,592,594,596,597,598,599,601,602,603,604,605,606,610,614,615,616,617,618,619,620,621,623,624,625,626,627,628,629,630,631,632,634,635,637,639,640,641,648,650,652,653,654,655,657,658,659,660,661,662,663,664,665,666,667,668,670,671,673,674,676,677,678,679,680,],[67,67,-134,67,67,109,67,-49,-137,-133,-131,137,-135,67,67,67,148,67,-50,67,-9,-7,67,173,67,179,67,67,-8,-136,67,67,67,202,67,67,109,-138,67,109,-132,-51,67,-52,67,67,67,67,67,67,-119,-110,-114,-109,67,-112,-116,-111,-115,-118,-120,-117,-113,67,67,-175,-174,67,67,67,67,67,67,67,67,67,279,67,67,173,289,294,67,-235,67,-231,-230,-238,-233,-236,-234,-232,-6,67,67,109,-193,67,67,67,67,67,67,331,333,109,67,67,340,67,67,67,173,67,67,-45,67,67,67,67,67,67,67,67,67,67,173,67,67,390,67,67,67,-239,67,-237,67,67,67,67,67,67,67,407,407,-194,67,-162,67,418,109,67,67,67,67,67,67,-157,-152,67,67,67,67,67,-361,67,67,67,173,173,460,462,-147,67,-171,-139,407,407,407,67,-163,67,-168,67,67,-156,67,67,67,-362,67,67,173,506,507,509,173,67,67,67,67,-144,67,-140,-141,407,531,407,-149,-46,67,67,-158,67,67,67,-151,67,67,67,67,173,556,557,67,173,-172,67,67,-143,-142,407,67,-10,-153,-154,-159,67,67,583,584,586,-148,67,67,67,-173,67,-146,602,67,67,67,67,608,67,67,-145,-21,-19,-17,-20,616,616,622,-150,67,-160,-161,633,602,-11,622,-18,-22,-12,616,67,67,-37,67,67,67,646,67,67,-155,651,616,616,-13,-23,-25,656,-28,-44,-14,-15,616,-43,-39,-38,-40,-42,-27,669,-41,-16,-24,-26,-34,675,-32,-35,675,-29,-33,-36,-30,675,-31,]),'INDENT':([257,539,647,],[353,574,662,]),'MINUSEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,119,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'ENAMLDEF':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,354,355,391,401,404,417,428,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[26,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,26,-138,-132,-51,-52,-175,-174,-6,-45,-162,-157,-152,-147,-171,-139,-163,-168,-156,-144,-140,-141,-149,-46,-158,-151,-172,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'DEDENT':([6,14,16,18,24,28,42,64,85,89,95,97,135,136,258,328,354,355,391,401,404,417,428,430,431,432,472,475,476,488,489,490,493,497,522,527,528,542,543,545,559,568,570,592,594,596,597,598,599,601,603,605,606,617,618,620,624,631,634,635,639,640,648,650,654,655,657,658,659,660,661,663,665,666,667,668,670,671,673,674,676,677,678,679,680,],[-134,-49,-137,-133,-131,-135,-50,-136,-138,-132,-51,-52,-175,-174,-45,-162,-157,-152,-147,-171,-139,-163,-168,-48,490,-156,-144,-140,-141,-149,-47,-46,-158,-151,-172,-143,-142,-153,-154,-159,-148,-173,-146,-145,-21,-19,-17,-20,615,619,-150,-160,-161,-18,-22,637,-37,-155,652,653,-23,-25,-28,-44,664,-43,-39,-38,-40,-42,-27,-41,-24,-26,-34,674,-32,-35,678,-29,-33,-36,-30,680,-31,]),'RETURN':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[29,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,29,-138,-132,-51,29,-52,-175,-174,29,-6,29,29,-45,29,29,29,-162,29,29,29,-157,-152,-147,-171,-139,-163,-168,29,29,-156,29,29,29,-144,-140,-141,-149,-46,29,29,-158,29,-151,29,-172,29,29,-143,-142,-10,-153,-154,-159,-148,-173,29,-146,29,29,29,-145,-150,29,-160,-161,-11,-12,29,-155,-13,-14,-15,-16,]),'DEL':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[31,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,31,-138,-132,-51,31,-52,-175,-174,31,-6,31,31,-45,31,31,31,-162,31,31,31,-157,-152,-147,-171,-139,-163,-168,31,31,-156,31,31,31,-144,-140,-141,-149,-46,31,31,-158,31,-151,31,-172,31,31,-143,-142,-10,-153,-154,-159,-148,-173,31,-146,31,31,31,-145,-150,31,-160,-161,-11,-12,31,-155,-13,-14,-15,-16,]),'PRINT':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[33,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,33,-138,-132,-51,33,-52,-175,-174,33,-6,33,33,-45,33,33,33,-162,33,33,33,-157,-152,-147,-171,-139,-163,-168,33,33,-156,33,33,33,-144,-140,-141,-149,-46,33,33,-158,33,-151,33,-172,33,33,-143,-142,-10,-153,-154,-159,-148,-173,33,-146,33,33,33,-145,-150,33,-160,-161,-11,-12,33,-155,-13,-14,-15,-16,]),'DOUBLESTAR':([30,35,52,54,67,72,90,140,160,165,166,170,183,210,215,251,262,271,274,278,279,292,300,316,364,370,378,382,383,442,444,459,501,510,513,521,552,585,609,],[-291,-292,168,176,-289,-290,-282,-293,-287,272,277,-280,-285,-284,-283,176,-288,-308,367,-281,-311,387,-286,272,-309,-361,-310,454,457,500,-362,512,550,555,558,176,582,610,632,]),'DEF':([0,6,14,16,18,22,24,25,28,42,44,47,63,64,73,85,89,95,97,130,135,136,196,258,317,328,353,354,355,391,401,404,417,428,430,432,470,472,475,476,488,490,493,497,522,524,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[34,-134,-49,-137,-133,-177,-131,34,-135,-50,-9,-7,-8,-136,34,-138,-132,-51,-52,-176,-175,-174,-6,-45,-178,-162,34,-157,-152,-147,-171,-139,-163,-168,34,-156,-179,-144,-140,-141,-149,-46,-158,-151,-172,-180,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'CIRCUMFLEXEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,118,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'COLON':([10,12,19,23,27,30,32,35,37,38,45,46,48,51,52,54,67,68,72,75,77,90,98,99,101,105,107,113,131,132,140,143,149,151,156,159,160,162,164,166,169,170,173,174,175,180,181,183,190,198,200,201,202,204,206,210,215,221,222,223,224,225,226,232,239,240,241,247,252,254,261,262,267,268,269,271,278,279,280,283,289,290,292,294,295,300,305,311,312,313,327,329,336,344,348,351,352,356,357,358,364,371,372,377,378,381,383,384,386,388,395,397,398,399,416,421,422,427,433,434,436,448,450,456,458,459,460,462,465,469,474,499,506,507,509,510,514,521,525,541,544,546,547,553,556,557,566,576,583,584,586,602,608,616,622,633,651,669,675,],[-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,155,-216,-224,-252,-276,177,-289,-226,-290,-220,-125,-282,-164,219,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,265,-287,-254,-253,-278,281,-280,-416,-392,293,299,-275,-285,-227,-221,-127,-126,315,-225,318,-284,-283,330,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,350,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,374,-409,-397,-393,-411,-387,-286,-228,-222,-128,-129,-165,-167,-247,-243,-169,-251,429,435,437,-219,-309,-279,447,281,-310,-417,-398,-402,-412,-388,-229,-223,-130,468,-166,487,-214,-170,491,492,495,503,281,-414,-407,-403,-389,-391,516,523,526,548,-410,-394,-396,-408,-413,567,569,575,577,578,579,-415,-399,-401,590,604,-404,-406,-390,628,-395,636,641,-400,-405,628,636,]),'DOUBLECOLON':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,169,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,283,295,300,305,311,336,344,351,358,364,371,377,378,388,395,397,422,450,602,616,622,656,669,675,],[-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,282,-280,-275,-285,-227,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,375,-387,-286,-228,-222,-247,-243,-251,-219,-309,-279,282,-310,-388,-229,-223,-214,282,630,630,630,630,630,630,]),'$end':([2,71,100,152,255,],[-4,0,-3,-2,-1,]),'FOR':([0,6,10,12,14,16,18,19,23,24,27,28,30,32,35,37,38,42,44,46,47,48,51,52,63,64,67,68,72,73,75,85,89,90,92,95,97,101,105,107,113,131,132,135,136,140,143,149,151,156,159,160,162,164,166,170,181,183,184,190,196,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,258,261,262,267,268,269,271,275,278,279,280,295,300,305,311,328,336,344,351,353,354,355,358,361,364,371,378,388,391,395,397,401,404,417,422,428,430,432,472,475,476,485,488,490,493,497,517,518,519,520,522,527,528,540,542,543,545,559,565,568,570,573,587,588,589,591,592,603,605,606,612,613,615,619,631,637,652,653,664,],[43,-134,-264,-244,-49,-137,-133,-215,-258,-131,-213,-135,-291,-240,-292,-272,-248,-50,-9,-216,-7,-224,-252,-276,-8,-136,-289,-226,-290,43,-220,-138,-132,-282,211,-51,-52,-273,-266,-265,-245,-259,-260,-175,-174,-293,-241,-249,-274,-217,211,-287,-254,-253,-278,-280,-275,-285,301,-227,-6,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-45,-218,-288,-256,-257,-255,-308,211,-281,-311,-277,-387,-286,-228,-222,-162,-247,-243,-251,43,-157,-152,-219,211,-309,-279,-310,-388,-147,-229,-223,-171,-139,-163,-214,-168,43,-156,-144,-140,-141,211,-149,-46,-158,-151,301,-378,-384,-383,-172,-143,-142,-10,-153,-154,-159,-148,-379,-173,-146,211,301,-381,-380,-385,-145,-150,-160,-161,-382,-386,-11,-12,-155,-13,-14,-15,-16,]),'DOUBLESTAREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,122,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'ELSE':([10,12,23,30,32,35,37,38,46,48,51,52,67,68,72,75,90,95,97,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,243,247,254,258,261,262,267,268,269,271,278,279,280,300,305,311,336,344,351,354,355,358,364,371,378,391,395,397,404,432,472,475,488,490,493,527,545,592,605,606,],[-264,-244,-258,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-282,-51,-52,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,341,-242,-250,-45,-218,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-222,-247,-243,-251,-157,433,-219,-309,-279,-310,465,-229,-223,474,-156,-144,474,541,-46,-158,-143,-159,-145,-160,-161,]),'TRY':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,353,354,355,391,401,404,417,428,430,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[45,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,45,-138,-132,-51,-52,-175,-174,-6,-45,-162,45,-157,-152,-147,-171,-139,-163,-168,45,-156,-144,-140,-141,-149,-46,-158,-151,-172,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'LEFTSHIFTLESS':([602,616,622,656,669,675,],[629,629,629,629,629,629,]),'AND':([10,12,23,30,32,35,37,38,48,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,311,336,344,351,364,371,378,395,397,],[-264,-244,-258,-291,-240,-292,-272,-248,-224,-252,-276,-289,-226,-290,199,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,-227,310,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-222,-247,-243,-251,-309,-279,-310,-229,-223,]),'LBRACE':([0,1,6,7,9,13,14,16,18,24,28,29,31,33,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[49,49,-134,49,49,49,-49,-137,-133,-131,-135,49,49,49,49,-50,49,-9,-7,49,49,49,49,-8,-136,49,49,49,49,49,-138,49,-132,-51,49,-52,49,49,49,49,49,49,-119,-110,-114,-109,49,-112,-116,-111,-115,-118,-120,-117,-113,49,49,-175,-174,49,49,49,49,49,49,49,49,49,49,49,49,-235,49,-231,-230,-238,-233,-236,-234,-232,-6,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-45,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-239,49,-237,49,49,49,49,49,49,49,49,-162,49,49,49,49,49,49,49,-157,-152,49,49,49,49,49,-361,49,49,49,-147,49,-171,-139,49,-163,49,-168,49,49,-156,49,49,49,-362,49,49,49,49,49,49,-144,49,-140,-141,-149,-46,49,49,-158,49,49,49,-151,49,49,49,49,49,-172,49,49,-143,-142,49,-10,-153,-154,-159,49,49,-148,49,49,49,-173,49,-146,49,49,49,49,49,49,-145,-150,49,-160,-161,-11,-12,49,49,49,49,49,49,49,-155,-13,-14,-15,-16,]),'AS':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,90,98,101,105,107,108,109,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,228,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,333,336,344,351,358,364,371,378,388,395,397,407,418,422,436,],[-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-282,218,-273,-266,-265,227,-209,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-225,-284,-283,-268,-270,-271,-269,-267,-210,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-211,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,479,-212,-214,494,]),'OR':([10,12,23,30,32,35,37,38,46,48,51,52,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,300,305,311,336,344,351,358,364,371,378,395,397,],[-264,-244,-258,-291,-240,-292,-272,-248,157,-224,-252,-276,-289,-226,-290,-220,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,260,-287,-254,-253,-278,-280,-275,-285,-227,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-222,-247,-243,-251,-219,-309,-279,-310,-229,-223,]),'LEFTSHIFT':([10,23,30,35,37,51,52,67,72,90,101,105,107,131,132,140,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,239,240,241,262,267,268,269,271,278,279,280,300,364,371,378,602,616,622,656,669,675,],[-264,-258,-291,-292,-272,161,-276,-289,-290,-282,-273,-266,-265,-259,-260,-293,-274,-287,-254,161,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-261,-262,-263,-288,-256,-257,-255,-308,-281,-311,-277,-286,-309,-279,-310,626,626,626,626,626,626,]),'CONTINUE':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[53,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,53,-138,-132,-51,53,-52,-175,-174,53,-6,53,53,-45,53,53,53,-162,53,53,53,-157,-152,-147,-171,-139,-163,-168,53,53,-156,53,53,53,-144,-140,-141,-149,-46,53,53,-158,53,-151,53,-172,53,53,-143,-142,-10,-153,-154,-159,-148,-173,53,-146,53,53,53,-145,-150,53,-160,-161,-11,-12,53,-155,-13,-14,-15,-16,]),'NOT':([0,1,6,7,10,12,14,16,18,23,24,28,29,30,32,33,35,37,38,42,44,47,49,51,52,55,57,63,64,65,67,68,72,73,74,82,83,85,86,89,90,95,96,97,101,105,107,113,116,117,118,119,120,121,122,123,124,125,126,127,128,129,131,132,135,136,138,140,143,147,149,151,155,157,160,162,164,165,166,169,170,177,181,183,189,190,196,199,201,210,213,215,216,219,220,222,223,224,225,226,232,234,239,240,241,247,248,254,256,258,260,262,263,265,267,268,269,270,271,272,274,278,279,280,281,282,291,293,296,299,300,303,305,309,310,312,314,315,316,318,324,328,330,336,341,344,346,347,350,351,353,354,355,356,360,364,365,367,368,370,371,374,375,377,378,391,394,395,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[83,83,-134,83,-264,-244,-49,-137,-133,-258,-131,-135,83,-291,-240,83,-292,-272,-248,-50,-9,-7,83,-252,-276,83,83,-8,-136,83,-289,192,-290,83,83,83,83,-138,83,-132,-282,-51,83,-52,-273,-266,-265,-245,83,-119,-110,-114,-109,83,-112,-116,-111,-115,-118,-120,-117,-113,-259,-260,-175,-174,83,-293,-241,83,-249,-274,83,83,-287,-254,-253,83,-278,83,-280,83,-275,-285,306,192,-6,83,83,-284,83,-283,83,83,83,-268,-270,-271,-269,-267,-246,83,-261,-262,-263,-242,83,-250,83,-45,83,-288,83,83,-256,-257,-255,83,-308,83,83,-281,-311,-277,83,83,83,83,83,83,-286,83,-228,83,83,83,83,83,83,83,83,-162,83,-247,83,-243,83,83,83,-251,83,-157,-152,83,83,-309,83,83,83,-361,-279,83,83,83,-310,-147,83,-229,-171,-139,83,-163,83,-168,83,83,-156,83,83,83,-362,83,83,83,83,83,83,-144,83,-140,-141,-149,-46,83,83,-158,83,83,83,-151,83,83,83,83,83,-172,83,83,-143,-142,83,-10,-153,-154,-159,83,83,-148,83,83,83,-173,83,-146,83,83,83,83,83,83,-145,-150,83,-160,-161,-11,-12,83,83,83,83,83,83,83,-155,-13,-14,-15,-16,]),'LAMBDA':([0,1,6,7,14,16,18,24,28,29,33,42,44,47,49,55,57,63,64,65,73,74,82,85,86,89,95,96,97,116,117,118,119,120,121,122,123,124,125,126,127,128,129,135,136,147,155,165,169,177,196,201,213,216,219,220,234,248,256,258,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,328,330,341,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[54,54,-134,54,-49,-137,-133,-131,-135,54,54,-50,-9,-7,54,54,54,-8,-136,54,54,54,54,-138,54,-132,-51,54,-52,54,-119,-110,-114,-109,54,-112,-116,-111,-115,-118,-120,-117,-113,-175,-174,54,54,54,54,54,-6,54,54,54,54,54,54,54,54,-45,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-162,54,54,54,54,54,54,-157,-152,54,54,54,54,54,-361,54,54,54,-147,54,-171,-139,-163,54,-168,54,54,-156,54,54,54,-362,54,54,54,54,521,54,-144,54,-140,-141,-149,-46,54,54,-158,54,54,54,-151,54,54,54,54,54,-172,54,54,-143,-142,521,-10,-153,-154,-159,54,54,-148,521,521,521,-173,54,-146,54,54,54,54,521,521,-145,-150,54,-160,-161,-11,-12,54,54,54,54,54,54,54,-155,-13,-14,-15,-16,]),'NEWLINE':([0,3,4,5,6,10,12,14,15,16,17,18,19,20,21,23,24,27,28,29,30,32,33,35,36,37,38,40,41,42,44,46,47,48,50,51,52,53,55,58,59,60,62,63,64,66,67,68,69,70,72,73,75,76,77,78,79,81,82,85,88,89,90,94,95,96,97,101,105,107,108,109,110,111,113,114,115,131,132,135,136,139,140,141,142,143,145,146,149,151,155,156,160,162,164,166,170,178,179,181,183,190,196,197,198,200,201,203,204,205,210,215,216,217,219,222,223,224,225,226,228,231,232,235,236,237,238,239,240,241,244,245,247,248,249,250,254,258,261,262,267,268,269,271,278,279,280,295,297,299,300,305,311,312,313,315,318,326,328,330,331,333,334,336,337,338,339,342,343,344,345,346,350,351,354,355,358,364,371,378,388,389,390,391,395,396,397,398,401,402,404,405,406,407,409,412,413,417,418,419,422,423,424,425,426,428,429,432,435,437,464,468,471,472,475,476,477,478,481,482,486,487,488,490,491,492,493,495,497,515,516,522,523,526,527,528,529,530,531,532,534,540,542,543,545,559,568,569,570,571,572,575,577,578,592,595,600,603,604,605,606,615,619,622,628,630,631,636,637,638,642,643,644,645,646,649,652,653,656,664,672,],[8,95,-182,97,-134,-264,-244,-49,-105,-137,-66,-133,-215,-79,-58,-258,-131,-213,-135,-87,-291,-240,-67,-292,-62,-272,-248,-65,153,-50,-9,-216,-7,-224,-61,-252,-276,-86,-89,-82,-63,-81,-59,-8,-136,-83,-289,-226,-85,-84,-290,-5,-220,-80,-125,-64,-181,-93,-94,-138,-60,-132,-282,-54,-51,-53,-52,-273,-266,-265,-197,-209,-183,-205,-245,-100,-108,-259,-260,-175,-174,-88,-293,-78,-332,-241,-69,-68,-249,-274,257,-217,-287,-254,-253,-278,-280,-90,-96,-275,-285,-227,-6,-103,-221,-127,-126,-95,-225,317,-284,-283,-55,-56,257,-268,-270,-271,-269,-267,-210,-206,-246,-107,-106,-122,-121,-261,-262,-263,-333,-334,-242,-73,-74,-70,-250,-45,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-97,257,-286,-228,-222,-128,-129,257,257,-57,-162,257,-198,-211,-207,-247,-101,-124,-123,-336,-335,-243,-76,-75,257,-251,-157,-152,-219,-309,-279,-310,-388,-91,-99,-147,-229,-104,-223,-130,-171,470,-139,-199,-184,-195,-185,-190,-191,-163,-212,-208,-214,-337,-77,-72,-71,-168,257,-156,257,257,-98,257,524,-144,-140,-141,-200,-201,-188,-187,-102,539,-149,-46,257,257,-158,257,-151,-92,257,-172,257,257,-143,-142,-203,-202,-196,-186,-192,-10,-153,-154,-159,-148,-173,257,-146,-204,-189,257,257,257,-145,614,618,-150,257,-160,-161,-11,-12,639,647,257,-155,647,-13,655,657,658,659,660,661,663,-14,-15,665,-16,677,]),'RAISE':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[55,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,55,-138,-132,-51,55,-52,-175,-174,55,-6,55,55,-45,55,55,55,-162,55,55,55,-157,-152,-147,-171,-139,-163,-168,55,55,-156,55,55,55,-144,-140,-141,-149,-46,55,55,-158,55,-151,55,-172,55,55,-143,-142,-10,-153,-154,-159,-148,-173,55,-146,55,55,55,-145,-150,55,-160,-161,-11,-12,55,-155,-13,-14,-15,-16,]),'GLOBAL':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[56,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,56,-138,-132,-51,56,-52,-175,-174,56,-6,56,56,-45,56,56,56,-162,56,56,56,-157,-152,-147,-171,-139,-163,-168,56,56,-156,56,56,56,-144,-140,-141,-149,-46,56,56,-158,56,-151,56,-172,56,56,-143,-142,-10,-153,-154,-159,-148,-173,56,-146,56,56,56,-145,-150,56,-160,-161,-11,-12,56,-155,-13,-14,-15,-16,]),'WHILE':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,328,353,354,355,391,401,404,417,428,430,432,472,475,476,488,490,493,497,522,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[57,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,57,-138,-132,-51,-52,-175,-174,-6,-45,-162,57,-157,-152,-147,-171,-139,-163,-168,57,-156,-144,-140,-141,-149,-46,-158,-151,-172,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'VBAR':([10,12,23,30,32,35,37,38,51,52,67,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,336,344,351,364,371,378,],[-264,-244,-258,-291,144,-292,-272,-248,-252,-276,-289,-290,-282,-273,-266,-265,-245,-259,-260,-293,246,-249,-274,-287,-254,-253,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-247,-243,-251,-309,-279,-310,]),'STAR':([10,30,35,37,52,54,67,72,90,101,105,107,140,151,160,165,166,170,181,183,210,215,222,223,224,225,226,251,262,271,274,278,279,280,292,300,316,319,321,364,370,371,378,383,410,444,459,510,521,],[102,-291,-292,-272,-276,172,-289,-290,-282,-273,-266,102,-293,-274,-287,270,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,172,-288,-308,365,-281,-311,-277,385,-286,270,406,412,-309,-361,-279,-310,455,482,-362,511,554,172,]),'DOT':([30,35,52,67,72,87,90,109,140,160,166,170,183,208,209,210,215,228,262,271,278,279,300,322,333,364,378,418,],[-291,-292,167,-289,-290,209,-282,229,-293,-287,167,-280,-285,322,-193,-284,-283,332,-288,-308,-281,-311,-286,-194,-211,-309,-310,-212,]),'LEFTSHIFTEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,129,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'TILDE':([0,1,6,7,9,13,14,16,18,24,28,29,31,33,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[61,61,-134,61,61,61,-49,-137,-133,-131,-135,61,61,61,61,-50,61,-9,-7,61,61,61,61,-8,-136,61,61,61,61,61,-138,61,-132,-51,61,-52,61,61,61,61,61,61,-119,-110,-114,-109,61,-112,-116,-111,-115,-118,-120,-117,-113,61,61,-175,-174,61,61,61,61,61,61,61,61,61,61,61,61,-235,61,-231,-230,-238,-233,-236,-234,-232,-6,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-45,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-239,61,-237,61,61,61,61,61,61,61,61,-162,61,61,61,61,61,61,61,-157,-152,61,61,61,61,61,-361,61,61,61,-147,61,-171,-139,61,-163,61,-168,61,61,-156,61,61,61,-362,61,61,61,61,61,61,-144,61,-140,-141,-149,-46,61,61,-158,61,61,61,-151,61,61,61,61,61,-172,61,61,-143,-142,61,-10,-153,-154,-159,61,61,-148,61,61,61,-173,61,-146,61,61,61,61,61,61,-145,-150,61,-160,-161,-11,-12,61,61,61,61,61,61,61,-155,-13,-14,-15,-16,]),'RSQB':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,65,67,68,72,75,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,182,183,184,190,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,281,282,283,284,285,286,295,300,302,303,304,305,311,336,344,351,358,364,371,372,373,374,375,376,377,378,388,393,394,395,397,422,447,448,449,450,451,467,502,503,504,517,518,519,520,551,560,561,562,565,587,588,589,591,611,612,613,],[-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,183,-289,-226,-290,-220,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,300,-285,-295,-227,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-320,-321,-319,-312,378,-318,-387,-286,-294,-296,-297,-228,-222,-247,-243,-251,-219,-309,-279,-324,-326,-322,-323,-314,-313,-310,-388,-299,-298,-229,-223,-214,-325,-327,-331,-315,-316,-300,-329,-328,-317,-366,-378,-384,-383,-330,-367,-369,-368,-379,-370,-381,-380,-385,-371,-382,-386,]),'PERCENT':([10,30,35,37,52,67,72,90,101,105,107,140,151,160,166,170,181,183,210,215,222,223,224,225,226,262,271,278,279,280,300,364,371,378,],[103,-291,-292,-272,-276,-289,-290,-282,-273,-266,103,-293,-274,-287,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-288,-308,-281,-311,-277,-286,-309,-279,-310,]),'DOUBLESLASH':([10,30,35,37,52,67,72,90,101,105,107,140,151,160,166,170,181,183,210,215,222,223,224,225,226,262,271,278,279,280,300,364,371,378,],[104,-291,-292,-272,-276,-289,-290,-282,-273,-266,104,-293,-274,-287,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-288,-308,-281,-311,-277,-286,-309,-279,-310,]),'EQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,82,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,173,174,181,183,190,198,200,201,203,204,210,215,222,223,224,225,226,232,237,238,239,240,241,247,254,261,262,267,268,269,271,275,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,381,386,388,395,397,398,422,456,602,616,622,656,669,675,],[-264,-244,121,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-94,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-416,291,-275,-285,-227,-221,-127,-126,-95,-225,-284,-283,-268,-270,-271,-269,-267,-246,121,121,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,368,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-417,461,-388,-229,-223,-130,-214,508,625,625,625,625,625,625,]),'PLUSEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,123,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'ELLIPSIS':([169,377,450,],[286,286,286,]),'LESSEQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,194,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,194,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'LSQB':([0,1,6,7,9,13,14,16,18,24,28,29,30,31,33,35,39,42,43,44,47,49,52,55,57,61,63,64,65,67,72,73,74,82,83,85,86,89,90,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,140,144,147,150,155,157,160,161,163,165,166,168,169,170,177,183,185,186,187,188,189,191,193,194,195,196,199,201,210,211,213,215,216,218,219,220,233,234,244,246,248,253,256,258,260,262,263,265,270,271,272,274,277,278,279,281,282,291,293,296,299,300,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,364,365,367,368,370,374,375,377,378,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[65,65,-134,65,65,65,-49,-137,-133,-131,-135,65,-291,65,65,-292,65,-50,65,-9,-7,65,169,65,65,65,-8,-136,65,-289,-290,65,65,65,65,-138,65,-132,-282,-51,65,-52,65,65,65,65,65,65,-119,-110,-114,-109,65,-112,-116,-111,-115,-118,-120,-117,-113,65,65,-175,-174,65,-293,65,65,65,65,65,-287,65,65,65,169,65,65,-280,65,-285,-235,65,-231,-230,-238,-233,-236,-234,-232,-6,65,65,-284,65,65,-283,65,65,65,65,65,65,65,65,65,65,65,-45,65,-288,65,65,65,-308,65,65,65,-281,-311,65,65,65,65,65,65,-286,65,65,-239,65,-237,65,65,65,65,65,65,65,65,-162,65,65,65,65,65,65,65,-157,-152,65,65,-309,65,65,65,-361,65,65,65,-310,-147,65,-171,-139,65,-163,65,-168,65,65,-156,65,65,65,-362,65,65,65,65,65,65,-144,65,-140,-141,-149,-46,65,65,-158,65,65,65,-151,65,65,65,65,65,-172,65,65,-143,-142,65,-10,-153,-154,-159,65,65,-148,65,65,65,-173,65,-146,65,65,65,65,65,65,-145,-150,65,-160,-161,-11,-12,65,65,65,65,65,65,65,-155,-13,-14,-15,-16,]),'GREATER':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,187,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,187,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'VBAREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,127,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'BREAK':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[69,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,69,-138,-132,-51,69,-52,-175,-174,69,-6,69,69,-45,69,69,69,-162,69,69,69,-157,-152,-147,-171,-139,-163,-168,69,69,-156,69,69,69,-144,-140,-141,-149,-46,69,69,-158,69,-151,69,-172,69,69,-143,-142,-10,-153,-154,-159,-148,-173,69,-146,69,69,69,-145,-150,69,-160,-161,-11,-12,69,-155,-13,-14,-15,-16,]),'STAREQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,117,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'ELIF':([95,97,258,404,472,475,490,527,592,],[-51,-52,-45,473,-144,473,-46,-143,-145,]),'SLASHEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,126,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'NUMBER':([0,1,6,7,9,13,14,16,18,24,28,29,31,33,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[72,72,-134,72,72,72,-49,-137,-133,-131,-135,72,72,72,72,-50,72,-9,-7,72,72,72,72,-8,-136,72,72,72,72,72,-138,72,-132,-51,72,-52,72,72,72,72,72,72,-119,-110,-114,-109,72,-112,-116,-111,-115,-118,-120,-117,-113,72,72,-175,-174,72,72,72,72,72,72,72,72,72,72,72,72,-235,72,-231,-230,-238,-233,-236,-234,-232,-6,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-45,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-239,72,-237,72,72,72,72,72,72,72,72,-162,72,72,72,72,72,72,72,-157,-152,72,72,72,72,72,-361,72,72,72,-147,72,-171,-139,72,-163,72,-168,72,72,-156,72,72,72,-362,72,72,72,72,72,72,-144,72,-140,-141,-149,-46,72,72,-158,72,72,72,-151,72,72,72,72,72,-172,72,72,-143,-142,72,-10,-153,-154,-159,72,72,-148,72,72,72,-173,72,-146,72,72,72,72,72,72,-145,-150,72,-160,-161,-11,-12,72,72,72,72,72,72,72,-155,-13,-14,-15,-16,]),'RPAR':([1,10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,82,90,91,92,93,101,105,107,113,131,132,140,143,149,151,156,160,162,164,165,166,170,173,174,181,183,190,198,200,201,203,204,210,212,213,214,215,222,223,224,225,226,232,239,240,241,247,251,254,261,262,267,268,269,271,273,275,276,278,279,280,287,288,289,290,292,294,295,300,305,311,312,313,314,316,324,325,336,340,344,349,351,358,362,363,364,366,369,370,371,378,379,380,381,383,384,386,388,395,397,398,400,403,405,407,415,422,443,444,445,446,452,453,456,458,459,460,462,477,478,480,484,485,505,506,507,509,510,514,519,520,529,530,531,533,535,536,537,549,553,556,557,571,573,581,583,584,586,591,593,608,613,633,651,],[90,-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-94,-282,210,-302,215,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,271,-278,-280,-416,-392,-275,-285,-227,-221,-127,-126,-95,-225,-284,-304,-303,-301,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,348,-250,-218,-288,-256,-257,-255,-308,364,-363,-351,-281,-311,-277,-418,381,-409,-397,-393,-411,-387,-286,-228,-222,-128,-129,399,402,-305,-306,-247,421,-243,427,-251,-219,-353,-355,-309,-356,-364,-352,-279,-310,-419,-420,-417,-398,-402,-412,-388,-229,-223,-130,469,471,-199,-195,-307,-214,-358,-357,-360,-365,-422,-421,-414,-407,-403,-389,-391,-200,-201,532,534,-372,-423,-410,-394,-396,-408,-413,-384,-383,-203,-202,-196,572,-375,-374,-373,-354,-415,-399,-401,-204,-376,-359,-404,-406,-390,-385,-377,-395,-386,-400,-405,]),'ASSERT':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[74,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,74,-138,-132,-51,74,-52,-175,-174,74,-6,74,74,-45,74,74,74,-162,74,74,74,-157,-152,-147,-171,-139,-163,-168,74,74,-156,74,74,74,-144,-140,-141,-149,-46,74,74,-158,74,-151,74,-172,74,74,-143,-142,-10,-153,-154,-159,-148,-173,74,-146,74,74,74,-145,-150,74,-160,-161,-11,-12,74,-155,-13,-14,-15,-16,]),'RIGHTSHIFTEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,128,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'GREATEREQUAL':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,191,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,191,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'SEMI':([3,4,10,12,15,17,19,20,21,23,27,29,30,32,33,35,36,37,38,40,46,48,50,51,52,53,55,58,59,60,62,66,67,68,69,70,72,75,76,77,78,79,81,82,88,90,94,101,105,107,108,109,110,111,113,114,115,131,132,139,140,141,142,143,145,146,149,151,156,160,162,164,166,170,178,179,181,183,190,197,198,200,201,203,204,210,215,217,222,223,224,225,226,228,231,232,235,236,237,238,239,240,241,244,245,247,248,249,250,254,261,262,267,268,269,271,278,279,280,295,297,300,305,311,312,313,326,331,333,334,336,337,338,339,342,343,344,345,346,351,358,364,371,378,388,389,390,395,396,397,398,405,406,407,409,412,413,418,419,422,423,424,425,426,464,477,478,481,482,486,515,529,530,531,532,534,571,572,],[96,-182,-264,-244,-105,-66,-215,-79,-58,-258,-213,-87,-291,-240,-67,-292,-62,-272,-248,-65,-216,-224,-61,-252,-276,-86,-89,-82,-63,-81,-59,-83,-289,-226,-85,-84,-290,-220,-80,-125,-64,-181,-93,-94,-60,-282,216,-273,-266,-265,-197,-209,-183,-205,-245,-100,-108,-259,-260,-88,-293,-78,-332,-241,-69,-68,-249,-274,-217,-287,-254,-253,-278,-280,-90,-96,-275,-285,-227,-103,-221,-127,-126,-95,-225,-284,-283,-56,-268,-270,-271,-269,-267,-210,-206,-246,-107,-106,-122,-121,-261,-262,-263,-333,-334,-242,-73,-74,-70,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-97,-286,-228,-222,-128,-129,-57,-198,-211,-207,-247,-101,-124,-123,-336,-335,-243,-76,-75,-251,-219,-309,-279,-310,-388,-91,-99,-229,-104,-223,-130,-199,-184,-195,-185,-190,-191,-212,-208,-214,-337,-77,-72,-71,-98,-200,-201,-188,-187,-102,-92,-203,-202,-196,-186,-192,-204,-189,]),'DOUBLESLASHEQUAL':([10,12,15,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,101,105,107,113,131,132,140,143,149,151,156,160,162,164,166,170,181,183,190,198,200,201,204,210,215,222,223,224,225,226,232,239,240,241,247,254,261,262,267,268,269,271,278,279,280,295,300,305,311,312,313,336,344,351,358,364,371,378,388,395,397,398,422,],[-264,-244,124,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,-125,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-221,-127,-126,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-218,-288,-256,-257,-255,-308,-281,-311,-277,-387,-286,-228,-222,-128,-129,-247,-243,-251,-219,-309,-279,-310,-388,-229,-223,-130,-214,]),'COMMA':([10,12,19,23,27,30,32,35,37,38,46,48,51,52,67,68,72,75,77,90,92,98,99,101,105,107,108,109,111,113,131,132,140,142,143,146,149,151,156,159,160,162,164,166,170,173,174,178,179,181,183,184,190,197,198,200,204,210,212,215,222,223,224,225,226,228,231,232,239,240,241,245,247,249,250,254,261,262,264,267,268,269,271,275,276,278,279,280,281,282,283,284,286,287,289,290,295,300,304,305,311,313,325,327,329,331,333,334,336,337,342,344,345,351,358,359,361,362,364,366,369,371,372,373,374,375,376,378,380,381,384,386,388,389,390,393,395,397,398,405,407,415,418,419,422,423,424,426,436,438,439,443,446,447,448,449,451,452,456,458,460,467,478,485,502,503,504,505,507,514,518,519,520,529,531,535,536,537,551,553,556,565,571,573,580,583,588,591,593,607,612,613,],[-264,-244,-215,-258,-213,-291,-240,-292,-272,-248,-216,-224,-252,-276,-289,-226,-290,-220,201,-282,213,-164,220,-273,-266,-265,-197,-209,230,-245,-259,-260,-293,244,-241,248,-249,-274,-217,263,-287,-254,-253,-278,-280,-416,292,296,298,-275,-285,303,-227,309,-221,312,-225,-284,324,-283,-268,-270,-271,-269,-267,-210,335,-246,-261,-262,-263,343,-242,346,347,-250,-218,-288,360,-256,-257,-255,-308,-363,370,-281,-311,-277,-320,-321,-319,377,-318,379,382,383,-387,-286,394,-228,-222,-129,-306,-165,220,-198,-211,-207,-247,420,-336,-243,-76,-251,-219,-349,440,442,-309,444,-364,-279,-324,-326,-322,-323,450,-310,453,-417,459,-412,-388,463,298,-299,-229,-223,-130,477,-195,-307,-212,-208,-214,-337,-77,248,496,-350,498,501,-365,-325,-327,-331,-316,-422,-414,510,513,-300,530,-372,-329,-328,-317,-423,552,-413,564,-384,-383,-203,-196,-375,-374,-373,-330,-415,585,589,-204,-376,-347,609,-381,-385,-377,-348,-382,-386,]),'CLASS':([0,6,14,16,18,22,24,25,28,42,44,47,63,64,73,85,89,95,97,130,135,136,196,258,317,328,353,354,355,391,401,404,417,428,430,432,470,472,475,476,488,490,493,497,522,524,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[80,-134,-49,-137,-133,-177,-131,80,-135,-50,-9,-7,-8,-136,80,-138,-132,-51,-52,-176,-175,-174,-6,-45,-178,-162,80,-157,-152,-147,-171,-139,-163,-168,80,-156,-179,-144,-140,-141,-149,-46,-158,-151,-172,-180,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'RIGHTSHIFT':([10,23,30,33,35,37,51,52,67,72,90,101,105,107,131,132,140,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,239,240,241,262,267,268,269,271,278,279,280,300,364,371,378,602,616,622,656,669,675,],[-264,-258,-291,147,-292,-272,163,-276,-289,-290,-282,-273,-266,-265,-259,-260,-293,-274,-287,-254,163,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-261,-262,-263,-288,-256,-257,-255,-308,-281,-311,-277,-286,-309,-279,-310,621,621,621,621,621,621,]),'STRING':([0,1,6,7,9,13,14,16,18,24,28,29,30,31,33,35,39,42,43,44,47,49,55,57,61,63,64,65,73,74,82,83,85,86,89,95,96,97,102,103,104,106,112,116,117,118,119,120,121,122,123,124,125,126,127,128,129,133,134,135,136,138,140,144,147,150,155,157,161,163,165,168,169,177,185,186,187,188,189,191,193,194,195,196,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,258,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,306,307,308,309,310,312,314,315,316,318,324,328,330,341,343,346,347,350,353,354,355,356,360,365,367,368,370,374,375,377,391,394,401,404,414,417,420,428,429,430,432,435,437,440,444,447,450,461,463,466,468,472,473,475,476,488,490,491,492,493,494,495,496,497,498,500,503,508,516,522,523,526,527,528,538,540,542,543,545,548,550,559,563,564,567,568,569,570,574,575,577,578,579,589,590,592,603,604,605,606,615,619,621,623,625,626,627,629,630,631,637,652,653,664,],[35,35,-134,35,35,35,-49,-137,-133,-131,-135,35,140,35,35,-292,35,-50,35,-9,-7,35,35,35,35,-8,-136,35,35,35,35,35,-138,35,-132,-51,35,-52,35,35,35,35,35,35,-119,-110,-114,-109,35,-112,-116,-111,-115,-118,-120,-117,-113,35,35,-175,-174,35,-293,35,35,35,35,35,35,35,35,35,35,35,-235,35,-231,-230,-238,-233,-236,-234,-232,-6,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-45,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-239,35,-237,35,35,35,35,35,35,35,35,-162,35,35,35,35,35,35,35,-157,-152,35,35,35,35,35,-361,35,35,35,-147,35,-171,-139,35,-163,35,-168,35,35,-156,35,35,35,-362,35,35,35,35,35,35,-144,35,-140,-141,-149,-46,35,35,-158,35,35,35,-151,35,35,35,35,35,-172,35,35,-143,-142,35,-10,-153,-154,-159,35,35,-148,35,35,35,-173,35,-146,595,35,35,35,35,35,35,-145,-150,35,-160,-161,-11,-12,35,35,35,35,35,35,35,-155,-13,-14,-15,-16,]),'COLONEQUAL':([602,616,622,656,669,675,],[623,623,623,623,623,623,]),'IS':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,131,132,140,143,149,151,160,162,164,166,170,181,183,190,210,215,222,223,224,225,226,232,239,240,241,247,254,262,267,268,269,271,278,279,280,300,305,336,344,351,364,371,378,395,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,189,-290,-282,-273,-266,-265,-245,-259,-260,-293,-241,-249,-274,-287,-254,-253,-278,-280,-275,-285,189,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-247,-243,-251,-309,-279,-310,-229,]),'YIELD':([0,1,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,116,117,118,119,120,121,122,123,124,125,126,127,128,129,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[82,82,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,82,-138,-132,-51,82,-52,82,-119,-110,-114,-109,82,-112,-116,-111,-115,-118,-120,-117,-113,-175,-174,82,-6,82,82,-45,82,82,82,-162,82,82,82,-157,-152,-147,-171,-139,-163,-168,82,82,-156,82,82,82,-144,-140,-141,-149,-46,82,82,-158,82,-151,82,-172,82,82,-143,-142,-10,-153,-154,-159,-148,-173,82,-146,82,82,82,-145,-150,82,-160,-161,-11,-12,82,-155,-13,-14,-15,-16,]),'FINALLY':([95,97,258,259,354,355,432,490,493,542,545,605,606,],[-51,-52,-45,357,-157,434,-156,-46,-158,576,-159,-160,-161,]),'AT':([0,6,14,16,18,22,24,28,42,44,47,63,64,73,85,89,95,97,135,136,196,258,317,328,353,354,355,391,401,404,417,428,430,432,470,472,475,476,488,490,493,497,522,524,527,528,540,542,543,545,559,568,570,592,603,605,606,615,619,631,637,652,653,664,],[84,-134,-49,-137,-133,84,-131,-135,-50,-9,-7,-8,-136,84,-138,-132,-51,-52,-175,-174,-6,-45,-178,-162,84,-157,-152,-147,-171,-139,-163,-168,84,-156,-179,-144,-140,-141,-149,-46,-158,-151,-172,-180,-143,-142,-10,-153,-154,-159,-148,-173,-146,-145,-150,-160,-161,-11,-12,-155,-13,-14,-15,-16,]),'AMPER':([10,23,30,35,37,38,51,52,67,72,90,101,105,107,131,132,140,149,151,160,162,164,166,170,181,183,210,215,222,223,224,225,226,239,240,241,254,262,267,268,269,271,278,279,280,300,351,364,371,378,],[-264,-258,-291,-292,-272,150,-252,-276,-289,-290,-282,-273,-266,-265,-259,-260,-293,253,-274,-287,-254,-253,-278,-280,-275,-285,-284,-283,-268,-270,-271,-269,-267,-261,-262,-263,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-251,-309,-279,-310,]),'IN':([10,12,23,30,32,35,37,38,51,52,67,68,72,90,101,105,107,113,114,131,132,140,142,143,149,151,154,160,162,164,166,170,181,183,190,192,210,215,222,223,224,225,226,232,239,240,241,244,245,247,254,262,267,268,269,271,278,279,280,300,305,323,336,342,343,344,351,364,371,378,392,395,423,],[-264,-244,-258,-291,-240,-292,-272,-248,-252,-276,-289,193,-290,-282,-273,-266,-265,-245,234,-259,-260,-293,-332,-241,-249,-274,256,-287,-254,-253,-278,-280,-275,-285,193,308,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-333,-334,-242,-250,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,414,-247,-336,-335,-243,-251,-309,-279,-310,466,-229,-337,]),'LEFTSHIFTCOLON':([602,616,622,656,669,675,],[627,627,627,627,627,627,]),'IF':([0,6,10,12,14,16,18,23,24,27,28,30,32,35,37,38,42,44,46,47,48,51,52,63,64,67,68,72,73,75,85,89,90,95,97,101,105,107,113,131,132,135,136,140,143,149,151,156,160,162,164,166,170,181,183,190,196,198,204,210,215,222,223,224,225,226,232,239,240,241,247,254,258,261,262,267,268,269,271,278,279,280,300,305,311,328,336,344,351,353,354,355,358,364,371,378,391,395,397,401,404,417,428,430,432,472,475,476,485,488,490,493,497,517,518,519,520,522,527,528,540,542,543,545,559,565,568,570,573,587,588,589,591,592,603,605,606,612,613,615,619,631,637,652,653,664,],[86,-134,-264,-244,-49,-137,-133,-258,-131,138,-135,-291,-240,-292,-272,-248,-50,-9,-216,-7,-224,-252,-276,-8,-136,-289,-226,-290,86,-220,-138,-132,-282,-51,-52,-273,-266,-265,-245,-259,-260,-175,-174,-293,-241,-249,-274,-217,-287,-254,-253,-278,-280,-275,-285,-227,-6,-221,-225,-284,-283,-268,-270,-271,-269,-267,-246,-261,-262,-263,-242,-250,-45,-218,-288,-256,-257,-255,-308,-281,-311,-277,-286,-228,-222,-162,-247,-243,-251,86,-157,-152,-219,-309,-279,-310,-147,-229,-223,-171,-139,-163,-168,86,-156,-144,-140,-141,538,-149,-46,-158,-151,563,-378,-384,-383,-172,-143,-142,-10,-153,-154,-159,-148,-379,-173,-146,538,563,-381,-380,-385,-145,-150,-160,-161,-382,-386,-11,-12,-155,-13,-14,-15,-16,]),'FROM':([0,6,14,16,18,24,28,42,44,47,63,64,73,85,89,95,96,97,135,136,155,196,216,219,258,299,315,318,328,330,350,353,354,355,391,401,404,417,428,429,430,432,435,437,468,472,475,476,488,490,491,492,493,495,497,516,522,523,526,527,528,540,542,543,545,559,568,569,570,575,577,578,592,603,604,605,606,615,619,630,631,637,652,653,664,],[87,-134,-49,-137,-133,-131,-135,-50,-9,-7,-8,-136,87,-138,-132,-51,87,-52,-175,-174,87,-6,87,87,-45,87,87,87,-162,87,87,87,-157,-152,-147,-171,-139,-163,-168,87,87,-156,87,87,87,-144,-140,-141,-149,-46,87,87,-158,87,-151,87,-172,87,87,-143,-142,-10,-153,-154,-159,-148,-173,87,-146,87,87,87,-145,-150,87,-160,-161,-11,-12,87,-155,-13,-14,-15,-16,]),}
 
 _lr_action = { }
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'import_as_name':([319,321,408,410,411,477,483,530,],[405,405,405,481,405,529,405,571,]),'try_stmt':([0,73,353,430,],[6,6,6,6,]),'small_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[3,3,217,3,326,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'augassign':([15,],[116,]),'import_from':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'small_stmt_list':([0,73,155,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'import_as_names':([319,321,408,411,483,],[409,413,480,484,533,]),'else_stmt':([404,475,],[476,528,]),'comp_op':([68,190,],[186,307,]),'parameters':([148,],[252,]),'factor':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[10,10,10,101,10,10,10,10,151,10,10,10,10,181,10,10,10,10,10,10,10,222,223,224,225,10,10,10,10,10,10,10,10,10,10,10,10,10,10,280,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,371,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'suite':([155,219,299,315,318,330,350,429,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[259,328,391,401,404,417,428,488,493,497,522,542,543,545,559,568,570,592,603,605,606,629,646,]),'globals_list':([179,390,],[297,464,]),'exec_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'and_expr_list':([38,],[149,]),'or_test_list':([46,],[156,]),'simple_stmt':([0,73,155,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[14,14,258,258,258,258,258,258,258,14,258,14,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,]),'dotted_as_names_list':([111,],[231,]),'subscriptlist':([169,],[285,]),'testlist':([0,29,73,82,96,116,121,155,216,219,256,299,314,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[15,139,15,203,15,236,238,15,15,15,352,15,400,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'classdef':([0,25,73,353,430,],[16,135,16,16,16,]),'assert_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'for_stmt':([0,73,353,430,],[18,18,18,18,]),'lambdef':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,147,155,165,169,177,201,213,216,219,220,234,248,256,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,420,429,430,435,437,440,447,450,461,463,468,473,491,492,494,495,496,498,500,503,508,516,523,526,548,550,569,575,577,578,579,604,621,623,625,626,628,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'expr_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'decorator':([0,22,73,353,430,],[22,22,22,22,22,]),'arith_op':([23,131,],[132,239,]),'term':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,133,134,138,144,147,150,155,157,161,163,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,240,241,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'if_stmt':([0,73,353,430,],[24,24,24,24,]),'enaml_module':([0,],[41,]),'or_test':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,138,147,155,165,169,177,201,213,216,219,220,234,248,256,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,243,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,485,27,27,27,27,27,27,27,27,27,27,520,27,27,27,27,27,27,27,27,27,27,27,27,27,27,520,27,27,520,520,520,27,27,27,27,27,520,520,27,27,27,27,27,27,]),'with_stmt':([0,73,353,430,],[28,28,28,28,]),'comp_for':([92,159,275,361,485,573,],[214,266,369,441,536,536,]),'and_test_list':([75,],[198,]),'identifier':([574,614,657,],[601,633,667,]),'trailer':([52,166,],[170,278,]),'with_item_list':([99,329,],[221,416,]),'instantiation_body_items':([657,667,],[662,673,]),'expr_list':([32,],[143,]),'varargslist_list':([174,384,],[290,458,]),'atom_string_list':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'listmaker':([65,],[182,]),'arglist':([165,316,],[273,403,]),'exprlist_list':([142,],[245,]),'flow_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'comp_if':([485,573,],[535,535,]),'shift_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,138,144,147,150,155,157,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,254,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,351,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'import_from_dots':([87,],[208,]),'arglist_list':([165,316,],[274,274,]),'list_iter':([517,587,],[560,611,]),'dictorsetmaker':([49,],[158,]),'list_for':([184,517,587,],[302,562,562,]),'subscript':([169,377,450,],[284,451,504,]),'decorators':([0,22,73,353,430,],[25,130,25,25,25,]),'compound_stmt':([0,73,353,430,],[42,42,42,42,]),'dosm_comma_list':([159,],[264,]),'dotted_name':([11,84,87,208,230,335,],[108,205,207,320,108,108,]),'power':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'xor_expr_list':([12,],[113,]),'stmt':([0,73,353,430,],[44,44,430,430,]),'fplist_list':([287,],[380,]),'xor_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,116,121,138,144,147,155,157,165,169,177,186,199,201,211,213,216,218,219,220,234,244,246,248,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,247,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,344,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'term_list':([10,],[107,]),'comparison':([0,1,7,29,33,49,55,57,65,73,74,82,83,86,96,116,121,138,147,155,157,165,169,177,199,201,213,216,219,220,234,248,256,260,263,265,270,272,274,281,282,291,293,296,299,303,309,310,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'pass_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'arith_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,138,144,147,150,155,157,161,163,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,267,268,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'declaration_body_item':([574,599,601,614,620,632,633,650,],[597,617,597,597,617,617,597,617,]),'instantiation_body_item':([657,662,667,673,],[664,670,664,670,]),'atom':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'import_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'elif_stmts':([404,],[475,]),'comp_iter':([485,573,],[537,593,]),'print_list_list':([146,426,],[249,249,]),'dotted_as_names':([11,],[110,]),'shift_op':([51,164,],[162,269,]),'attribute_declaration':([574,599,601,614,620,632,633,650,],[596,596,596,596,596,596,596,596,]),'return_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'testlist_comp':([1,],[91,]),'old_test':([466,538,563,564,567,589,590,],[518,573,587,588,591,612,613,]),'testlist_safe_list':([518,],[565,]),'instantiation':([574,599,601,614,620,632,633,650,657,662,667,673,],[594,594,594,594,594,594,594,594,661,661,661,661,]),'enaml_module_item':([0,73,],[47,196,]),'continue_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'testlist_list':([77,],[200,]),'attribute_binding':([574,599,601,614,620,632,633,650,657,662,667,673,],[598,598,598,598,598,598,598,598,665,665,665,665,]),'dotted_as_name':([11,230,335,],[111,334,419,]),'equal_list':([15,237,238,],[115,338,339,]),'print_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'binding':([602,616,622,652,663,669,],[624,624,638,660,624,624,]),'term_op':([10,107,],[105,226,]),'declaration':([0,73,],[63,63,]),'funcdef':([0,25,73,353,430,],[64,136,64,64,64,]),'raise_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'old_lambdef':([466,538,563,564,567,589,590,],[519,519,519,519,519,519,519,]),'exprlist':([31,43,211,301,],[141,154,323,392,]),'expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,116,121,138,147,155,157,165,169,177,186,199,201,211,213,216,218,219,220,234,244,248,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[68,68,68,114,68,142,68,142,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,305,68,68,142,68,68,327,68,68,68,342,68,68,68,68,68,68,68,68,68,68,68,68,68,68,142,68,395,68,68,68,68,68,68,68,68,68,68,423,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'declaration_body':([487,],[540,]),'except_clause':([259,354,],[354,354,]),'and_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,138,144,147,155,157,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,232,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,336,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'instantiation_body':([627,634,],[645,645,]),'yield_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'arith_expr_list':([23,],[131,]),'shift_list':([51,],[164,]),'enaml':([0,],[71,]),'subscriptlist_list':([284,],[376,]),'argument':([165,274,316,],[276,366,276,]),'enaml_module_body':([0,],[73,]),'fplist':([171,],[288,]),'testlist_safe':([466,],[517,]),'not_test':([0,1,7,29,33,49,55,57,65,73,74,82,83,86,96,116,121,138,147,155,157,165,169,177,199,201,213,216,219,220,234,248,256,260,263,265,270,272,274,281,282,291,293,296,299,303,309,310,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[75,75,75,75,75,75,75,75,75,75,75,75,204,75,75,75,75,75,75,75,75,75,75,75,311,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,397,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'print_list':([33,347,],[145,425,]),'break_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'del_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'fpdef':([54,171,251,292,379,383,453,459,510,521,],[174,287,174,386,452,456,505,386,456,174,]),'testlist_comp_list':([92,],[212,]),'small_stmt_list_list':([3,],[94,]),'list_if':([517,587,],[561,561,]),'test':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,147,155,165,169,177,201,213,216,219,220,234,248,256,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,420,429,430,435,437,440,447,450,461,463,468,473,491,492,494,495,496,498,500,503,508,516,523,526,548,550,569,575,577,578,579,604,621,623,625,626,628,],[77,92,98,77,146,159,178,180,184,77,197,77,206,77,77,77,250,77,275,283,295,313,325,77,77,98,337,345,77,359,361,362,363,275,372,373,384,388,389,77,393,396,398,77,77,275,77,415,77,422,424,426,77,77,436,438,443,445,446,448,449,283,467,486,77,77,77,77,499,502,283,514,515,77,525,77,77,544,77,546,547,549,551,553,77,77,77,580,581,77,77,77,77,607,77,636,640,641,642,77,]),'global_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'import_as_names_list':([405,],[478,]),'with_item':([7,220,],[99,329,]),'import_name':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'yield_expr':([0,1,73,96,116,121,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,628,],[81,93,81,81,235,237,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'except_clauses':([259,354,],[355,432,]),'comparison_list':([68,],[190,]),'and_test':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,138,147,155,157,165,169,177,201,213,216,219,220,234,248,256,260,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,628,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,261,46,46,46,46,46,46,46,46,46,46,46,358,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'declaration_body_items':([574,601,614,633,],[599,620,632,650,]),'decorated':([0,73,353,430,],[85,85,85,85,]),'stmt_list':([353,430,],[431,489,]),'elif_stmt':([404,475,],[472,527,]),'dosm_colon_list':([361,],[439,]),'power_list':([52,],[166,]),'while_stmt':([0,73,353,430,],[89,89,89,89,]),'varargslist':([54,251,521,],[175,349,566,]),'dotted_name_list':([109,],[228,]),'listmaker_list':([184,],[304,]),}
+_lr_goto_items = {'import_as_name':([319,321,408,410,411,477,483,530,],[405,405,405,481,405,529,405,571,]),'try_stmt':([0,73,353,430,],[6,6,6,6,]),'small_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[3,3,217,3,326,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'augassign':([15,],[116,]),'import_from':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'small_stmt_list':([0,73,155,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'import_as_names':([319,321,408,411,483,],[409,413,480,484,533,]),'else_stmt':([404,475,],[476,528,]),'comp_op':([68,190,],[186,307,]),'parameters':([148,],[252,]),'factor':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[10,10,10,101,10,10,10,10,151,10,10,10,10,181,10,10,10,10,10,10,10,222,223,224,225,10,10,10,10,10,10,10,10,10,10,10,10,10,10,280,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,371,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'suite':([155,219,299,315,318,330,350,429,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[259,328,391,401,404,417,428,488,493,497,522,542,543,545,559,568,570,592,603,605,606,631,650,]),'globals_list':([179,390,],[297,464,]),'exec_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'and_expr_list':([38,],[149,]),'or_test_list':([46,],[156,]),'simple_stmt':([0,73,155,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[14,14,258,258,258,258,258,258,258,14,258,14,258,258,258,258,258,258,258,258,258,258,258,258,258,258,258,]),'dotted_as_names_list':([111,],[231,]),'subscriptlist':([169,],[285,]),'testlist':([0,29,73,82,96,116,121,155,216,219,256,299,314,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[15,139,15,203,15,236,238,15,15,15,352,15,400,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'classdef':([0,25,73,353,430,],[16,135,16,16,16,]),'assert_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'for_stmt':([0,73,353,430,],[18,18,18,18,]),'lambdef':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,147,155,165,169,177,201,213,216,219,220,234,248,256,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,420,429,430,435,437,440,447,450,461,463,468,473,491,492,494,495,496,498,500,503,508,516,523,526,548,550,569,575,577,578,579,604,621,623,625,626,627,629,630,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'expr_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'decorator':([0,22,73,353,430,],[22,22,22,22,22,]),'arith_op':([23,131,],[132,239,]),'term':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,133,134,138,144,147,150,155,157,161,163,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,240,241,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'if_stmt':([0,73,353,430,],[24,24,24,24,]),'enaml_module':([0,],[41,]),'or_test':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,138,147,155,165,169,177,201,213,216,219,220,234,248,256,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,243,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,485,27,27,27,27,27,27,27,27,27,27,520,27,27,27,27,27,27,27,27,27,27,27,27,27,27,520,27,27,520,520,520,27,27,27,27,27,520,520,27,27,27,27,27,27,27,27,]),'with_stmt':([0,73,353,430,],[28,28,28,28,]),'comp_for':([92,159,275,361,485,573,],[214,266,369,441,536,536,]),'and_test_list':([75,],[198,]),'identifier':([574,614,662,],[601,635,673,]),'trailer':([52,166,],[170,278,]),'with_item_list':([99,329,],[221,416,]),'instantiation_body_items':([662,673,],[668,679,]),'expr_list':([32,],[143,]),'varargslist_list':([174,384,],[290,458,]),'atom_string_list':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'listmaker':([65,],[182,]),'arglist':([165,316,],[273,403,]),'exprlist_list':([142,],[245,]),'flow_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'comp_if':([485,573,],[535,535,]),'shift_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,138,144,147,150,155,157,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,254,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,351,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'import_from_dots':([87,],[208,]),'arglist_list':([165,316,],[274,274,]),'list_iter':([517,587,],[560,611,]),'dictorsetmaker':([49,],[158,]),'list_for':([184,517,587,],[302,562,562,]),'subscript':([169,377,450,],[284,451,504,]),'decorators':([0,22,73,353,430,],[25,130,25,25,25,]),'compound_stmt':([0,73,353,430,],[42,42,42,42,]),'dosm_comma_list':([159,],[264,]),'dotted_name':([11,84,87,208,230,335,],[108,205,207,320,108,108,]),'power':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'xor_expr_list':([12,],[113,]),'stmt':([0,73,353,430,],[44,44,430,430,]),'fplist_list':([287,],[380,]),'xor_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,116,121,138,144,147,155,157,165,169,177,186,199,201,211,213,216,218,219,220,234,244,246,248,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,247,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,344,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'term_list':([10,],[107,]),'comparison':([0,1,7,29,33,49,55,57,65,73,74,82,83,86,96,116,121,138,147,155,157,165,169,177,199,201,213,216,219,220,234,248,256,260,263,265,270,272,274,281,282,291,293,296,299,303,309,310,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'pass_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'arith_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,138,144,147,150,155,157,161,163,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,267,268,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'declaration_body_item':([574,599,601,614,620,634,635,654,],[597,617,597,597,617,617,597,617,]),'instantiation_body_item':([662,668,673,679,],[670,676,670,676,]),'atom':([0,1,7,9,13,29,31,33,39,43,49,55,57,61,65,73,74,82,83,86,96,102,103,104,106,112,116,121,133,134,138,144,147,150,155,157,161,163,165,168,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,253,256,260,263,265,270,272,274,277,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'import_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'elif_stmts':([404,],[475,]),'comp_iter':([485,573,],[537,593,]),'print_list_list':([146,426,],[249,249,]),'dotted_as_names':([11,],[110,]),'shift_op':([51,164,],[162,269,]),'attribute_declaration':([574,599,601,614,620,634,635,654,],[596,596,596,596,596,596,596,596,]),'return_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'testlist_comp':([1,],[91,]),'old_test':([466,538,563,564,567,589,590,],[518,573,587,588,591,612,613,]),'testlist_safe_list':([518,],[565,]),'instantiation':([574,599,601,614,620,634,635,654,662,668,673,679,],[594,594,594,594,594,594,594,594,667,667,667,667,]),'enaml_module_item':([0,73,],[47,196,]),'continue_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'testlist_list':([77,],[200,]),'attribute_binding':([574,599,601,614,620,634,635,654,662,668,673,679,],[598,598,598,598,598,598,598,598,671,671,671,671,]),'dotted_as_name':([11,230,335,],[111,334,419,]),'equal_list':([15,237,238,],[115,338,339,]),'print_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'binding':([602,616,622,656,669,675,],[624,624,640,666,624,624,]),'term_op':([10,107,],[105,226,]),'declaration':([0,73,],[63,63,]),'funcdef':([0,25,73,353,430,],[64,136,64,64,64,]),'raise_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'old_lambdef':([466,538,563,564,567,589,590,],[519,519,519,519,519,519,519,]),'exprlist':([31,43,211,301,],[141,154,323,392,]),'expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,116,121,138,147,155,157,165,169,177,186,199,201,211,213,216,218,219,220,234,244,248,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[68,68,68,114,68,142,68,142,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,305,68,68,142,68,68,327,68,68,68,342,68,68,68,68,68,68,68,68,68,68,68,68,68,68,142,68,395,68,68,68,68,68,68,68,68,68,68,423,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'declaration_body':([487,],[540,]),'except_clause':([259,354,],[354,354,]),'and_expr':([0,1,7,13,29,31,33,43,49,55,57,65,73,74,82,83,86,96,112,116,121,138,144,147,155,157,165,169,177,186,199,201,211,213,216,218,219,220,233,234,244,246,248,256,260,263,265,270,272,274,281,282,291,293,296,299,301,303,307,309,310,312,314,315,316,318,324,330,341,343,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,232,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,336,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'instantiation_body':([628,636,],[648,648,]),'yield_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'arith_expr_list':([23,],[131,]),'shift_list':([51,],[164,]),'enaml':([0,],[71,]),'subscriptlist_list':([284,],[376,]),'argument':([165,274,316,],[276,366,276,]),'enaml_module_body':([0,],[73,]),'fplist':([171,],[288,]),'testlist_safe':([466,],[517,]),'not_test':([0,1,7,29,33,49,55,57,65,73,74,82,83,86,96,116,121,138,147,155,157,165,169,177,199,201,213,216,219,220,234,248,256,260,263,265,270,272,274,281,282,291,293,296,299,303,309,310,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[75,75,75,75,75,75,75,75,75,75,75,75,204,75,75,75,75,75,75,75,75,75,75,75,311,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,397,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'print_list':([33,347,],[145,425,]),'break_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'del_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'fpdef':([54,171,251,292,379,383,453,459,510,521,],[174,287,174,386,452,456,505,386,456,174,]),'testlist_comp_list':([92,],[212,]),'small_stmt_list_list':([3,],[94,]),'list_if':([517,587,],[561,561,]),'test':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,147,155,165,169,177,201,213,216,219,220,234,248,256,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,420,429,430,435,437,440,447,450,461,463,468,473,491,492,494,495,496,498,500,503,508,516,523,526,548,550,569,575,577,578,579,604,621,623,625,626,627,629,630,],[77,92,98,77,146,159,178,180,184,77,197,77,206,77,77,77,250,77,275,283,295,313,325,77,77,98,337,345,77,359,361,362,363,275,372,373,384,388,389,77,393,396,398,77,77,275,77,415,77,422,424,426,77,77,436,438,443,445,446,448,449,283,467,486,77,77,77,77,499,502,283,514,515,77,525,77,77,544,77,546,547,549,551,553,77,77,77,580,581,77,77,77,77,607,77,638,642,643,644,645,649,77,]),'global_stmt':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'import_as_names_list':([405,],[478,]),'with_item':([7,220,],[99,329,]),'import_name':([0,73,96,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'yield_expr':([0,1,73,96,116,121,155,216,219,299,315,318,330,350,353,429,430,435,437,468,491,492,495,516,523,526,569,575,577,578,604,630,],[81,93,81,81,235,237,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'except_clauses':([259,354,],[355,432,]),'comparison_list':([68,],[190,]),'and_test':([0,1,7,29,33,49,55,57,65,73,74,82,86,96,116,121,138,147,155,157,165,169,177,201,213,216,219,220,234,248,256,260,263,265,270,272,274,281,282,291,293,296,299,303,309,312,314,315,316,318,324,330,341,346,347,350,353,356,360,365,367,368,374,375,377,394,414,420,429,430,435,437,440,447,450,461,463,466,468,473,491,492,494,495,496,498,500,503,508,516,523,526,538,548,550,563,564,567,569,575,577,578,579,589,590,604,621,623,625,626,627,629,630,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,261,46,46,46,46,46,46,46,46,46,46,46,358,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'declaration_body_items':([574,601,614,635,],[599,620,634,654,]),'decorated':([0,73,353,430,],[85,85,85,85,]),'stmt_list':([353,430,],[431,489,]),'elif_stmt':([404,475,],[472,527,]),'dosm_colon_list':([361,],[439,]),'power_list':([52,],[166,]),'while_stmt':([0,73,353,430,],[89,89,89,89,]),'varargslist':([54,251,521,],[175,349,566,]),'dotted_name_list':([109,],[228,]),'listmaker_list':([184,],[304,]),}
 
 _lr_goto = { }
 for _k, _v in _lr_goto_items.items():
@@ -66,385 +66,387 @@ _lr_productions = [
   ('binding -> EQUAL test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',571),
   ('binding -> COLONEQUAL test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',572),
   ('binding -> LEFTSHIFT test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',573),
-  ('binding -> RIGHTSHIFT test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',574),
-  ('binding -> DOUBLECOLON suite','binding',2,'p_binding2','enaml/core/parser.py',585),
-  ('suite -> simple_stmt','suite',1,'p_suite1','enaml/core/parser.py',603),
-  ('suite -> NEWLINE INDENT stmt_list DEDENT','suite',4,'p_suite2','enaml/core/parser.py',615),
-  ('stmt_list -> stmt stmt_list','stmt_list',2,'p_stmt_list1','enaml/core/parser.py',620),
-  ('stmt_list -> stmt','stmt_list',1,'p_stmt_list2','enaml/core/parser.py',625),
-  ('stmt -> simple_stmt','stmt',1,'p_stmt','enaml/core/parser.py',637),
-  ('stmt -> compound_stmt','stmt',1,'p_stmt','enaml/core/parser.py',638),
-  ('simple_stmt -> small_stmt NEWLINE','simple_stmt',2,'p_simple_stmt1','enaml/core/parser.py',643),
-  ('simple_stmt -> small_stmt_list NEWLINE','simple_stmt',2,'p_simple_stmt2','enaml/core/parser.py',651),
-  ('small_stmt_list -> small_stmt SEMI','small_stmt_list',2,'p_small_stmt_list1','enaml/core/parser.py',661),
-  ('small_stmt_list -> small_stmt small_stmt_list_list','small_stmt_list',2,'p_small_stmt_list2','enaml/core/parser.py',666),
-  ('small_stmt_list -> small_stmt small_stmt_list_list SEMI','small_stmt_list',3,'p_small_stmt_list3','enaml/core/parser.py',671),
-  ('small_stmt_list_list -> SEMI small_stmt','small_stmt_list_list',2,'p_small_stmt_list_list1','enaml/core/parser.py',676),
-  ('small_stmt_list_list -> small_stmt_list_list SEMI small_stmt','small_stmt_list_list',3,'p_small_stmt_list_list2','enaml/core/parser.py',681),
-  ('small_stmt -> expr_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',686),
-  ('small_stmt -> print_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',687),
-  ('small_stmt -> del_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',688),
-  ('small_stmt -> pass_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',689),
-  ('small_stmt -> flow_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',690),
-  ('small_stmt -> import_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',691),
-  ('small_stmt -> global_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',692),
-  ('small_stmt -> exec_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',693),
-  ('small_stmt -> assert_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',694),
-  ('print_stmt -> PRINT','print_stmt',1,'p_print_stmt1','enaml/core/parser.py',699),
-  ('print_stmt -> PRINT test','print_stmt',2,'p_print_stmt2','enaml/core/parser.py',708),
-  ('print_stmt -> PRINT print_list','print_stmt',2,'p_print_stmt3','enaml/core/parser.py',717),
-  ('print_stmt -> PRINT RIGHTSHIFT test','print_stmt',3,'p_print_stmt4','enaml/core/parser.py',732),
-  ('print_stmt -> PRINT RIGHTSHIFT test COMMA test','print_stmt',5,'p_print_stmt5','enaml/core/parser.py',741),
-  ('print_stmt -> PRINT RIGHTSHIFT test COMMA print_list','print_stmt',5,'p_print_stmt6','enaml/core/parser.py',750),
-  ('print_list -> test COMMA','print_list',2,'p_print_list1','enaml/core/parser.py',765),
-  ('print_list -> test print_list_list','print_list',2,'p_print_list2','enaml/core/parser.py',770),
-  ('print_list -> test print_list_list COMMA','print_list',3,'p_print_list3','enaml/core/parser.py',775),
-  ('print_list_list -> COMMA test','print_list_list',2,'p_print_list_list1','enaml/core/parser.py',780),
-  ('print_list_list -> print_list_list COMMA test','print_list_list',3,'p_print_list_list2','enaml/core/parser.py',785),
-  ('del_stmt -> DEL exprlist','del_stmt',2,'p_del_stmt','enaml/core/parser.py',790),
-  ('pass_stmt -> PASS','pass_stmt',1,'p_pass_stmt','enaml/core/parser.py',799),
-  ('flow_stmt -> break_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',806),
-  ('flow_stmt -> continue_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',807),
-  ('flow_stmt -> return_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',808),
-  ('flow_stmt -> raise_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',809),
-  ('flow_stmt -> yield_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',810),
-  ('break_stmt -> BREAK','break_stmt',1,'p_break_stmt','enaml/core/parser.py',815),
-  ('continue_stmt -> CONTINUE','continue_stmt',1,'p_continue_stmt','enaml/core/parser.py',822),
-  ('return_stmt -> RETURN','return_stmt',1,'p_return_stmt1','enaml/core/parser.py',829),
-  ('return_stmt -> RETURN testlist','return_stmt',2,'p_return_stmt2','enaml/core/parser.py',836),
-  ('raise_stmt -> RAISE','raise_stmt',1,'p_raise_stmt1','enaml/core/parser.py',844),
-  ('raise_stmt -> RAISE test','raise_stmt',2,'p_raise_stmt2','enaml/core/parser.py',853),
-  ('raise_stmt -> RAISE test COMMA test','raise_stmt',4,'p_raise_stmt3','enaml/core/parser.py',862),
-  ('raise_stmt -> RAISE test COMMA test COMMA test','raise_stmt',6,'p_raise_stmt4','enaml/core/parser.py',871),
-  ('yield_stmt -> yield_expr','yield_stmt',1,'p_yield_stmt','enaml/core/parser.py',880),
-  ('yield_expr -> YIELD','yield_expr',1,'p_yield_expr1','enaml/core/parser.py',885),
-  ('yield_expr -> YIELD testlist','yield_expr',2,'p_yield_expr2','enaml/core/parser.py',890),
-  ('global_stmt -> GLOBAL NAME','global_stmt',2,'p_global_stmt1','enaml/core/parser.py',896),
-  ('global_stmt -> GLOBAL NAME globals_list','global_stmt',3,'p_global_stmt2','enaml/core/parser.py',904),
-  ('globals_list -> COMMA NAME globals_list','globals_list',3,'p_globals_list1','enaml/core/parser.py',912),
-  ('globals_list -> COMMA NAME','globals_list',2,'p_globals_list2','enaml/core/parser.py',917),
-  ('exec_stmt -> EXEC expr','exec_stmt',2,'p_exec_stmt1','enaml/core/parser.py',922),
-  ('exec_stmt -> EXEC expr IN test','exec_stmt',4,'p_exec_stmt2','enaml/core/parser.py',931),
-  ('exec_stmt -> EXEC expr IN test COMMA test','exec_stmt',6,'p_exec_stmt3','enaml/core/parser.py',940),
-  ('assert_stmt -> ASSERT test','assert_stmt',2,'p_assert_stmt1','enaml/core/parser.py',949),
-  ('assert_stmt -> ASSERT test COMMA test','assert_stmt',4,'p_assert_stmt2','enaml/core/parser.py',957),
-  ('expr_stmt -> testlist','expr_stmt',1,'p_expr_stmt1','enaml/core/parser.py',965),
-  ('expr_stmt -> testlist augassign testlist','expr_stmt',3,'p_expr_stmt2','enaml/core/parser.py',972),
-  ('expr_stmt -> testlist augassign yield_expr','expr_stmt',3,'p_expr_stmt2','enaml/core/parser.py',973),
-  ('expr_stmt -> testlist equal_list','expr_stmt',2,'p_expr_stmt3','enaml/core/parser.py',989),
-  ('augassign -> AMPEREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1005),
-  ('augassign -> CIRCUMFLEXEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1006),
-  ('augassign -> DOUBLESLASHEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1007),
-  ('augassign -> DOUBLESTAREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1008),
-  ('augassign -> LEFTSHIFTEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1009),
-  ('augassign -> MINUSEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1010),
-  ('augassign -> PERCENTEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1011),
-  ('augassign -> PLUSEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1012),
-  ('augassign -> RIGHTSHIFTEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1013),
-  ('augassign -> SLASHEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1014),
-  ('augassign -> STAREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1015),
-  ('augassign -> VBAREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1016),
-  ('equal_list -> EQUAL testlist','equal_list',2,'p_equal_list1','enaml/core/parser.py',1023),
-  ('equal_list -> EQUAL yield_expr','equal_list',2,'p_equal_list1','enaml/core/parser.py',1024),
-  ('equal_list -> EQUAL testlist equal_list','equal_list',3,'p_equal_list2','enaml/core/parser.py',1029),
-  ('equal_list -> EQUAL yield_expr equal_list','equal_list',3,'p_equal_list2','enaml/core/parser.py',1030),
-  ('testlist -> test','testlist',1,'p_testlist1','enaml/core/parser.py',1035),
-  ('testlist -> test COMMA','testlist',2,'p_testlist2','enaml/core/parser.py',1040),
-  ('testlist -> test testlist_list','testlist',2,'p_testlist3','enaml/core/parser.py',1045),
-  ('testlist -> test testlist_list COMMA','testlist',3,'p_testlist4','enaml/core/parser.py',1050),
-  ('testlist_list -> COMMA test','testlist_list',2,'p_testlist_list1','enaml/core/parser.py',1055),
-  ('testlist_list -> testlist_list COMMA test','testlist_list',3,'p_testlist_list2','enaml/core/parser.py',1060),
-  ('compound_stmt -> if_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1065),
-  ('compound_stmt -> while_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1066),
-  ('compound_stmt -> for_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1067),
-  ('compound_stmt -> try_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1068),
-  ('compound_stmt -> with_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1069),
-  ('compound_stmt -> funcdef','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1070),
-  ('compound_stmt -> classdef','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1071),
-  ('compound_stmt -> decorated','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1072),
-  ('if_stmt -> IF test COLON suite','if_stmt',4,'p_if_stmt1','enaml/core/parser.py',1077),
-  ('if_stmt -> IF test COLON suite elif_stmts','if_stmt',5,'p_if_stmt2','enaml/core/parser.py',1088),
-  ('if_stmt -> IF test COLON suite else_stmt','if_stmt',5,'p_if_stmt3','enaml/core/parser.py',1099),
-  ('if_stmt -> IF test COLON suite elif_stmts else_stmt','if_stmt',6,'p_if_stmt4','enaml/core/parser.py',1110),
-  ('elif_stmts -> elif_stmts elif_stmt','elif_stmts',2,'p_elif_stmts1','enaml/core/parser.py',1126),
-  ('elif_stmts -> elif_stmt','elif_stmts',1,'p_elif_stmts2','enaml/core/parser.py',1133),
-  ('elif_stmt -> ELIF test COLON suite','elif_stmt',4,'p_elif_stmt','enaml/core/parser.py',1138),
-  ('else_stmt -> ELSE COLON suite','else_stmt',3,'p_else_stmt','enaml/core/parser.py',1149),
-  ('while_stmt -> WHILE test COLON suite','while_stmt',4,'p_while_stmt1','enaml/core/parser.py',1154),
-  ('while_stmt -> WHILE test COLON suite ELSE COLON suite','while_stmt',7,'p_while_stmt2','enaml/core/parser.py',1165),
-  ('for_stmt -> FOR exprlist IN testlist COLON suite','for_stmt',6,'p_for_stmt1','enaml/core/parser.py',1176),
-  ('for_stmt -> FOR exprlist IN testlist COLON suite ELSE COLON suite','for_stmt',9,'p_for_stmt2','enaml/core/parser.py',1190),
-  ('try_stmt -> TRY COLON suite FINALLY COLON suite','try_stmt',6,'p_try_stmt1','enaml/core/parser.py',1204),
-  ('try_stmt -> TRY COLON suite except_clauses','try_stmt',4,'p_try_stmt2','enaml/core/parser.py',1214),
-  ('try_stmt -> TRY COLON suite except_clauses ELSE COLON suite','try_stmt',7,'p_try_stmt3','enaml/core/parser.py',1225),
-  ('try_stmt -> TRY COLON suite except_clauses FINALLY COLON suite','try_stmt',7,'p_try_stmt4','enaml/core/parser.py',1236),
-  ('try_stmt -> TRY COLON suite except_clauses ELSE COLON suite FINALLY COLON suite','try_stmt',10,'p_try_stmt5','enaml/core/parser.py',1253),
-  ('except_clauses -> except_clause except_clauses','except_clauses',2,'p_except_clauses1','enaml/core/parser.py',1270),
-  ('except_clauses -> except_clause','except_clauses',1,'p_except_clauses2','enaml/core/parser.py',1275),
-  ('except_clause -> EXCEPT COLON suite','except_clause',3,'p_except_clause1','enaml/core/parser.py',1280),
-  ('except_clause -> EXCEPT test COLON suite','except_clause',4,'p_except_clause2','enaml/core/parser.py',1291),
-  ('except_clause -> EXCEPT test AS test COLON suite','except_clause',6,'p_except_clause3','enaml/core/parser.py',1302),
-  ('except_clause -> EXCEPT test COMMA test COLON suite','except_clause',6,'p_except_clause3','enaml/core/parser.py',1303),
-  ('with_stmt -> WITH with_item COLON suite','with_stmt',4,'p_with_stmt1','enaml/core/parser.py',1316),
-  ('with_stmt -> WITH with_item with_item_list COLON suite','with_stmt',5,'p_with_stmt2','enaml/core/parser.py',1328),
-  ('with_item -> test','with_item',1,'p_with_item1','enaml/core/parser.py',1348),
-  ('with_item -> test AS expr','with_item',3,'p_with_item2','enaml/core/parser.py',1353),
-  ('with_item_list -> COMMA with_item with_item_list','with_item_list',3,'p_with_item_list1','enaml/core/parser.py',1360),
-  ('with_item_list -> COMMA with_item','with_item_list',2,'p_with_item_list2','enaml/core/parser.py',1365),
-  ('funcdef -> DEF NAME parameters COLON suite','funcdef',5,'p_funcdef','enaml/core/parser.py',1370),
-  ('parameters -> LPAR RPAR','parameters',2,'p_parameters1','enaml/core/parser.py',1382),
-  ('parameters -> LPAR varargslist RPAR','parameters',3,'p_parameters2','enaml/core/parser.py',1387),
-  ('classdef -> CLASS NAME COLON suite','classdef',4,'p_classdef1','enaml/core/parser.py',1392),
-  ('classdef -> CLASS NAME LPAR RPAR COLON suite','classdef',6,'p_classdef2','enaml/core/parser.py',1404),
-  ('classdef -> CLASS NAME LPAR testlist RPAR COLON suite','classdef',7,'p_classdef3','enaml/core/parser.py',1416),
-  ('decorated -> decorators funcdef','decorated',2,'p_decorated','enaml/core/parser.py',1431),
-  ('decorated -> decorators classdef','decorated',2,'p_decorated','enaml/core/parser.py',1432),
-  ('decorators -> decorator decorators','decorators',2,'p_decorators1','enaml/core/parser.py',1440),
-  ('decorators -> decorator','decorators',1,'p_decorators2','enaml/core/parser.py',1445),
-  ('decorator -> AT dotted_name NEWLINE','decorator',3,'p_decorator1','enaml/core/parser.py',1450),
-  ('decorator -> AT dotted_name LPAR RPAR NEWLINE','decorator',5,'p_decorator2','enaml/core/parser.py',1458),
-  ('decorator -> AT dotted_name LPAR arglist RPAR NEWLINE','decorator',6,'p_decorator3','enaml/core/parser.py',1471),
-  ('import_stmt -> import_name','import_stmt',1,'p_import_stmt1','enaml/core/parser.py',1485),
-  ('import_stmt -> import_from','import_stmt',1,'p_import_stmt2','enaml/core/parser.py',1490),
-  ('import_name -> IMPORT dotted_as_names','import_name',2,'p_import_name','enaml/core/parser.py',1494),
-  ('import_from -> FROM dotted_name IMPORT STAR','import_from',4,'p_import_from1','enaml/core/parser.py',1501),
-  ('import_from -> FROM dotted_name IMPORT import_as_names','import_from',4,'p_import_from2','enaml/core/parser.py',1509),
-  ('import_from -> FROM dotted_name IMPORT LPAR import_as_names RPAR','import_from',6,'p_import_from3','enaml/core/parser.py',1516),
-  ('import_from -> FROM import_from_dots dotted_name IMPORT STAR','import_from',5,'p_import_from4','enaml/core/parser.py',1523),
-  ('import_from -> FROM import_from_dots dotted_name IMPORT import_as_name','import_from',5,'p_import_from5','enaml/core/parser.py',1531),
-  ('import_from -> FROM import_from_dots dotted_name IMPORT LPAR import_as_names RPAR','import_from',7,'p_import_from6','enaml/core/parser.py',1538),
-  ('import_from -> FROM import_from_dots IMPORT STAR','import_from',4,'p_import_from7','enaml/core/parser.py',1545),
-  ('import_from -> FROM import_from_dots IMPORT import_as_names','import_from',4,'p_import_from8','enaml/core/parser.py',1553),
-  ('import_from -> FROM import_from_dots IMPORT LPAR import_as_names RPAR','import_from',6,'p_import_from9','enaml/core/parser.py',1560),
-  ('import_from_dots -> DOT','import_from_dots',1,'p_import_from_dots1','enaml/core/parser.py',1567),
-  ('import_from_dots -> import_from_dots DOT','import_from_dots',2,'p_import_from_dots2','enaml/core/parser.py',1572),
-  ('import_as_name -> NAME','import_as_name',1,'p_import_as_name1','enaml/core/parser.py',1577),
-  ('import_as_name -> NAME AS NAME','import_as_name',3,'p_import_as_name2','enaml/core/parser.py',1582),
-  ('dotted_as_name -> dotted_name','dotted_as_name',1,'p_dotted_as_name1','enaml/core/parser.py',1587),
-  ('dotted_as_name -> dotted_name AS NAME','dotted_as_name',3,'p_dotted_as_name2','enaml/core/parser.py',1593),
-  ('import_as_names -> import_as_name','import_as_names',1,'p_import_as_names1','enaml/core/parser.py',1599),
-  ('import_as_names -> import_as_name COMMA','import_as_names',2,'p_import_as_names2','enaml/core/parser.py',1604),
-  ('import_as_names -> import_as_name import_as_names_list','import_as_names',2,'p_import_as_names3','enaml/core/parser.py',1609),
-  ('import_as_names -> import_as_name import_as_names_list COMMA','import_as_names',3,'p_import_as_names4','enaml/core/parser.py',1614),
-  ('import_as_names_list -> COMMA import_as_name','import_as_names_list',2,'p_import_as_names_list1','enaml/core/parser.py',1619),
-  ('import_as_names_list -> import_as_names_list COMMA import_as_name','import_as_names_list',3,'p_import_as_names_list2','enaml/core/parser.py',1624),
-  ('dotted_as_names -> dotted_as_name','dotted_as_names',1,'p_dotted_as_names1','enaml/core/parser.py',1629),
-  ('dotted_as_names -> dotted_as_name dotted_as_names_list','dotted_as_names',2,'p_dotted_as_names2','enaml/core/parser.py',1634),
-  ('dotted_as_names_list -> COMMA dotted_as_name','dotted_as_names_list',2,'p_dotted_as_names_list1','enaml/core/parser.py',1639),
-  ('dotted_as_names_list -> dotted_as_names_list COMMA dotted_as_name','dotted_as_names_list',3,'p_dotted_as_names_star_list2','enaml/core/parser.py',1644),
-  ('dotted_name -> NAME','dotted_name',1,'p_dotted_name1','enaml/core/parser.py',1649),
-  ('dotted_name -> NAME dotted_name_list','dotted_name',2,'p_dotted_name2','enaml/core/parser.py',1654),
-  ('dotted_name_list -> DOT NAME','dotted_name_list',2,'p_dotted_name_list1','enaml/core/parser.py',1659),
-  ('dotted_name_list -> dotted_name_list DOT NAME','dotted_name_list',3,'p_dotted_name_list2','enaml/core/parser.py',1664),
-  ('test -> or_test','test',1,'p_test1','enaml/core/parser.py',1669),
-  ('test -> or_test IF or_test ELSE test','test',5,'p_test2','enaml/core/parser.py',1674),
-  ('test -> lambdef','test',1,'p_test3','enaml/core/parser.py',1680),
-  ('or_test -> and_test','or_test',1,'p_or_test1','enaml/core/parser.py',1685),
-  ('or_test -> and_test or_test_list','or_test',2,'p_or_test2','enaml/core/parser.py',1690),
-  ('or_test_list -> OR and_test','or_test_list',2,'p_or_test_list1','enaml/core/parser.py',1697),
-  ('or_test_list -> or_test_list OR and_test','or_test_list',3,'p_or_test_list2','enaml/core/parser.py',1702),
-  ('and_test -> not_test','and_test',1,'p_and_test1','enaml/core/parser.py',1707),
-  ('and_test -> not_test and_test_list','and_test',2,'p_and_test2','enaml/core/parser.py',1712),
-  ('and_test_list -> AND not_test','and_test_list',2,'p_and_test_list1','enaml/core/parser.py',1719),
-  ('and_test_list -> and_test_list AND not_test','and_test_list',3,'p_and_test_list2','enaml/core/parser.py',1724),
-  ('not_test -> comparison','not_test',1,'p_not_test','enaml/core/parser.py',1729),
-  ('not_test -> NOT not_test','not_test',2,'p_not_test2','enaml/core/parser.py',1734),
-  ('comparison -> expr','comparison',1,'p_comparison1','enaml/core/parser.py',1740),
-  ('comparison -> expr comparison_list','comparison',2,'p_comparison2','enaml/core/parser.py',1745),
-  ('comparison_list -> comp_op expr','comparison_list',2,'p_comparison_list1','enaml/core/parser.py',1753),
-  ('comparison_list -> comparison_list comp_op expr','comparison_list',3,'p_comparison_list2','enaml/core/parser.py',1758),
-  ('comp_op -> LESS','comp_op',1,'p_comp_op1','enaml/core/parser.py',1763),
-  ('comp_op -> GREATER','comp_op',1,'p_comp_op2','enaml/core/parser.py',1768),
-  ('comp_op -> EQEQUAL','comp_op',1,'p_comp_op3','enaml/core/parser.py',1773),
-  ('comp_op -> GREATEREQUAL','comp_op',1,'p_comp_op4','enaml/core/parser.py',1778),
-  ('comp_op -> LESSEQUAL','comp_op',1,'p_comp_op5','enaml/core/parser.py',1783),
-  ('comp_op -> NOTEQUAL','comp_op',1,'p_comp_op6','enaml/core/parser.py',1788),
-  ('comp_op -> IN','comp_op',1,'p_comp_op7','enaml/core/parser.py',1793),
-  ('comp_op -> NOT IN','comp_op',2,'p_comp_op8','enaml/core/parser.py',1798),
-  ('comp_op -> IS','comp_op',1,'p_comp_op9','enaml/core/parser.py',1803),
-  ('comp_op -> IS NOT','comp_op',2,'p_comp_op10','enaml/core/parser.py',1808),
-  ('expr -> xor_expr','expr',1,'p_expr1','enaml/core/parser.py',1813),
-  ('expr -> xor_expr expr_list','expr',2,'p_expr2','enaml/core/parser.py',1818),
-  ('expr_list -> VBAR xor_expr','expr_list',2,'p_expr_list1','enaml/core/parser.py',1826),
-  ('expr_list -> expr_list VBAR xor_expr','expr_list',3,'p_expr_list2','enaml/core/parser.py',1831),
-  ('xor_expr -> and_expr','xor_expr',1,'p_xor_expr1','enaml/core/parser.py',1836),
-  ('xor_expr -> and_expr xor_expr_list','xor_expr',2,'p_xor_expr2','enaml/core/parser.py',1841),
-  ('xor_expr_list -> CIRCUMFLEX and_expr','xor_expr_list',2,'p_xor_expr_list1','enaml/core/parser.py',1849),
-  ('xor_expr_list -> xor_expr_list CIRCUMFLEX and_expr','xor_expr_list',3,'p_xor_expr_list2','enaml/core/parser.py',1854),
-  ('and_expr -> shift_expr','and_expr',1,'p_and_expr1','enaml/core/parser.py',1859),
-  ('and_expr -> shift_expr and_expr_list','and_expr',2,'p_and_expr2','enaml/core/parser.py',1864),
-  ('and_expr_list -> AMPER shift_expr','and_expr_list',2,'p_and_expr_list1','enaml/core/parser.py',1872),
-  ('and_expr_list -> and_expr_list AMPER shift_expr','and_expr_list',3,'p_and_expr_list2','enaml/core/parser.py',1877),
-  ('shift_expr -> arith_expr','shift_expr',1,'p_shift_expr1','enaml/core/parser.py',1882),
-  ('shift_expr -> arith_expr shift_list','shift_expr',2,'p_shift_expr2','enaml/core/parser.py',1887),
-  ('shift_list -> shift_op','shift_list',1,'p_shift_list1','enaml/core/parser.py',1895),
-  ('shift_list -> shift_list shift_op','shift_list',2,'p_shift_list2','enaml/core/parser.py',1900),
-  ('shift_op -> LEFTSHIFT arith_expr','shift_op',2,'p_shift_op1','enaml/core/parser.py',1905),
-  ('shift_op -> RIGHTSHIFT arith_expr','shift_op',2,'p_shift_op2','enaml/core/parser.py',1910),
-  ('arith_expr -> term','arith_expr',1,'p_arith_expr1','enaml/core/parser.py',1915),
-  ('arith_expr -> term arith_expr_list','arith_expr',2,'p_arith_expr2','enaml/core/parser.py',1920),
-  ('arith_expr_list -> arith_op','arith_expr_list',1,'p_arith_expr_list1','enaml/core/parser.py',1928),
-  ('arith_expr_list -> arith_expr_list arith_op','arith_expr_list',2,'p_arith_expr_list2','enaml/core/parser.py',1933),
-  ('arith_op -> PLUS term','arith_op',2,'p_arith_op1','enaml/core/parser.py',1938),
-  ('arith_op -> MINUS term','arith_op',2,'p_arith_op2','enaml/core/parser.py',1944),
-  ('term -> factor','term',1,'p_term1','enaml/core/parser.py',1949),
-  ('term -> factor term_list','term',2,'p_term2','enaml/core/parser.py',1954),
-  ('term_list -> term_op','term_list',1,'p_term_list1','enaml/core/parser.py',1962),
-  ('term_list -> term_list term_op','term_list',2,'p_term_list2','enaml/core/parser.py',1967),
-  ('term_op -> STAR factor','term_op',2,'p_term_op1','enaml/core/parser.py',1972),
-  ('term_op -> SLASH factor','term_op',2,'p_term_op2','enaml/core/parser.py',1977),
-  ('term_op -> PERCENT factor','term_op',2,'p_term_op3','enaml/core/parser.py',1982),
-  ('term_op -> DOUBLESLASH factor','term_op',2,'p_term_op4','enaml/core/parser.py',1987),
-  ('factor -> power','factor',1,'p_factor1','enaml/core/parser.py',1992),
-  ('factor -> PLUS factor','factor',2,'p_factor2','enaml/core/parser.py',1997),
-  ('factor -> MINUS factor','factor',2,'p_factor3','enaml/core/parser.py',2005),
-  ('factor -> TILDE factor','factor',2,'p_factor4','enaml/core/parser.py',2013),
-  ('power -> atom','power',1,'p_power1','enaml/core/parser.py',2021),
-  ('power -> atom DOUBLESTAR factor','power',3,'p_power2','enaml/core/parser.py',2026),
-  ('power -> atom power_list','power',2,'p_power3','enaml/core/parser.py',2032),
-  ('power -> atom power_list DOUBLESTAR factor','power',4,'p_power4','enaml/core/parser.py',2048),
-  ('power_list -> trailer','power_list',1,'p_power_list1','enaml/core/parser.py',2065),
-  ('power_list -> power_list trailer','power_list',2,'p_power_list2','enaml/core/parser.py',2070),
-  ('atom -> LPAR RPAR','atom',2,'p_atom1','enaml/core/parser.py',2075),
-  ('atom -> LPAR yield_expr RPAR','atom',3,'p_atom2','enaml/core/parser.py',2080),
-  ('atom -> LPAR testlist_comp RPAR','atom',3,'p_atom3','enaml/core/parser.py',2085),
-  ('atom -> LSQB RSQB','atom',2,'p_atom4','enaml/core/parser.py',2099),
-  ('atom -> LSQB listmaker RSQB','atom',3,'p_atom5','enaml/core/parser.py',2104),
-  ('atom -> LBRACE RBRACE','atom',2,'p_atom6','enaml/core/parser.py',2116),
-  ('atom -> LBRACE dictorsetmaker RBRACE','atom',3,'p_atom7','enaml/core/parser.py',2121),
-  ('atom -> NAME','atom',1,'p_atom8','enaml/core/parser.py',2142),
-  ('atom -> NUMBER','atom',1,'p_atom9','enaml/core/parser.py',2147),
-  ('atom -> atom_string_list','atom',1,'p_atom10','enaml/core/parser.py',2153),
-  ('atom_string_list -> STRING','atom_string_list',1,'p_atom_string_list1','enaml/core/parser.py',2159),
-  ('atom_string_list -> atom_string_list STRING','atom_string_list',2,'p_atom_string_list2','enaml/core/parser.py',2164),
-  ('listmaker -> test list_for','listmaker',2,'p_listmaker1','enaml/core/parser.py',2174),
-  ('listmaker -> test','listmaker',1,'p_listmaker2','enaml/core/parser.py',2179),
-  ('listmaker -> test COMMA','listmaker',2,'p_listmaker3','enaml/core/parser.py',2184),
-  ('listmaker -> test listmaker_list','listmaker',2,'p_listmaker4','enaml/core/parser.py',2189),
-  ('listmaker -> test listmaker_list COMMA','listmaker',3,'p_listmaker5','enaml/core/parser.py',2195),
-  ('listmaker_list -> COMMA test','listmaker_list',2,'p_listmaker_list1','enaml/core/parser.py',2201),
-  ('listmaker_list -> listmaker_list COMMA test','listmaker_list',3,'p_listmaker_list2','enaml/core/parser.py',2206),
-  ('testlist_comp -> test comp_for','testlist_comp',2,'p_testlist_comp1','enaml/core/parser.py',2211),
-  ('testlist_comp -> test','testlist_comp',1,'p_testlist_comp2','enaml/core/parser.py',2216),
-  ('testlist_comp -> test COMMA','testlist_comp',2,'p_testlist_comp3','enaml/core/parser.py',2221),
-  ('testlist_comp -> test testlist_comp_list','testlist_comp',2,'p_testlist_comp4','enaml/core/parser.py',2226),
-  ('testlist_comp -> test testlist_comp_list COMMA','testlist_comp',3,'p_testlist_comp5','enaml/core/parser.py',2232),
-  ('testlist_comp_list -> COMMA test','testlist_comp_list',2,'p_testlist_comp_list1','enaml/core/parser.py',2238),
-  ('testlist_comp_list -> testlist_comp_list COMMA test','testlist_comp_list',3,'p_testlist_comp_list2','enaml/core/parser.py',2243),
-  ('trailer -> LPAR RPAR','trailer',2,'p_trailer1','enaml/core/parser.py',2248),
-  ('trailer -> LPAR arglist RPAR','trailer',3,'p_trailer2','enaml/core/parser.py',2253),
-  ('trailer -> LSQB subscriptlist RSQB','trailer',3,'p_trailer3','enaml/core/parser.py',2260),
-  ('trailer -> DOT NAME','trailer',2,'p_trailer4','enaml/core/parser.py',2265),
-  ('subscriptlist -> subscript','subscriptlist',1,'p_subscriptlist1','enaml/core/parser.py',2270),
-  ('subscriptlist -> subscript COMMA','subscriptlist',2,'p_subscriptlist2','enaml/core/parser.py',2275),
-  ('subscriptlist -> subscript subscriptlist_list','subscriptlist',2,'p_subscriptlist3','enaml/core/parser.py',2281),
-  ('subscriptlist -> subscript subscriptlist_list COMMA','subscriptlist',3,'p_subscriptlist4','enaml/core/parser.py',2287),
-  ('subscriptlist_list -> COMMA subscript','subscriptlist_list',2,'p_subscriptlist_list1','enaml/core/parser.py',2293),
-  ('subscriptlist_list -> subscriptlist_list COMMA subscript','subscriptlist_list',3,'p_subscript_list2','enaml/core/parser.py',2298),
-  ('subscript -> ELLIPSIS','subscript',1,'p_subscript1','enaml/core/parser.py',2303),
-  ('subscript -> test','subscript',1,'p_subcript2','enaml/core/parser.py',2308),
-  ('subscript -> COLON','subscript',1,'p_subscript3','enaml/core/parser.py',2313),
-  ('subscript -> DOUBLECOLON','subscript',1,'p_subscript4','enaml/core/parser.py',2318),
-  ('subscript -> test COLON','subscript',2,'p_subscript5','enaml/core/parser.py',2324),
-  ('subscript -> test DOUBLECOLON','subscript',2,'p_subscrip6','enaml/core/parser.py',2329),
-  ('subscript -> COLON test','subscript',2,'p_subscript7','enaml/core/parser.py',2335),
-  ('subscript -> COLON test COLON','subscript',3,'p_subscript8','enaml/core/parser.py',2340),
-  ('subscript -> DOUBLECOLON test','subscript',2,'p_subscript9','enaml/core/parser.py',2346),
-  ('subscript -> test COLON test','subscript',3,'p_subscript10','enaml/core/parser.py',2351),
-  ('subscript -> test COLON test COLON','subscript',4,'p_subscript11','enaml/core/parser.py',2356),
-  ('subscript -> COLON test COLON test','subscript',4,'p_subscript12','enaml/core/parser.py',2362),
-  ('subscript -> test COLON test COLON test','subscript',5,'p_subscript13','enaml/core/parser.py',2367),
-  ('subscript -> test DOUBLECOLON test','subscript',3,'p_subscript14','enaml/core/parser.py',2372),
-  ('exprlist -> expr','exprlist',1,'p_exprlist1','enaml/core/parser.py',2377),
-  ('exprlist -> expr COMMA','exprlist',2,'p_exprlist2','enaml/core/parser.py',2382),
-  ('exprlist -> expr exprlist_list','exprlist',2,'p_exprlist3','enaml/core/parser.py',2389),
-  ('exprlist -> expr exprlist_list COMMA','exprlist',3,'p_exprlist4','enaml/core/parser.py',2396),
-  ('exprlist_list -> COMMA expr','exprlist_list',2,'p_exprlist_list1','enaml/core/parser.py',2403),
-  ('exprlist_list -> exprlist_list COMMA expr','exprlist_list',3,'p_exprlist_list2','enaml/core/parser.py',2408),
-  ('dictorsetmaker -> test COLON test comp_for','dictorsetmaker',4,'p_dictorsetmaker1','enaml/core/parser.py',2413),
-  ('dictorsetmaker -> test COLON test','dictorsetmaker',3,'p_dictorsetmaker2','enaml/core/parser.py',2418),
-  ('dictorsetmaker -> test COLON test COMMA','dictorsetmaker',4,'p_dictorsetmaker3','enaml/core/parser.py',2424),
-  ('dictorsetmaker -> test COLON test dosm_colon_list','dictorsetmaker',4,'p_dictorsetmaker4','enaml/core/parser.py',2430),
-  ('dictorsetmaker -> test COLON test dosm_colon_list COMMA','dictorsetmaker',5,'p_dictorsetmaker5','enaml/core/parser.py',2436),
-  ('dictorsetmaker -> test comp_for','dictorsetmaker',2,'p_dictorsetmaker6','enaml/core/parser.py',2442),
-  ('dictorsetmaker -> test COMMA','dictorsetmaker',2,'p_dictorsetmaker7','enaml/core/parser.py',2447),
-  ('dictorsetmaker -> test dosm_comma_list','dictorsetmaker',2,'p_dictorsetmaker8','enaml/core/parser.py',2453),
-  ('dictorsetmaker -> test dosm_comma_list COMMA','dictorsetmaker',3,'p_dictorsetmaker9','enaml/core/parser.py',2459),
-  ('dosm_colon_list -> COMMA test COLON test','dosm_colon_list',4,'p_dosm_colon_list1','enaml/core/parser.py',2465),
-  ('dosm_colon_list -> dosm_colon_list COMMA test COLON test','dosm_colon_list',5,'p_dosm_colon_list2','enaml/core/parser.py',2470),
-  ('dosm_comma_list -> COMMA test','dosm_comma_list',2,'p_dosm_comma_list1','enaml/core/parser.py',2475),
-  ('dosm_comma_list -> dosm_comma_list COMMA test','dosm_comma_list',3,'p_dosm_comma_list2','enaml/core/parser.py',2480),
-  ('arglist -> argument','arglist',1,'p_arglist1','enaml/core/parser.py',2485),
-  ('arglist -> argument COMMA','arglist',2,'p_arglist2','enaml/core/parser.py',2493),
-  ('arglist -> STAR test','arglist',2,'p_arglist3','enaml/core/parser.py',2501),
-  ('arglist -> STAR test COMMA DOUBLESTAR test','arglist',5,'p_arglist4','enaml/core/parser.py',2506),
-  ('arglist -> DOUBLESTAR test','arglist',2,'p_arglist5','enaml/core/parser.py',2511),
-  ('arglist -> arglist_list argument','arglist',2,'p_arglist6','enaml/core/parser.py',2516),
-  ('arglist -> arglist_list argument COMMA','arglist',3,'p_arglist7','enaml/core/parser.py',2528),
-  ('arglist -> arglist_list STAR test','arglist',3,'p_arglist8','enaml/core/parser.py',2540),
-  ('arglist -> arglist_list STAR test COMMA DOUBLESTAR test','arglist',6,'p_arglist9','enaml/core/parser.py',2552),
-  ('arglist -> arglist_list DOUBLESTAR test','arglist',3,'p_arglist10','enaml/core/parser.py',2564),
-  ('arglist_list -> argument COMMA','arglist_list',2,'p_arglist_list1','enaml/core/parser.py',2576),
-  ('arglist_list -> arglist_list argument COMMA','arglist_list',3,'p_arglist_list2','enaml/core/parser.py',2581),
-  ('argument -> test','argument',1,'p_argument1','enaml/core/parser.py',2586),
-  ('argument -> test comp_for','argument',2,'p_argument2','enaml/core/parser.py',2591),
-  ('argument -> test EQUAL test','argument',3,'p_argument3','enaml/core/parser.py',2598),
-  ('list_for -> FOR exprlist IN testlist_safe','list_for',4,'p_list_for1','enaml/core/parser.py',2606),
-  ('list_for -> FOR exprlist IN testlist_safe list_iter','list_for',5,'p_list_for2','enaml/core/parser.py',2613),
-  ('list_iter -> list_for','list_iter',1,'p_list_iter1','enaml/core/parser.py',2627),
-  ('list_iter -> list_if','list_iter',1,'p_list_iter2','enaml/core/parser.py',2632),
-  ('list_if -> IF old_test','list_if',2,'p_list_if1','enaml/core/parser.py',2637),
-  ('list_if -> IF old_test list_iter','list_if',3,'p_list_if2','enaml/core/parser.py',2642),
-  ('comp_for -> FOR exprlist IN or_test','comp_for',4,'p_comp_for1','enaml/core/parser.py',2647),
-  ('comp_for -> FOR exprlist IN or_test comp_iter','comp_for',5,'p_comp_for2','enaml/core/parser.py',2654),
-  ('comp_iter -> comp_for','comp_iter',1,'p_comp_iter1','enaml/core/parser.py',2668),
-  ('comp_iter -> comp_if','comp_iter',1,'p_comp_iter2','enaml/core/parser.py',2673),
-  ('comp_if -> IF old_test','comp_if',2,'p_comp_if1','enaml/core/parser.py',2678),
-  ('comp_if -> IF old_test comp_iter','comp_if',3,'p_comp_if2','enaml/core/parser.py',2683),
-  ('testlist_safe -> old_test','testlist_safe',1,'p_testlist_safe1','enaml/core/parser.py',2688),
-  ('testlist_safe -> old_test testlist_safe_list','testlist_safe',2,'p_testlist_safe2','enaml/core/parser.py',2693),
-  ('testlist_safe -> old_test testlist_safe_list COMMA','testlist_safe',3,'p_testlist_safe3','enaml/core/parser.py',2699),
-  ('testlist_safe_list -> COMMA old_test','testlist_safe_list',2,'p_testlist_safe_list1','enaml/core/parser.py',2705),
-  ('testlist_safe_list -> testlist_safe_list COMMA old_test','testlist_safe_list',3,'p_testlist_safe_list2','enaml/core/parser.py',2710),
-  ('old_test -> or_test','old_test',1,'p_old_test1','enaml/core/parser.py',2715),
-  ('old_test -> old_lambdef','old_test',1,'p_old_test2','enaml/core/parser.py',2720),
-  ('old_lambdef -> LAMBDA COLON old_test','old_lambdef',3,'p_old_lambdef1','enaml/core/parser.py',2725),
-  ('old_lambdef -> LAMBDA varargslist COLON old_test','old_lambdef',4,'p_old_lambdef2','enaml/core/parser.py',2732),
-  ('lambdef -> LAMBDA COLON test','lambdef',3,'p_lambdef1','enaml/core/parser.py',2739),
-  ('lambdef -> LAMBDA varargslist COLON test','lambdef',4,'p_lambdef2','enaml/core/parser.py',2746),
-  ('varargslist -> fpdef COMMA STAR NAME','varargslist',4,'p_varargslist1','enaml/core/parser.py',2753),
-  ('varargslist -> fpdef COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',7,'p_varargslist2','enaml/core/parser.py',2760),
-  ('varargslist -> fpdef COMMA DOUBLESTAR NAME','varargslist',4,'p_varargslist3','enaml/core/parser.py',2767),
-  ('varargslist -> fpdef','varargslist',1,'p_varargslist4','enaml/core/parser.py',2774),
-  ('varargslist -> fpdef COMMA','varargslist',2,'p_varargslist5','enaml/core/parser.py',2781),
-  ('varargslist -> fpdef varargslist_list COMMA STAR NAME','varargslist',5,'p_varargslist6','enaml/core/parser.py',2788),
-  ('varargslist -> fpdef varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',8,'p_varargslist7','enaml/core/parser.py',2797),
-  ('varargslist -> fpdef varargslist_list COMMA DOUBLESTAR NAME','varargslist',5,'p_varargslist8','enaml/core/parser.py',2806),
-  ('varargslist -> fpdef varargslist_list','varargslist',2,'p_varargslist9','enaml/core/parser.py',2815),
-  ('varargslist -> fpdef varargslist_list COMMA','varargslist',3,'p_varargslist10','enaml/core/parser.py',2824),
-  ('varargslist -> fpdef EQUAL test COMMA STAR NAME','varargslist',6,'p_varargslist11','enaml/core/parser.py',2833),
-  ('varargslist -> fpdef EQUAL test COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',9,'p_varargslist12','enaml/core/parser.py',2840),
-  ('varargslist -> fpdef EQUAL test COMMA DOUBLESTAR NAME','varargslist',6,'p_varargslist13','enaml/core/parser.py',2847),
-  ('varargslist -> fpdef EQUAL test','varargslist',3,'p_varargslist14','enaml/core/parser.py',2854),
-  ('varargslist -> fpdef EQUAL test COMMA','varargslist',4,'p_varargslist15','enaml/core/parser.py',2861),
-  ('varargslist -> fpdef EQUAL test varargslist_list COMMA STAR NAME','varargslist',7,'p_varargslist16','enaml/core/parser.py',2868),
-  ('varargslist -> fpdef EQUAL test varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',10,'p_varargslist17','enaml/core/parser.py',2881),
-  ('varargslist -> fpdef EQUAL test varargslist_list COMMA DOUBLESTAR NAME','varargslist',7,'p_varargslist18','enaml/core/parser.py',2894),
-  ('varargslist -> fpdef EQUAL test varargslist_list','varargslist',4,'p_varargslist19','enaml/core/parser.py',2907),
-  ('varargslist -> fpdef EQUAL test varargslist_list COMMA','varargslist',5,'p_varargslist20','enaml/core/parser.py',2920),
-  ('varargslist -> STAR NAME','varargslist',2,'p_varargslist21','enaml/core/parser.py',2933),
-  ('varargslist -> STAR NAME COMMA DOUBLESTAR NAME','varargslist',5,'p_varargslist22','enaml/core/parser.py',2939),
-  ('varargslist -> DOUBLESTAR NAME','varargslist',2,'p_varargslist23','enaml/core/parser.py',2945),
-  ('varargslist_list -> COMMA fpdef','varargslist_list',2,'p_varargslist_list1','enaml/core/parser.py',2952),
-  ('varargslist_list -> COMMA fpdef EQUAL test','varargslist_list',4,'p_varargslist_list2','enaml/core/parser.py',2957),
-  ('varargslist_list -> varargslist_list COMMA fpdef','varargslist_list',3,'p_varargslist_list3','enaml/core/parser.py',2962),
-  ('varargslist_list -> varargslist_list COMMA fpdef EQUAL test','varargslist_list',5,'p_varargslist_list4','enaml/core/parser.py',2973),
-  ('fpdef -> NAME','fpdef',1,'p_fpdef1','enaml/core/parser.py',2981),
-  ('fpdef -> LPAR fplist RPAR','fpdef',3,'p_fpdef2','enaml/core/parser.py',2986),
-  ('fplist -> fpdef','fplist',1,'p_fplist1','enaml/core/parser.py',2993),
-  ('fplist -> fpdef COMMA','fplist',2,'p_fplist2','enaml/core/parser.py',2998),
-  ('fplist -> fpdef fplist_list','fplist',2,'p_fplist3','enaml/core/parser.py',3006),
-  ('fplist -> fpdef fplist_list COMMA','fplist',3,'p_fplist4','enaml/core/parser.py',3015),
-  ('fplist_list -> COMMA fpdef','fplist_list',2,'p_fplist_list1','enaml/core/parser.py',3024),
-  ('fplist_list -> fplist_list COMMA fpdef','fplist_list',3,'p_fplist_list2','enaml/core/parser.py',3029),
+  ('binding -> LEFTSHIFTLESS test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',574),
+  ('binding -> LEFTSHIFTCOLON test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',575),
+  ('binding -> RIGHTSHIFT test NEWLINE','binding',3,'p_binding1','enaml/core/parser.py',576),
+  ('binding -> DOUBLECOLON suite','binding',2,'p_binding2','enaml/core/parser.py',587),
+  ('suite -> simple_stmt','suite',1,'p_suite1','enaml/core/parser.py',605),
+  ('suite -> NEWLINE INDENT stmt_list DEDENT','suite',4,'p_suite2','enaml/core/parser.py',617),
+  ('stmt_list -> stmt stmt_list','stmt_list',2,'p_stmt_list1','enaml/core/parser.py',622),
+  ('stmt_list -> stmt','stmt_list',1,'p_stmt_list2','enaml/core/parser.py',627),
+  ('stmt -> simple_stmt','stmt',1,'p_stmt','enaml/core/parser.py',639),
+  ('stmt -> compound_stmt','stmt',1,'p_stmt','enaml/core/parser.py',640),
+  ('simple_stmt -> small_stmt NEWLINE','simple_stmt',2,'p_simple_stmt1','enaml/core/parser.py',645),
+  ('simple_stmt -> small_stmt_list NEWLINE','simple_stmt',2,'p_simple_stmt2','enaml/core/parser.py',653),
+  ('small_stmt_list -> small_stmt SEMI','small_stmt_list',2,'p_small_stmt_list1','enaml/core/parser.py',663),
+  ('small_stmt_list -> small_stmt small_stmt_list_list','small_stmt_list',2,'p_small_stmt_list2','enaml/core/parser.py',668),
+  ('small_stmt_list -> small_stmt small_stmt_list_list SEMI','small_stmt_list',3,'p_small_stmt_list3','enaml/core/parser.py',673),
+  ('small_stmt_list_list -> SEMI small_stmt','small_stmt_list_list',2,'p_small_stmt_list_list1','enaml/core/parser.py',678),
+  ('small_stmt_list_list -> small_stmt_list_list SEMI small_stmt','small_stmt_list_list',3,'p_small_stmt_list_list2','enaml/core/parser.py',683),
+  ('small_stmt -> expr_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',688),
+  ('small_stmt -> print_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',689),
+  ('small_stmt -> del_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',690),
+  ('small_stmt -> pass_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',691),
+  ('small_stmt -> flow_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',692),
+  ('small_stmt -> import_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',693),
+  ('small_stmt -> global_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',694),
+  ('small_stmt -> exec_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',695),
+  ('small_stmt -> assert_stmt','small_stmt',1,'p_small_stmt1','enaml/core/parser.py',696),
+  ('print_stmt -> PRINT','print_stmt',1,'p_print_stmt1','enaml/core/parser.py',701),
+  ('print_stmt -> PRINT test','print_stmt',2,'p_print_stmt2','enaml/core/parser.py',710),
+  ('print_stmt -> PRINT print_list','print_stmt',2,'p_print_stmt3','enaml/core/parser.py',719),
+  ('print_stmt -> PRINT RIGHTSHIFT test','print_stmt',3,'p_print_stmt4','enaml/core/parser.py',734),
+  ('print_stmt -> PRINT RIGHTSHIFT test COMMA test','print_stmt',5,'p_print_stmt5','enaml/core/parser.py',743),
+  ('print_stmt -> PRINT RIGHTSHIFT test COMMA print_list','print_stmt',5,'p_print_stmt6','enaml/core/parser.py',752),
+  ('print_list -> test COMMA','print_list',2,'p_print_list1','enaml/core/parser.py',767),
+  ('print_list -> test print_list_list','print_list',2,'p_print_list2','enaml/core/parser.py',772),
+  ('print_list -> test print_list_list COMMA','print_list',3,'p_print_list3','enaml/core/parser.py',777),
+  ('print_list_list -> COMMA test','print_list_list',2,'p_print_list_list1','enaml/core/parser.py',782),
+  ('print_list_list -> print_list_list COMMA test','print_list_list',3,'p_print_list_list2','enaml/core/parser.py',787),
+  ('del_stmt -> DEL exprlist','del_stmt',2,'p_del_stmt','enaml/core/parser.py',792),
+  ('pass_stmt -> PASS','pass_stmt',1,'p_pass_stmt','enaml/core/parser.py',801),
+  ('flow_stmt -> break_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',808),
+  ('flow_stmt -> continue_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',809),
+  ('flow_stmt -> return_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',810),
+  ('flow_stmt -> raise_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',811),
+  ('flow_stmt -> yield_stmt','flow_stmt',1,'p_flow_stmt','enaml/core/parser.py',812),
+  ('break_stmt -> BREAK','break_stmt',1,'p_break_stmt','enaml/core/parser.py',817),
+  ('continue_stmt -> CONTINUE','continue_stmt',1,'p_continue_stmt','enaml/core/parser.py',824),
+  ('return_stmt -> RETURN','return_stmt',1,'p_return_stmt1','enaml/core/parser.py',831),
+  ('return_stmt -> RETURN testlist','return_stmt',2,'p_return_stmt2','enaml/core/parser.py',838),
+  ('raise_stmt -> RAISE','raise_stmt',1,'p_raise_stmt1','enaml/core/parser.py',846),
+  ('raise_stmt -> RAISE test','raise_stmt',2,'p_raise_stmt2','enaml/core/parser.py',855),
+  ('raise_stmt -> RAISE test COMMA test','raise_stmt',4,'p_raise_stmt3','enaml/core/parser.py',864),
+  ('raise_stmt -> RAISE test COMMA test COMMA test','raise_stmt',6,'p_raise_stmt4','enaml/core/parser.py',873),
+  ('yield_stmt -> yield_expr','yield_stmt',1,'p_yield_stmt','enaml/core/parser.py',882),
+  ('yield_expr -> YIELD','yield_expr',1,'p_yield_expr1','enaml/core/parser.py',887),
+  ('yield_expr -> YIELD testlist','yield_expr',2,'p_yield_expr2','enaml/core/parser.py',892),
+  ('global_stmt -> GLOBAL NAME','global_stmt',2,'p_global_stmt1','enaml/core/parser.py',898),
+  ('global_stmt -> GLOBAL NAME globals_list','global_stmt',3,'p_global_stmt2','enaml/core/parser.py',906),
+  ('globals_list -> COMMA NAME globals_list','globals_list',3,'p_globals_list1','enaml/core/parser.py',914),
+  ('globals_list -> COMMA NAME','globals_list',2,'p_globals_list2','enaml/core/parser.py',919),
+  ('exec_stmt -> EXEC expr','exec_stmt',2,'p_exec_stmt1','enaml/core/parser.py',924),
+  ('exec_stmt -> EXEC expr IN test','exec_stmt',4,'p_exec_stmt2','enaml/core/parser.py',933),
+  ('exec_stmt -> EXEC expr IN test COMMA test','exec_stmt',6,'p_exec_stmt3','enaml/core/parser.py',942),
+  ('assert_stmt -> ASSERT test','assert_stmt',2,'p_assert_stmt1','enaml/core/parser.py',951),
+  ('assert_stmt -> ASSERT test COMMA test','assert_stmt',4,'p_assert_stmt2','enaml/core/parser.py',959),
+  ('expr_stmt -> testlist','expr_stmt',1,'p_expr_stmt1','enaml/core/parser.py',967),
+  ('expr_stmt -> testlist augassign testlist','expr_stmt',3,'p_expr_stmt2','enaml/core/parser.py',974),
+  ('expr_stmt -> testlist augassign yield_expr','expr_stmt',3,'p_expr_stmt2','enaml/core/parser.py',975),
+  ('expr_stmt -> testlist equal_list','expr_stmt',2,'p_expr_stmt3','enaml/core/parser.py',991),
+  ('augassign -> AMPEREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1007),
+  ('augassign -> CIRCUMFLEXEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1008),
+  ('augassign -> DOUBLESLASHEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1009),
+  ('augassign -> DOUBLESTAREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1010),
+  ('augassign -> LEFTSHIFTEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1011),
+  ('augassign -> MINUSEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1012),
+  ('augassign -> PERCENTEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1013),
+  ('augassign -> PLUSEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1014),
+  ('augassign -> RIGHTSHIFTEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1015),
+  ('augassign -> SLASHEQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1016),
+  ('augassign -> STAREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1017),
+  ('augassign -> VBAREQUAL','augassign',1,'p_augassign','enaml/core/parser.py',1018),
+  ('equal_list -> EQUAL testlist','equal_list',2,'p_equal_list1','enaml/core/parser.py',1025),
+  ('equal_list -> EQUAL yield_expr','equal_list',2,'p_equal_list1','enaml/core/parser.py',1026),
+  ('equal_list -> EQUAL testlist equal_list','equal_list',3,'p_equal_list2','enaml/core/parser.py',1031),
+  ('equal_list -> EQUAL yield_expr equal_list','equal_list',3,'p_equal_list2','enaml/core/parser.py',1032),
+  ('testlist -> test','testlist',1,'p_testlist1','enaml/core/parser.py',1037),
+  ('testlist -> test COMMA','testlist',2,'p_testlist2','enaml/core/parser.py',1042),
+  ('testlist -> test testlist_list','testlist',2,'p_testlist3','enaml/core/parser.py',1047),
+  ('testlist -> test testlist_list COMMA','testlist',3,'p_testlist4','enaml/core/parser.py',1052),
+  ('testlist_list -> COMMA test','testlist_list',2,'p_testlist_list1','enaml/core/parser.py',1057),
+  ('testlist_list -> testlist_list COMMA test','testlist_list',3,'p_testlist_list2','enaml/core/parser.py',1062),
+  ('compound_stmt -> if_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1067),
+  ('compound_stmt -> while_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1068),
+  ('compound_stmt -> for_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1069),
+  ('compound_stmt -> try_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1070),
+  ('compound_stmt -> with_stmt','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1071),
+  ('compound_stmt -> funcdef','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1072),
+  ('compound_stmt -> classdef','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1073),
+  ('compound_stmt -> decorated','compound_stmt',1,'p_compound_stmt','enaml/core/parser.py',1074),
+  ('if_stmt -> IF test COLON suite','if_stmt',4,'p_if_stmt1','enaml/core/parser.py',1079),
+  ('if_stmt -> IF test COLON suite elif_stmts','if_stmt',5,'p_if_stmt2','enaml/core/parser.py',1090),
+  ('if_stmt -> IF test COLON suite else_stmt','if_stmt',5,'p_if_stmt3','enaml/core/parser.py',1101),
+  ('if_stmt -> IF test COLON suite elif_stmts else_stmt','if_stmt',6,'p_if_stmt4','enaml/core/parser.py',1112),
+  ('elif_stmts -> elif_stmts elif_stmt','elif_stmts',2,'p_elif_stmts1','enaml/core/parser.py',1128),
+  ('elif_stmts -> elif_stmt','elif_stmts',1,'p_elif_stmts2','enaml/core/parser.py',1135),
+  ('elif_stmt -> ELIF test COLON suite','elif_stmt',4,'p_elif_stmt','enaml/core/parser.py',1140),
+  ('else_stmt -> ELSE COLON suite','else_stmt',3,'p_else_stmt','enaml/core/parser.py',1151),
+  ('while_stmt -> WHILE test COLON suite','while_stmt',4,'p_while_stmt1','enaml/core/parser.py',1156),
+  ('while_stmt -> WHILE test COLON suite ELSE COLON suite','while_stmt',7,'p_while_stmt2','enaml/core/parser.py',1167),
+  ('for_stmt -> FOR exprlist IN testlist COLON suite','for_stmt',6,'p_for_stmt1','enaml/core/parser.py',1178),
+  ('for_stmt -> FOR exprlist IN testlist COLON suite ELSE COLON suite','for_stmt',9,'p_for_stmt2','enaml/core/parser.py',1192),
+  ('try_stmt -> TRY COLON suite FINALLY COLON suite','try_stmt',6,'p_try_stmt1','enaml/core/parser.py',1206),
+  ('try_stmt -> TRY COLON suite except_clauses','try_stmt',4,'p_try_stmt2','enaml/core/parser.py',1216),
+  ('try_stmt -> TRY COLON suite except_clauses ELSE COLON suite','try_stmt',7,'p_try_stmt3','enaml/core/parser.py',1227),
+  ('try_stmt -> TRY COLON suite except_clauses FINALLY COLON suite','try_stmt',7,'p_try_stmt4','enaml/core/parser.py',1238),
+  ('try_stmt -> TRY COLON suite except_clauses ELSE COLON suite FINALLY COLON suite','try_stmt',10,'p_try_stmt5','enaml/core/parser.py',1255),
+  ('except_clauses -> except_clause except_clauses','except_clauses',2,'p_except_clauses1','enaml/core/parser.py',1272),
+  ('except_clauses -> except_clause','except_clauses',1,'p_except_clauses2','enaml/core/parser.py',1277),
+  ('except_clause -> EXCEPT COLON suite','except_clause',3,'p_except_clause1','enaml/core/parser.py',1282),
+  ('except_clause -> EXCEPT test COLON suite','except_clause',4,'p_except_clause2','enaml/core/parser.py',1293),
+  ('except_clause -> EXCEPT test AS test COLON suite','except_clause',6,'p_except_clause3','enaml/core/parser.py',1304),
+  ('except_clause -> EXCEPT test COMMA test COLON suite','except_clause',6,'p_except_clause3','enaml/core/parser.py',1305),
+  ('with_stmt -> WITH with_item COLON suite','with_stmt',4,'p_with_stmt1','enaml/core/parser.py',1318),
+  ('with_stmt -> WITH with_item with_item_list COLON suite','with_stmt',5,'p_with_stmt2','enaml/core/parser.py',1330),
+  ('with_item -> test','with_item',1,'p_with_item1','enaml/core/parser.py',1350),
+  ('with_item -> test AS expr','with_item',3,'p_with_item2','enaml/core/parser.py',1355),
+  ('with_item_list -> COMMA with_item with_item_list','with_item_list',3,'p_with_item_list1','enaml/core/parser.py',1362),
+  ('with_item_list -> COMMA with_item','with_item_list',2,'p_with_item_list2','enaml/core/parser.py',1367),
+  ('funcdef -> DEF NAME parameters COLON suite','funcdef',5,'p_funcdef','enaml/core/parser.py',1372),
+  ('parameters -> LPAR RPAR','parameters',2,'p_parameters1','enaml/core/parser.py',1384),
+  ('parameters -> LPAR varargslist RPAR','parameters',3,'p_parameters2','enaml/core/parser.py',1389),
+  ('classdef -> CLASS NAME COLON suite','classdef',4,'p_classdef1','enaml/core/parser.py',1394),
+  ('classdef -> CLASS NAME LPAR RPAR COLON suite','classdef',6,'p_classdef2','enaml/core/parser.py',1406),
+  ('classdef -> CLASS NAME LPAR testlist RPAR COLON suite','classdef',7,'p_classdef3','enaml/core/parser.py',1418),
+  ('decorated -> decorators funcdef','decorated',2,'p_decorated','enaml/core/parser.py',1433),
+  ('decorated -> decorators classdef','decorated',2,'p_decorated','enaml/core/parser.py',1434),
+  ('decorators -> decorator decorators','decorators',2,'p_decorators1','enaml/core/parser.py',1442),
+  ('decorators -> decorator','decorators',1,'p_decorators2','enaml/core/parser.py',1447),
+  ('decorator -> AT dotted_name NEWLINE','decorator',3,'p_decorator1','enaml/core/parser.py',1452),
+  ('decorator -> AT dotted_name LPAR RPAR NEWLINE','decorator',5,'p_decorator2','enaml/core/parser.py',1460),
+  ('decorator -> AT dotted_name LPAR arglist RPAR NEWLINE','decorator',6,'p_decorator3','enaml/core/parser.py',1473),
+  ('import_stmt -> import_name','import_stmt',1,'p_import_stmt1','enaml/core/parser.py',1487),
+  ('import_stmt -> import_from','import_stmt',1,'p_import_stmt2','enaml/core/parser.py',1492),
+  ('import_name -> IMPORT dotted_as_names','import_name',2,'p_import_name','enaml/core/parser.py',1496),
+  ('import_from -> FROM dotted_name IMPORT STAR','import_from',4,'p_import_from1','enaml/core/parser.py',1503),
+  ('import_from -> FROM dotted_name IMPORT import_as_names','import_from',4,'p_import_from2','enaml/core/parser.py',1511),
+  ('import_from -> FROM dotted_name IMPORT LPAR import_as_names RPAR','import_from',6,'p_import_from3','enaml/core/parser.py',1518),
+  ('import_from -> FROM import_from_dots dotted_name IMPORT STAR','import_from',5,'p_import_from4','enaml/core/parser.py',1525),
+  ('import_from -> FROM import_from_dots dotted_name IMPORT import_as_name','import_from',5,'p_import_from5','enaml/core/parser.py',1533),
+  ('import_from -> FROM import_from_dots dotted_name IMPORT LPAR import_as_names RPAR','import_from',7,'p_import_from6','enaml/core/parser.py',1540),
+  ('import_from -> FROM import_from_dots IMPORT STAR','import_from',4,'p_import_from7','enaml/core/parser.py',1547),
+  ('import_from -> FROM import_from_dots IMPORT import_as_names','import_from',4,'p_import_from8','enaml/core/parser.py',1555),
+  ('import_from -> FROM import_from_dots IMPORT LPAR import_as_names RPAR','import_from',6,'p_import_from9','enaml/core/parser.py',1562),
+  ('import_from_dots -> DOT','import_from_dots',1,'p_import_from_dots1','enaml/core/parser.py',1569),
+  ('import_from_dots -> import_from_dots DOT','import_from_dots',2,'p_import_from_dots2','enaml/core/parser.py',1574),
+  ('import_as_name -> NAME','import_as_name',1,'p_import_as_name1','enaml/core/parser.py',1579),
+  ('import_as_name -> NAME AS NAME','import_as_name',3,'p_import_as_name2','enaml/core/parser.py',1584),
+  ('dotted_as_name -> dotted_name','dotted_as_name',1,'p_dotted_as_name1','enaml/core/parser.py',1589),
+  ('dotted_as_name -> dotted_name AS NAME','dotted_as_name',3,'p_dotted_as_name2','enaml/core/parser.py',1595),
+  ('import_as_names -> import_as_name','import_as_names',1,'p_import_as_names1','enaml/core/parser.py',1601),
+  ('import_as_names -> import_as_name COMMA','import_as_names',2,'p_import_as_names2','enaml/core/parser.py',1606),
+  ('import_as_names -> import_as_name import_as_names_list','import_as_names',2,'p_import_as_names3','enaml/core/parser.py',1611),
+  ('import_as_names -> import_as_name import_as_names_list COMMA','import_as_names',3,'p_import_as_names4','enaml/core/parser.py',1616),
+  ('import_as_names_list -> COMMA import_as_name','import_as_names_list',2,'p_import_as_names_list1','enaml/core/parser.py',1621),
+  ('import_as_names_list -> import_as_names_list COMMA import_as_name','import_as_names_list',3,'p_import_as_names_list2','enaml/core/parser.py',1626),
+  ('dotted_as_names -> dotted_as_name','dotted_as_names',1,'p_dotted_as_names1','enaml/core/parser.py',1631),
+  ('dotted_as_names -> dotted_as_name dotted_as_names_list','dotted_as_names',2,'p_dotted_as_names2','enaml/core/parser.py',1636),
+  ('dotted_as_names_list -> COMMA dotted_as_name','dotted_as_names_list',2,'p_dotted_as_names_list1','enaml/core/parser.py',1641),
+  ('dotted_as_names_list -> dotted_as_names_list COMMA dotted_as_name','dotted_as_names_list',3,'p_dotted_as_names_star_list2','enaml/core/parser.py',1646),
+  ('dotted_name -> NAME','dotted_name',1,'p_dotted_name1','enaml/core/parser.py',1651),
+  ('dotted_name -> NAME dotted_name_list','dotted_name',2,'p_dotted_name2','enaml/core/parser.py',1656),
+  ('dotted_name_list -> DOT NAME','dotted_name_list',2,'p_dotted_name_list1','enaml/core/parser.py',1661),
+  ('dotted_name_list -> dotted_name_list DOT NAME','dotted_name_list',3,'p_dotted_name_list2','enaml/core/parser.py',1666),
+  ('test -> or_test','test',1,'p_test1','enaml/core/parser.py',1671),
+  ('test -> or_test IF or_test ELSE test','test',5,'p_test2','enaml/core/parser.py',1676),
+  ('test -> lambdef','test',1,'p_test3','enaml/core/parser.py',1682),
+  ('or_test -> and_test','or_test',1,'p_or_test1','enaml/core/parser.py',1687),
+  ('or_test -> and_test or_test_list','or_test',2,'p_or_test2','enaml/core/parser.py',1692),
+  ('or_test_list -> OR and_test','or_test_list',2,'p_or_test_list1','enaml/core/parser.py',1699),
+  ('or_test_list -> or_test_list OR and_test','or_test_list',3,'p_or_test_list2','enaml/core/parser.py',1704),
+  ('and_test -> not_test','and_test',1,'p_and_test1','enaml/core/parser.py',1709),
+  ('and_test -> not_test and_test_list','and_test',2,'p_and_test2','enaml/core/parser.py',1714),
+  ('and_test_list -> AND not_test','and_test_list',2,'p_and_test_list1','enaml/core/parser.py',1721),
+  ('and_test_list -> and_test_list AND not_test','and_test_list',3,'p_and_test_list2','enaml/core/parser.py',1726),
+  ('not_test -> comparison','not_test',1,'p_not_test','enaml/core/parser.py',1731),
+  ('not_test -> NOT not_test','not_test',2,'p_not_test2','enaml/core/parser.py',1736),
+  ('comparison -> expr','comparison',1,'p_comparison1','enaml/core/parser.py',1742),
+  ('comparison -> expr comparison_list','comparison',2,'p_comparison2','enaml/core/parser.py',1747),
+  ('comparison_list -> comp_op expr','comparison_list',2,'p_comparison_list1','enaml/core/parser.py',1755),
+  ('comparison_list -> comparison_list comp_op expr','comparison_list',3,'p_comparison_list2','enaml/core/parser.py',1760),
+  ('comp_op -> LESS','comp_op',1,'p_comp_op1','enaml/core/parser.py',1765),
+  ('comp_op -> GREATER','comp_op',1,'p_comp_op2','enaml/core/parser.py',1770),
+  ('comp_op -> EQEQUAL','comp_op',1,'p_comp_op3','enaml/core/parser.py',1775),
+  ('comp_op -> GREATEREQUAL','comp_op',1,'p_comp_op4','enaml/core/parser.py',1780),
+  ('comp_op -> LESSEQUAL','comp_op',1,'p_comp_op5','enaml/core/parser.py',1785),
+  ('comp_op -> NOTEQUAL','comp_op',1,'p_comp_op6','enaml/core/parser.py',1790),
+  ('comp_op -> IN','comp_op',1,'p_comp_op7','enaml/core/parser.py',1795),
+  ('comp_op -> NOT IN','comp_op',2,'p_comp_op8','enaml/core/parser.py',1800),
+  ('comp_op -> IS','comp_op',1,'p_comp_op9','enaml/core/parser.py',1805),
+  ('comp_op -> IS NOT','comp_op',2,'p_comp_op10','enaml/core/parser.py',1810),
+  ('expr -> xor_expr','expr',1,'p_expr1','enaml/core/parser.py',1815),
+  ('expr -> xor_expr expr_list','expr',2,'p_expr2','enaml/core/parser.py',1820),
+  ('expr_list -> VBAR xor_expr','expr_list',2,'p_expr_list1','enaml/core/parser.py',1828),
+  ('expr_list -> expr_list VBAR xor_expr','expr_list',3,'p_expr_list2','enaml/core/parser.py',1833),
+  ('xor_expr -> and_expr','xor_expr',1,'p_xor_expr1','enaml/core/parser.py',1838),
+  ('xor_expr -> and_expr xor_expr_list','xor_expr',2,'p_xor_expr2','enaml/core/parser.py',1843),
+  ('xor_expr_list -> CIRCUMFLEX and_expr','xor_expr_list',2,'p_xor_expr_list1','enaml/core/parser.py',1851),
+  ('xor_expr_list -> xor_expr_list CIRCUMFLEX and_expr','xor_expr_list',3,'p_xor_expr_list2','enaml/core/parser.py',1856),
+  ('and_expr -> shift_expr','and_expr',1,'p_and_expr1','enaml/core/parser.py',1861),
+  ('and_expr -> shift_expr and_expr_list','and_expr',2,'p_and_expr2','enaml/core/parser.py',1866),
+  ('and_expr_list -> AMPER shift_expr','and_expr_list',2,'p_and_expr_list1','enaml/core/parser.py',1874),
+  ('and_expr_list -> and_expr_list AMPER shift_expr','and_expr_list',3,'p_and_expr_list2','enaml/core/parser.py',1879),
+  ('shift_expr -> arith_expr','shift_expr',1,'p_shift_expr1','enaml/core/parser.py',1884),
+  ('shift_expr -> arith_expr shift_list','shift_expr',2,'p_shift_expr2','enaml/core/parser.py',1889),
+  ('shift_list -> shift_op','shift_list',1,'p_shift_list1','enaml/core/parser.py',1897),
+  ('shift_list -> shift_list shift_op','shift_list',2,'p_shift_list2','enaml/core/parser.py',1902),
+  ('shift_op -> LEFTSHIFT arith_expr','shift_op',2,'p_shift_op1','enaml/core/parser.py',1907),
+  ('shift_op -> RIGHTSHIFT arith_expr','shift_op',2,'p_shift_op2','enaml/core/parser.py',1912),
+  ('arith_expr -> term','arith_expr',1,'p_arith_expr1','enaml/core/parser.py',1917),
+  ('arith_expr -> term arith_expr_list','arith_expr',2,'p_arith_expr2','enaml/core/parser.py',1922),
+  ('arith_expr_list -> arith_op','arith_expr_list',1,'p_arith_expr_list1','enaml/core/parser.py',1930),
+  ('arith_expr_list -> arith_expr_list arith_op','arith_expr_list',2,'p_arith_expr_list2','enaml/core/parser.py',1935),
+  ('arith_op -> PLUS term','arith_op',2,'p_arith_op1','enaml/core/parser.py',1940),
+  ('arith_op -> MINUS term','arith_op',2,'p_arith_op2','enaml/core/parser.py',1946),
+  ('term -> factor','term',1,'p_term1','enaml/core/parser.py',1951),
+  ('term -> factor term_list','term',2,'p_term2','enaml/core/parser.py',1956),
+  ('term_list -> term_op','term_list',1,'p_term_list1','enaml/core/parser.py',1964),
+  ('term_list -> term_list term_op','term_list',2,'p_term_list2','enaml/core/parser.py',1969),
+  ('term_op -> STAR factor','term_op',2,'p_term_op1','enaml/core/parser.py',1974),
+  ('term_op -> SLASH factor','term_op',2,'p_term_op2','enaml/core/parser.py',1979),
+  ('term_op -> PERCENT factor','term_op',2,'p_term_op3','enaml/core/parser.py',1984),
+  ('term_op -> DOUBLESLASH factor','term_op',2,'p_term_op4','enaml/core/parser.py',1989),
+  ('factor -> power','factor',1,'p_factor1','enaml/core/parser.py',1994),
+  ('factor -> PLUS factor','factor',2,'p_factor2','enaml/core/parser.py',1999),
+  ('factor -> MINUS factor','factor',2,'p_factor3','enaml/core/parser.py',2007),
+  ('factor -> TILDE factor','factor',2,'p_factor4','enaml/core/parser.py',2015),
+  ('power -> atom','power',1,'p_power1','enaml/core/parser.py',2023),
+  ('power -> atom DOUBLESTAR factor','power',3,'p_power2','enaml/core/parser.py',2028),
+  ('power -> atom power_list','power',2,'p_power3','enaml/core/parser.py',2034),
+  ('power -> atom power_list DOUBLESTAR factor','power',4,'p_power4','enaml/core/parser.py',2050),
+  ('power_list -> trailer','power_list',1,'p_power_list1','enaml/core/parser.py',2067),
+  ('power_list -> power_list trailer','power_list',2,'p_power_list2','enaml/core/parser.py',2072),
+  ('atom -> LPAR RPAR','atom',2,'p_atom1','enaml/core/parser.py',2077),
+  ('atom -> LPAR yield_expr RPAR','atom',3,'p_atom2','enaml/core/parser.py',2082),
+  ('atom -> LPAR testlist_comp RPAR','atom',3,'p_atom3','enaml/core/parser.py',2087),
+  ('atom -> LSQB RSQB','atom',2,'p_atom4','enaml/core/parser.py',2101),
+  ('atom -> LSQB listmaker RSQB','atom',3,'p_atom5','enaml/core/parser.py',2106),
+  ('atom -> LBRACE RBRACE','atom',2,'p_atom6','enaml/core/parser.py',2118),
+  ('atom -> LBRACE dictorsetmaker RBRACE','atom',3,'p_atom7','enaml/core/parser.py',2123),
+  ('atom -> NAME','atom',1,'p_atom8','enaml/core/parser.py',2144),
+  ('atom -> NUMBER','atom',1,'p_atom9','enaml/core/parser.py',2149),
+  ('atom -> atom_string_list','atom',1,'p_atom10','enaml/core/parser.py',2155),
+  ('atom_string_list -> STRING','atom_string_list',1,'p_atom_string_list1','enaml/core/parser.py',2161),
+  ('atom_string_list -> atom_string_list STRING','atom_string_list',2,'p_atom_string_list2','enaml/core/parser.py',2166),
+  ('listmaker -> test list_for','listmaker',2,'p_listmaker1','enaml/core/parser.py',2176),
+  ('listmaker -> test','listmaker',1,'p_listmaker2','enaml/core/parser.py',2181),
+  ('listmaker -> test COMMA','listmaker',2,'p_listmaker3','enaml/core/parser.py',2186),
+  ('listmaker -> test listmaker_list','listmaker',2,'p_listmaker4','enaml/core/parser.py',2191),
+  ('listmaker -> test listmaker_list COMMA','listmaker',3,'p_listmaker5','enaml/core/parser.py',2197),
+  ('listmaker_list -> COMMA test','listmaker_list',2,'p_listmaker_list1','enaml/core/parser.py',2203),
+  ('listmaker_list -> listmaker_list COMMA test','listmaker_list',3,'p_listmaker_list2','enaml/core/parser.py',2208),
+  ('testlist_comp -> test comp_for','testlist_comp',2,'p_testlist_comp1','enaml/core/parser.py',2213),
+  ('testlist_comp -> test','testlist_comp',1,'p_testlist_comp2','enaml/core/parser.py',2218),
+  ('testlist_comp -> test COMMA','testlist_comp',2,'p_testlist_comp3','enaml/core/parser.py',2223),
+  ('testlist_comp -> test testlist_comp_list','testlist_comp',2,'p_testlist_comp4','enaml/core/parser.py',2228),
+  ('testlist_comp -> test testlist_comp_list COMMA','testlist_comp',3,'p_testlist_comp5','enaml/core/parser.py',2234),
+  ('testlist_comp_list -> COMMA test','testlist_comp_list',2,'p_testlist_comp_list1','enaml/core/parser.py',2240),
+  ('testlist_comp_list -> testlist_comp_list COMMA test','testlist_comp_list',3,'p_testlist_comp_list2','enaml/core/parser.py',2245),
+  ('trailer -> LPAR RPAR','trailer',2,'p_trailer1','enaml/core/parser.py',2250),
+  ('trailer -> LPAR arglist RPAR','trailer',3,'p_trailer2','enaml/core/parser.py',2255),
+  ('trailer -> LSQB subscriptlist RSQB','trailer',3,'p_trailer3','enaml/core/parser.py',2262),
+  ('trailer -> DOT NAME','trailer',2,'p_trailer4','enaml/core/parser.py',2267),
+  ('subscriptlist -> subscript','subscriptlist',1,'p_subscriptlist1','enaml/core/parser.py',2272),
+  ('subscriptlist -> subscript COMMA','subscriptlist',2,'p_subscriptlist2','enaml/core/parser.py',2277),
+  ('subscriptlist -> subscript subscriptlist_list','subscriptlist',2,'p_subscriptlist3','enaml/core/parser.py',2283),
+  ('subscriptlist -> subscript subscriptlist_list COMMA','subscriptlist',3,'p_subscriptlist4','enaml/core/parser.py',2289),
+  ('subscriptlist_list -> COMMA subscript','subscriptlist_list',2,'p_subscriptlist_list1','enaml/core/parser.py',2295),
+  ('subscriptlist_list -> subscriptlist_list COMMA subscript','subscriptlist_list',3,'p_subscript_list2','enaml/core/parser.py',2300),
+  ('subscript -> ELLIPSIS','subscript',1,'p_subscript1','enaml/core/parser.py',2305),
+  ('subscript -> test','subscript',1,'p_subcript2','enaml/core/parser.py',2310),
+  ('subscript -> COLON','subscript',1,'p_subscript3','enaml/core/parser.py',2315),
+  ('subscript -> DOUBLECOLON','subscript',1,'p_subscript4','enaml/core/parser.py',2320),
+  ('subscript -> test COLON','subscript',2,'p_subscript5','enaml/core/parser.py',2326),
+  ('subscript -> test DOUBLECOLON','subscript',2,'p_subscrip6','enaml/core/parser.py',2331),
+  ('subscript -> COLON test','subscript',2,'p_subscript7','enaml/core/parser.py',2337),
+  ('subscript -> COLON test COLON','subscript',3,'p_subscript8','enaml/core/parser.py',2342),
+  ('subscript -> DOUBLECOLON test','subscript',2,'p_subscript9','enaml/core/parser.py',2348),
+  ('subscript -> test COLON test','subscript',3,'p_subscript10','enaml/core/parser.py',2353),
+  ('subscript -> test COLON test COLON','subscript',4,'p_subscript11','enaml/core/parser.py',2358),
+  ('subscript -> COLON test COLON test','subscript',4,'p_subscript12','enaml/core/parser.py',2364),
+  ('subscript -> test COLON test COLON test','subscript',5,'p_subscript13','enaml/core/parser.py',2369),
+  ('subscript -> test DOUBLECOLON test','subscript',3,'p_subscript14','enaml/core/parser.py',2374),
+  ('exprlist -> expr','exprlist',1,'p_exprlist1','enaml/core/parser.py',2379),
+  ('exprlist -> expr COMMA','exprlist',2,'p_exprlist2','enaml/core/parser.py',2384),
+  ('exprlist -> expr exprlist_list','exprlist',2,'p_exprlist3','enaml/core/parser.py',2391),
+  ('exprlist -> expr exprlist_list COMMA','exprlist',3,'p_exprlist4','enaml/core/parser.py',2398),
+  ('exprlist_list -> COMMA expr','exprlist_list',2,'p_exprlist_list1','enaml/core/parser.py',2405),
+  ('exprlist_list -> exprlist_list COMMA expr','exprlist_list',3,'p_exprlist_list2','enaml/core/parser.py',2410),
+  ('dictorsetmaker -> test COLON test comp_for','dictorsetmaker',4,'p_dictorsetmaker1','enaml/core/parser.py',2415),
+  ('dictorsetmaker -> test COLON test','dictorsetmaker',3,'p_dictorsetmaker2','enaml/core/parser.py',2420),
+  ('dictorsetmaker -> test COLON test COMMA','dictorsetmaker',4,'p_dictorsetmaker3','enaml/core/parser.py',2426),
+  ('dictorsetmaker -> test COLON test dosm_colon_list','dictorsetmaker',4,'p_dictorsetmaker4','enaml/core/parser.py',2432),
+  ('dictorsetmaker -> test COLON test dosm_colon_list COMMA','dictorsetmaker',5,'p_dictorsetmaker5','enaml/core/parser.py',2438),
+  ('dictorsetmaker -> test comp_for','dictorsetmaker',2,'p_dictorsetmaker6','enaml/core/parser.py',2444),
+  ('dictorsetmaker -> test COMMA','dictorsetmaker',2,'p_dictorsetmaker7','enaml/core/parser.py',2449),
+  ('dictorsetmaker -> test dosm_comma_list','dictorsetmaker',2,'p_dictorsetmaker8','enaml/core/parser.py',2455),
+  ('dictorsetmaker -> test dosm_comma_list COMMA','dictorsetmaker',3,'p_dictorsetmaker9','enaml/core/parser.py',2461),
+  ('dosm_colon_list -> COMMA test COLON test','dosm_colon_list',4,'p_dosm_colon_list1','enaml/core/parser.py',2467),
+  ('dosm_colon_list -> dosm_colon_list COMMA test COLON test','dosm_colon_list',5,'p_dosm_colon_list2','enaml/core/parser.py',2472),
+  ('dosm_comma_list -> COMMA test','dosm_comma_list',2,'p_dosm_comma_list1','enaml/core/parser.py',2477),
+  ('dosm_comma_list -> dosm_comma_list COMMA test','dosm_comma_list',3,'p_dosm_comma_list2','enaml/core/parser.py',2482),
+  ('arglist -> argument','arglist',1,'p_arglist1','enaml/core/parser.py',2487),
+  ('arglist -> argument COMMA','arglist',2,'p_arglist2','enaml/core/parser.py',2495),
+  ('arglist -> STAR test','arglist',2,'p_arglist3','enaml/core/parser.py',2503),
+  ('arglist -> STAR test COMMA DOUBLESTAR test','arglist',5,'p_arglist4','enaml/core/parser.py',2508),
+  ('arglist -> DOUBLESTAR test','arglist',2,'p_arglist5','enaml/core/parser.py',2513),
+  ('arglist -> arglist_list argument','arglist',2,'p_arglist6','enaml/core/parser.py',2518),
+  ('arglist -> arglist_list argument COMMA','arglist',3,'p_arglist7','enaml/core/parser.py',2530),
+  ('arglist -> arglist_list STAR test','arglist',3,'p_arglist8','enaml/core/parser.py',2542),
+  ('arglist -> arglist_list STAR test COMMA DOUBLESTAR test','arglist',6,'p_arglist9','enaml/core/parser.py',2554),
+  ('arglist -> arglist_list DOUBLESTAR test','arglist',3,'p_arglist10','enaml/core/parser.py',2566),
+  ('arglist_list -> argument COMMA','arglist_list',2,'p_arglist_list1','enaml/core/parser.py',2578),
+  ('arglist_list -> arglist_list argument COMMA','arglist_list',3,'p_arglist_list2','enaml/core/parser.py',2583),
+  ('argument -> test','argument',1,'p_argument1','enaml/core/parser.py',2588),
+  ('argument -> test comp_for','argument',2,'p_argument2','enaml/core/parser.py',2593),
+  ('argument -> test EQUAL test','argument',3,'p_argument3','enaml/core/parser.py',2600),
+  ('list_for -> FOR exprlist IN testlist_safe','list_for',4,'p_list_for1','enaml/core/parser.py',2608),
+  ('list_for -> FOR exprlist IN testlist_safe list_iter','list_for',5,'p_list_for2','enaml/core/parser.py',2615),
+  ('list_iter -> list_for','list_iter',1,'p_list_iter1','enaml/core/parser.py',2629),
+  ('list_iter -> list_if','list_iter',1,'p_list_iter2','enaml/core/parser.py',2634),
+  ('list_if -> IF old_test','list_if',2,'p_list_if1','enaml/core/parser.py',2639),
+  ('list_if -> IF old_test list_iter','list_if',3,'p_list_if2','enaml/core/parser.py',2644),
+  ('comp_for -> FOR exprlist IN or_test','comp_for',4,'p_comp_for1','enaml/core/parser.py',2649),
+  ('comp_for -> FOR exprlist IN or_test comp_iter','comp_for',5,'p_comp_for2','enaml/core/parser.py',2656),
+  ('comp_iter -> comp_for','comp_iter',1,'p_comp_iter1','enaml/core/parser.py',2670),
+  ('comp_iter -> comp_if','comp_iter',1,'p_comp_iter2','enaml/core/parser.py',2675),
+  ('comp_if -> IF old_test','comp_if',2,'p_comp_if1','enaml/core/parser.py',2680),
+  ('comp_if -> IF old_test comp_iter','comp_if',3,'p_comp_if2','enaml/core/parser.py',2685),
+  ('testlist_safe -> old_test','testlist_safe',1,'p_testlist_safe1','enaml/core/parser.py',2690),
+  ('testlist_safe -> old_test testlist_safe_list','testlist_safe',2,'p_testlist_safe2','enaml/core/parser.py',2695),
+  ('testlist_safe -> old_test testlist_safe_list COMMA','testlist_safe',3,'p_testlist_safe3','enaml/core/parser.py',2701),
+  ('testlist_safe_list -> COMMA old_test','testlist_safe_list',2,'p_testlist_safe_list1','enaml/core/parser.py',2707),
+  ('testlist_safe_list -> testlist_safe_list COMMA old_test','testlist_safe_list',3,'p_testlist_safe_list2','enaml/core/parser.py',2712),
+  ('old_test -> or_test','old_test',1,'p_old_test1','enaml/core/parser.py',2717),
+  ('old_test -> old_lambdef','old_test',1,'p_old_test2','enaml/core/parser.py',2722),
+  ('old_lambdef -> LAMBDA COLON old_test','old_lambdef',3,'p_old_lambdef1','enaml/core/parser.py',2727),
+  ('old_lambdef -> LAMBDA varargslist COLON old_test','old_lambdef',4,'p_old_lambdef2','enaml/core/parser.py',2734),
+  ('lambdef -> LAMBDA COLON test','lambdef',3,'p_lambdef1','enaml/core/parser.py',2741),
+  ('lambdef -> LAMBDA varargslist COLON test','lambdef',4,'p_lambdef2','enaml/core/parser.py',2748),
+  ('varargslist -> fpdef COMMA STAR NAME','varargslist',4,'p_varargslist1','enaml/core/parser.py',2755),
+  ('varargslist -> fpdef COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',7,'p_varargslist2','enaml/core/parser.py',2762),
+  ('varargslist -> fpdef COMMA DOUBLESTAR NAME','varargslist',4,'p_varargslist3','enaml/core/parser.py',2769),
+  ('varargslist -> fpdef','varargslist',1,'p_varargslist4','enaml/core/parser.py',2776),
+  ('varargslist -> fpdef COMMA','varargslist',2,'p_varargslist5','enaml/core/parser.py',2783),
+  ('varargslist -> fpdef varargslist_list COMMA STAR NAME','varargslist',5,'p_varargslist6','enaml/core/parser.py',2790),
+  ('varargslist -> fpdef varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',8,'p_varargslist7','enaml/core/parser.py',2799),
+  ('varargslist -> fpdef varargslist_list COMMA DOUBLESTAR NAME','varargslist',5,'p_varargslist8','enaml/core/parser.py',2808),
+  ('varargslist -> fpdef varargslist_list','varargslist',2,'p_varargslist9','enaml/core/parser.py',2817),
+  ('varargslist -> fpdef varargslist_list COMMA','varargslist',3,'p_varargslist10','enaml/core/parser.py',2826),
+  ('varargslist -> fpdef EQUAL test COMMA STAR NAME','varargslist',6,'p_varargslist11','enaml/core/parser.py',2835),
+  ('varargslist -> fpdef EQUAL test COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',9,'p_varargslist12','enaml/core/parser.py',2842),
+  ('varargslist -> fpdef EQUAL test COMMA DOUBLESTAR NAME','varargslist',6,'p_varargslist13','enaml/core/parser.py',2849),
+  ('varargslist -> fpdef EQUAL test','varargslist',3,'p_varargslist14','enaml/core/parser.py',2856),
+  ('varargslist -> fpdef EQUAL test COMMA','varargslist',4,'p_varargslist15','enaml/core/parser.py',2863),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA STAR NAME','varargslist',7,'p_varargslist16','enaml/core/parser.py',2870),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',10,'p_varargslist17','enaml/core/parser.py',2883),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA DOUBLESTAR NAME','varargslist',7,'p_varargslist18','enaml/core/parser.py',2896),
+  ('varargslist -> fpdef EQUAL test varargslist_list','varargslist',4,'p_varargslist19','enaml/core/parser.py',2909),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA','varargslist',5,'p_varargslist20','enaml/core/parser.py',2922),
+  ('varargslist -> STAR NAME','varargslist',2,'p_varargslist21','enaml/core/parser.py',2935),
+  ('varargslist -> STAR NAME COMMA DOUBLESTAR NAME','varargslist',5,'p_varargslist22','enaml/core/parser.py',2941),
+  ('varargslist -> DOUBLESTAR NAME','varargslist',2,'p_varargslist23','enaml/core/parser.py',2947),
+  ('varargslist_list -> COMMA fpdef','varargslist_list',2,'p_varargslist_list1','enaml/core/parser.py',2954),
+  ('varargslist_list -> COMMA fpdef EQUAL test','varargslist_list',4,'p_varargslist_list2','enaml/core/parser.py',2959),
+  ('varargslist_list -> varargslist_list COMMA fpdef','varargslist_list',3,'p_varargslist_list3','enaml/core/parser.py',2964),
+  ('varargslist_list -> varargslist_list COMMA fpdef EQUAL test','varargslist_list',5,'p_varargslist_list4','enaml/core/parser.py',2975),
+  ('fpdef -> NAME','fpdef',1,'p_fpdef1','enaml/core/parser.py',2983),
+  ('fpdef -> LPAR fplist RPAR','fpdef',3,'p_fpdef2','enaml/core/parser.py',2988),
+  ('fplist -> fpdef','fplist',1,'p_fplist1','enaml/core/parser.py',2995),
+  ('fplist -> fpdef COMMA','fplist',2,'p_fplist2','enaml/core/parser.py',3000),
+  ('fplist -> fpdef fplist_list','fplist',2,'p_fplist3','enaml/core/parser.py',3008),
+  ('fplist -> fpdef fplist_list COMMA','fplist',3,'p_fplist4','enaml/core/parser.py',3017),
+  ('fplist_list -> COMMA fpdef','fplist_list',2,'p_fplist_list1','enaml/core/parser.py',3026),
+  ('fplist_list -> fplist_list COMMA fpdef','fplist_list',3,'p_fplist_list2','enaml/core/parser.py',3031),
 ]
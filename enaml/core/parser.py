@@ -571,6 +571,8 @@ def p_binding1(p):
     ''' binding : EQUAL test NEWLINE
                 | COLONEQUAL test NEWLINE
                 | LEFTSHIFT test NEWLINE
+                | LEFTSHIFTLESS test NEWLINE
+                | LEFTSHIFTCOLON test NEWLINE
                 | RIGHTSHIFT test NEWLINE '''
     lineno = p.lineno(1) 
     operator = translate_operator(p[1])
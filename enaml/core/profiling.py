@@ -0,0 +1,175 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import sys
+
+from . import expressions
+
+
+#------------------------------------------------------------------------------
+# Binding Stats
+#------------------------------------------------------------------------------
+class BindingStats(object):
+    """ The statistics collected by a BindingProfiler for a binding.
+
+    """
+    __slots__ = (
+        'filename', 'lineno', 'name', 'evals', 'notifications',
+        'total_time', 'max_time', 'changed', 'unchanged',
+    )
+
+    def __init__(self, filename, lineno, name):
+        """ Initialize a BindingStats.
+
+        Parameters
+        ----------
+        filename : string
+            The filename of the code of the bound expression.
+
+        lineno : int
+            The line number of the bound expression.
+
+        name : string
+            The name of the attribute to which the expression is bound.
+
+        """
+        self.filename = filename
+        self.lineno = lineno
+        self.name = name
+        self.evals = 0
+        self.notifications = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.changed = 0
+        self.unchanged = 0
+
+    @property
+    def changed_ratio(self):
+        """ The fraction of the reevaluations which produced a changed
+        value, or None if the expression was never reevaluated.
+
+        """
+        n = self.changed + self.unchanged
+        if n:
+            return float(self.changed) / n
+
+
+#------------------------------------------------------------------------------
+# Binding Profiler
+#------------------------------------------------------------------------------
+class BindingProfiler(object):
+    """ A profiler which collects the evaluation and notification counts
+    and times of bound expressions.
+
+    An instance is installed with 'enable_binding_profiler'. The stats
+    are keyed on the filename and line number of the expression and the
+    name of the attribute to which it is bound, so the stats of all of
+    the instances of a declaration are combined.
+
+    """
+    def __init__(self):
+        self.stats = {}
+
+    def get_stats(self, expr):
+        """ Returns the BindingStats for the given expression, creating
+        it if necessary.
+
+        """
+        code = expr.code
+        key = (code.co_filename, code.co_firstlineno, expr.name)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = BindingStats(*key)
+        return stats
+
+    def record_eval(self, expr, seconds):
+        """ Records an evaluation of the given expression which took
+        the given number of seconds.
+
+        """
+        stats = self.get_stats(expr)
+        stats.evals += 1
+        stats.total_time += seconds
+        if seconds > stats.max_time:
+            stats.max_time = seconds
+
+    def record_notify(self, expr, seconds):
+        """ Records a notification of the given expression which took
+        the given number of seconds.
+
+        """
+        stats = self.get_stats(expr)
+        stats.notifications += 1
+        stats.total_time += seconds
+        if seconds > stats.max_time:
+            stats.max_time = seconds
+
+    def record_change(self, expr, changed):
+        """ Records whether a reevaluation of the given expression
+        produced a changed value.
+
+        """
+        stats = self.get_stats(expr)
+        if changed:
+            stats.changed += 1
+        else:
+            stats.unchanged += 1
+
+    def report(self, stream=None, limit=None):
+        """ Writes a report of the collected stats, sorted by the total
+        time in descending order.
+
+        Parameters
+        ----------
+        stream : file-like object, optional
+            The stream to which to write the report. The default is
+            sys.stderr.
+
+        limit : int, optional
+            The maximum number of bindings to report. The default is
+            to report all of the bindings.
+
+        """
+        if stream is None:
+            stream = sys.stderr
+        stats = sorted(
+            self.stats.itervalues(), key=lambda s: s.total_time,
+            reverse=True,
+        )
+        if limit is not None:
+            stats = stats[:limit]
+        header = '%10s %10s %8s %8s %8s  %s\n'
+        row = '%10.3f %10.3f %8d %8d %8s  %s:%d (%s)\n'
+        stream.write(header % (
+            'total ms', 'max ms', 'evals', 'notifies', 'changed', 'binding',
+        ))
+        for s in stats:
+            ratio = s.changed_ratio
+            ratio = '-' if ratio is None else '%.0f%%' % (ratio * 100)
+            stream.write(row % (
+                s.total_time * 1000.0, s.max_time * 1000.0, s.evals,
+                s.notifications, ratio, s.filename, s.lineno, s.name,
+            ))
+
+
+def enable_binding_profiler():
+    """ Creates a BindingProfiler and installs it for all expressions.
+
+    Returns
+    -------
+    result : BindingProfiler
+        The installed profiler.
+
+    """
+    profiler = BindingProfiler()
+    expressions.set_binding_profiler(profiler)
+    return profiler
+
+
+def disable_binding_profiler():
+    """ Uninstalls the current BindingProfiler, if any.
+
+    """
+    expressions.set_binding_profiler(None)
+
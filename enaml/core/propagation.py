@@ -0,0 +1,128 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from heapq import heappush, heappop
+from itertools import count
+
+
+#------------------------------------------------------------------------------
+# Propagation Scheduler
+#------------------------------------------------------------------------------
+#: The nesting depth of the active propagations. While it is non-zero,
+#: the updates of expressions are deferred.
+_propagation_depth = 0
+
+
+#: The expressions which are waiting to be updated, keyed on their id.
+_pending = {}
+
+
+#: A heap of (rank, sequence, key) tuples for the pending expressions.
+#: The sequence number preserves the order of notification amongst the
+#: expressions of equal rank.
+_queue = []
+
+
+#: The counter which generates the sequence numbers of the heap.
+_sequence = count()
+
+
+#: The current epoch of the dependency graph of the expressions. It is
+#: incremented whenever the dependencies of an expression change, which
+#: invalidates the cached ranks of all expressions.
+_rank_epoch = 0
+
+
+def rank_epoch():
+    """ Returns the current epoch of the dependency graph.
+
+    """
+    return _rank_epoch
+
+
+def invalidate_ranks():
+    """ Invalidates the cached ranks of all expressions. This should be
+    called whenever the dependencies of an expression, or the expression
+    bound to an attribute, have changed.
+
+    """
+    global _rank_epoch
+    _rank_epoch += 1
+
+
+def defer_update(expr):
+    """ Defers the update of an expression until the end of the active
+    propagation.
+
+    Parameters
+    ----------
+    expr : object
+        The expression which was notified of a change. It must have
+        a 'reevaluate' method which takes no arguments, and may have a
+        'rank' method which returns its topological rank. Pending
+        expressions are updated in order of increasing rank. An
+        expression which is already pending is not added a second time.
+
+    Returns
+    -------
+    result : bool
+        True if the update was deferred, False if there is no active
+        propagation and the caller should update the expression
+        immediately.
+
+    """
+    if _propagation_depth == 0:
+        return False
+    key = id(expr)
+    if key not in _pending:
+        _pending[key] = expr
+        rank = getattr(expr, 'rank', None)
+        rank = rank() if rank is not None else 0
+        heappush(_queue, (rank, next(_sequence), key))
+    return True
+
+
+def begin_propagation():
+    """ Begins a propagation. Until the matching call to
+    'end_propagation', the updates of expressions are deferred.
+
+    """
+    global _propagation_depth
+    _propagation_depth += 1
+
+
+def end_propagation():
+    """ Ends a propagation. When the outermost propagation ends, the
+    pending expressions are updated in order of rank.
+
+    """
+    global _propagation_depth
+    _propagation_depth -= 1
+    if _propagation_depth == 0 and _queue:
+        _flush()
+
+
+def _flush():
+    """ Updates the pending expressions in order of rank. Changes made
+    by those updates are deferred and handled by the same flush, so an
+    expression is updated after every expression of lower rank, and so
+    sees no intermediate state of its dependencies.
+
+    """
+    global _propagation_depth
+    pending = _pending
+    queue = _queue
+    _propagation_depth += 1
+    try:
+        while queue:
+            rank, seq, key = heappop(queue)
+            expr = pending.pop(key)
+            expr.reevaluate()
+    except Exception:
+        pending.clear()
+        del queue[:]
+        raise
+    finally:
+        _propagation_depth -= 1
+
@@ -2,6 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from collections import OrderedDict
 from types import MethodType
 from weakref import ref, WeakKeyDictionary
 
@@ -86,6 +87,23 @@ class Signal(object):
         self._instances.pop(obj, None)
 
 
+def _callback_key(callback):
+    """ Returns the key which identifies a callback amongst the handlers
+    connected to a signal.
+
+    The key of a bound method is made from the id of the bound object
+    and the underlying function, so that two bound method objects for
+    the same object and function share a key. The key of any other 
+    callable is its id. The ids cannot be reused while the connection
+    is alive, since the connection is removed as soon as the object is
+    garbage collected.
+
+    """
+    if isinstance(callback, MethodType):
+        return (id(callback.im_self), callback.im_func)
+    return id(callback)
+
+
 class _Signal(object):
     """ A signal implementation object. Instance of this class are
     created as needed by the Signal descriptor. A single instance 
@@ -93,13 +111,18 @@ class _Signal(object):
     the Signal descriptor. This class manages the actual connected
     handlers for the object.
 
+    The connections are kept in an ordered dictionary keyed on the 
+    identity of their callbacks, so that connecting and disconnecting
+    take constant time, and the handlers are invoked in the order in
+    which they were connected.
+
     """
     __slots__ = ('_connections', '__weakref__')
     
     def __init__(self):
-        self._connections = []
+        self._connections = OrderedDict()
     
-    def _make_connection(self, callback):
+    def _make_connection(self, callback, key):
         """ A private method which creates an appropriate connection 
         object for the given callback.
 
@@ -108,6 +131,9 @@ class _Signal(object):
         callback : callable
             The callable object which will be called when the signal
             is emitted.
+
+        key : object
+            The key of the callback, as returned by '_callback_key'.
         
         Returns
         -------
@@ -117,14 +143,14 @@ class _Signal(object):
 
         """
         if isinstance(callback, MethodType):
-            connection = _MethodConnection(self, callback)
+            connection = _MethodConnection(self, callback, key)
         else:
-            connection = _DirectConnection(self, callback)
+            connection = _DirectConnection(self, callback, key)
         return connection
 
     def _connection_dead(self, conn):
         """ A private method which removes the connection object from
-        the internal list of connections when the connection has died.
+        the internal dict of connections when the connection has died.
 
         Parameters
         ----------
@@ -133,14 +159,17 @@ class _Signal(object):
 
         """
         connections = self._connections
-        if conn in connections:
-            connections.remove(conn)
+        key = conn._key
+        if connections.get(key) is conn:
+            del connections[key]
 
     def __call__(self, *args, **kwargs):
-        """ Emits the signal with the given arguments and keywords.
+        """ Emits the signal with the given arguments and keywords. The
+        handlers are invoked from a snapshot of the connections, so a
+        handler may safely connect or disconnect handlers.
 
         """
-        for conn in self._connections:
+        for conn in self._connections.values():
             conn(args, kwargs)
 
     def connect(self, callback):
@@ -160,10 +189,10 @@ class _Signal(object):
         """
         if not callable(callback):
             raise TypeError('Cannot connect a non-callable to a Signal')
-        conn = self._make_connection(callback)
+        key = _callback_key(callback)
         connections = self._connections
-        if conn not in connections:
-            connections.append(conn)
+        if key not in connections:
+            connections[key] = self._make_connection(callback, key)
     
     def disconnect(self, callback):
         """ Disconnects the given callback from the signal. If the 
@@ -179,8 +208,7 @@ class _Signal(object):
         """
         if not callable(callback):
             raise TypeError('Cannot disconnect a non-callable from a Signal')
-        conn = self._make_connection(callback)
-        self._connection_dead(conn)
+        self._connections.pop(_callback_key(callback), None)
 
 
 class _BaseConnection(object):
@@ -189,9 +217,9 @@ class _BaseConnection(object):
     be implemented by subclasses.
 
     """
-    __slots__ = ('_parent_ref', '_remove', '__weakref__')
+    __slots__ = ('_parent_ref', '_remove', '_key', '__weakref__')
 
-    def __init__(self, parent):
+    def __init__(self, parent, key):
         """ Initialize a _BaseConnection
 
         Parameters
@@ -200,15 +228,20 @@ class _BaseConnection(object):
             The _Signal instance which owns this connection. Only a
             weak reference is maintained to the _Signal.
 
+        key : object
+            The key of the connection in the connections of the
+            _Signal.
+
         """
         def remove(item, selfref=ref(self)):
             this = selfref()
             if this is not None:
-                parent = self._parent_ref()
+                parent = this._parent_ref()
                 if parent is not None:
                     parent._connection_dead(this)
         self._parent_ref = ref(parent)
         self._remove = remove
+        self._key = key
     
     def __call__(self, args, kwargs):
         """ Invokes the underlying callable with the given arguments
@@ -216,22 +249,6 @@ class _BaseConnection(object):
 
         """
         raise NotImplementedError
-    
-    def __hash__(self):
-        """ Computes the hash of the underlying callable. Two different
-        connection instances with the same underlying callable should
-        hash the same.
-
-        """
-        raise NotImplementedError
-    
-    def __eq__(self, other):
-        """ Performs equality comparison. Two different connection
-        instances with the same underlying callable should compare
-        equally.
-
-        """
-        raise NotImplementedError
 
 
 class _DirectConnection(_BaseConnection):
@@ -241,7 +258,7 @@ class _DirectConnection(_BaseConnection):
     """
     __slots__ = ('_callback_ref',)
 
-    def __init__(self, parent, callback):
+    def __init__(self, parent, callback, key):
         """ Initialize a _DirectConnection
 
         Parameters
@@ -254,8 +271,12 @@ class _DirectConnection(_BaseConnection):
             The callable to which the connection should be made. 
             Only a direct weak reference to the callable is kept.
 
+        key : object
+            The key of the connection in the connections of the
+            _Signal.
+
         """
-        super(_DirectConnection, self).__init__(parent)
+        super(_DirectConnection, self).__init__(parent, key)
         self._callback_ref = ref(callback, self._remove)
 
     def __call__(self, args, kwargs):
@@ -266,24 +287,6 @@ class _DirectConnection(_BaseConnection):
         callback = self._callback_ref()
         if callback is not None:
             callback(*args, **kwargs)
-
-    def __hash__(self):
-        """ Computes and returns the hash of the weak reference to the
-        underlying callable.
-
-        """
-        return hash(self._callback_ref)
-    
-    def __eq__(self, other):
-        """ Performs equality comparison. If comparing against another
-        instance of _DirectionConnection, the comparison is made between
-        the weak references to the underlying callables. Otherwise, this
-        method will return False.
-
-        """
-        if isinstance(other, _DirectConnection):
-            return self._callback_ref == other._callback_ref
-        return False
     
 
 class _MethodConnection(_BaseConnection):
@@ -293,7 +296,7 @@ class _MethodConnection(_BaseConnection):
     """
     __slots__ = ('_im_func', '_im_self_ref', '_im_class',)
 
-    def __init__(self, parent, method):
+    def __init__(self, parent, method, key):
         """ Initialize a _MethodConnection
 
         Parameters
@@ -309,8 +312,12 @@ class _MethodConnection(_BaseConnection):
             of the bound object. Only a weak reference to that object
             is kept.
 
+        key : object
+            The key of the connection in the connections of the
+            _Signal.
+
         """
-        super(_MethodConnection, self).__init__(parent)
+        super(_MethodConnection, self).__init__(parent, key)
         self._im_func = method.im_func
         self._im_self_ref = ref(method.im_self, self._remove)
         self._im_class = method.im_class
@@ -324,24 +331,4 @@ class _MethodConnection(_BaseConnection):
         if im_self is not None:
             method = MethodType(self._im_func, im_self, self._im_class)
             method(*args, **kwargs)
-    
-    def __hash__(self):
-        """ Computes and returns a hash of the consituent components
-        of the underlying method.
-
-        """
-        return hash((self._im_func, self._im_self_ref, self._im_class))
-
-    def __eq__(self, other):
-        """ Performs equality comparison. If comparing against another
-        instance of _MethodConnection, the comparison is made between
-        the constituent components of the bound method. Otherwise, this
-        method will return False.
-
-        """
-        if isinstance(other, _MethodConnection):
-            return (self._im_func == other._im_func and
-                    self._im_self_ref == other._im_self_ref and
-                    self._im_class == other._im_class)
-        return False
 
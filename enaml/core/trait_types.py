@@ -570,3 +570,52 @@ class EnamlWidgetInstance(BaseInstance):
         value.setup(obj.toolkit_widget)
         return value
 
+
+
+#------------------------------------------------------------------------------
+# Shared Dict
+#------------------------------------------------------------------------------
+class FrozenDict(dict):
+    """ A dict subclass whose items cannot be changed.
+
+    """
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('%s is immutable' % type(self).__name__)
+
+    __setitem__ = __delitem__ = _immutable
+
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+#: The empty dict which is shared as the default value of SharedDict.
+EMPTY_DICT = FrozenDict()
+
+
+class SharedDict(TraitType):
+    """ A trait for a dict which is shared and empty until a dict is
+    assigned to it.
+
+    A Dict trait creates a new dict for each object the first time the
+    trait is accessed. The default value of this trait is EMPTY_DICT,
+    which is shared by all of the objects and cannot be changed. Code
+    which adds items must first assign a new dict to the trait. It is
+    used for the private dicts which are empty for most objects.
+
+    """
+    default_value = EMPTY_DICT
+
+    info_text = 'a dict'
+
+    def get_default_value(self):
+        """ Returns the shared empty dict as a constant default value.
+
+        """
+        return (0, EMPTY_DICT)
+
+    def validate(self, obj, name, value):
+        """ Validates that the value is a dict.
+
+        """
+        if isinstance(value, dict):
+            return value
+        self.error(obj, name, value)
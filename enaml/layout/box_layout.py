@@ -0,0 +1,617 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A layout engine for pure trees of hbox and vbox helpers.
+
+A box tree whose leaves are only constrained by their size hints has a
+solution which can be computed directly, without a simplex solver. In
+each dimension, the cost of a node as a function of its size is convex
+and piecewise linear, where the slope of each piece is the lexicographic
+(strong, medium, weak) cost per pixel of the constraints which are
+violated by growing or shrinking the node. The cost of a box is the
+sum of the costs of its items along its orientation, and the pointwise
+sum of the costs of its items across its orientation, where the flexible
+margin spacers cap the cost of growing an item. The size of the layout
+is then found by walking the cost of the root from its minimum towards
+the suggested size, and the sizes are handed down the tree in the same
+way.
+
+The solution is the one which the constraints of the box helpers have
+in a casuarius solver. Where the constraints do not determine a single
+solution, such as when two items hug their size with the same strength,
+the extra space goes to the last of the items and an item which is
+narrower than its box is placed at the leading edge of the box.
+
+"""
+from casuarius import medium
+
+from ..guard import guard
+
+
+#: The infinite length of the last piece of a cost.
+INF = float('inf')
+
+#: The slope of a cost which does not change.
+ZERO = (0.0, 0.0, 0.0)
+
+#: The index in a slope of each strength of the constraints.
+STRENGTH_INDEX = {'strong': 0, 'medium': 1, 'weak': 2}
+
+#: The slope of the cost of the flexible spacers of the margins of a
+#: box, which are medium constraints with a weight of 1.25.
+FLEX_SLOPE = (0.0, 1.25, 0.0)
+
+
+def policy_slope(policy, weight=1.0):
+    """ Returns the slope of the cost of a size hint policy.
+
+    Parameters
+    ----------
+    policy : str
+        The policy, one of 'ignore', 'weak', 'medium' or 'strong'. A
+        'required' policy is a hard bound rather than a cost.
+
+    weight : float, optional
+        The weight of the constraint of the policy. The default is 1.0.
+
+    Returns
+    -------
+    result : tuple
+        The (strong, medium, weak) cost per pixel of violating the
+        constraint of the policy.
+
+    """
+    if policy == 'ignore':
+        return ZERO
+    slope = [0.0, 0.0, 0.0]
+    slope[STRENGTH_INDEX[policy]] = weight
+    return tuple(slope)
+
+
+def add_slopes(first, second):
+    """ Returns the sum of two slopes.
+
+    """
+    return (
+        first[0] + second[0], first[1] + second[1], first[2] + second[2],
+    )
+
+
+#------------------------------------------------------------------------------
+# Box Tree
+#------------------------------------------------------------------------------
+class BoxItem(object):
+    """ A leaf of a box tree, which is a component laid out from its
+    size hint.
+
+    """
+    def __init__(self, component, size_hint, hug, resist_clip):
+        """ Initialize a BoxItem.
+
+        Parameters
+        ----------
+        component : object
+            The component which is laid out by the item. It is handed
+            back to the callback of the layout with its geometry.
+
+        size_hint : (int, int)
+            The (width, height) size hint of the component. A negative
+            value means that there is no size hint in that dimension.
+
+        hug : (str, str)
+            The (width, height) hug policies of the component.
+
+        resist_clip : (str, str)
+            The (width, height) resist clip policies of the component.
+
+        """
+        self.component = component
+        self.size_hint = tuple(size_hint)
+        self.hug = tuple(hug)
+        self.resist_clip = tuple(resist_clip)
+
+
+class BoxGroup(object):
+    """ A node of a box tree, which lays out its items like the hbox
+    and vbox layout helpers.
+
+    """
+    def __init__(self, orientation, items, spacing, margins):
+        """ Initialize a BoxGroup.
+
+        Parameters
+        ----------
+        orientation : str
+            Either 'horizontal' or 'vertical'.
+
+        items : list
+            The non-empty list of the BoxItem and BoxGroup instances in
+            the box.
+
+        spacing : int
+            The space between adjacent items.
+
+        margins : Box
+            The margins of the box.
+
+        """
+        self.orientation = orientation
+        self.items = items
+        self.spacing = spacing
+        self.margins = margins
+
+
+#------------------------------------------------------------------------------
+# Costs
+#------------------------------------------------------------------------------
+class SizeCost(object):
+    """ The convex piecewise linear cost of the size of a node of a box
+    tree in one dimension.
+
+    """
+    def __init__(self, lo, hi, x0, shrink, grow):
+        """ Initialize a SizeCost.
+
+        Parameters
+        ----------
+        lo : float
+            The minimum size of the node.
+
+        hi : float
+            The maximum size of the node, which may be infinite.
+
+        x0 : float
+            The smallest size of the node with the minimum cost.
+
+        shrink : list of (float, tuple)
+            The (length, slope) pieces of the cost from 'x0' down to
+            'lo', in order of increasing slope.
+
+        grow : list of (float, tuple)
+            The (length, slope) pieces of the cost from 'x0' up to
+            'hi', in order of increasing slope.
+
+        """
+        self.lo = lo
+        self.hi = hi
+        self.x0 = x0
+        self.shrink = shrink
+        self.grow = grow
+
+    def walk(self, size, slope):
+        """ Returns the size which minimizes the cost plus the cost of
+        the distance from the given size.
+
+        Parameters
+        ----------
+        size : float
+            The suggested size.
+
+        slope : tuple or None
+            The cost per pixel of the distance from the suggested size,
+            or None if the suggested size is required.
+
+        Returns
+        -------
+        result : float
+            The size with the minimum total cost. When a range of sizes
+            have the minimum cost, the one which is closest to the
+            suggested size is returned.
+
+        """
+        if slope is None:
+            return min(max(size, self.lo), self.hi)
+        res = self.x0
+        if size > res:
+            pieces = self.grow
+            delta = size - res
+            sign = 1
+        else:
+            pieces = self.shrink
+            delta = res - size
+            sign = -1
+        for length, piece_slope in pieces:
+            if delta <= 0 or piece_slope > slope:
+                break
+            step = min(length, delta)
+            res += sign * step
+            delta -= step
+        return res
+
+
+def leaf_cost(hint, hug, resist_clip):
+    """ Returns the SizeCost of a leaf in one dimension.
+
+    """
+    if hint < 0 or (hug == 'ignore' and resist_clip == 'ignore'):
+        return SizeCost(0.0, INF, 0.0, [], [(INF, ZERO)])
+    lo = 0.0
+    hi = INF
+    if hug == 'required':
+        lo = hi = hint
+    if resist_clip == 'required':
+        lo = max(lo, hint)
+    shrink = []
+    if lo < hint:
+        slope = add_slopes(policy_slope(hug), policy_slope(resist_clip))
+        shrink.append((hint - lo, slope))
+    grow = []
+    if hi > hint:
+        grow.append((INF, policy_slope(hug)))
+    return SizeCost(lo, hi, float(hint), shrink, grow)
+
+
+def along_cost(costs, fixed):
+    """ Returns the SizeCost of a box along its orientation, and the
+    pieces of the costs of its items in the order in which they are
+    taken to shrink and grow the box.
+
+    The size of the box is the sum of the sizes of its items plus the
+    fixed space of the margins and the spacing. The pieces of equal
+    slope are taken from the last item first.
+
+    """
+    lo = hi = x0 = fixed
+    shrink = []
+    grow = []
+    for idx, cost in enumerate(costs):
+        lo += cost.lo
+        hi += cost.hi
+        x0 += cost.x0
+        shrink.extend((slope, -idx, length) for length, slope in cost.shrink)
+        grow.extend((slope, -idx, length) for length, slope in cost.grow)
+    shrink.sort()
+    grow.sort()
+    # The pieces after the first infinite piece can never be reached.
+    for idx, piece in enumerate(grow):
+        if piece[2] == INF:
+            del grow[idx + 1:]
+            break
+    cost = SizeCost(
+        lo, hi, x0,
+        [(length, slope) for slope, idx, length in shrink],
+        [(length, slope) for slope, idx, length in grow],
+    )
+    return cost, shrink, grow
+
+
+def capped_grow(cost):
+    """ Returns the pieces of the cost of growing an item across a box,
+    where the item stops growing once it is cheaper to leave the space
+    to the flexible spacers of the margins.
+
+    An item which costs as much to grow as the spacers is grown, so that
+    the space of a nested box is given to the spacers inside of it.
+
+    """
+    grow = []
+    for length, slope in cost.grow:
+        if slope > FLEX_SLOPE:
+            break
+        grow.append((length, slope))
+        if length == INF:
+            break
+    if not grow or grow[-1][0] != INF:
+        grow.append((INF, FLEX_SLOPE))
+    return grow
+
+
+def across_cost(costs, fixed):
+    """ Returns the SizeCost of a box across its orientation.
+
+    Every item has the size of the box less the fixed space of the
+    margins, or is smaller than it and leaves the space to the margin
+    spacers, so the cost of the box is the pointwise sum of the capped
+    costs of the items.
+
+    """
+    # The cost is found by a sweep over the points at which the slope
+    # of the cost of an item changes.
+    lo = max(cost.lo for cost in costs)
+    events = []
+    for cost in costs:
+        pos = cost.lo
+        prev = ZERO
+        pieces = [(length, tuple(-s for s in slope))
+                  for length, slope in reversed(cost.shrink)]
+        pieces.extend(capped_grow(cost))
+        for length, slope in pieces:
+            if length <= 0:
+                continue
+            delta = tuple(s - p for s, p in zip(slope, prev))
+            events.append((pos, delta))
+            prev = slope
+            pos += length
+            if pos == INF:
+                break
+    events.sort()
+
+    slope = ZERO
+    idx = 0
+    n_events = len(events)
+    while idx < n_events and events[idx][0] <= lo:
+        slope = add_slopes(slope, events[idx][1])
+        idx += 1
+    pieces = []
+    pos = lo
+    while idx < n_events:
+        end, delta = events[idx]
+        if end > pos:
+            pieces.append((pos, end, slope))
+            pos = end
+        slope = add_slopes(slope, delta)
+        idx += 1
+    pieces.append((pos, INF, slope))
+
+    x0 = None
+    shrink = []
+    grow = []
+    for start, end, slope in pieces:
+        if x0 is None and slope < ZERO:
+            shrink.append((end - start, tuple(-s for s in slope)))
+            continue
+        if x0 is None:
+            x0 = start
+        grow.append((end - start, slope))
+    shrink.reverse()
+    return SizeCost(lo + fixed, INF, x0 + fixed, shrink, grow)
+
+
+#------------------------------------------------------------------------------
+# Box Layout
+#------------------------------------------------------------------------------
+class BoxLayout(object):
+    """ A layout engine which computes the geometry of a pure tree of
+    box helpers directly from the size hints and policies of its leaves.
+
+    It provides the layout, min size and max size of a ConstraintsLayout.
+    The costs of the tree are computed once when it is initialized, and
+    each layout is then linear in the size of the tree.
+
+    """
+    #: The internal flag indicating if the layout is initialized.
+    _initialized = False
+
+    #: The root BoxGroup of the layout.
+    _root = None
+
+    #: The (top, right, bottom, left) padding around the root box.
+    _padding = None
+
+    #: The internal list of the BoxItem leaves of the tree, in order.
+    _leaves = None
+
+    #: The internal dict which maps the id of each node of the tree to
+    #: the (width, height) tuple of its SizeCost instances.
+    _costs = None
+
+    #: The internal dict which maps the id of each BoxGroup to the
+    #: (shrink, grow) pieces of its items along its orientation.
+    _pieces = None
+
+    @property
+    def initialized(self):
+        """ A read-only property which returns whether or not this
+        layout has been initialized.
+
+        """
+        return self._initialized
+
+    def initialize(self, root, padding):
+        """ Initializes the layout for a box tree.
+
+        Parameters
+        ----------
+        root : BoxGroup
+            The root box of the tree.
+
+        padding : Box
+            The padding between the container and the root box.
+
+        """
+        self._root = root
+        self._padding = tuple(padding)
+        self._leaves = []
+        self._costs = {}
+        self._pieces = {}
+        self._compute_costs(root)
+        self._initialized = True
+
+    def _compute_costs(self, node):
+        """ Computes the costs of a node and of all of the nodes below
+        it, and returns the (width, height) costs of the node.
+
+        """
+        if isinstance(node, BoxItem):
+            costs = tuple(
+                leaf_cost(*args) for args in
+                zip(node.size_hint, node.hug, node.resist_clip)
+            )
+            self._costs[id(node)] = costs
+            self._leaves.append(node)
+            return costs
+
+        child_costs = [self._compute_costs(item) for item in node.items]
+        top, right, bottom, left = node.margins
+        along_fixed = node.spacing * (len(node.items) - 1)
+        if node.orientation == 'horizontal':
+            along, across = 0, 1
+            along_fixed += left + right
+            across_fixed = top + bottom
+        else:
+            along, across = 1, 0
+            along_fixed += top + bottom
+            across_fixed = left + right
+        costs = [None, None]
+        costs[along], shrink, grow = along_cost(
+            [c[along] for c in child_costs], along_fixed,
+        )
+        costs[across] = across_cost(
+            [c[across] for c in child_costs], across_fixed,
+        )
+        costs = tuple(costs)
+        self._costs[id(node)] = costs
+        self._pieces[id(node)] = (shrink, grow)
+        return costs
+
+    def _solve(self, size, strength, weight):
+        """ Returns the (width, height) of the root box which best
+        satisfies its constraints and the suggested size.
+
+        """
+        if strength.name == 'required':
+            slope = None
+        else:
+            slope = policy_slope(strength.name, weight)
+        top, right, bottom, left = self._padding
+        width, height = self._costs[id(self._root)]
+        return (
+            width.walk(size[0] - left - right, slope),
+            height.walk(size[1] - top - bottom, slope),
+        )
+
+    def _place(self, node, dim, pos, size, geometry):
+        """ Places a node with the given position and size in a
+        dimension, and stores the [pos, size] of the leaves below it
+        in the geometry dict, keyed on the ids of the leaves.
+
+        """
+        if isinstance(node, BoxItem):
+            geometry[id(node)][dim] = pos
+            geometry[id(node)][dim + 2] = size
+            return
+
+        top, right, bottom, left = node.margins
+        items = node.items
+        costs = [self._costs[id(item)][dim] for item in items]
+        along = 0 if node.orientation == 'horizontal' else 1
+        first = left if dim == 0 else top
+        if dim == along:
+            # The items are stacked, and their sizes are taken from
+            # their minimum cost in the order of the pieces of the box.
+            sizes = [cost.x0 for cost in costs]
+            delta = size - self._costs[id(node)][dim].x0
+            shrink, grow = self._pieces[id(node)]
+            if delta > 0:
+                pieces = grow
+                sign = 1
+            else:
+                pieces = shrink
+                sign = -1
+                delta = -delta
+            for slope, neg_idx, length in pieces:
+                if delta <= 0:
+                    break
+                step = min(length, delta)
+                sizes[-neg_idx] += sign * step
+                delta -= step
+            pos += first
+            spacing = node.spacing
+            for item, item_size in zip(items, sizes):
+                self._place(item, dim, pos, item_size, geometry)
+                pos += item_size + spacing
+        else:
+            # Every item is as large as the box less the margins, or is
+            # smaller and placed at the leading edge of the box.
+            last = right if dim == 0 else bottom
+            inner = size - first - last
+            pos += first
+            for item, cost in zip(items, costs):
+                item_size = inner
+                if inner > cost.x0:
+                    item_size = cost.x0
+                    delta = inner - cost.x0
+                    for length, slope in cost.grow:
+                        if delta <= 0 or slope > FLEX_SLOPE:
+                            break
+                        step = min(length, delta)
+                        item_size += step
+                        delta -= step
+                self._place(item, dim, pos, item_size, geometry)
+
+    def layout(self, cb, size, strength=medium, weight=1.0):
+        """ Compute the geometry of the leaves of the tree for the new
+        size of the container.
+
+        Parameters
+        ----------
+        cb : callable
+            A callback which is called with the list of the (component,
+            x, y, width, height) geometry of the leaves of the tree, in
+            the order of the leaves in the tree.
+
+        size : (int, int)
+            The (width, height) size tuple which is the current size
+            of the main layout container.
+
+        strength : casuarius strength, optional
+            The strength with which to perform the layout using the
+            current size of the container. i.e. the strength of the
+            resize. The default is casuarius.medium.
+
+        weight : float, optional
+            The weight to apply to the strength. The default is 1.0
+
+        """
+        if not self._initialized:
+            raise RuntimeError('Layout with uninitialized box layout')
+
+        if not guard.guarded(self, 'layout'):
+            with guard(self, 'layout'):
+                width, height = self._solve(size, strength, weight)
+                top, right, bottom, left = self._padding
+                leaves = self._leaves
+                geometry = dict((id(leaf), [0, 0, 0, 0]) for leaf in leaves)
+                root = self._root
+                self._place(root, 0, left, width, geometry)
+                self._place(root, 1, top, height, geometry)
+                res = [
+                    (leaf.component,) + tuple(geometry[id(leaf)])
+                    for leaf in leaves
+                ]
+                cb(res)
+
+    def get_min_size(self, strength=medium, weight=0.1):
+        """ Compute the minimum size of the container which satisfies
+        the constraints of the tree, like the 'get_min_size' method of
+        ConstraintsLayout.
+
+        Returns
+        -------
+        result : (float, float)
+            The floating point (min_width, min_height) size of the
+            container.
+
+        """
+        if not self._initialized:
+            raise RuntimeError('Get min size on uninitialized box layout')
+        width, height = self._solve((0.0, 0.0), strength, weight)
+        top, right, bottom, left = self._padding
+        return (width + left + right, height + top + bottom)
+
+    def get_max_size(self, strength=medium, weight=0.1):
+        """ Compute the maximum size of the container which satisfies
+        the constraints of the tree, like the 'get_max_size' method of
+        ConstraintsLayout. A size of -1 indicates that there is no
+        maximum in that direction.
+
+        Returns
+        -------
+        result : (float or -1, float or -1)
+            The floating point (max_width, max_height) size of the
+            container.
+
+        """
+        if not self._initialized:
+            raise RuntimeError('Get max size on uninitialized box layout')
+        max_val = 2**24 - 1 # Arbitrary, but the max allowed by Qt.
+        width, height = self._solve((max_val, max_val), strength, weight)
+        top, right, bottom, left = self._padding
+        max_width = width + left + right
+        max_height = height + top + bottom
+        if abs(max_val - int(round(max_width))) <= 1:
+            max_width = -1
+        if abs(max_val - int(round(max_height))) <= 1:
+            max_height = -1
+        return (max_width, max_height)
@@ -75,10 +75,24 @@ class Constrainable(HasStrictTraits):
     #--------------------------------------------------------------------------
     # Change Handlers
     #--------------------------------------------------------------------------
-    @on_trait_change('constraints, constraints_items')
+    def _constraints_changed(self):
+        """ The change handler for the 'constraints' attribute.
+
+        """
+        self._on_constrainable_deps_changed()
+
+    def _constraints_items_changed(self):
+        """ The change handler for the items of the 'constraints'
+        attribute.
+
+        """
+        self._on_constrainable_deps_changed()
+
     def _on_constrainable_deps_changed(self):
-        """ A change handler which requests a relayout when the constraints
-        change, provided that the component is initialized.
+        """ Requests a relayout when the constraints change, provided
+        that the component is initialized. The change handlers which
+        call this method are static handlers, since a decorated handler
+        allocates its listeners for every component.
 
         """
         if self.initialized:
@@ -255,17 +269,25 @@ class PaddingConstraints(Constrainable):
     #--------------------------------------------------------------------------
     # Constraint Handling
     #--------------------------------------------------------------------------
+    def compute_padding(self):
+        """ Returns the Box of the padding which is enforced by the
+        padding constraints. The default implementation returns the
+        value of the 'padding' attribute.
+
+        """
+        return self.padding
+
     def padding_constraints(self):
         """ Returns the list of symbolic constraints for the padding of 
         the component. These constraints apply to the internal layout 
         calculations of an object. The default implementation constrains 
-        the padding according the values in the 'padding' attribute and
-        the strengths in 'padding_strength' attribute. It also places a 
-        required constraint >= 0 on every padding element.
+        the padding according the values returned by 'compute_padding'
+        and the strengths in 'padding_strength' attribute. It also places
+        a required constraint >= 0 on every padding element.
 
         """
         cns = []
-        padding = self.padding
+        padding = self.compute_padding()
         tags = ('top', 'right', 'bottom', 'left')
         strengths = self.padding_strength
         if isinstance(strengths, basestring):
@@ -2,22 +2,111 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from casuarius import Solver, medium
+from collections import defaultdict
+from contextlib import contextmanager
 
+from casuarius import CassowaryError, medium
+
+from .partitioning import (
+    SolverPartition, constraint_variables, partition_constraints,
+)
 from ..guard import guard
 
 
+@contextmanager
+def nested_contexts(contexts):
+    """ A context manager which enters the given context managers in
+    order and exits them in reverse order.
+
+    """
+    if not contexts:
+        yield
+    else:
+        with contexts[0]:
+            with nested_contexts(contexts[1:]):
+                yield
+
+
+def constraint_key(cn):
+    """ Returns a hashable key for a constraint, such that two
+    constraints have the same key if they are equivalent.
+
+    The constraints which are computed for a component are new objects
+    each time they are computed, so they are compared by the variables,
+    coefficients and constant of the expression 'lhs - rhs', and by the
+    operator, strength and weight of the constraint. The variables are
+    compared by identity, since comparing them with '==' creates a new
+    constraint.
+
+    Parameters
+    ----------
+    cn : LinearConstraint
+        The casuarius constraint for which to compute the key.
+
+    Returns
+    -------
+    result : tuple
+        The hashable key of the constraint.
+
+    """
+    # The sides are reduced by hand, since subtracting them with the
+    # casuarius expressions is far more expensive.
+    lhs = cn.lhs
+    rhs = cn.rhs
+    coeffs = {}
+    for term in lhs.terms:
+        key = id(term.var)
+        coeffs[key] = coeffs.get(key, 0.0) + term.coeff
+    for term in rhs.terms:
+        key = id(term.var)
+        coeffs[key] = coeffs.get(key, 0.0) - term.coeff
+    terms = tuple(sorted(item for item in coeffs.iteritems() if item[1]))
+    constant = lhs.constant - rhs.constant
+    return (cn.op, terms, constant, repr(cn.strength), cn.weight)
+
+
 class ConstraintsLayout(object):
-    """ A class which uses a casuarius solver to manage a system 
+    """ A class which uses casuarius solvers to manage a system
     of constraints.
 
-    """ 
-    #: The internal Casuarius solver instance to use for this layout.
-    _solver = None
+    The constraints are partitioned into groups which share no
+    variables, such as the constraints of sibling containers which
+    never refer to each other, and each group is given its own solver.
+    A change of the constraints only resolves the solvers of the groups
+    which it touches.
+
+    """
+    #: The internal list of the SolverPartition instances of the layout.
+    _partitions = None
+
+    #: The internal dict which maps the id of each variable of the
+    #: layout to the partition which contains it.
+    _var_partitions = None
+
+    #: The internal dict which maps the id of each constraint of the
+    #: layout to the partition which contains it.
+    _cn_partitions = None
 
     #: The internal flag indicating if the solver is initialized
     _initialized = False
 
+    #: The internal dict which maps the key of each constraint in the
+    #: solver to the list of the constraints with that key.
+    _constraints = None
+
+    #: The internal dict of the results of 'get_min_size' and
+    #: 'get_max_size', keyed on the arguments. It is cleared whenever
+    #: the constraints in the solver change.
+    _size_cache = None
+
+    #: The number of calls to 'get_min_size' and 'get_max_size' which
+    #: were answered from the cache.
+    size_cache_hits = 0
+
+    #: The number of calls to 'get_min_size' and 'get_max_size' which
+    #: ran an iteration of the solver.
+    size_cache_misses = 0
+
     @property
     def initialized(self):
         """ A read-only property which returns whether or not this solver
@@ -39,16 +128,66 @@ class ConstraintsLayout(object):
 
         """
         self._initialized = False
-        self._solver = solver = Solver(autosolve=False)
-        for cn in constraints:
-            solver.add_constraint(cn)
-        solver.autosolve = True
+        self._size_cache = {}
+        self._partitions = []
+        self._var_partitions = {}
+        self._cn_partitions = {}
+        self._constraints = added = defaultdict(list)
+        for cns in partition_constraints(constraints):
+            partition = self._new_partition()
+            for cn in cns:
+                self._add_to_partition(partition, cn, constraint_variables(cn))
+                added[constraint_key(cn)].append(cn)
+            partition.solver.autosolve = True
         self._initialized = True
 
+    def replace_constraints(self, constraints):
+        """ Replaces the constraints in the solver with the given
+        constraints.
+
+        The given constraints are compared to the constraints in the
+        solver with 'constraint_key', so that only the constraints
+        which were removed or added are passed to 'update_constraints'.
+        The solver is initialized from scratch if it has not yet been
+        initialized, or if the update fails.
+
+        Parameters
+        ----------
+        constraints : Iterable
+            An iterable that yields the new constraints of the layout.
+
+        """
+        constraints = list(constraints)
+        if not self._initialized:
+            self.initialize(constraints)
+            return
+
+        new = defaultdict(list)
+        for cn in constraints:
+            new[constraint_key(cn)].append(cn)
+
+        # The solver can only remove the constraint objects which were
+        # added to it, so the old objects of the unchanged constraints
+        # are left in the solver and the new objects are discarded.
+        old = self._constraints
+        old_cns = []
+        new_cns = []
+        for key, cns in old.iteritems():
+            old_cns.extend(cns[len(new.get(key, ())):])
+        for key, cns in new.iteritems():
+            new_cns.extend(cns[len(old.get(key, ())):])
+
+        if old_cns or new_cns:
+            try:
+                self.update_constraints(old_cns, new_cns)
+            except CassowaryError:
+                self.initialize(constraints)
+
     def update_constraints(self, old_cns, new_cns):
-        """ Re-run the initialization routine to build a new solver with
-        updated constraints. This should typically only be called when 
-        the user constraints are updated.
+        """ Removes the old constraints from the solver and adds the
+        new constraints to it. An old constraint may be an equivalent
+        constraint rather than the object in the solver. This should
+        typically only be called when the user constraints are updated.
 
         Parameters
         ----------
@@ -62,13 +201,133 @@ class ConstraintsLayout(object):
         if not self._initialized:
             raise RuntimeError('Update constraints on uninitialized solver')
 
-        solver = self._solver
-        solver.autosolve = False
+        added = self._constraints
+        self._size_cache.clear()
+
+        # The solvers of the touched partitions are not resolved until
+        # all of the constraints have been updated.
+        touched = set()
+        def touch(partition):
+            if partition not in touched:
+                partition.solver.autosolve = False
+                touched.add(partition)
+
         for cn in old_cns:
-            solver.remove_constraint(cn)
+            # A constraint which is equivalent to a constraint in the
+            # solver removes that constraint.
+            key = constraint_key(cn)
+            cns = added.get(key)
+            if not cns:
+                msg = 'Tried to remove a constraint that was never added'
+                raise CassowaryError(msg)
+            idx = 0
+            for other_idx, other in enumerate(cns):
+                if other is cn:
+                    idx = other_idx
+                    break
+            cn = cns.pop(idx)
+            if not cns:
+                del added[key]
+            partition = self._cn_partitions.pop(id(cn))
+            touch(partition)
+            partition.remove_constraint(cn)
+
         for cn in new_cns:
-            solver.add_constraint(cn)
-        solver.autosolve = True
+            # A constraint which joins partitions merges them into a
+            # new partition.
+            partitions = []
+            variables = constraint_variables(cn)
+            for var in variables:
+                partition = self._var_partitions.get(id(var))
+                if partition is not None and partition not in partitions:
+                    partitions.append(partition)
+            if len(partitions) == 1:
+                partition = partitions[0]
+            elif partitions:
+                partition = self._merge_partitions(partitions)
+            else:
+                partition = self._new_partition()
+            touch(partition)
+            self._add_to_partition(partition, cn, variables)
+            added[constraint_key(cn)].append(cn)
+
+        for partition in touched:
+            if partition not in self._partitions:
+                continue
+            if partition.constraints:
+                partition.solver.autosolve = True
+            else:
+                self._remove_partition(partition)
+
+    def _new_partition(self):
+        """ Creates a new empty partition for the layout.
+
+        """
+        partition = SolverPartition()
+        self._partitions.append(partition)
+        return partition
+
+    def _add_to_partition(self, partition, cn, variables):
+        """ Adds a constraint with the given variables to a partition
+        of the layout.
+
+        """
+        partition.add_constraint(cn, variables)
+        self._cn_partitions[id(cn)] = partition
+        var_partitions = self._var_partitions
+        for var in variables:
+            var_partitions[id(var)] = partition
+
+    def _remove_partition(self, partition):
+        """ Removes a partition and its variables from the layout.
+
+        """
+        self._partitions.remove(partition)
+        var_partitions = self._var_partitions
+        for var_id in partition.variables:
+            if var_partitions.get(var_id) is partition:
+                del var_partitions[var_id]
+
+    def _merge_partitions(self, partitions):
+        """ Merges partitions into a new partition whose solver has all
+        of their constraints, and returns the new partition.
+
+        """
+        merged = self._new_partition()
+        var_partitions = self._var_partitions
+        for partition in partitions:
+            self._partitions.remove(partition)
+            for cn in partition.constraints.itervalues():
+                merged.solver.add_constraint(cn)
+                merged.constraints[id(cn)] = cn
+                self._cn_partitions[id(cn)] = merged
+            merged.variables.update(partition.variables)
+            for var_id in partition.variables:
+                var_partitions[var_id] = merged
+        return merged
+
+    def _suggest_values(self, values, strength, weight):
+        """ Returns a context manager which suggests the values of the
+        given variables to the solvers of their partitions. A variable
+        which is not in any partition is ignored.
+
+        """
+        suggested = []
+        groups = {}
+        for var, value in values:
+            partition = self._var_partitions.get(id(var))
+            if partition is None:
+                continue
+            if partition not in groups:
+                groups[partition] = []
+                suggested.append(partition)
+            groups[partition].append((var, value))
+        contexts = [
+            partition.solver.suggest_values(groups[partition], strength,
+                                            weight)
+            for partition in suggested
+        ]
+        return nested_contexts(contexts)
 
     def layout(self, cb, width, height, size, strength=medium, weight=1.0):
         """ Perform an iteration of the solver for the new width and 
@@ -111,7 +370,7 @@ class ConstraintsLayout(object):
             with guard(self, 'layout'):
                 w, h = size
                 values = [(width, w), (height, h)]
-                with self._solver.suggest_values(values, strength, weight):
+                with self._suggest_values(values, strength, weight):
                     cb()
 
     def get_min_size(self, width, height, strength=medium, weight=0.1):
@@ -150,11 +409,19 @@ class ConstraintsLayout(object):
         if not self._initialized:
             raise RuntimeError('Get min size on uninitialized solver')
 
+        key = ('min', id(width), id(height), repr(strength), weight)
+        res = self._size_cache.get(key)
+        if res is not None:
+            self.size_cache_hits += 1
+            return res
+        self.size_cache_misses += 1
+
         values = [(width, 0.0), (height, 0.0)]
-        with self._solver.suggest_values(values, strength, weight):
+        with self._suggest_values(values, strength, weight):
             min_width = width.value
             min_height = height.value
-        return (min_width, min_height)
+        res = self._size_cache[key] = (min_width, min_height)
+        return res
 
     def get_max_size(self, width, height, strength=medium, weight=0.1):
         """ Run an iteration of the solver with the suggested size of 
@@ -194,9 +461,16 @@ class ConstraintsLayout(object):
         if not self._initialized:
             raise RuntimeError('Get max size on uninitialized solver')
 
+        key = ('max', id(width), id(height), repr(strength), weight)
+        res = self._size_cache.get(key)
+        if res is not None:
+            self.size_cache_hits += 1
+            return res
+        self.size_cache_misses += 1
+
         max_val = 2**24 - 1 # Arbitrary, but the max allowed by Qt.
         values = [(width, max_val), (height, max_val)]
-        with self._solver.suggest_values(values, strength, weight): 
+        with self._suggest_values(values, strength, weight):
             max_width = width.value
             max_height = height.value
         width_diff = abs(max_val - int(round(max_width)))
@@ -205,5 +479,6 @@ class ConstraintsLayout(object):
             max_width = -1
         if height_diff <= 1:
             max_height = -1
-        return (max_width, max_height)
+        res = self._size_cache[key] = (max_width, max_height)
+        return res
 
@@ -0,0 +1,132 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from casuarius import Solver
+
+
+def constraint_variables(cn):
+    """ Returns the constraint variables of a constraint.
+
+    Parameters
+    ----------
+    cn : LinearConstraint
+        The casuarius constraint.
+
+    Returns
+    -------
+    result : list of ConstraintVariable
+        The variables with a term on either side of the constraint. The
+        terms are not reduced, since subtracting the sides is far more
+        expensive, so a variable may be listed more than once.
+
+    """
+    return [term.var for term in cn.lhs.terms + cn.rhs.terms]
+
+
+def partition_constraints(constraints):
+    """ Partitions constraints into the connected components of the
+    graph whose nodes are the constraint variables and whose edges are
+    the constraints.
+
+    The constraints in different partitions share no variable, so each
+    partition can be solved by its own solver. A constraint which has no
+    variable is placed in a partition of its own.
+
+    Parameters
+    ----------
+    constraints : Iterable
+        An iterable that yields the casuarius constraints.
+
+    Returns
+    -------
+    result : list of list
+        The lists of the constraints in each partition. The partitions
+        and the constraints in them are in the order of the first
+        appearance of the constraints.
+
+    """
+    # A union-find over the ids of the variables, where each root is
+    # the id of the first constraint which introduced the partition.
+    parents = {}
+
+    def find(node):
+        root = node
+        while parents[root] != root:
+            root = parents[root]
+        while parents[node] != root:
+            parents[node], node = root, parents[node]
+        return root
+
+    cns = []
+    for cn in constraints:
+        node = ('cn', id(cn))
+        parents[node] = node
+        for var in constraint_variables(cn):
+            var_node = ('var', id(var))
+            if var_node not in parents:
+                parents[var_node] = node
+            else:
+                root = find(var_node)
+                new_root = find(node)
+                if root != new_root:
+                    parents[new_root] = root
+        cns.append((cn, node))
+
+    partitions = {}
+    res = []
+    for cn, node in cns:
+        root = find(node)
+        partition = partitions.get(root)
+        if partition is None:
+            partition = partitions[root] = []
+            res.append(partition)
+        partition.append(cn)
+    return res
+
+
+class SolverPartition(object):
+    """ A casuarius solver for the constraints of a partition, along
+    with the variables of the partition.
+
+    """
+    def __init__(self):
+        #: The solver for the constraints of the partition.
+        self.solver = Solver(autosolve=False)
+
+        #: The dict of the variables of the partition, keyed on their
+        #: ids. The variables are kept alive so their ids are not reused.
+        self.variables = {}
+
+        #: The dict of the constraints in the solver, keyed on their ids.
+        self.constraints = {}
+
+    def add_constraint(self, cn, variables):
+        """ Adds a constraint to the solver of the partition.
+
+        Parameters
+        ----------
+        cn : LinearConstraint
+            The casuarius constraint to add.
+
+        variables : list of ConstraintVariable
+            The variables of the constraint.
+
+        """
+        self.solver.add_constraint(cn)
+        self.constraints[id(cn)] = cn
+        for var in variables:
+            self.variables[id(var)] = var
+
+    def remove_constraint(self, cn):
+        """ Removes a constraint from the solver of the partition. The
+        variables of the constraint are kept in the partition.
+
+        Parameters
+        ----------
+        cn : LinearConstraint
+            The casuarius constraint to remove.
+
+        """
+        self.solver.remove_constraint(cn)
+        del self.constraints[id(cn)]
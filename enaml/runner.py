@@ -5,6 +5,7 @@
 """ Command-line tool to run .enaml files.
 
 """
+import atexit
 import optparse
 import os
 import sys
@@ -14,6 +15,7 @@ import warnings
 from enaml import imports, default_toolkit, wx_toolkit, qt_toolkit
 from enaml.core.parser import parse
 from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.profiling import enable_binding_profiler
 
 
 # Acceptable enaml toolkit options for enaml-run
@@ -79,9 +81,17 @@ def main():
     parser.add_option('-t', '--toolkit', default='default',
                       choices=['default', 'wx', 'qt'],
                       help='The toolkit backend to use')
+    parser.add_option('--profile-bindings', action='store_true',
+                      default=False,
+                      help=('Profile the bound expressions and print a '
+                            'report of the most expensive on exit'))
 
     options, args = parser.parse_args()
 
+    if options.profile_bindings:
+        profiler = enable_binding_profiler()
+        atexit.register(profiler.report)
+
     # Preapare the toolkit
     toolkit = prepare_toolkit(options.toolkit)
 
@@ -0,0 +1,78 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Helpers for testing the Enaml core without a gui toolkit backend.
+
+"""
+import marshal
+import types
+
+from traits.api import Bool
+
+from enaml.core.base_component import BaseComponent, update_shown_components
+from enaml.core.constructor import Constructor
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.operators import OPERATORS
+from enaml.core.parser import parse
+from enaml.core.toolkit import Toolkit
+
+
+class Panel(BaseComponent):
+    """ A component which can be hidden without a toolkit widget.
+
+    """
+    shown = Bool(True)
+
+    _hiding_attributes = ('shown',)
+
+    def _shown_changed(self, shown):
+        if shown:
+            update_shown_components()
+
+    def hides(self, component):
+        if component is self and not self.shown:
+            return True
+        return super(Panel, self).hides(component)
+
+
+def headless_toolkit():
+    """ Creates and returns a Toolkit which contains the builtin Enaml
+    operators and the 'BaseComponent' and 'Panel' constructors, but no
+    toolkit backed widgets.
+
+    """
+    toolkit = Toolkit(
+        BaseComponent=Constructor(lambda: BaseComponent),
+        Panel=Constructor(lambda: Panel),
+    )
+    toolkit.update(OPERATORS)
+    return toolkit
+
+
+def compile_code(source, filename='__enaml_tests__', precompile=False):
+    """ Parses and compiles the given Enaml source and returns the 
+    module code object. The code is round-tripped through the marshal
+    module, as it would be when cached to disk.
+
+    """
+    code = EnamlCompiler.compile(parse(source), filename, precompile)
+    return marshal.loads(marshal.dumps(code))
+
+
+def exec_code(code):
+    """ Executes a module code object returned by 'compile_code' and 
+    returns the module.
+
+    """
+    module = types.ModuleType('__enaml_tests__')
+    exec code in module.__dict__
+    return module
+
+
+def compile_source(source, filename='__enaml_tests__', precompile=False):
+    """ Parses and compiles the given Enaml source and returns the 
+    executed module.
+
+    """
+    return exec_code(compile_code(source, filename, precompile))
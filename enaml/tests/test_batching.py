@@ -0,0 +1,90 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Int
+
+from enaml.core import batch_updates
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Model(HasTraits):
+
+    x = Int
+
+    y = Int
+
+    z = Int
+
+
+SOURCE = """
+values = []
+
+def record(value):
+    values.append(value)
+    return value
+
+enamldef Main(BaseComponent):
+    attr model
+    attr total: int << record(model.x + model.y + model.z)
+"""
+
+
+class TestBatchUpdates(unittest.TestCase):
+    """ Tests for the batch_updates context manager.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        self.model = Model()
+        with headless_toolkit():
+            self.cmpnt = self.module.Main(model=self.model)
+        self.cmpnt.setup()
+        del self.module.values[:]
+
+    def test_unbatched(self):
+        """ Test that each change is evaluated outside of a batch.
+
+        """
+        self.model.x = 1
+        self.model.y = 2
+        self.model.z = 3
+        self.assertEqual(self.module.values, [1, 3, 6])
+
+    def test_coalesced(self):
+        """ Test that the expression is evaluated once per batch.
+
+        """
+        with batch_updates():
+            self.model.x = 1
+            self.model.y = 2
+            self.model.z = 3
+            self.assertEqual(self.cmpnt.total, 0)
+        self.assertEqual(self.module.values, [6])
+        self.assertEqual(self.cmpnt.total, 6)
+
+    def test_nested(self):
+        """ Test that the updates are deferred to the outermost batch.
+
+        """
+        with batch_updates():
+            with batch_updates():
+                self.model.x = 1
+            self.assertEqual(self.module.values, [])
+            self.model.y = 2
+        self.assertEqual(self.module.values, [3])
+
+    def test_exception(self):
+        """ Test that the pending updates are applied when the block
+        raises an exception.
+
+        """
+        with self.assertRaises(ValueError):
+            with batch_updates():
+                self.model.x = 1
+                raise ValueError
+        self.assertEqual(self.cmpnt.total, 1)
+
@@ -0,0 +1,283 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import random
+import unittest
+
+from traits.api import Any, Tuple
+
+from enaml.components.constraints_widget import ConstraintsWidget
+from enaml.components.container import Container
+from enaml.layout.constraints_layout import ConstraintsLayout
+from enaml.layout.layout_helpers import hbox, vbox
+
+
+#: The policies of the widgets of the random box trees.
+POLICIES = ('ignore', 'weak', 'medium', 'strong', 'required')
+
+
+class Widget(ConstraintsWidget):
+    """ A constraints widget with a settable size hint, which records
+    its layout geometry.
+
+    """
+    hint = Tuple((50, 20))
+
+    rect = Any
+
+    def size_hint(self):
+        return self.hint
+
+    def set_layout_geometry(self, rect):
+        self.rect = tuple(rect)
+
+
+class Owner(Container):
+    """ A container with a settable size.
+
+    """
+    current_size = Tuple((300, 200))
+
+    def size(self):
+        return self.current_size
+
+
+class TestBoxLayout(unittest.TestCase):
+    """ Tests for the box layout of a container whose children are
+    arranged by a pure tree of box helpers.
+
+    """
+    def setUp(self):
+        self.owner = Owner()
+        self.widgets = [
+            Widget(hint=(50, 20), hug_width='weak'),
+            Widget(hint=(80, 30)),
+            Widget(hint=(40, 25), hug_height='weak'),
+            Widget(hint=(60, 20), hug_width='weak'),
+        ]
+        for widget in self.widgets:
+            self.owner.add_subcomponent(widget)
+
+    def layout(self, use_box):
+        """ Lays out the owner with the box layout or with the solver
+        and returns the rects of the widgets, the min size and the max
+        size.
+
+        """
+        owner = self.owner
+        if use_box:
+            self.assertTrue(owner.initialize_box_layout())
+        else:
+            owner._box_layout = None
+            owner.layout_manager.initialize(owner.compute_constraints())
+        owner.do_refresh()
+        rects = [widget.rect for widget in self.widgets]
+        return rects, owner.compute_min_size(), owner.compute_max_size()
+
+    def assertSolverLayout(self):
+        """ Asserts that the sizes of the box layout match the sizes of
+        the layout of the solver. The positions are not compared, since
+        the solver places a widget which is narrower than its box at an
+        arbitrary offset.
+
+        """
+        sizes = lambda rects: [rect and rect[2:] for rect in rects]
+        rects, min_size, max_size = self.layout(True)
+        box = (sizes(rects), min_size, max_size)
+        rects, min_size, max_size = self.layout(False)
+        solver = (sizes(rects), min_size, max_size)
+        self.assertEqual(box, solver)
+
+    def test_default_vbox(self):
+        """ Test the box layout of the default vbox of a container.
+
+        """
+        self.assertSolverLayout()
+        rects, min_size, max_size = self.layout(True)
+        self.assertEqual(rects[0], (10, 10, 80, 20))
+        self.assertEqual(rects[2], (10, 80, 40, 80))
+        self.assertEqual(min_size, (100, 145))
+        self.assertEqual(max_size, (100, -1))
+
+    def test_nested_boxes(self):
+        """ Test the box layout of nested hbox and vbox helpers.
+
+        """
+        first, second, third, fourth = self.widgets
+        self.owner.constraints = [
+            hbox(vbox(first, second), third, fourth, spacing=5),
+        ]
+        self.assertSolverLayout()
+        rects, min_size, max_size = self.layout(True)
+        self.assertEqual(rects[3], (140, 10, 150, 20))
+        self.owner.current_size = (150, 60)
+        self.assertSolverLayout()
+
+    def test_invisible_child(self):
+        """ Test that an invisible child is left out of the box layout.
+
+        """
+        hidden = self.widgets.pop(1)
+        hidden.trait_setq(visible=False)
+        self.assertSolverLayout()
+        hidden.rect = None
+        rects, min_size, max_size = self.layout(True)
+        self.assertEqual(rects[1][1], 40)
+        self.assertIsNone(hidden.rect)
+
+    def test_medium_hug(self):
+        """ Test that a widget which hugs its width with the strength of
+        the suggested size fills the container. Any width between the
+        hint and the container has the same cost, and the solver does
+        not break such ties consistently, so only the min and max sizes
+        are compared with the solver.
+
+        """
+        del self.owner._subcomponents[1:]
+        del self.widgets[1:]
+        self.widgets[0].hug_width = 'medium'
+        self.owner.current_size = (480, 200)
+        rects, min_size, max_size = self.layout(True)
+        self.assertEqual(rects[0][2], 460)
+        self.assertEqual(self.layout(False)[1:], (min_size, max_size))
+
+    def test_fallback(self):
+        """ Test that the solver is used when the constraints are not a
+        pure tree of box helpers.
+
+        """
+        owner = self.owner
+        first, second, third, fourth = self.widgets
+        owner.constraints = [
+            vbox(first, second, third, fourth), first.width == 20,
+        ]
+        self.assertIsNone(owner.compute_box_tree())
+        owner.constraints = [vbox(first, 20, second, third, fourth)]
+        self.assertIsNone(owner.compute_box_tree())
+        owner.constraints = [vbox(first, second, third)]
+        self.assertIsNone(owner.compute_box_tree())
+        owner.constraints = []
+        second.constraints = [second.width == 20]
+        self.assertIsNone(owner.compute_box_tree())
+        second.constraints = []
+        owner.padding_strength = 'strong'
+        self.assertIsNone(owner.compute_box_tree())
+        owner.padding_strength = 'required'
+        self.assertIsNotNone(owner.compute_box_tree())
+
+    def test_shared_layout(self):
+        """ Test that a child container which shares its layout needs the
+        solver, and that one which does not is laid out by its size hint.
+
+        """
+        child = Container()
+        self.owner.add_subcomponent(child)
+        self.assertIsNotNone(self.owner.compute_box_tree())
+        child.share_layout = True
+        self.assertIsNone(self.owner.compute_box_tree())
+
+
+class TestRandomBoxTrees(unittest.TestCase):
+    """ Tests that the box layout is equivalent to the solver on random
+    box trees.
+
+    The cost of a layout is the lexicographic sum of the errors of the
+    constraints which are not required, weighted by their strength and
+    weight, plus the error of the suggested size of the container. The
+    box layout must reach the minimum cost which is found by the solver.
+    Where several layouts have the minimum cost, the two may pick
+    different ones, so the geometry of the widgets is not compared.
+
+    """
+    def random_tree(self, rand, widgets, depth=0):
+        """ Returns a random box helper, appending the widgets it lays
+        out to the given list.
+
+        """
+        items = []
+        for idx in range(rand.randint(1, 3)):
+            if depth < 2 and rand.random() < 0.3:
+                items.append(self.random_tree(rand, widgets, depth + 1))
+            else:
+                widget = Widget(
+                    hint=(rand.randint(0, 100), rand.randint(0, 60)),
+                    hug_width=rand.choice(POLICIES),
+                    hug_height=rand.choice(POLICIES),
+                    resist_clip_width=rand.choice(POLICIES),
+                    resist_clip_height=rand.choice(POLICIES),
+                )
+                widgets.append(widget)
+                items.append(widget)
+        helper = rand.choice((hbox, vbox))
+        return helper(*items, spacing=rand.randint(0, 12))
+
+    def layout_cost(self, owner, constraints):
+        """ Returns the cost of the layout of the owner which is found by
+        the solver for the given constraints.
+
+        """
+        res = [0.0, 0.0, 0.0]
+        size = owner.current_size
+        def cb():
+            for cn in constraints:
+                if cn.strength.name == 'required':
+                    continue
+                val = (cn.lhs - cn.rhs).value
+                if cn.op == '==':
+                    err = abs(val)
+                elif cn.op == '>=':
+                    err = max(0.0, -val)
+                else:
+                    err = max(0.0, val)
+                weights = cn.strength.symbolic_weight.weights
+                for idx, level in enumerate(weights):
+                    res[idx] += level * cn.weight * err
+            # The size of the container is suggested with a medium
+            # strength and a weight of 1.0.
+            res[1] += abs(owner.width.value - size[0])
+            res[1] += abs(owner.height.value - size[1])
+        layout = ConstraintsLayout()
+        layout.initialize(constraints)
+        layout.layout(cb, owner.width, owner.height, size)
+        return [round(level, 6) for level in res]
+
+    def test_random_trees(self):
+        """ Test that the box layout has the min size, max size and cost
+        of the solver on random box trees.
+
+        """
+        rand = random.Random(1234)
+        for idx in range(200):
+            owner = Owner(
+                current_size=(rand.randint(0, 400), rand.randint(0, 400)),
+            )
+            widgets = []
+            owner.constraints = [self.random_tree(rand, widgets)]
+            for widget in widgets:
+                owner.add_subcomponent(widget)
+            self.assertTrue(owner.initialize_box_layout())
+            owner.do_refresh()
+            rects = [widget.rect for widget in widgets]
+            box_sizes = (owner.compute_min_size(), owner.compute_max_size())
+
+            owner._box_layout = None
+            constraints = owner.compute_constraints()
+            owner.layout_manager.initialize(constraints)
+            solver_sizes = (
+                owner.compute_min_size(), owner.compute_max_size(),
+            )
+            self.assertEqual(box_sizes, solver_sizes)
+
+            # The cost of the box layout is found by fixing the widgets
+            # at their geometry.
+            fixed = []
+            for widget, (x, y, width, height) in zip(widgets, rects):
+                fixed.extend([
+                    widget.left == x, widget.top == y,
+                    widget.width == width, widget.height == height,
+                ])
+            self.assertEqual(
+                self.layout_cost(owner, constraints + fixed),
+                self.layout_cost(owner, constraints),
+            )
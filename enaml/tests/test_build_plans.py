@@ -0,0 +1,139 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.base_component import BaseComponent
+from enaml.core.constructor import Constructor
+from enaml.core.factory import EnamlDeclaration
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Other(BaseComponent):
+    """ A component used to rebind the base type of a declaration.
+
+    """
+    pass
+
+
+SOURCE = """
+from enaml.core.base_component import BaseComponent as Component
+from enaml.core.constructor import Constructor
+
+Base = Constructor(lambda: Component)
+
+enamldef Level0(Base):
+    attr a: int = 1
+
+enamldef Level1(Level0):
+    attr b: int = a + 1
+    BaseComponent:
+        pass
+
+enamldef Level2(Level1):
+    a = 10
+
+class Namespace(object):
+    Base = Base
+"""
+
+
+class TestBuildPlans(unittest.TestCase):
+    """ Tests for the build plans of Enaml declarations.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        self.toolkit = headless_toolkit()
+
+    def build(self, decl, toolkit=None):
+        with toolkit or self.toolkit:
+            return decl()
+
+    def test_derived(self):
+        """ Test that a derived declaration chain is built as usual.
+
+        """
+        cmpnt = self.build(self.module.Level2)
+        self.assertEqual(cmpnt.a, 10)
+        self.assertEqual(cmpnt.b, 11)
+        self.assertEqual(len(cmpnt._subcomponents), 1)
+        self.assertTrue(isinstance(cmpnt, self.module.Level0))
+
+    def test_shared_lookups(self):
+        """ Test that the lookups of the same name are shared.
+
+        """
+        lookups = self.module.Level1.__lookups__
+        self.assertEqual(len(lookups), 4)
+
+    def test_plan_reused(self):
+        """ Test that the plan is computed once for a toolkit, and that
+        it is recomputed once cleared.
+
+        """
+        decl = self.module.Level0
+        self.build(decl)
+        plan = decl.build_plan(self.toolkit)
+        self.assertIs(decl.build_plan(self.toolkit), plan)
+        decl.clear_plans()
+        self.assertIsNot(decl.build_plan(self.toolkit), plan)
+
+    def test_rebound_global(self):
+        """ Test that rebinding a module global between two builds is
+        picked up by the next build.
+
+        """
+        decl = self.module.Level0
+        self.assertIs(type(self.build(decl)), BaseComponent)
+        self.module.Base = Constructor(lambda: Other)
+        self.assertIs(type(self.build(decl)), Other)
+
+    def test_overridden_toolkit_name(self):
+        """ Test that adding or overriding a constructor in the toolkit
+        between two builds is picked up by the next build.
+
+        """
+        decl = self.module.Level1
+        child, = self.build(decl)._subcomponents
+        self.assertIs(type(child), BaseComponent)
+        self.toolkit['BaseComponent'] = Constructor(lambda: Other)
+        child, = self.build(decl)._subcomponents
+        self.assertIs(type(child), Other)
+
+    def test_dotted_lookup(self):
+        """ Test that a plan with a dotted lookup is reused, and that the
+        dotted lookup is evaluated again on each build.
+
+        """
+        level0 = self.module.Level0
+        lookups = list(level0.__lookups__)
+        idx = level0._lookup_names.index('Base')
+        lookups[idx] = compile('Namespace.Base', 'test', mode='eval')
+        decl = EnamlDeclaration(level0.__func__, tuple(lookups))
+        self.assertIs(type(self.build(decl)), BaseComponent)
+        plan = decl.build_plan(self.toolkit)
+        self.assertEqual(decl.build_plan(self.toolkit), plan)
+        self.module.Namespace.Base = Constructor(lambda: Other)
+        cmpnt = self.build(decl)
+        self.assertIs(type(cmpnt), Other)
+        self.assertEqual(cmpnt.a, 1)
+        self.module.int = long
+        idx = level0._lookup_names.index('int')
+        self.assertIs(decl.build_plan(self.toolkit)[idx], long)
+
+    def test_plan_per_toolkit(self):
+        """ Test that a plan is computed for each toolkit, and released
+        with the toolkit.
+
+        """
+        decl = self.module.Level0
+        self.build(decl)
+        other = headless_toolkit()
+        self.build(decl, other)
+        self.assertEqual(len(decl._plans), 2)
+        del other
+        self.assertEqual(len(decl._plans), 1)
+
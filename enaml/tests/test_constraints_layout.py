@@ -0,0 +1,114 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from casuarius import ConstraintVariable
+
+from enaml.layout.constraints_layout import ConstraintsLayout, constraint_key
+
+
+class Rows(object):
+    """ The variables of a column of rows which are stacked top to
+    bottom in a container.
+
+    """
+    def __init__(self, count):
+        self.width = ConstraintVariable('width')
+        self.height = ConstraintVariable('height')
+        self.tops = [ConstraintVariable('top_%d' % i) for i in range(count)]
+
+    def constraints(self, hidden=()):
+        """ Returns new constraints which stack the rows which are not
+        hidden.
+
+        """
+        tops = [t for i, t in enumerate(self.tops) if i not in hidden]
+        cns = [tops[0] == 0, self.height >= tops[-1] + 10, self.width >= 0]
+        for above, below in zip(tops, tops[1:]):
+            cns.append(below == above + 10)
+        return cns
+
+    def solve(self, layout):
+        """ Returns the solved tops of the rows.
+
+        """
+        values = []
+        callback = lambda: values.extend(t.value for t in self.tops)
+        layout.layout(callback, self.width, self.height, (100, 100))
+        return values
+
+
+class TestConstraintsLayout(unittest.TestCase):
+    """ Tests for the incremental updates of a ConstraintsLayout.
+
+    """
+    def setUp(self):
+        self.rows = Rows(5)
+        self.layout = ConstraintsLayout()
+        self.layout.initialize(self.rows.constraints())
+        self.updates = []
+        update = self.layout.update_constraints
+        def spy(old_cns, new_cns):
+            self.updates.append((len(old_cns), len(new_cns)))
+            update(old_cns, new_cns)
+        self.layout.update_constraints = spy
+
+    def test_key(self):
+        """ Test that equivalent constraints have the same key.
+
+        """
+        top = self.rows.tops[0]
+        self.assertEqual(constraint_key(top == 0), constraint_key(0 == top))
+        self.assertNotEqual(constraint_key(top >= 0), constraint_key(top == 0))
+        weak = (top == 0) | 'weak'
+        self.assertNotEqual(constraint_key(weak), constraint_key(top == 0))
+
+    def test_unchanged(self):
+        """ Test that recomputed constraints do not update the solver.
+
+        """
+        self.layout.replace_constraints(self.rows.constraints())
+        self.assertEqual(self.updates, [])
+
+    def test_hide_and_show(self):
+        """ Test that only the changed constraints are updated when a row
+        is hidden and shown, and that the solution matches a solver
+        initialized from scratch.
+
+        """
+        self.layout.replace_constraints(self.rows.constraints(hidden=[2]))
+        self.assertEqual(self.updates, [(2, 1)])
+        fresh = ConstraintsLayout()
+        fresh.initialize(self.rows.constraints(hidden=[2]))
+        tops = self.rows.solve(self.layout)
+        self.assertEqual(tops[3:], self.rows.solve(fresh)[3:])
+        self.assertEqual(tops[3], 20)
+
+        self.layout.replace_constraints(self.rows.constraints())
+        self.assertEqual(self.updates, [(2, 1), (1, 2)])
+        self.assertEqual(self.rows.solve(self.layout), [0, 10, 20, 30, 40])
+
+    def test_size_cache(self):
+        """ Test that the min and max sizes are cached until the
+        constraints change.
+
+        """
+        layout = self.layout
+        width, height = self.rows.width, self.rows.height
+        min_size = layout.get_min_size(width, height)
+        self.assertEqual(min_size, (0, 50))
+        self.assertEqual(layout.get_min_size(width, height), min_size)
+        layout.get_max_size(width, height)
+        self.assertEqual(layout.size_cache_hits, 1)
+        self.assertEqual(layout.size_cache_misses, 2)
+
+        layout.replace_constraints(self.rows.constraints())
+        layout.get_min_size(width, height)
+        self.assertEqual(layout.size_cache_hits, 2)
+
+        layout.replace_constraints(self.rows.constraints(hidden=[2]))
+        self.assertEqual(layout.get_min_size(width, height), (0, 40))
+        self.assertEqual(layout.size_cache_misses, 3)
+
@@ -0,0 +1,478 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import gc
+import unittest
+from weakref import ref
+
+from traits.api import HasTraits, Bool, Int
+
+from enaml.core.base_component import BaseComponent
+from enaml.core.expressions import (
+    ExecutionScope, NameResolutionCache, inverted_code_cache_info, 
+    _inverted_code_cache, _monitored_code_cache,
+)
+
+from .headless_toolkit import (
+    headless_toolkit, compile_source, compile_code, exec_code,
+)
+
+
+class Model(HasTraits):
+
+    x = Int(1)
+
+    y = Int(2)
+
+
+SOURCE = """
+enamldef Main(BaseComponent):
+    attr model
+    attr total: int << model.x + getattr(model, 'y')
+"""
+
+
+class TestSubscriptionExpression(unittest.TestCase):
+    """ Tests for the expressions bound with the '<<' operator.
+
+    """
+    def setUp(self):
+        self.toolkit = headless_toolkit()
+        self.Main = compile_source(SOURCE).Main
+
+    def create(self, model):
+        with self.toolkit:
+            cmpnt = self.Main(model=model)
+        cmpnt.setup()
+        return cmpnt
+
+    def test_code_per_file(self):
+        """ Test that the same expression in two files does not share
+        the rewritten code, so that errors report the right file.
+
+        """
+        exprs = []
+        for filename in ('a.enaml', 'b.enaml'):
+            with self.toolkit:
+                cmpnt = compile_source(SOURCE, filename).Main(model=Model())
+            exprs.append(cmpnt._expressions['total'][0])
+        a, b = [expr.eval_code.co_filename for expr in exprs]
+        self.assertEqual((a, b), ('a.enaml', 'b.enaml'))
+
+    def test_monitored_code_cache_bounded(self):
+        """ Test that the monitored code cache discards the least
+        recently used code once it is full.
+
+        """
+        maxsize = _monitored_code_cache.maxsize
+        _monitored_code_cache.maxsize = 1
+        _monitored_code_cache.clear()
+        try:
+            for filename in ('a.enaml', 'b.enaml'):
+                with self.toolkit:
+                    compile_source(SOURCE, filename).Main(model=Model())
+            self.assertEqual(len(_monitored_code_cache), 1)
+        finally:
+            _monitored_code_cache.maxsize = maxsize
+
+    def test_attribute_and_getattr_monitors(self):
+        """ Test that dotted and getattr access are both monitored.
+
+        """
+        model = Model()
+        cmpnt = self.create(model)
+        self.assertEqual(cmpnt.total, 3)
+        model.x = 10
+        self.assertEqual(cmpnt.total, 12)
+        model.y = 20
+        self.assertEqual(cmpnt.total, 30)
+
+    def test_shared_monitored_code(self):
+        """ Test that instances of a declaration share the instrumented
+        code, but keep independent monitors.
+
+        """
+        m1 = Model()
+        m2 = Model()
+        c1 = self.create(m1)
+        c2 = self.create(m2)
+        e1 = c1._expressions['total'][0]
+        e2 = c2._expressions['total'][0]
+        self.assertIs(e1.eval_code, e2.eval_code)
+        m1.x = 5
+        self.assertEqual(c1.total, 7)
+        self.assertEqual(c2.total, 3)
+
+
+DELEGATE_SOURCE = """
+enamldef Main(BaseComponent):
+    attr model
+    attr value: int := model.x
+    attr out: int = 0
+    out >> model.y
+"""
+
+
+class TestInvertedExpressions(unittest.TestCase):
+    """ Tests for the expressions bound with the ':=' and '>>' operators.
+
+    """
+    def setUp(self):
+        self.toolkit = headless_toolkit()
+        self.Main = compile_source(DELEGATE_SOURCE).Main
+
+    def create(self, model):
+        with self.toolkit:
+            cmpnt = self.Main(model=model)
+        cmpnt.setup()
+        return cmpnt
+
+    def test_inversion(self):
+        """ Test that values are written back to the model.
+
+        """
+        model = Model()
+        cmpnt = self.create(model)
+        self.assertEqual(cmpnt.value, 1)
+        cmpnt.value = 42
+        self.assertEqual(model.x, 42)
+        cmpnt.out = 7
+        self.assertEqual(model.y, 7)
+
+    def test_inverted_code_cache_hits(self):
+        """ Test that further instances are served from the cache.
+
+        """
+        self.create(Model())
+        before = inverted_code_cache_info()
+        self.create(Model())
+        after = inverted_code_cache_info()
+        self.assertEqual(after.hits - before.hits, 2)
+        self.assertEqual(after.misses, before.misses)
+        e1 = self.create(Model())._expressions['value'][0]
+        e2 = self.create(Model())._expressions['value'][0]
+        self.assertIs(e1.inverters, e2.inverters)
+
+    def test_inverted_code_per_file(self):
+        """ Test that the same expression in two files does not share
+        the inverted code.
+
+        """
+        filenames = []
+        for filename in ('a.enaml', 'b.enaml'):
+            with self.toolkit:
+                module = compile_source(DELEGATE_SOURCE, filename)
+                cmpnt = module.Main(model=Model())
+            inverter, = cmpnt._expressions['value'][0].inverters
+            filenames.append(inverter.co_filename)
+        self.assertEqual(filenames, ['a.enaml', 'b.enaml'])
+
+
+class TestPrecompiledExpressions(unittest.TestCase):
+    """ Tests for modules compiled with precompiled code variants.
+
+    """
+    def setUp(self):
+        self.toolkit = headless_toolkit()
+        code = compile_code(
+            SOURCE + DELEGATE_SOURCE.replace('Main', 'Delegate'),
+            precompile=True,
+        )
+        _inverted_code_cache.clear()
+        _monitored_code_cache.clear()
+        self.module = exec_code(code)
+
+    def create(self, factory, model):
+        with self.toolkit:
+            cmpnt = factory(model=model)
+        cmpnt.setup()
+        return cmpnt
+
+    def test_caches_seeded(self):
+        """ Test that executing the module seeds the code caches.
+
+        """
+        # 'total' and 'value' are monitored, 'value' and 'out' inverted.
+        self.assertEqual(len(_monitored_code_cache), 2)
+        self.assertEqual(inverted_code_cache_info().currsize, 2)
+
+    def test_no_runtime_rewriting(self):
+        """ Test that the precompiled variants are used at runtime and
+        behave like the variants generated at runtime.
+
+        """
+        before = inverted_code_cache_info()
+        model = Model()
+        cmpnt = self.create(self.module.Main, model)
+        model.x = 10
+        self.assertEqual(cmpnt.total, 12)
+        cmpnt = self.create(self.module.Delegate, model)
+        cmpnt.value = 42
+        self.assertEqual(model.x, 42)
+        cmpnt.out = 7
+        self.assertEqual(model.y, 7)
+        after = inverted_code_cache_info()
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(after.hits - before.hits, 2)
+        self.assertEqual(len(_monitored_code_cache), 2)
+
+
+class TestNameResolutionCache(unittest.TestCase):
+    """ Tests for the name resolution cache of the execution scope.
+
+    """
+    def setUp(self):
+        self.parent = BaseComponent()
+        self.parent.add_attribute('foo')
+        self.parent.foo = 'parent'
+        self.child = BaseComponent()
+        self.parent.add_subcomponent(self.child)
+        self.identifiers = {}
+        self.f_globals = {'bar': 'global'}
+        self.toolkit = headless_toolkit()
+        self.cache = NameResolutionCache()
+
+    def lookup(self, name):
+        scope = ExecutionScope(
+            self.child, self.identifiers, self.f_globals, self.toolkit, 
+            {}, None, self.cache,
+        )
+        return scope[name]
+
+    def test_cached_lookups(self):
+        """ Test that cached lookups return the same values.
+
+        """
+        for i in range(2):
+            self.assertEqual(self.lookup('foo'), 'parent')
+            self.assertEqual(self.lookup('bar'), 'global')
+            self.assertRaises(KeyError, self.lookup, 'len')
+        self.assertEqual(len(self.cache.entries), 3)
+
+    def test_new_identifier(self):
+        """ Test that a new identifier shadows a cached name.
+
+        """
+        self.assertEqual(self.lookup('foo'), 'parent')
+        self.identifiers['foo'] = 'identifier'
+        self.assertEqual(self.lookup('foo'), 'identifier')
+
+    def test_swapped_identifier(self):
+        """ Test that a new identifier shadows a cached name when the
+        number of identifiers is unchanged.
+
+        """
+        self.identifiers['baz'] = 'identifier'
+        self.assertEqual(self.lookup('foo'), 'parent')
+        self.assertEqual(self.lookup('bar'), 'global')
+        del self.identifiers['baz']
+        self.identifiers['foo'] = 'identifier'
+        self.assertEqual(self.lookup('foo'), 'identifier')
+        del self.identifiers['foo']
+        self.identifiers['bar'] = 'identifier'
+        self.assertEqual(self.lookup('bar'), 'identifier')
+
+    def test_unrelated_changes(self):
+        """ Test that changes outside of the ancestors of the component
+        leave the cache intact.
+
+        """
+        self.assertEqual(self.lookup('foo'), 'parent')
+        sibling = BaseComponent()
+        self.parent.add_subcomponent(sibling)
+        sibling.add_attribute('foo')
+        other = BaseComponent()
+        other.add_subcomponent(BaseComponent())
+        self.lookup('bar')
+        self.assertIn('foo', self.cache.entries)
+
+    def test_add_attribute(self):
+        """ Test that a new attribute shadows a cached name.
+
+        """
+        self.assertEqual(self.lookup('bar'), 'global')
+        self.assertEqual(self.lookup('foo'), 'parent')
+        self.child.add_attribute('foo')
+        self.child.add_attribute('bar')
+        self.child.foo = 'child'
+        self.child.bar = 'child'
+        self.assertEqual(self.lookup('foo'), 'child')
+        self.assertEqual(self.lookup('bar'), 'child')
+
+    def test_parent_changed(self):
+        """ Test that reparenting a component invalidates the cache.
+
+        """
+        self.assertEqual(self.lookup('foo'), 'parent')
+        other = BaseComponent()
+        other.add_attribute('foo')
+        other.foo = 'other'
+        other.add_subcomponent(self.child)
+        self.assertEqual(self.lookup('foo'), 'other')
+
+    def test_ancestor_changed(self):
+        """ Test that reparenting an ancestor of the component, or adding
+        an attribute to it, invalidates the cache.
+
+        """
+        self.assertEqual(self.lookup('foo'), 'parent')
+        self.assertEqual(self.lookup('bar'), 'global')
+        root = BaseComponent()
+        root.add_attribute('bar')
+        root.bar = 'root'
+        root.add_subcomponent(self.parent)
+        self.assertEqual(self.lookup('bar'), 'root')
+        self.parent.add_attribute('bar')
+        self.parent.bar = 'parent'
+        self.assertEqual(self.lookup('bar'), 'parent')
+
+
+class TestScopeReuse(unittest.TestCase):
+    """ Tests for the reuse of execution scopes by expressions.
+
+    """
+    def setUp(self):
+        self.toolkit = headless_toolkit()
+
+    def create(self, factory, model):
+        with self.toolkit:
+            cmpnt = factory(model=model)
+        cmpnt.setup()
+        return cmpnt
+
+    def test_scope_reused(self):
+        """ Test that an expression reuses its scope across evaluations.
+
+        """
+        model = Model()
+        cmpnt = self.create(compile_source(SOURCE).Main, model)
+        expr = cmpnt._expressions['total'][0]
+        scope = expr._scope_state[0]
+        model.x = 10
+        self.assertEqual(cmpnt.total, 12)
+        self.assertIs(expr._scope_state[0], scope)
+        self.assertFalse(expr._scope_busy)
+
+    def test_scope_is_weak(self):
+        """ Test that a stored scope does not keep its component alive.
+
+        """
+        cmpnt = self.create(compile_source(SOURCE).Main, Model())
+        expr = cmpnt._expressions['total'][0]
+        scope, overrides, nonlocals = expr._scope_state
+        self.assertIs(scope._obj_ref(), cmpnt)
+        self.assertIs(nonlocals._nls_obj, cmpnt)
+        obj_ref = ref(cmpnt)
+        del cmpnt
+        gc.collect()
+        self.assertIsNone(obj_ref())
+
+    def test_delegation_transients_removed(self):
+        """ Test that per-change values are removed from the scope after
+        an inversion.
+
+        """
+        model = Model()
+        cmpnt = self.create(compile_source(DELEGATE_SOURCE).Main, model)
+        cmpnt.value = 42
+        self.assertEqual(model.x, 42)
+        overrides = cmpnt._expressions['value'][0]._scope_state[1]
+        self.assertNotIn('_[new]', overrides)
+        self.assertNotIn('_[expr]', overrides)
+
+    def test_nested_acquire(self):
+        """ Test that a nested evaluation of an expression does not 
+        reuse the scope of the outer evaluation.
+
+        """
+        cmpnt = self.create(compile_source(SOURCE).Main, Model())
+        expr = cmpnt._expressions['total'][0]
+        outer, overrides = expr.acquire_scope(cmpnt)
+        inner, overrides = expr.acquire_scope(cmpnt)
+        self.assertIsNot(inner, outer)
+        expr.release_scope(inner)
+        self.assertTrue(expr._scope_busy)
+        expr.release_scope(outer)
+        self.assertIs(expr.acquire_scope(cmpnt)[0], outer)
+
+
+class Switch(HasTraits):
+
+    flag = Bool(True)
+
+    x = Int(1)
+
+    y = Int(2)
+
+
+SWITCH_SOURCE = """
+enamldef Main(BaseComponent):
+    attr model
+    attr value: int << model.x if model.flag else model.y
+"""
+
+
+def notifier_count(obj, name):
+    """ Returns the number of instance trait notifiers for the given
+    object attribute pair.
+
+    """
+    notifiers = obj._trait(name, 2)._notifiers(1)
+    return len(notifiers)
+
+
+class TestDifferentialMonitors(unittest.TestCase):
+    """ Tests for the differential rebinding of the monitor notifiers.
+
+    """
+    def setUp(self):
+        self.toolkit = headless_toolkit()
+        self.module = compile_source(SWITCH_SOURCE)
+        self.model = Switch()
+        with self.toolkit:
+            self.cmpnt = self.module.Main(model=self.model)
+        self.cmpnt.setup()
+        expr = self.cmpnt._expressions['value'][0]
+        self.monitor = expr.monitors[0]
+
+    def test_unchanged_dependencies(self):
+        """ Test that the handlers are kept when the dependencies of an
+        evaluation are unchanged.
+
+        """
+        handlers = dict(self.monitor._handlers)
+        self.assertEqual(len(handlers), 2)
+        self.model.x = 10
+        self.assertEqual(self.cmpnt.value, 10)
+        self.assertEqual(self.monitor._handlers, handlers)
+        self.assertEqual(notifier_count(self.model, 'x'), 1)
+
+    def test_changed_dependencies(self):
+        """ Test that only the changed dependencies are rebound.
+
+        """
+        self.model.flag = False
+        self.assertEqual(self.cmpnt.value, 2)
+        attrs = sorted(key[1] for key in self.monitor._handlers)
+        self.assertEqual(attrs, ['flag', 'y'])
+        self.assertEqual(notifier_count(self.model, 'x'), 0)
+        self.assertEqual(notifier_count(self.model, 'y'), 1)
+        self.model.flag = True
+        self.model.x = 5
+        self.assertEqual(self.cmpnt.value, 5)
+        self.assertEqual(notifier_count(self.model, 'x'), 1)
+        self.assertEqual(notifier_count(self.model, 'y'), 0)
+
+    def test_implicit_attributes(self):
+        """ Test that the implicit attribute notifiers are kept when the
+        dependencies are unchanged.
+
+        """
+        binder = self.cmpnt._expressions['value'][0].implicit_binder
+        handlers = dict(binder._handlers)
+        self.assertEqual(len(handlers), 1)
+        self.model.x = 10
+        self.assertEqual(binder._handlers, handlers)
+        self.assertEqual(notifier_count(self.cmpnt, 'model'), 1)
+
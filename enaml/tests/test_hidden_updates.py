@@ -0,0 +1,119 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Int
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Model(HasTraits):
+
+    x = Int
+
+
+SOURCE = """
+values = []
+
+def record(value):
+    values.append(value)
+    return value
+
+enamldef Child(Panel):
+    attr model
+    attr value: int << record(model.x)
+    pause_hidden_updates = True
+
+enamldef Main(Panel):
+    id: main
+    attr model
+    Child:
+        model = main.model
+"""
+
+
+class TestHiddenUpdates(unittest.TestCase):
+    """ Tests for the updates deferred while a component is hidden.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        self.model = Model()
+        with headless_toolkit():
+            self.cmpnt = self.module.Main(model=self.model)
+        self.cmpnt.setup()
+        self.child = self.cmpnt.children[0]
+        del self.module.values[:]
+
+    def test_hidden(self):
+        """ Test that the updates of a hidden component are coalesced
+        into one when it is shown.
+
+        """
+        self.child.shown = False
+        self.model.x = 1
+        self.model.x = 2
+        self.assertEqual(self.module.values, [])
+        self.assertEqual(self.child.value, 0)
+        self.child.shown = True
+        self.assertEqual(self.module.values, [2])
+        self.assertEqual(self.child.value, 2)
+
+    def test_hidden_ancestor(self):
+        """ Test that the updates are deferred while an ancestor is
+        hidden.
+
+        """
+        self.cmpnt.shown = False
+        self.assertTrue(self.child.is_hidden())
+        self.model.x = 1
+        self.assertEqual(self.child.value, 0)
+        self.cmpnt.shown = True
+        self.assertEqual(self.child.value, 1)
+        self.assertEqual(self.module.values, [1])
+
+    def test_not_paused(self):
+        """ Test that the updates are applied while hidden if they are
+        not paused.
+
+        """
+        self.child.pause_hidden_updates = False
+        self.child.shown = False
+        self.model.x = 1
+        self.assertEqual(self.child.value, 1)
+
+    def test_unpause(self):
+        """ Test that the deferred updates are applied when the updates
+        are unpaused.
+
+        """
+        self.child.shown = False
+        self.model.x = 1
+        self.child.pause_hidden_updates = False
+        self.assertEqual(self.child.value, 1)
+
+
+    def test_reparent(self):
+        """ Test that moving a hidden component to a shown parent applies
+        its deferred updates, and only those of its subtree.
+
+        """
+        with headless_toolkit():
+            other = self.module.Main(model=self.model)
+            target = self.module.Main(model=self.model)
+        other.setup()
+        target.setup()
+        other_child = other.children[0]
+        self.cmpnt.shown = False
+        other.shown = False
+        self.model.x = 1
+        self.assertEqual(self.child.value, 0)
+        self.assertEqual(other_child.value, 0)
+        # Showing the other tree quietly leaves its updates pending
+        # until a visibility handler checks them.
+        other.trait_setq(shown=True)
+        self.child.parent = target
+        self.assertEqual(self.child.value, 1)
+        self.assertEqual(other_child.value, 0)
@@ -0,0 +1,135 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import Int, Str
+
+from enaml.components.include import Include
+from enaml.core.base_component import BaseComponent
+
+
+class Root(BaseComponent):
+    """ A root component which runs the relayout tasks immediately and
+    counts them.
+
+    """
+    relayouts = Int
+
+    def request_relayout_task(self, callback, *args, **kwargs):
+        callback(*args, **kwargs)
+        self.relayouts += 1
+
+
+class Row(BaseComponent):
+    """ A component which counts its setups and destructions.
+
+    """
+    label = Str
+
+    detail = Str
+
+    setups = Int
+
+    destroyed = Int
+
+    def _setup_finalize(self):
+        super(Row, self)._setup_finalize()
+        self.setups += 1
+
+    def destroy(self):
+        super(Row, self).destroy()
+        self.destroyed += 1
+
+
+class TestIncludeReconciliation(unittest.TestCase):
+    """ Tests for the reconciliation of the components of an Include.
+
+    """
+    def setUp(self):
+        self.root = Root()
+        self.include = Include()
+        self.include.component_key = lambda row: row.label
+        self.root.add_subcomponent(self.include)
+        self.rows = self.make_rows('ab')
+        self.include.components = self.rows
+        self.root.setup()
+
+    def make_rows(self, labels):
+        return [Row(label=label) for label in labels]
+
+    def test_append(self):
+        """ Test that appending a component only sets up that component
+        and keeps the existing ones.
+
+        """
+        new = self.make_rows('abc')
+        self.include.components = new
+        a, b, c = self.include.components
+        self.assertIs(a, self.rows[0])
+        self.assertIs(b, self.rows[1])
+        self.assertIs(c, new[2])
+        self.assertEqual([r.setups for r in (a, b, c)], [1, 1, 1])
+        self.assertEqual([r.destroyed for r in new], [1, 1, 0])
+        self.assertEqual(self.root.relayouts, 1)
+        self.assertEqual(self.root.children, [a, b, c])
+
+    def test_remove_and_reorder(self):
+        """ Test that a removed component is destroyed and the kept
+        components follow the order of the new list.
+
+        """
+        self.include.components = self.make_rows('ba')[:1]
+        self.assertEqual(self.include.components, [self.rows[1]])
+        self.assertEqual(self.rows[0].destroyed, 1)
+        self.assertEqual(self.rows[1].destroyed, 0)
+        self.assertEqual(self.root.children, [self.rows[1]])
+
+    def test_identity(self):
+        """ Test that the components are matched by identity without a
+        key function.
+
+        """
+        self.include.component_key = None
+        self.include.components = self.rows + self.make_rows('c')
+        setups = [r.setups for r in self.include.components]
+        self.assertEqual(setups, [1, 1, 1])
+        self.assertEqual([r.destroyed for r in self.rows], [0, 0])
+
+
+    def test_comprehension_without_key(self):
+        """ Test that building new components from the data on every
+        change rebuilds every component without a key function.
+
+        """
+        self.include.component_key = None
+        items = 'abc'
+        self.include.components = [Row(label=x) for x in items]
+        self.assertEqual([r.destroyed for r in self.rows], [1, 1])
+        setups = [r.setups for r in self.include.components]
+        self.assertEqual(setups, [1, 1, 1])
+        kept = [r for r in self.include.components if r in self.rows]
+        self.assertEqual(kept, [])
+
+    def test_comprehension_with_key(self):
+        """ Test that building new components from the data on every
+        change only sets up the new components with a key function.
+
+        """
+        items = 'abc'
+        new = [Row(label=x) for x in items]
+        self.include.components = new
+        self.assertEqual(self.include.components[:2], self.rows)
+        self.assertIs(self.include.components[2], new[2])
+        self.assertEqual([r.destroyed for r in self.rows], [0, 0])
+
+    def test_kept_as_is(self):
+        """ Test that a kept component is not updated from the new
+        component which has the same key.
+
+        """
+        self.include.components = [Row(label='a', detail='x')]
+        a, = self.include.components
+        self.assertIs(a, self.rows[0])
+        self.assertEqual(a.detail, '')
@@ -0,0 +1,131 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.base_component import _flatten_subtrees
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+SOURCE = """
+enamldef Main(Panel):
+    Panel:
+        BaseComponent:
+            pass
+    Panel:
+        shown = False
+        Panel:
+            shown = False
+            BaseComponent:
+                pass
+"""
+
+
+class TestLazyRealization(unittest.TestCase):
+    """ Tests for the deferred setup of hidden subtrees.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        with headless_toolkit():
+            self.cmpnt = self.module.Main()
+        self.visible, self.hidden = self.cmpnt._subcomponents
+        self.nested = self.hidden._subcomponents[0]
+        self.leaf = self.nested._subcomponents[0]
+
+    def test_eager(self):
+        """ Test that the whole tree is setup by default.
+
+        """
+        self.cmpnt.setup()
+        self.assertTrue(self.leaf.initialized)
+        self.assertEqual(self.hidden.children, [self.nested])
+
+    def test_deferred(self):
+        """ Test that the subtree of a hidden component is not setup.
+
+        """
+        self.cmpnt.lazy_realization = True
+        self.cmpnt.setup()
+        self.assertTrue(self.visible.children[0].initialized)
+        self.assertTrue(self.hidden.initialized)
+        self.assertFalse(self.nested.initialized)
+        self.assertEqual(self.hidden.children, [])
+
+    def test_realize_on_show(self):
+        """ Test that a deferred subtree is setup when it is shown, and
+        that hidden subtrees within it are deferred in turn.
+
+        """
+        self.cmpnt.lazy_realization = True
+        self.cmpnt.setup()
+        self.hidden.shown = True
+        self.assertTrue(self.nested.initialized)
+        self.assertEqual(self.hidden.children, [self.nested])
+        self.assertFalse(self.leaf.initialized)
+        self.nested.shown = True
+        self.assertTrue(self.leaf.initialized)
+
+
+
+BOUND_SOURCE = """
+values = []
+
+def record(value):
+    values.append(value)
+    return value
+
+enamldef Main(Panel):
+    id: main
+    attr flag: bool = False
+    lazy_realization = True
+    Panel:
+        shown << record(main.flag)
+        BaseComponent:
+            pass
+"""
+
+
+class TestBoundRealization(unittest.TestCase):
+    """ Tests for the deferred setup of subtrees whose visibility is
+    bound to an expression.
+
+    """
+    def setUp(self):
+        self.module = compile_source(BOUND_SOURCE)
+        with headless_toolkit():
+            self.cmpnt = self.module.Main()
+        self.panel = self.cmpnt._subcomponents[0]
+        self.leaf = self.panel._subcomponents[0]
+
+    def test_not_evaluated_early(self):
+        """ Test that the bound expression is not evaluated to decide
+        the deferral before the tree is setup.
+
+        """
+        _flatten_subtrees([self.cmpnt])
+        self.assertEqual(self.module.values, [])
+
+    def test_hidden(self):
+        """ Test that the subtree is deferred when the expression hides
+        the component.
+
+        """
+        self.cmpnt.setup()
+        self.assertEqual(self.module.values, [False])
+        self.assertFalse(self.leaf.initialized)
+        self.cmpnt.flag = True
+        self.assertTrue(self.leaf.initialized)
+
+    def test_shown(self):
+        """ Test that the subtree is setup with the tree when the
+        expression shows the component.
+
+        """
+        self.cmpnt.flag = True
+        self.cmpnt.setup()
+        self.assertEqual(self.module.values, [True])
+        self.assertTrue(self.leaf.initialized)
+        self.assertEqual(self.panel.children, [self.leaf])
@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.components.label import Label
+from enaml.core.trait_types import EMPTY_DICT
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+SOURCE = """
+enamldef Main(Panel):
+    attr value: int = 1
+    BaseComponent:
+        pass
+"""
+
+
+class TestSharedContainers(unittest.TestCase):
+    """ Tests for the containers which are shared until they are used.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        with headless_toolkit():
+            self.cmpnt = self.module.Main()
+        self.cmpnt.setup()
+        self.leaf = self.cmpnt.children[0]
+
+    def test_shared(self):
+        """ Test that a component without bindings shares the empty
+        dicts.
+
+        """
+        self.assertIs(self.leaf._expressions, EMPTY_DICT)
+        self.assertIs(self.leaf._hidden_updates, EMPTY_DICT)
+        self.assertEqual(self.cmpnt.value, 1)
+        self.assertIsNot(self.cmpnt._expressions, EMPTY_DICT)
+        with self.assertRaises(TypeError):
+            EMPTY_DICT['value'] = None
+
+    def test_destroy(self):
+        """ Test that the dicts are shared again after destruction.
+
+        """
+        self.cmpnt.destroy()
+        self.assertIs(self.cmpnt._expressions, EMPTY_DICT)
+
+    def test_bases(self):
+        """ Test that the bases of a component are in derived order.
+
+        """
+        bases = self.cmpnt._bases
+        self.assertIsInstance(bases, tuple)
+        self.assertIs(bases[0], self.module.Main)
+        self.assertEqual(len(bases), 2)
+
+
+class TestStaticHandlers(unittest.TestCase):
+    """ Tests for the properties whose changes are signaled by static
+    change handlers.
+
+    """
+    def test_hug(self):
+        """ Test that the changes of 'hug' and 'resist_clip' are
+        signaled when their parts change.
+
+        """
+        label = Label()
+        events = []
+        label.on_trait_change(
+            lambda name, new: events.append((name, new)),
+            'hug, resist_clip',
+        )
+        label.hug_width = 'required'
+        label.resist_clip_height = 'required'
+        self.assertEqual(events, [
+            ('hug', ('required', label.hug_height)),
+            ('resist_clip', (label.resist_clip_width, 'required')),
+        ])
+
@@ -0,0 +1,147 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.components.include import Include
+from enaml.core.base_component import BaseComponent
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+SOURCE = """
+enamldef Main(Panel):
+    name = 'main'
+    Panel:
+        name = 'a'
+        BaseComponent:
+            name = 'b'
+    Panel:
+        name = 'b'
+        BaseComponent:
+            name = 'a'
+"""
+
+
+def traverse_all(cmpnt, name):
+    """ Finds the named components by traversing the tree.
+
+    """
+    return [c for c in cmpnt.traverse() if c.name == name]
+
+
+class Root(BaseComponent):
+    """ A root component which runs the relayout tasks immediately.
+
+    """
+    def request_relayout_task(self, callback, *args, **kwargs):
+        callback(*args, **kwargs)
+
+
+class TestNameIndex(unittest.TestCase):
+    """ Tests for the lookups of the named components.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        with headless_toolkit():
+            self.cmpnt = self.module.Main()
+        self.cmpnt.setup()
+        self.first, self.second = self.cmpnt.children
+
+    def test_breadth_first(self):
+        """ Test that the first component in breadth first order is
+        found.
+
+        """
+        self.assertIs(self.cmpnt.find_by_name('a'), self.first)
+        self.assertIs(self.cmpnt.find_by_name('b'), self.second)
+        self.assertIs(self.first.find_by_name('b'), self.first.children[0])
+        self.assertIs(self.cmpnt.find_by_name('main'), self.cmpnt)
+        self.assertIsNone(self.first.find_by_name('main'))
+        self.assertIsNone(self.cmpnt.find_by_name('c'))
+
+    def test_find_all(self):
+        """ Test that all of the named components are found in breadth
+        first order.
+
+        """
+        for name in ('a', 'b', 'main', 'c'):
+            self.assertEqual(
+                self.cmpnt.find_all_by_name(name),
+                traverse_all(self.cmpnt, name),
+            )
+
+    def test_rename(self):
+        """ Test that a renamed component is found by its new name.
+
+        """
+        self.second.name = 'c'
+        self.assertIs(self.cmpnt.find_by_name('c'), self.second)
+        self.assertIs(self.cmpnt.find_by_name('b'), self.first.children[0])
+
+    def test_destroy(self):
+        """ Test that a destroyed component is not found.
+
+        """
+        leaf = self.second.children[0]
+        self.second.destroy()
+        self.assertNotIn(leaf, self.cmpnt.find_all_by_name('a'))
+
+    def test_include(self):
+        """ Test that the components of an Include are found in the
+        children of the parent of the Include.
+
+        """
+        root = Root()
+        include = Include()
+        root.add_subcomponent(BaseComponent(name='x'))
+        root.add_subcomponent(include)
+        root.setup()
+        rows = [BaseComponent(name='x'), BaseComponent(name='y')]
+        include.components = rows
+        self.assertEqual(root.find_all_by_name('x'), traverse_all(root, 'x'))
+        self.assertIs(root.find_by_name('y'), rows[1])
+        include.components = rows[:1]
+        self.assertIsNone(root.find_by_name('y'))
+
+
+    def test_reorder(self):
+        """ Test that the positions of the children follow a change of
+        the children.
+
+        """
+        root = Root()
+        include = Include()
+        root.add_subcomponent(include)
+        root.setup()
+        rows = [BaseComponent(name='x'), BaseComponent(name='x')]
+        include.components = rows
+        self.assertEqual(root.find_all_by_name('x'), rows)
+        include.components = rows[::-1]
+        self.assertEqual(root.find_all_by_name('x'), rows[::-1])
+        self.assertEqual(root.find_all_by_name('x'), traverse_all(root, 'x'))
+
+    def test_repeated_names(self):
+        """ Test that the components of a small subtree and of the whole
+        tree are found when many components share a name.
+
+        """
+        root = Root()
+        rows = []
+        for idx in range(50):
+            row = BaseComponent(name='row')
+            row.add_subcomponent(BaseComponent(name='price'))
+            root.add_subcomponent(row)
+            rows.append(row)
+        root.setup()
+        price = rows[10].children[0]
+        self.assertIs(rows[10].find_by_name('price'), price)
+        self.assertEqual(rows[10].find_all_by_name('price'), [price])
+        self.assertIs(rows[10].find_by_name('row'), rows[10])
+        self.assertIsNone(rows[10].find_by_name('missing'))
+        self.assertEqual(
+            root.find_all_by_name('price'), traverse_all(root, 'price'),
+        )
+        self.assertIs(root.find_by_name('price'), rows[0].children[0])
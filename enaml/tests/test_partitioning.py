@@ -0,0 +1,86 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from casuarius import ConstraintVariable
+
+from enaml.layout.constraints_layout import ConstraintsLayout
+from enaml.layout.partitioning import partition_constraints
+
+
+class TestPartitioning(unittest.TestCase):
+    """ Tests for the partitioning of the constraints of a layout into
+    independent subsystems.
+
+    """
+    def setUp(self):
+        self.width = ConstraintVariable('width')
+        self.height = ConstraintVariable('height')
+        self.a = ConstraintVariable('a')
+        self.b = ConstraintVariable('b')
+        self.c = ConstraintVariable('c')
+        self.d = ConstraintVariable('d')
+
+    def constraints(self):
+        """ Returns new constraints with a partition for the size of the
+        container, one for a and b, and one for c and d.
+
+        """
+        a, b, c, d = self.a, self.b, self.c, self.d
+        return [
+            self.width >= 0, self.height >= self.width,
+            a == 10, b == a + 5, c == 20, d >= 0, d == c + 1,
+        ]
+
+    def solve(self, layout):
+        """ Returns the solved values of the variables a to d.
+
+        """
+        values = []
+        variables = (self.a, self.b, self.c, self.d)
+        callback = lambda: values.extend(v.value for v in variables)
+        layout.layout(callback, self.width, self.height, (100, 50))
+        return values
+
+    def test_partition_constraints(self):
+        """ Test that constraints which share a variable, directly or
+        through other constraints, are in the same partition.
+
+        """
+        cns = self.constraints()
+        partitions = partition_constraints(cns)
+        ids = lambda cns: map(id, cns)
+        self.assertEqual(
+            map(ids, partitions), map(ids, [cns[0:2], cns[2:4], cns[4:7]]),
+        )
+
+    def test_layout(self):
+        """ Test that each partition is given its own solver and that
+        the partitions are solved.
+
+        """
+        layout = ConstraintsLayout()
+        layout.initialize(self.constraints())
+        self.assertEqual(len(layout._partitions), 3)
+        self.assertEqual(self.solve(layout), [10, 15, 20, 21])
+        self.assertEqual(layout.get_min_size(self.width, self.height), (0, 0))
+
+    def test_update(self):
+        """ Test that a constraint which joins partitions merges them,
+        and that a partition without constraints is dropped.
+
+        """
+        layout = ConstraintsLayout()
+        cns = self.constraints()
+        layout.initialize(cns)
+        a, c = self.a, self.c
+        layout.update_constraints([cns[4]], [c == a + 30])
+        self.assertEqual(len(layout._partitions), 2)
+        self.assertEqual(self.solve(layout), [10, 15, 40, 41])
+
+        layout.update_constraints([cns[2], cns[3]], [])
+        self.assertEqual(len(layout._partitions), 2)
+        layout.update_constraints(cns[:2], [])
+        self.assertEqual(len(layout._partitions), 1)
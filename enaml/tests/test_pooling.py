@@ -0,0 +1,134 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Int
+
+from enaml.components.include import Include
+from enaml.core.base_component import BaseComponent
+from enaml.core.trait_types import UninitializedAttributeError
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Model(HasTraits):
+
+    x = Int
+
+
+class Root(BaseComponent):
+    """ A root component which runs the relayout tasks immediately.
+
+    """
+    def request_relayout_task(self, callback, *args, **kwargs):
+        callback(*args, **kwargs)
+
+
+SOURCE = """
+enamldef Pane(BaseComponent):
+    attr model
+    attr value: int << model.x
+    attr count: int = 0
+    attr note: str
+    attr label: str
+    BaseComponent:
+        pass
+"""
+
+
+class TestPooling(unittest.TestCase):
+    """ Tests for the reuse of the components released to the pool of
+    their factory.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        self.Pane = self.module.Pane
+        self.Pane.pool_size = 1
+        self.toolkit = headless_toolkit()
+        self.model = Model()
+
+    def make_pane(self):
+        with self.toolkit:
+            return self.Pane(model=self.model)
+
+    def test_not_pooled(self):
+        """ Test that the components are not pooled by default.
+
+        """
+        self.Pane.pool_size = 0
+        pane = self.make_pane()
+        pane.setup()
+        pane.release()
+        self.assertIsNot(self.make_pane(), pane)
+        self.assertEqual(pane._subcomponents, [])
+
+    def test_reuse(self):
+        """ Test that a released component is reused with its bindings
+        reset, and that it keeps its subtree.
+
+        """
+        pane = self.make_pane()
+        pane.setup()
+        child = pane.children[0]
+        pane.count = 3
+        pane.release()
+        self.model.x = 5
+        other = self.make_pane()
+        self.assertIs(other, pane)
+        self.assertTrue(other.initialized)
+        self.assertEqual(other.count, 0)
+        self.assertEqual(other.value, 5)
+        self.assertEqual(other.children, [child])
+
+    def test_unbound_state(self):
+        """ Test that the attributes which are not bound are restored to
+        their values at setup when a component is reused.
+
+        """
+        pane = self.make_pane()
+        pane.label = 'initial'
+        pane.setup()
+        pane.note = 'used'
+        pane.label = 'used'
+        pane.count = 3
+        pane.release()
+        other = self.make_pane()
+        self.assertIs(other, pane)
+        self.assertEqual(other.count, 0)
+        self.assertEqual(other.label, 'initial')
+        self.assertRaises(UninitializedAttributeError, getattr, other, 'note')
+        self.assertIs(other.model, self.model)
+
+    def test_pool_size(self):
+        """ Test that the components released to a full pool are
+        destroyed.
+
+        """
+        first = self.make_pane()
+        second = self.make_pane()
+        first.release()
+        second.release()
+        self.assertEqual(len(second._subcomponents), 0)
+        self.assertIs(self.make_pane(), first)
+        self.assertIsNot(self.make_pane(), second)
+
+    def test_include(self):
+        """ Test that a component removed from an Include is parked and
+        is not setup again when it is included again.
+
+        """
+        root = Root()
+        include = Include()
+        root.add_subcomponent(include)
+        pane = self.make_pane()
+        include.components = [pane]
+        root.setup()
+        include.components = []
+        self.assertIsNone(pane.parent)
+        include.components = [self.make_pane()]
+        self.assertEqual(root.children, [pane])
+        self.assertIs(pane.parent, include)
+
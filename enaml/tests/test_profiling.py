@@ -0,0 +1,95 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from cStringIO import StringIO
+import unittest
+
+from traits.api import HasTraits, Int
+
+from enaml.core import expressions
+from enaml.core.profiling import (
+    enable_binding_profiler, disable_binding_profiler,
+)
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Model(HasTraits):
+
+    x = Int
+
+    y = Int
+
+
+SOURCE = """
+enamldef Main(BaseComponent):
+    attr model
+    attr parity: int << model.x % 2
+    attr out: int = 0
+    out >> model.y
+"""
+
+
+class TestBindingProfiler(unittest.TestCase):
+    """ Tests for the binding profiler.
+
+    """
+    def setUp(self):
+        self.profiler = enable_binding_profiler()
+        self.module = compile_source(SOURCE, filename='profiled.enaml')
+        self.model = Model()
+        with headless_toolkit():
+            self.cmpnt = self.module.Main(model=self.model)
+        self.cmpnt.setup()
+
+    def tearDown(self):
+        disable_binding_profiler()
+
+    def get_stats(self, lineno, name):
+        return self.profiler.stats[('profiled.enaml', lineno, name)]
+
+    def test_disabled(self):
+        """ Test that the profiler is uninstalled when disabled.
+
+        """
+        disable_binding_profiler()
+        self.assertIsNone(expressions._binding_profiler)
+
+    def test_subscription_stats(self):
+        """ Test the stats of a subscription expression.
+
+        """
+        self.model.x = 1
+        self.model.x = 3
+        self.model.x = 4
+        self.model.x = 6
+        stats = self.get_stats(4, 'parity')
+        self.assertEqual(stats.evals, 5)
+        self.assertEqual(stats.changed, 2)
+        self.assertEqual(stats.unchanged, 2)
+        self.assertEqual(stats.changed_ratio, 0.5)
+        self.assertTrue(stats.max_time <= stats.total_time)
+
+    def test_notification_stats(self):
+        """ Test the stats of an update expression.
+
+        """
+        self.cmpnt.out = 1
+        self.cmpnt.out = 2
+        stats = self.get_stats(6, 'out')
+        self.assertEqual(stats.notifications, 2)
+        self.assertIsNone(stats.changed_ratio)
+
+    def test_report(self):
+        """ Test that the report lists the bindings by total time.
+
+        """
+        self.get_stats(4, 'parity').total_time = 1.0
+        stream = StringIO()
+        self.profiler.report(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn('profiled.enaml:4 (parity)', lines[1])
+        self.assertIn('profiled.enaml:5 (out)', lines[2])
+
@@ -0,0 +1,81 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Int
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Model(HasTraits):
+
+    x = Int
+
+
+SOURCE = """
+values = []
+
+def record(value):
+    values.append(value)
+    return value
+
+enamldef Main(BaseComponent):
+    attr model
+    attr d: int << record(c + a)
+    attr c: int << a + b + model.x
+    attr b: int << a * 2
+    attr a: int << model.x
+    attr e: int << c if model.x > 5 else 0
+"""
+
+
+class TestPropagation(unittest.TestCase):
+    """ Tests for the ordered propagation of changes through chained
+    subscription expressions.
+
+    """
+    def setUp(self):
+        self.module = compile_source(SOURCE)
+        self.model = Model()
+        with headless_toolkit():
+            self.cmpnt = self.module.Main(model=self.model)
+        self.cmpnt.setup()
+        del self.module.values[:]
+
+    def rank(self, name):
+        return self.cmpnt._expressions[name][0].rank()
+
+    def test_ranks(self):
+        """ Test that each expression is ranked after the expressions
+        which write its dependencies.
+
+        """
+        self.assertEqual(self.rank('a'), 0)
+        self.assertEqual(self.rank('b'), 1)
+        self.assertEqual(self.rank('c'), 2)
+        self.assertEqual(self.rank('d'), 3)
+
+    def test_glitch_free(self):
+        """ Test that a change is seen once by each expression, with all
+        of its dependencies up to date.
+
+        """
+        self.model.x = 1
+        self.assertEqual(self.module.values, [5])
+        self.model.x = 2
+        self.assertEqual(self.module.values, [5, 10])
+        self.assertEqual(self.cmpnt.c, 8)
+
+    def test_rank_follows_dependencies(self):
+        """ Test that a rank is updated when the dependencies of an 
+        expression change.
+
+        """
+        self.assertEqual(self.rank('e'), 0)
+        self.model.x = 10
+        self.assertEqual(self.cmpnt.e, 40)
+        self.assertEqual(self.rank('e'), 3)
+        self.model.x = 0
+        self.assertEqual(self.rank('e'), 0)
@@ -0,0 +1,128 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import HasTraits, Int
+
+from enaml.core import expressions
+from enaml.core.parser import parse
+
+from .headless_toolkit import headless_toolkit, compile_source
+
+
+class Model(HasTraits):
+
+    x = Int
+
+
+class FakeApp(object):
+    """ A stand-in for a toolkit application which collects the timer
+    callbacks so that they can be fired by the tests.
+
+    """
+    def __init__(self):
+        self.timers = []
+
+    def timer(self, ms, callback, *args, **kwargs):
+        self.timers.append((ms, callback))
+
+    def fire(self):
+        timers = self.timers
+        self.timers = []
+        for ms, callback in timers:
+            callback()
+
+
+SOURCE = """
+enamldef Main(BaseComponent):
+    attr model
+    attr throttled: int <<< model.x
+    attr debounced: int <<: model.x
+"""
+
+
+class TestRateLimitedOperators(unittest.TestCase):
+    """ Tests for the throttled '<<<' and debounced '<<:' operators.
+
+    """
+    def setUp(self):
+        self.now = 0.0
+        self.old_timer = expressions.default_timer
+        expressions.default_timer = lambda: self.now
+        self.module = compile_source(SOURCE)
+        self.model = Model()
+        self.toolkit = toolkit = headless_toolkit()
+        with toolkit:
+            self.cmpnt = self.module.Main(model=self.model)
+        self.cmpnt.setup()
+        self.app = toolkit.app = FakeApp()
+
+    def tearDown(self):
+        expressions.default_timer = self.old_timer
+
+    def pending(self, name):
+        expr = self.cmpnt._expressions[name][0]
+        return [cb for ms, cb in self.app.timers if cb.im_self is expr]
+
+    def test_parse(self):
+        """ Test that the operators are parsed as bindings.
+
+        """
+        ast = parse(SOURCE)
+        exprs = ast.body[0].body
+        ops = [expr.default.binding.op for expr in exprs[1:]]
+        self.assertEqual(
+            ops, ['__operator_LessLessLess__', '__operator_LessLessColon__'],
+        )
+
+    def test_throttle(self):
+        """ Test that a throttled expression is updated at most once per
+        interval, with the latest value.
+
+        """
+        self.now = 10.0
+        self.model.x = 1
+        self.assertEqual(self.cmpnt.throttled, 1)
+        self.now = 10.001
+        self.model.x = 2
+        self.model.x = 3
+        self.assertEqual(self.cmpnt.throttled, 1)
+        self.assertEqual(len(self.pending('throttled')), 1)
+        self.now = 10.02
+        self.app.fire()
+        self.assertEqual(self.cmpnt.throttled, 3)
+        self.now = 11.0
+        self.model.x = 4
+        self.assertEqual(self.cmpnt.throttled, 4)
+        self.assertEqual(self.pending('throttled'), [])
+
+    def test_debounce(self):
+        """ Test that a debounced expression is updated once the changes
+        have stopped for the quiet period.
+
+        """
+        self.now = 10.0
+        self.model.x = 1
+        self.assertEqual(self.cmpnt.debounced, 0)
+        self.now = 10.05
+        self.model.x = 2
+        self.app.fire()
+        self.assertEqual(self.cmpnt.debounced, 0)
+        self.assertEqual(len(self.app.timers), 1)
+        self.now = 10.2
+        self.app.fire()
+        self.assertEqual(self.cmpnt.debounced, 2)
+        self.assertEqual(self.app.timers, [])
+
+    def test_no_app(self):
+        """ Test that the expressions are updated immediately when there
+        is no toolkit application.
+
+        """
+        self.toolkit.app = None
+        self.model.x = 5
+        self.assertEqual(self.cmpnt.throttled, 5)
+        self.assertEqual(self.cmpnt.debounced, 5)
+
@@ -0,0 +1,116 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import sys
+import unittest
+
+from traits.api import Str
+
+from enaml.core.base_component import BaseComponent
+
+
+#: The log of the setup methods called on the Recorder components.
+LOG = []
+
+
+class Recorder(BaseComponent):
+    """ A component which logs the calls of its setup methods, in the
+    way that reimplementations in subclasses call the parent class.
+
+    """
+    label = Str
+
+    def _setup_create_widgets(self, parent):
+        LOG.append(('create', self.label, parent))
+        super(Recorder, self)._setup_create_widgets(parent)
+
+    def _setup_init_visibility(self):
+        LOG.append(('visibility', self.label))
+        super(Recorder, self)._setup_init_visibility()
+
+    def _setup_init_layout(self):
+        super(Recorder, self)._setup_init_layout()
+        LOG.append(('layout', self.label))
+
+    def _setup_finalize(self):
+        super(Recorder, self)._setup_finalize()
+        LOG.append(('finalize', self.label, self.initialized))
+
+
+def make_tree():
+    """ Creates a tree of Recorder components labeled by their path:
+
+        a
+        |-- ab
+        |   |-- abc
+        |   `-- abd
+        `-- ae
+
+    """
+    nodes = dict((label, Recorder(label=label))
+                 for label in ('a', 'ab', 'abc', 'abd', 'ae'))
+    nodes['a'].add_subcomponent(nodes['ab'])
+    nodes['ab'].add_subcomponent(nodes['abc'])
+    nodes['ab'].add_subcomponent(nodes['abd'])
+    nodes['a'].add_subcomponent(nodes['ae'])
+    return nodes['a']
+
+
+class TestSetup(unittest.TestCase):
+    """ Tests for the setup process of a component tree.
+
+    """
+    def setUp(self):
+        del LOG[:]
+
+    def entries(self, step):
+        return [entry[1:] for entry in LOG if entry[0] == step]
+
+    def test_step_order(self):
+        """ Test that the top-down steps are run in pre-order and the
+        bottom-up steps in post-order.
+
+        """
+        make_tree().setup()
+        preorder = ['a', 'ab', 'abc', 'abd', 'ae']
+        postorder = ['abc', 'abd', 'ab', 'ae', 'a']
+        self.assertEqual(
+            [e[0] for e in self.entries('visibility')], preorder,
+        )
+        self.assertEqual([e[0] for e in self.entries('layout')], postorder)
+        steps = [entry[0] for entry in LOG]
+        self.assertEqual(steps.index('layout'), 10)
+
+    def test_create_parent(self):
+        """ Test that the parent widget is passed to the components
+        which do not have their own toolkit widget.
+
+        """
+        make_tree().setup('widget')
+        parents = set(e[1] for e in self.entries('create'))
+        self.assertEqual(parents, set(['widget']))
+
+    def test_initialized(self):
+        """ Test that every component is finalized before it is marked
+        as initialized, and that the whole tree is initialized.
+
+        """
+        root = make_tree()
+        root.setup()
+        self.assertFalse(any(e[1] for e in self.entries('finalize')))
+        self.assertTrue(all(c.initialized for c in root.traverse()))
+
+    def test_deep_tree(self):
+        """ Test that the setup of a tree which is deeper than the
+        recursion limit succeeds.
+
+        """
+        root = cmpnt = BaseComponent()
+        for i in xrange(sys.getrecursionlimit() + 100):
+            child = BaseComponent()
+            cmpnt.add_subcomponent(child)
+            cmpnt = child
+        root.setup()
+        self.assertTrue(cmpnt.initialized)
+
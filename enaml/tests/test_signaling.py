@@ -0,0 +1,100 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.signaling import Signal
+
+
+class Emitter(object):
+
+    changed = Signal()
+
+
+class Listener(object):
+
+    def __init__(self, log):
+        self.log = log
+
+    def on_changed(self, value):
+        self.log.append(('method', value))
+
+
+class TestSignal(unittest.TestCase):
+    """ Tests for the connections of a Signal.
+
+    """
+    def setUp(self):
+        self.log = []
+        self.emitter = Emitter()
+
+    def handler(self, value):
+        self.log.append(('handler', value))
+
+    def test_connect_once(self):
+        """ Test that a callback is only connected once, even through
+        different bound method objects.
+
+        """
+        listener = Listener(self.log)
+        signal = self.emitter.changed
+        signal.connect(listener.on_changed)
+        signal.connect(listener.on_changed)
+        signal(1)
+        self.assertEqual(self.log, [('method', 1)])
+
+    def test_order(self):
+        """ Test that the handlers are invoked in the order in which
+        they were connected.
+
+        """
+        log = self.log
+        signal = self.emitter.changed
+        funcs = [lambda v, i=i: log.append(i) for i in range(5)]
+        for func in funcs:
+            signal.connect(func)
+        signal.disconnect(funcs[2])
+        signal(0)
+        self.assertEqual(log, [0, 1, 3, 4])
+
+    def test_disconnect(self):
+        """ Test that a bound method can be disconnected.
+
+        """
+        listener = Listener(self.log)
+        signal = self.emitter.changed
+        signal.connect(listener.on_changed)
+        signal.disconnect(listener.on_changed)
+        signal.disconnect(listener.on_changed)
+        signal(1)
+        self.assertEqual(self.log, [])
+
+    def test_dead_connection(self):
+        """ Test that a connection is removed when the object of a bound
+        method is garbage collected.
+
+        """
+        listener = Listener(self.log)
+        signal = self.emitter.changed
+        signal.connect(listener.on_changed)
+        del listener
+        self.assertEqual(len(signal._connections), 0)
+
+    def test_snapshot(self):
+        """ Test that a handler which disconnects itself during emission
+        does not disturb the other handlers.
+
+        """
+        signal = self.emitter.changed
+        def once(value):
+            signal.disconnect(once)
+            self.log.append(('once', value))
+        signal.connect(once)
+        signal.connect(self.handler)
+        signal(1)
+        signal(2)
+        self.assertEqual(
+            self.log, [('once', 1), ('handler', 1), ('handler', 2)],
+        )
+
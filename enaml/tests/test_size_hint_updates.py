@@ -0,0 +1,110 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import Int, List, Tuple
+
+from enaml.components.constraints_widget import ConstraintsWidget
+from enaml.components.container import Container
+
+
+class Widget(ConstraintsWidget):
+    """ A constraints widget with a settable size hint.
+
+    """
+    hint = Tuple((50, 20))
+
+    def size_hint(self):
+        return self.hint
+
+
+class Owner(Container):
+    """ A container which counts the relayouts it requests and the
+    updates of its solver.
+
+    """
+    relayouts = Int
+
+    updates = List
+
+    def request_relayout(self):
+        self.relayouts += 1
+
+    def spy_updates(self):
+        manager = self.layout_manager
+        update = manager.update_constraints
+        def spy(old_cns, new_cns):
+            self.updates.append((len(old_cns), len(new_cns)))
+            update(old_cns, new_cns)
+        manager.update_constraints = spy
+
+
+class TestSizeHintUpdates(unittest.TestCase):
+    """ Tests for the updates of the size hint constraints of a child
+    of a container.
+
+    """
+    def setUp(self):
+        self.owner = Owner()
+        self.widgets = [Widget(), Widget()]
+        for widget in self.widgets:
+            self.owner.add_subcomponent(widget)
+        self.manager = self.owner.layout_manager
+        self.manager.initialize(self.owner.compute_constraints())
+        self.owner.spy_updates()
+
+    def solve(self):
+        """ Returns the solved (width, height) of the first widget and
+        the top of the second widget.
+
+        """
+        first, second = self.widgets
+        owner = self.owner
+        values = []
+        callback = lambda: values.extend([
+            first.width.value, first.height.value, second.top.value,
+        ])
+        self.manager.layout(callback, owner.width, owner.height, (200, 200))
+        return values
+
+    def test_update(self):
+        """ Test that a new size hint replaces the size hint constraints
+        of the child without a relayout.
+
+        """
+        self.widgets[0].hint = (80, 30)
+        self.owner._update_size_hint(self.widgets[0])
+        self.assertEqual(self.owner.relayouts, 0)
+        self.assertEqual(self.owner.updates, [(4, 4)])
+        self.assertEqual(self.solve(), [80, 30, 50])
+
+    def test_unchanged(self):
+        """ Test that an unchanged size hint does not update the solver.
+
+        """
+        self.owner._update_size_hint(self.widgets[0])
+        self.assertEqual(self.owner.updates, [])
+
+    def test_after_relayout(self):
+        """ Test that the size hint constraints can be replaced after the
+        constraints have been recomputed by a relayout.
+
+        """
+        self.manager.replace_constraints(self.owner.compute_constraints())
+        self.widgets[1].hint = (10, 10)
+        self.owner._update_size_hint(self.widgets[1])
+        self.widgets[0].hint = (80, 30)
+        self.owner._update_size_hint(self.widgets[0])
+        self.assertEqual(self.owner.relayouts, 0)
+        self.assertEqual(self.solve(), [80, 30, 50])
+
+    def test_unknown_child(self):
+        """ Test that a relayout is requested for a child whose size hint
+        constraints are not in the solver.
+
+        """
+        self.owner._update_size_hint(Widget())
+        self.assertEqual(self.owner.relayouts, 1)
+
@@ -0,0 +1,123 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import Any
+
+from enaml.components.virtual_repeater import VirtualRepeater, visible_range
+from enaml.core.base_component import BaseComponent
+from enaml.layout.geometry import Rect
+
+
+class Row(BaseComponent):
+    """ A row component which displays an item.
+
+    """
+    item = Any
+
+
+class Repeater(VirtualRepeater):
+    """ A VirtualRepeater with a fixed viewport, since the tests do not
+    have a scroll area.
+
+    """
+    rect = Any
+
+    def viewport(self):
+        return self.rect
+
+
+class TestVisibleRange(unittest.TestCase):
+    """ Tests for the computation of the rows in a viewport.
+
+    """
+    def test_top(self):
+        self.assertEqual(visible_range(0, 50, 10, 2, 100), (0, 8))
+
+    def test_middle(self):
+        self.assertEqual(visible_range(105, 50, 10, 2, 100), (8, 18))
+
+    def test_bottom(self):
+        self.assertEqual(visible_range(980, 50, 10, 2, 100), (96, 100))
+
+    def test_empty(self):
+        self.assertEqual(visible_range(0, 50, 10, 2, 0), (0, 0))
+
+
+class TestVirtualRepeater(unittest.TestCase):
+    """ Tests for the realization and recycling of the rows of a
+    VirtualRepeater.
+
+    """
+    def setUp(self):
+        self.repeater = Repeater(
+            rect=Rect(0, 0, 100, 50), row_height=10, overscan=2,
+            factory=Row, items=range(100),
+        )
+        self.repeater.update_rows()
+
+    def items(self):
+        return [row.item for row in self.repeater._include.components]
+
+    def test_realized(self):
+        """ Test that only the rows in the viewport are realized.
+
+        """
+        self.assertEqual(self.items(), range(8))
+
+    def test_recycle(self):
+        """ Test that the rows which leave the viewport are reused for
+        the rows which enter it.
+
+        """
+        rows = set(self.repeater._include.components)
+        self.repeater.rect = Rect(0, 30, 100, 50)
+        self.repeater.update_rows()
+        self.assertEqual(self.items(), range(1, 11))
+        new_rows = self.repeater._include.components
+        self.assertEqual(len(set(new_rows) - rows), 2)
+        self.assertEqual(len(rows - set(new_rows)), 0)
+
+    def test_keep_rows(self):
+        """ Test that the rows which remain in the viewport keep their
+        items.
+
+        """
+        before = dict((row.item, row) for row in self.repeater._rows)
+        self.repeater.rect = Rect(0, 20, 100, 50)
+        self.repeater.update_rows()
+        for row in self.repeater._rows:
+            if row.item in before:
+                self.assertIs(before[row.item], row)
+
+    def test_items_changed(self):
+        """ Test that replacing the items rebinds the realized rows.
+
+        """
+        rows = list(self.repeater._rows)
+        self.repeater.items = range(100, 200)
+        self.assertEqual(self.items(), range(100, 108))
+        self.assertEqual(self.repeater._rows, rows)
+
+
+    def test_items_modified(self):
+        """ Test that changing the items in place rebinds the realized
+        rows.
+
+        """
+        rows = list(self.repeater._rows)
+        self.repeater.items[3] = 'three'
+        self.assertEqual(self.items(), [0, 1, 2, 'three', 4, 5, 6, 7])
+        self.repeater.items.insert(0, 'first')
+        self.assertEqual(self.items(), ['first', 0, 1, 2, 'three', 4, 5, 6])
+        self.assertEqual(self.repeater._rows, rows)
+
+    def test_items_appended(self):
+        """ Test that appending an item updates the count of the items
+        in the window.
+
+        """
+        self.repeater.items.append(100)
+        self.assertEqual(self.repeater._window, (0, 8, 101))
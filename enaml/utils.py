@@ -5,6 +5,9 @@
 """ An amalgamation of utilities used throughout the Enaml framework.
 
 """
+from collections import OrderedDict
+
+
 class abstractclassmethod(classmethod):
     """ A backport of the Python 3's abc.abstractclassmethod.
 
@@ -15,3 +18,73 @@ class abstractclassmethod(classmethod):
         func.__isabstractmethod__ = True
         super(abstractclassmethod, self).__init__(func)
 
+
+
+class LRUCache(object):
+    """ A simple mapping-like cache which holds at most 'maxsize' items,
+    discarding the least recently used item when the limit is reached.
+    The number of cache hits and misses are counted on the instance.
+
+    """
+    def __init__(self, maxsize=1024):
+        """ Initialize an LRUCache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of items held by the cache. The default
+            is 1024.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        """ Returns the number of items currently held in the cache.
+
+        """
+        return len(self._data)
+
+    def __contains__(self, key):
+        """ Returns whether the key is in the cache. This does not 
+        affect the recently used order or the hit and miss counts.
+
+        """
+        return key in self._data
+
+    def __setitem__(self, key, value):
+        """ Stores the value in the cache as the most recently used 
+        item, discarding the least recently used item if necessary.
+
+        """
+        data = self._data
+        data.pop(key, None)
+        data[key] = value
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def get(self, key, default=None):
+        """ Returns the value for the key and marks it as the most 
+        recently used item, or returns the default if the key is not
+        in the cache.
+
+        """
+        data = self._data
+        try:
+            value = data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        data[key] = value
+        self.hits += 1
+        return value
+
+    def clear(self):
+        """ Removes all items from the cache and resets the counts.
+
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
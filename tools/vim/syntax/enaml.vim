@@ -24,7 +24,7 @@ endif
 syn keyword enamlStatement      enamldef
 " FIXME: This captures the predefined operators, not any extensions that may be
 " added.
-syn match enamlOperator         "\%(\w\|\s\)\(::\|<<\|>>\|=\|:=\)\%(\w\|\s\)"
+syn match enamlOperator         "\%(\w\|\s\)\(::\|<<<\|<<:\|<<\|>>\|=\|:=\)\%(\w\|\s\)"
 if exists("python_highlight_builtins") || exists("enaml_highlight_builtins")
     syn keyword enamlBuiltin    horizontal vertical hbox vbox align spacer
 endif